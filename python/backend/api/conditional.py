@@ -0,0 +1,78 @@
+"""
+HTTP validators for conditional GET.
+
+Responses carry an ETag and Last-Modified plus "Cache-Control: no-cache",
+so browsers store them and revalidate with If-None-Match on every use; an
+unchanged resource then costs a 304 without a body.
+"""
+
+import hashlib
+from email.utils import formatdate
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong entity tag from the parts that determine a representation.
+
+    Args:
+        parts: Values (str, bytes or anything with a stable str()) that change
+            whenever the representation changes
+
+    Returns:
+        Quoted entity tag
+    """
+    digest = hashlib.blake2b(digest_size=12)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check If-None-Match against an entity tag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a tag
+    weakened by response compression still matches.
+
+    Args:
+        request: Incoming request
+        etag: Current entity tag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def validator_headers(etag: str, last_modified: Optional[float] = None) -> Dict[str, str]:
+    """
+    Headers announcing the validators of a representation.
+
+    Args:
+        etag: Entity tag
+        last_modified: Unix seconds of the last change, if known
+
+    Returns:
+        ETag, Cache-Control and, when known, Last-Modified headers
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def not_modified(headers: Dict[str, str]) -> Response:
+    """Return a 304 carrying the validator headers."""
+    return Response(status_code=304, headers=headers)
@@ -0,0 +1,18 @@
+"""
+FastAPI dependencies shared by the route handlers.
+"""
+
+from backend.database.async_operations import AsyncEmployeeRepository, get_async_repository
+
+
+def get_employee_repository() -> AsyncEmployeeRepository:
+    """
+    Provide the employee repository for the configured DB_BACKEND.
+
+    Override with app.dependency_overrides to run the API against another
+    backend, e.g. a MemoryEmployeeRepository in tests.
+
+    Returns:
+        Async repository
+    """
+    return get_async_repository()
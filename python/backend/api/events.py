@@ -0,0 +1,333 @@
+"""
+Live employee change stream (GET /employees/stream, Server-Sent Events).
+
+Write routes publish create, update and delete events to the process-wide
+Broadcaster once the write has committed. A fan-out backend carries them to
+every worker: LocalFanout delivers within this process, RedisFanout over a
+Redis pub/sub channel so clients connected to any worker see every change.
+Each stream connection has a Subscription that coalesces pending events
+per employee, so a slow consumer receives the latest state of each changed
+employee in one batch instead of every intermediate event. The pending set
+is bounded; a subscription that overflows it is told to resync instead.
+"""
+
+import asyncio
+import json
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+from backend import metrics
+from backend.api.serialization import dumps
+from backend.config import EventsConfig
+
+Event = Dict[str, Any]
+Deliver = Callable[[List[Event]], None]
+
+# Tells the client its copy may be stale and must be reloaded
+RESYNC: Event = {"type": "resync"}
+
+# Reconnect delay suggested to EventSource clients, in milliseconds
+RETRY_MS = 3000
+
+
+def employee_event(kind: str, employee_id: int, employee: Optional[Dict[str, Any]] = None) -> Event:
+    """
+    Build a change event.
+
+    Args:
+        kind: "create", "update" or "delete"
+        employee_id: Changed employee
+        employee: Employee as returned by the API; omitted for deletes
+
+    Returns:
+        Event dictionary
+    """
+    event: Event = {"type": kind, "id": employee_id}
+    if employee is not None:
+        event["employee"] = employee
+    return event
+
+
+class Fanout(ABC):
+    """Carries published events to the broadcasters of every worker."""
+
+    @abstractmethod
+    def start(self, deliver: Deliver) -> None:
+        """Begin delivering events to deliver, which may be called from any thread."""
+
+    @abstractmethod
+    def publish(self, events: List[Event]) -> None:
+        """Send events to every worker, this one included; must not block."""
+
+    def close(self) -> None:
+        """Stop delivering events."""
+
+
+class LocalFanout(Fanout):
+    """Delivers events within this process only; enough for a single worker."""
+
+    def __init__(self) -> None:
+        self._deliver: Optional[Deliver] = None
+
+    def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    def publish(self, events: List[Event]) -> None:
+        if self._deliver is not None:
+            self._deliver(events)
+
+    def close(self) -> None:
+        self._deliver = None
+
+
+class RedisFanout(Fanout):
+    """
+    Fan-out over a Redis pub/sub channel, for multi-worker deployments.
+
+    Publishing hands events to a background thread, so a slow or
+    unreachable Redis never delays the request that made the change;
+    events published while Redis is unreachable are dropped and logged.
+    """
+
+    def __init__(self, client: Any, channel: str):
+        self.client = client
+        self.channel = channel
+        self._outbox: "queue.SimpleQueue[Optional[List[Event]]]" = queue.SimpleQueue()
+        self._pubsub: Any = None
+
+    def start(self, deliver: Deliver) -> None:
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(self.channel)
+        threading.Thread(target=self._listen, args=(self._pubsub, deliver), name="events-listen", daemon=True).start()
+        threading.Thread(target=self._send, name="events-publish", daemon=True).start()
+
+    def _listen(self, pubsub: Any, deliver: Deliver) -> None:
+        try:
+            for message in pubsub.listen():
+                if message.get("type") == "message":
+                    deliver(json.loads(message["data"]))
+        except Exception as e:
+            # Also how close() ends this thread
+            if self._pubsub is not None:
+                print(f"Employee event listener stopped: {e}")
+
+    def _send(self) -> None:
+        while True:
+            events = self._outbox.get()
+            if events is None:
+                return
+            try:
+                self.client.publish(self.channel, dumps(events))
+            except Exception as e:
+                print(f"Error publishing {len(events)} employee events: {e}")
+
+    def publish(self, events: List[Event]) -> None:
+        self._outbox.put(events)
+
+    def close(self) -> None:
+        self._outbox.put(None)
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            pubsub.close()
+
+
+class Subscription:
+    """
+    Pending events of one stream connection.
+
+    Used from the event loop thread only. Events are kept per employee id
+    with the latest one winning: create then update stays a create with the
+    newest data, create then delete cancels out, and update then delete is
+    a delete.
+    """
+
+    def __init__(self, max_pending: int):
+        self.max_pending = max_pending
+        self.closed = False
+        self._pending: Dict[int, Event] = {}
+        self._resync = False
+        self._ready = asyncio.Event()
+
+    def push(self, events: List[Event]) -> None:
+        """Merge newly published events into the pending set."""
+        for event in events:
+            if event["type"] == "resync":
+                self._overflow()
+                continue
+            employee_id = event["id"]
+            previous = self._pending.pop(employee_id, None)
+            if previous is not None and previous["type"] == "create":
+                if event["type"] == "delete":
+                    continue
+                event = {**event, "type": "create"}
+            self._pending[employee_id] = event
+        if len(self._pending) > self.max_pending:
+            metrics.EVENT_STREAM_OVERFLOWS.inc()
+            self._overflow()
+        self._ready.set()
+
+    def _overflow(self) -> None:
+        # The client reloads everything, so the pending events are moot
+        self._pending = {}
+        self._resync = True
+
+    def close(self) -> None:
+        self.closed = True
+        self._ready.set()
+
+    async def next_batch(self, timeout: float, batch_window: float) -> Optional[Tuple[bool, List[Event]]]:
+        """
+        Wait for events and take everything pending.
+
+        Args:
+            timeout: Seconds to wait for a first event
+            batch_window: Seconds to wait after the first event for more to join it
+
+        Returns:
+            Tuple of (resync, events), or None if nothing arrived in time or
+            the subscription was closed
+        """
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if batch_window > 0 and not self.closed:
+            await asyncio.sleep(batch_window)
+        self._ready.clear()
+        if self.closed:
+            return None
+        batch = (self._resync, list(self._pending.values()))
+        self._pending = {}
+        self._resync = False
+        return batch
+
+
+class Broadcaster:
+    """Publishes change events through a fan-out backend to the local subscriptions."""
+
+    def __init__(self, fanout: Fanout, max_pending: int = 1000):
+        self.fanout = fanout
+        self.max_pending = max_pending
+        self._subscriptions: Set[Subscription] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        """Bind to the running event loop and start the fan-out; call on startup."""
+        self._loop = asyncio.get_running_loop()
+        self.fanout.start(self._dispatch)
+
+    def close(self) -> None:
+        """Stop the fan-out and end every open stream."""
+        self.fanout.close()
+        for subscription in list(self._subscriptions):
+            subscription.close()
+        self._subscriptions.clear()
+
+    def _dispatch(self, events: List[Event]) -> None:
+        """Hand events from any thread to the subscriptions on the event loop."""
+        loop = self._loop
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if loop is None or current is loop:
+            self._deliver(events)
+        elif not loop.is_closed():
+            loop.call_soon_threadsafe(self._deliver, events)
+
+    def _deliver(self, events: List[Event]) -> None:
+        for subscription in self._subscriptions:
+            subscription.push(events)
+
+    def publish(self, events: List[Event]) -> None:
+        """Publish committed changes to every subscriber of every worker."""
+        if not events:
+            return
+        for event in events:
+            metrics.EVENTS_PUBLISHED.inc((event["type"],))
+        self.fanout.publish(events)
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription(self.max_pending)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+
+async def event_stream(broadcaster: Broadcaster) -> AsyncIterator[bytes]:
+    """
+    Encode a subscription as a text/event-stream body.
+
+    Sends "changes" events carrying a JSON list of coalesced change events,
+    "resync" events when the client must reload, and a comment line on
+    idle streams so proxies keep the connection open. Ends when the
+    broadcaster closes; a client disconnect cancels it.
+
+    Args:
+        broadcaster: Broadcaster to subscribe to
+
+    Yields:
+        Encoded server-sent events
+    """
+    subscription = broadcaster.subscribe()
+    try:
+        yield f"retry: {RETRY_MS}\n\n".encode()
+        while not subscription.closed:
+            batch = await subscription.next_batch(EventsConfig.HEARTBEAT_SECONDS, EventsConfig.BATCH_MS / 1000)
+            if batch is None:
+                if not subscription.closed:
+                    yield b": keepalive\n\n"
+                continue
+            resync, events = batch
+            if resync:
+                yield b"event: resync\ndata: {}\n\n"
+            if events:
+                yield b"event: changes\ndata: " + dumps(events) + b"\n\n"
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+_broadcaster: Optional[Broadcaster] = None
+
+
+def _create_fanout() -> Fanout:
+    """Build the configured fan-out, falling back to local delivery without Redis."""
+    if EventsConfig.FANOUT == "shared":
+        if not EventsConfig.SHARED_URL:
+            print("EVENTS_FANOUT=shared needs EVENTS_SHARED_URL; delivering events within this process only")
+            return LocalFanout()
+        try:
+            import redis  # type: ignore
+        except ImportError:
+            print("EVENTS_FANOUT=shared but the redis package is not installed; delivering events locally")
+            return LocalFanout()
+        return RedisFanout(redis.Redis.from_url(EventsConfig.SHARED_URL), EventsConfig.CHANNEL)
+    return LocalFanout()
+
+
+def get_broadcaster() -> Optional[Broadcaster]:
+    """
+    Return the process-wide broadcaster, creating it on first use.
+
+    Returns:
+        Broadcaster, or None when the change stream is disabled
+    """
+    global _broadcaster
+    if _broadcaster is None and EventsConfig.ENABLED:
+        _broadcaster = Broadcaster(_create_fanout(), EventsConfig.QUEUE_SIZE)
+    return _broadcaster
+
+
+def publish_changes(events: List[Event]) -> None:
+    """Publish change events if the change stream is enabled."""
+    broadcaster = get_broadcaster()
+    if broadcaster is not None:
+        broadcaster.publish(events)
@@ -0,0 +1,111 @@
+"""
+Backend initialization and cached database status for the health probes.
+
+Startup does not wait for the database: the HealthMonitor initializes the
+storage backend (pool, schema check) in the background, retrying until it
+succeeds, and afterwards tests the connection every
+HEALTH_CHECK_INTERVAL_SECONDS. GET /readyz and GET /health answer from the
+last result, so probes cost no database round trip; GET /livez only shows
+that the process serves requests.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from backend.config import AppConfig
+from backend.database.repository import get_repository
+
+
+class HealthMonitor:
+    """Initializes the backend and keeps its last known status."""
+
+    def __init__(self, interval: float = 5.0):
+        """
+        Args:
+            interval: Seconds between connection tests, and between
+                initialization attempts while the database is unreachable
+        """
+        self.interval = interval
+        self.initialized = False
+        self.database_ok = False
+        self.checked_at: Optional[float] = None
+        self.error: Optional[str] = None
+        self.stopping = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start initializing and monitoring in the background; call on startup."""
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Report not ready from now on and stop monitoring; call on shutdown."""
+        self.stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> None:
+        """Initialize the backend if still needed, otherwise test its connection."""
+        repo = get_repository()
+        try:
+            if not self.initialized:
+                started = time.perf_counter()
+                await asyncio.to_thread(repo.initialize)
+                self.initialized = True
+                self.database_ok = True
+                print(f"Storage backend initialized in {time.perf_counter() - started:.2f}s")
+            else:
+                self.database_ok = await asyncio.to_thread(repo.test_connection)
+            self.error = None if self.database_ok else "connection test failed"
+        except Exception as e:
+            # Initialization is retried at the next interval
+            if self.error is None:
+                print(f"Storage backend not available: {e}")
+            self.database_ok = False
+            self.error = str(e)
+        self.checked_at = time.time()
+
+    @property
+    def stale(self) -> bool:
+        """True if no check finished recently, e.g. because one is hanging."""
+        return self.checked_at is None or time.time() - self.checked_at > 3 * self.interval
+
+    @property
+    def ready(self) -> bool:
+        return self.initialized and self.database_ok and not self.stale and not self.stopping
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the last known status.
+
+        Returns:
+            Dictionary with ready, database ("connected", "disconnected" or
+            "starting"), the age of the last check and the last error
+        """
+        if self.initialized:
+            database = "connected" if self.database_ok else "disconnected"
+        else:
+            database = "starting" if self.checked_at is None else "disconnected"
+        return {
+            "ready": self.ready,
+            "database": database,
+            "checked_seconds_ago": round(time.time() - self.checked_at, 3) if self.checked_at else None,
+            "error": self.error,
+        }
+
+
+_monitor: Optional[HealthMonitor] = None
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Return the process-wide health monitor, creating it on first use."""
+    global _monitor
+    if _monitor is None:
+        _monitor = HealthMonitor(AppConfig.HEALTH_CHECK_INTERVAL_SECONDS)
+    return _monitor
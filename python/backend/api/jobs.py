@@ -0,0 +1,223 @@
+"""
+FastAPI route handlers for background jobs.
+
+POST /jobs queues a job and answers 202 with its URL; any server worker
+running jobs picks it up (see backend/jobs/runner.py). CSV imports are
+queued by POST /employees/import, which needs the upload.
+"""
+
+import asyncio
+import os
+from typing import Annotated, Any, Dict, Literal, Optional
+
+from fastapi import APIRouter, Body, HTTPException, Query, status
+from fastapi.responses import FileResponse, JSONResponse
+
+from backend.config import AppConfig, JobsConfig
+from backend.database.pool import PoolTimeoutError
+from backend.jobs.handlers import SINGLE_ATTEMPT_KINDS, remove_files
+from backend.jobs.runner import get_job_runner
+from backend.jobs.store import get_job_store
+from backend.models.schemas import JobList, JobRequest, JobResponse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+def job_response(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Describe a job to clients.
+    
+    Server-side file paths are left out; a job that produced a file gets
+    the URL to download it from instead.
+    
+    Args:
+        job: Job as the job store returns it
+        
+    Returns:
+        Dictionary matching JobResponse
+    """
+    params = {key: value for key, value in job["params"].items() if key != "upload"}
+    result = job["result"]
+    result_url = None
+    if result is not None and "file" in result:
+        result = {key: value for key, value in result.items() if key != "file"}
+        if job["status"] == "succeeded":
+            result_url = f"{AppConfig.API_PREFIX}/jobs/{job['id']}/result"
+    total = job["progress_total"]
+    return {
+        **{key: value for key, value in job.items() if key not in ("worker", "heartbeat_at")},
+        "params": params,
+        "result": result,
+        "result_url": result_url,
+        "progress": round(min(job["progress_done"] / total, 1.0), 4) if total else None,
+    }
+
+
+async def queue_job(kind: str, params: Dict[str, Any], max_attempts: Optional[int] = None) -> JSONResponse:
+    """
+    Queue a job and build the 202 response pointing at it.
+    
+    Args:
+        kind: Handler name
+        params: JSON-serializable handler parameters
+        max_attempts: Runs before giving up; JOBS_MAX_ATTEMPTS by default,
+            always 1 for kinds that must not run twice
+        
+    Returns:
+        202 response with the queued job, its status URL in the Location header
+    """
+    if kind in SINGLE_ATTEMPT_KINDS:
+        max_attempts = 1
+    job = await asyncio.to_thread(
+        get_job_store().create, kind, params, max_attempts or JobsConfig.MAX_ATTEMPTS
+    )
+    runner = get_job_runner()
+    if runner is not None:
+        runner.wake()
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=job_response(job),
+        headers={"Location": f"{AppConfig.API_PREFIX}/jobs/{job['id']}"}
+    )
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_job(request: Annotated[JobRequest, Body(discriminator="kind")]):
+    """
+    Queue an export, salary adjustment, summary rebuild or index reconciliation.
+    
+    Args:
+        request: Job kind, its parameters and optionally max_attempts
+        
+    Returns:
+        The queued job, with its status URL in the Location header
+        
+    Raises:
+        HTTPException: If the job cannot be queued
+    """
+    try:
+        params = request.params.model_dump(mode="json", exclude_none=True)
+        return await queue_job(request.kind, params, request.max_attempts)
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error queueing job: {str(e)}"
+        )
+
+
+@router.get("", response_model=JobList)
+async def list_jobs(
+    status_filter: Optional[JobStatus] = Query(None, alias="status", description="Only jobs in this status"),
+    kind: Optional[str] = Query(None, max_length=50, description="Only jobs of this kind"),
+    limit: int = Query(50, ge=1, le=500, description="Number of jobs, newest first"),
+):
+    """
+    List recent jobs and the number of jobs per status.
+    
+    Args:
+        status_filter: Only jobs in this status
+        kind: Only jobs of this kind
+        limit: Number of jobs to return
+        
+    Returns:
+        Jobs, newest first, and counts per status
+    """
+    try:
+        store = get_job_store()
+        jobs = await asyncio.to_thread(store.list, status_filter, kind, limit)
+        counts = await asyncio.to_thread(store.counts)
+        return {"jobs": [job_response(job) for job in jobs], "counts": counts}
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving jobs: {str(e)}"
+        )
+
+
+async def _get_job(job_id: int) -> Dict[str, Any]:
+    """
+    Load a job.
+    
+    Args:
+        job_id: Id returned when the job was queued
+        
+    Returns:
+        The job
+        
+    Raises:
+        HTTPException: If the job is not found or has expired
+    """
+    job = await asyncio.to_thread(get_job_store().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int):
+    """
+    Report a job's status and progress.
+    
+    Args:
+        job_id: Id returned when the job was queued
+        
+    Returns:
+        Job status, progress, result and last error
+        
+    Raises:
+        HTTPException: If the job is not found or has expired
+    """
+    return job_response(await _get_job(job_id))
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel_job(job_id: int):
+    """
+    Cancel a job.
+    
+    A queued job is cancelled at once; a running one stops at its next
+    progress report, keeping the work done until then. Finished jobs are
+    left as they are.
+    
+    Args:
+        job_id: Id returned when the job was queued
+        
+    Returns:
+        The job afterwards; cancel_requested is set while it winds down
+        
+    Raises:
+        HTTPException: If the job is not found
+    """
+    job = await asyncio.to_thread(get_job_store().cancel, job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} not found")
+    if job["status"] == "cancelled":
+        await asyncio.to_thread(remove_files, job)
+    return job_response(job)
+
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: int):
+    """
+    Download the file a succeeded job produced: an export, or an import's error report.
+    
+    Args:
+        job_id: Id returned when the job was queued
+        
+    Returns:
+        The file as an attachment
+        
+    Raises:
+        HTTPException: If the job is not found, not succeeded or produced no file
+    """
+    job = await _get_job(job_id)
+    result = job["result"] or {}
+    if job["status"] != "succeeded" or "file" not in result or not os.path.exists(result["file"]):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Job {job_id} has no result file")
+    return FileResponse(result["file"], media_type=result["media_type"], filename=result["filename"])
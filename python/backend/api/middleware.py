@@ -0,0 +1,242 @@
+"""
+ASGI middleware.
+"""
+
+import time
+import zlib
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import cookie_parser
+
+from backend import metrics
+from backend.database.replicas import primary_reads
+
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+# Media types worth compressing; everything the API returns is one of them
+COMPRESSIBLE_TYPES = frozenset({"application/json", "application/x-ndjson", "text/csv", "text/plain", "text/html"})
+
+
+class MetricsMiddleware:
+    """
+    Record latency and status of every HTTP request.
+
+    Requests are labelled with the matched route template (e.g.
+    /api/employees/{employee_id}) rather than the raw path, so the number of
+    series stays bounded; requests that match no route share "unmatched".
+    Written as plain ASGI rather than BaseHTTPMiddleware to keep streaming
+    responses streaming and the per-request cost to a few microseconds.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = "500"
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+            metrics.HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, (method, route))
+            metrics.HTTP_RESPONSES.inc((method, route, status))
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with br or gzip, as negotiated by Accept-Encoding.
+
+    Only textual responses (JSON, NDJSON, CSV, text) are compressed, and a
+    single-message response only once it reaches minimum_size bytes, since
+    compressing small bodies costs more CPU than the bytes it saves.
+    Streamed responses such as the export are compressed chunk by chunk.
+    br is offered only when the optional brotli package is installed.
+    Strong ETags are weakened on compressed responses, as the compressed
+    bytes differ from the identity representation.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 4):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Send a client's reads to the primary for a while after it writes.
+
+    A successful POST, PUT, PATCH or DELETE sets a cookie holding the time
+    until which the client's requests read from the primary, so a replica
+    that has not yet applied the write cannot hide it from its author. The
+    write itself runs inside primary_reads() as well, since handlers such as
+    the bulk endpoints read back what they changed.
+    """
+
+    WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+    def __init__(self, app, window: float = 5.0, cookie_name: str = "read_primary_until"):
+        self.app = app
+        self.window = window
+        self.cookie_name = cookie_name
+
+    def _sticky(self, scope) -> bool:
+        cookies = cookie_parser(Headers(scope=scope).get("cookie", ""))
+        try:
+            return float(cookies.get(self.cookie_name, 0)) > time.time()
+        except ValueError:
+            return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["method"] not in self.WRITE_METHODS:
+            if self._sticky(scope):
+                with primary_reads():
+                    await self.app(scope, receive, send)
+            else:
+                await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = time.time() + self.window
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append(
+                    "Set-Cookie",
+                    f"{self.cookie_name}={until:.3f}; Max-Age={int(self.window) + 1}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        with primary_reads():
+            await self.app(scope, receive, send_with_cookie)
+
+
+class _CompressingResponder:
+    """Per-response state of CompressionMiddleware."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start_message = None
+        # None until the first body message decides; then True or False
+        self.compressing = None
+        self.compress = None
+        self.finish = None
+
+    def _start_compressor(self) -> None:
+        if self.encoding == "br":
+            compressor = brotli.Compressor(quality=self.middleware.brotli_quality)
+            self.compress, self.finish = compressor.process, compressor.finish
+        else:
+            # wbits 31 writes a gzip header and trailer
+            compressor = zlib.compressobj(self.middleware.gzip_level, zlib.DEFLATED, 31)
+            self.compress, self.finish = compressor.compress, compressor.flush
+
+    async def send(self, message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows whether to compress
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self.downstream(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.compressing is None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            compressible = (
+                self.start_message["status"] not in (204, 304)
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").split(";")[0].strip() in COMPRESSIBLE_TYPES
+            )
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+            self.compressing = compressible and (more_body or len(body) >= self.middleware.minimum_size)
+            if self.compressing:
+                self._start_compressor()
+                headers["Content-Encoding"] = self.encoding
+                etag = headers.get("etag")
+                if etag is not None and not etag.startswith("W/"):
+                    headers["ETag"] = "W/" + etag
+                if more_body:
+                    del headers["Content-Length"]
+                else:
+                    body = self.compress(body) + self.finish()
+                    headers["Content-Length"] = str(len(body))
+                    message = {"type": "http.response.body", "body": body}
+            await self.downstream(self.start_message)
+            if not self.compressing or not more_body:
+                await self.downstream(message)
+                return
+
+        if not self.compressing:
+            await self.downstream(message)
+            return
+        chunk = self.compress(body)
+        if not more_body:
+            chunk += self.finish()
+        await self.downstream({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the content coding to use from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Header value, e.g. "gzip, deflate, br;q=0.9"
+
+    Returns:
+        "br" or "gzip", or None to send the response uncompressed
+    """
+    available = ("br", "gzip") if brotli is not None else ("gzip",)
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+    best, best_weight = None, 0.0
+    for coding in available:
+        weight = weights.get(coding, weights.get("*", 0.0))
+        # Ties go to the earlier, better compressing coding
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
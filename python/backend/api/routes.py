@@ -2,21 +2,67 @@
 FastAPI route handlers for employee management.
 """
 
-from typing import List
-from fastapi import APIRouter, HTTPException, status
-from backend.models.schemas import EmployeeCreate, EmployeeUpdate, EmployeeResponse
-from backend.database import operations
+import csv
+import os
+import uuid
+from datetime import date
+from typing import List, Literal, Optional
+from urllib.parse import urlencode
+import anyio
+import anyio.to_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from backend.api.conditional import etag_matches, make_etag, not_modified, validator_headers
+from backend.api.dependencies import get_employee_repository
+from backend.api.events import RESYNC, employee_event, event_stream, get_broadcaster, publish_changes
+from backend.api.jobs import queue_job
+from backend.api.serialization import EMPLOYEE_ROWS, FastJSONResponse
+from backend.config import AppConfig, JobsConfig, SyncConfig
+from backend.models.schemas import (
+    BulkCreateResponse,
+    BulkDeleteRequest,
+    BulkMutationResponse,
+    BulkUpdateRequest,
+    EmployeeChanges,
+    EmployeeCreate,
+    EmployeePage,
+    EmployeeResponse,
+    EmployeeSearchResults,
+    EmployeeStats,
+    EmployeeSort,
+    EmployeeUpdate,
+    JobResponse,
+)
+from backend.database.async_operations import AsyncEmployeeRepository
+from backend.database.pool import PoolTimeoutError
+from backend.database.repository import DuplicateEmailError, SyncTokenExpiredError
+from backend.utils.export import EXPORT_MEDIA_TYPES, csv_chunks, ndjson_chunks
+from backend.utils.importer import ImportFormatError, read_header
+from backend.utils.pagination import InvalidCursorError, decode_cursor, decode_sync_token, encode_cursor
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
 
+def _created_employee(employee_id: int, employee: EmployeeCreate) -> dict:
+    """The stored form of a bulk-created employee, as Employee.to_dict returns it."""
+    data = employee.model_dump(mode="json")
+    if data["salary"] is not None:
+        # Mirror the DECIMAL(10, 2) column
+        data["salary"] = round(data["salary"], 2)
+    return {"id": employee_id, **data}
+
+
 @router.post("", response_model=EmployeeResponse, status_code=status.HTTP_201_CREATED)
-async def create_employee(employee: EmployeeCreate):
+async def create_employee(
+    employee: EmployeeCreate,
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
     """
     Create a new employee.
     
     Args:
         employee: Employee data from request body
+        repo: Employee repository for the configured backend
         
     Returns:
         Created employee object
@@ -26,18 +72,21 @@ async def create_employee(employee: EmployeeCreate):
     """
     try:
         employee_dict = employee.model_dump()
-        created_employee = operations.create_employee(employee_dict)
+        created_employee = await repo.create_employee(employee_dict)
         
         if created_employee:
+            publish_changes([employee_event("create", created_employee.id, created_employee.to_dict())])
             return EmployeeResponse(**created_employee.to_dict())
         else:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to create employee"
             )
+    except PoolTimeoutError:
+        raise
     except Exception as e:
         # Check for duplicate email error
-        if "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
+        if isinstance(e, DuplicateEmailError) or "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already exists"
@@ -48,17 +97,299 @@ async def create_employee(employee: EmployeeCreate):
         )
 
 
-@router.get("", response_model=List[EmployeeResponse])
-async def get_all_employees():
+@router.post("/bulk", response_model=BulkCreateResponse)
+async def bulk_create_employees(
+    employees: List[EmployeeCreate],
+    chunk_size: int = Query(AppConfig.BULK_CHUNK_SIZE, ge=1, le=5000, description="Rows per INSERT"),
+    transaction: Literal["chunk", "batch"] = Query(
+        "chunk", description="Commit per chunk, or once for the whole batch"
+    ),
+    abort_on_error: bool = Query(False, description="Roll back and stop at the first failure"),
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
     """
-    Retrieve all employees.
+    Create many employees in one request.
     
+    Args:
+        employees: Employees to create
+        chunk_size: Number of rows per multi-row INSERT
+        transaction: Transaction scope, per chunk or for the whole batch
+        abort_on_error: Stop at the first failed item instead of skipping it
+        repo: Employee repository for the configured backend
+        
     Returns:
-        List of all employee objects
+        Assigned ids per item and the items that failed
+        
+    Raises:
+        HTTPException: If the batch is too large or the insert fails
     """
+    if len(employees) > AppConfig.BULK_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {AppConfig.BULK_MAX_ITEMS} employees per request"
+        )
+
     try:
-        employees = operations.get_all_employees()
-        return [EmployeeResponse(**emp.to_dict()) for emp in employees]
+        result = await repo.bulk_create_employees(
+            [employee.model_dump() for employee in employees],
+            chunk_size=chunk_size,
+            single_transaction=transaction == "batch",
+            abort_on_error=abort_on_error,
+        )
+        created = sum(1 for employee_id in result["ids"] if employee_id is not None)
+        if created and get_broadcaster() is not None:
+            publish_changes([
+                employee_event("create", employee_id, _created_employee(employee_id, employee))
+                for employee_id, employee in zip(result["ids"], employees)
+                if employee_id is not None
+            ])
+        return BulkCreateResponse(created=created, **result)
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating employees: {str(e)}"
+        )
+
+
+@router.patch("/bulk", response_model=BulkMutationResponse)
+async def bulk_update_employees(
+    request: BulkUpdateRequest,
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
+    """
+    Update every employee matching an id list or filter in one statement.
+    
+    Args:
+        request: Selection, changes to apply and whether to return ids
+        repo: Employee repository for the configured backend
+        
+    Returns:
+        Number of affected employees and, if requested, their ids
+        
+    Raises:
+        HTTPException: If the update fails
+    """
+    try:
+        result = await repo.bulk_update_employees(
+            request.changes.model_dump(exclude_none=True),
+            ids=request.ids,
+            filters=request.filter.model_dump(exclude_none=True) if request.filter else None,
+            salary_factor=request.salary_factor,
+            return_ids=request.return_ids,
+        )
+        if result["affected"]:
+            # The new values of the matched rows are not read back
+            publish_changes([RESYNC])
+        return BulkMutationResponse(**result)
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error updating employees: {str(e)}"
+        )
+
+
+@router.delete("/bulk", response_model=BulkMutationResponse)
+async def bulk_delete_employees(
+    request: BulkDeleteRequest,
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
+    """
+    Delete every employee matching an id list or filter in one statement.
+    
+    Args:
+        request: Selection and whether to return ids
+        repo: Employee repository for the configured backend
+        
+    Returns:
+        Number of deleted employees and, if requested, their ids
+        
+    Raises:
+        HTTPException: If the deletion fails
+    """
+    try:
+        # Deleted ids are needed for the change events even when not requested
+        publishing = get_broadcaster() is not None
+        result = await repo.bulk_delete_employees(
+            ids=request.ids,
+            filters=request.filter.model_dump(exclude_none=True) if request.filter else None,
+            return_ids=request.return_ids or publishing,
+        )
+        if publishing and result["affected"]:
+            publish_changes([employee_event("delete", employee_id) for employee_id in result["ids"]])
+        if not request.return_ids:
+            result["ids"] = None
+        return BulkMutationResponse(**result)
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error deleting employees: {str(e)}"
+        )
+
+
+def _check_upload_header(upload_path: str) -> None:
+    """
+    Check the header row of an uploaded CSV file.
+    
+    Args:
+        upload_path: Path of the stored upload
+        
+    Raises:
+        ImportFormatError: If a required column is missing
+        UnicodeDecodeError: If the file is not UTF-8
+    """
+    with open(upload_path, encoding="utf-8-sig", newline="") as upload:
+        read_header(next(csv.reader(upload), []))
+
+
+@router.post("/import", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def import_employees(request: Request):
+    """
+    Import employees from a CSV upload in the background.
+    
+    The request body is the CSV file itself (Content-Type: text/csv), with a
+    header row naming at least the name and email columns. It is streamed to
+    JOBS_DIR, its header checked, and the import queued as an "import" job
+    whose progress is at GET /jobs/{job_id}; rejected rows end up in an error
+    report downloadable from GET /jobs/{job_id}/result.
+    
+    Args:
+        request: Incoming request carrying the CSV body
+        
+    Returns:
+        The queued job, with its status URL in the Location header
+        
+    Raises:
+        HTTPException: If the upload is too large, empty, not UTF-8 or lacks
+            a required column
+    """
+    os.makedirs(JobsConfig.DIR, exist_ok=True)
+    upload_path = os.path.join(JobsConfig.DIR, f"upload-{uuid.uuid4().hex}.csv")
+    try:
+        size = 0
+        # File I/O runs in worker threads so a slow disk does not stall the event loop
+        async with await anyio.open_file(upload_path, "wb") as upload:
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > AppConfig.IMPORT_MAX_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Imports are limited to {AppConfig.IMPORT_MAX_BYTES} bytes"
+                    )
+                await upload.write(chunk)
+        await anyio.to_thread.run_sync(_check_upload_header, upload_path)
+        return await queue_job("import", {"upload": upload_path})
+    except (ImportFormatError, UnicodeDecodeError) as e:
+        os.remove(upload_path)
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Cannot import file: {e}")
+    except BaseException:
+        os.remove(upload_path)
+        raise
+
+
+@router.get("", response_model=EmployeePage)
+async def get_all_employees(
+    request: Request,
+    limit: int = Query(AppConfig.PAGE_SIZE_DEFAULT, ge=1, le=AppConfig.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
+    after_id: Optional[int] = Query(None, ge=1, description="Return employees past this id (id sorts only)"),
+    department: Optional[str] = Query(None, max_length=50),
+    position: Optional[str] = Query(None, max_length=50),
+    salary_min: Optional[float] = Query(None, ge=0),
+    salary_max: Optional[float] = Query(None, ge=0),
+    hired_after: Optional[date] = Query(None, description="Hired on or after this date"),
+    hired_before: Optional[date] = Query(None, description="Hired on or before this date"),
+    sort: EmployeeSort = Query("-id", description='Sort key; a leading "-" means descending'),
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
+    """
+    Retrieve employees one page at a time, filtered and sorted on the server.
+    
+    The ETag is derived from the collection version, so a client whose
+    If-None-Match is still current gets a 304 before any row is read.
+    
+    Args:
+        request: Incoming request, for If-None-Match and the query string
+        limit: Maximum number of employees per page
+        cursor: Opaque cursor returned as next_cursor by the previous page
+        after_id: Raw keyset position, an alternative to cursor for id sorts
+        department: Only employees in this department
+        position: Only employees with this position
+        salary_min: Only employees earning at least this amount
+        salary_max: Only employees earning at most this amount
+        hired_after: Only employees hired on or after this date
+        hired_before: Only employees hired on or before this date
+        sort: Sort key, newest first (-id) by default
+        repo: Employee repository for the configured backend
+        
+    Returns:
+        Page of employee objects and the cursor for the next page
+        
+    Raises:
+        HTTPException: If the cursor is invalid or does not match the sort
+    """
+    if cursor is not None and after_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either cursor or after_id, not both"
+        )
+
+    after = None
+    if after_id is not None:
+        if sort.lstrip("-") != "id":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="after_id only works with sort=id or sort=-id; use cursor"
+            )
+        after = {"id": after_id}
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if not isinstance(after.get("v"), (str, int, float, type(None))):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        # Cursors issued before sorting existed carry no sort key
+        if after.get("s", "-id") != sort:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cursor was issued for a different sort order"
+            )
+
+    filters = {
+        "department": department,
+        "position": position,
+        "salary_min": salary_min,
+        "salary_max": salary_max,
+        "hired_after": hired_after,
+        "hired_before": hired_before,
+    }
+
+    try:
+        version = await repo.get_collection_version()
+        # Every page shares the collection version; the normalized query
+        # string tells pages apart
+        etag = make_etag(
+            "employees",
+            version["last_modified"],
+            version["count"],
+            version["write_version"],
+            urlencode(sorted(request.query_params.multi_items())),
+        )
+        headers = validator_headers(etag, version["last_modified"])
+        if etag_matches(request, etag):
+            return not_modified(headers)
+
+        rows, next_position = await repo.get_employee_rows_page(limit, after, filters, sort)
+        next_cursor = encode_cursor({**next_position, "s": sort}) if next_position is not None else None
+        return FastJSONResponse(content=EMPLOYEE_ROWS.encode_page(rows, next_cursor), headers=headers)
+    except PoolTimeoutError:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -66,30 +397,213 @@ async def get_all_employees():
         )
 
 
+@router.get("/export")
+async def export_employees(
+    format: Literal["ndjson", "csv"] = Query("ndjson"),
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
+    """
+    Stream every employee as NDJSON or CSV.
+    
+    Rows are read from an unbuffered cursor and encoded batch by batch, so
+    memory use does not grow with the size of the table.
+    
+    Args:
+        format: Output format, either ndjson or csv
+        repo: Employee repository for the configured backend
+        
+    Returns:
+        Streaming response with the encoded employees
+    """
+    batches = repo.sync.iter_employee_batches(AppConfig.EXPORT_BATCH_SIZE)
+    encoder = csv_chunks if format == "csv" else ndjson_chunks
+    return StreamingResponse(
+        encoder(batches),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="employees.{format}"'}
+    )
+
+
+@router.get("/changes", response_model=EmployeeChanges)
+async def get_employee_changes(
+    since: Optional[str] = Query(None, description="next_token of the previous read; omit for a full sync"),
+    limit: int = Query(SyncConfig.LIMIT_DEFAULT, ge=1, le=SyncConfig.LIMIT_MAX),
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
+    """
+    Incremental sync: employees created or updated, and ids deleted, since a token.
+    
+    Apply items, then deleted, and keep next_token for the next read; read
+    again right away while has_more is true. Reads follow the updated_at and
+    deleted_at indexes, so their cost depends on the number of changes, not
+    on the size of the table.
+    
+    Args:
+        since: Token returned by the previous read
+        limit: Maximum number of changed employees, and of deleted ids, per read
+        repo: Employee repository for the configured backend
+        
+    Returns:
+        Changed employees, deleted ids and the next token
+        
+    Raises:
+        HTTPException: 400 if the token is invalid, 410 if it is older than
+            the tombstone retention and the client must resync without one
+    """
+    position = None
+    if since is not None:
+        try:
+            position = decode_sync_token(since)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    try:
+        changes = await repo.get_changes(position, limit)
+        return FastJSONResponse(
+            content=EMPLOYEE_ROWS.encode_changes(
+                changes["rows"], changes["deleted"], encode_cursor(changes["next"]), changes["has_more"]
+            )
+        )
+    except SyncTokenExpiredError:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Sync token expired; resync by omitting since"
+        )
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving employee changes: {str(e)}"
+        )
+
+
+@router.get("/stream")
+async def stream_employee_changes():
+    """
+    Live change feed as Server-Sent Events.
+    
+    "changes" events carry a JSON list of {type, id, employee} objects, type
+    being create, update or delete (deletes carry no employee); apply them in
+    order. Changes to the same employee are coalesced while the client is
+    behind. A "resync" event means changes were not delivered individually
+    (bulk updates, or a client too slow to keep up) and the list must be
+    reloaded.
+    
+    Returns:
+        text/event-stream response open until the client disconnects
+        
+    Raises:
+        HTTPException: If the change stream is disabled
+    """
+    broadcaster = get_broadcaster()
+    if broadcaster is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Change stream is disabled")
+    return StreamingResponse(
+        event_stream(broadcaster),
+        media_type="text/event-stream",
+        # X-Accel-Buffering stops nginx from holding events back
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/search", response_model=EmployeeSearchResults)
+async def search_employees(
+    q: str = Query(..., min_length=2, max_length=100, description="Text to find in name, email, department or position"),
+    limit: int = Query(AppConfig.SEARCH_LIMIT_DEFAULT, ge=1, le=AppConfig.SEARCH_LIMIT_MAX),
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
+    """
+    Type-ahead search over name, email, department and position.
+    
+    Args:
+        q: Search text; every whitespace-separated term must match
+        limit: Maximum number of employees to return
+        repo: Employee repository for the configured backend
+        
+    Returns:
+        Matching employees, best match first
+    """
+    try:
+        rows = await repo.search_employee_rows(q, limit)
+        return FastJSONResponse(content=EMPLOYEE_ROWS.encode_items(rows))
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error searching employees: {str(e)}"
+        )
+
+
+@router.get("/stats", response_model=EmployeeStats)
+async def get_employee_stats(
+    by: Literal["department", "position", "hire_month"] = Query("department", description="Grouping dimension"),
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
+    """
+    Headcount and salary aggregates per department, position or hire month.
+    
+    Served from the incrementally maintained summary table, so the cost
+    depends on the number of groups, not the number of employees.
+    
+    Args:
+        by: Grouping dimension
+        repo: Employee repository for the configured backend
+        
+    Returns:
+        Aggregates per group
+    """
+    try:
+        groups = await repo.get_employee_stats(by)
+        return FastJSONResponse(content={"by": by, "groups": groups})
+    except PoolTimeoutError:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving employee stats: {str(e)}"
+        )
+
+
 @router.get("/{employee_id}", response_model=EmployeeResponse)
-async def get_employee(employee_id: int):
+async def get_employee(
+    employee_id: int,
+    request: Request,
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
     """
     Retrieve a single employee by ID.
     
+    The ETag covers updated_at and the response body, since updated_at
+    alone only has one-second resolution.
+    
     Args:
         employee_id: Unique employee identifier
+        request: Incoming request, for If-None-Match
+        repo: Employee repository for the configured backend
         
     Returns:
-        Employee object
+        Employee object, or 304 if the client's copy is current
         
     Raises:
         HTTPException: If employee not found
     """
     try:
-        employee = operations.get_employee(employee_id)
+        employee = await repo.get_employee(employee_id)
         if employee:
-            return EmployeeResponse(**employee.to_dict())
+            response = FastJSONResponse(content=employee.to_dict())
+            headers = validator_headers(make_etag(employee.updated_at, response.body), employee.updated_at)
+            if etag_matches(request, headers["ETag"]):
+                return not_modified(headers)
+            response.headers.update(headers)
+            return response
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Employee with ID {employee_id} not found"
             )
-    except HTTPException:
+    except (HTTPException, PoolTimeoutError):
         raise
     except Exception as e:
         raise HTTPException(
@@ -99,13 +613,18 @@ async def get_employee(employee_id: int):
 
 
 @router.put("/{employee_id}", response_model=EmployeeResponse)
-async def update_employee(employee_id: int, employee: EmployeeUpdate):
+async def update_employee(
+    employee_id: int,
+    employee: EmployeeUpdate,
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
     """
     Update an existing employee.
     
     Args:
         employee_id: Unique employee identifier
         employee: Employee data to update
+        repo: Employee repository for the configured backend
         
     Returns:
         Updated employee object
@@ -114,30 +633,23 @@ async def update_employee(employee_id: int, employee: EmployeeUpdate):
         HTTPException: If employee not found or update fails
     """
     try:
-        # Check if employee exists
-        existing_employee = operations.get_employee(employee_id)
-        if not existing_employee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Employee with ID {employee_id} not found"
-            )
-        
         # Get only non-None fields from the update request
         update_data = employee.model_dump(exclude_unset=True)
-        updated_employee = operations.update_employee(employee_id, update_data)
+        updated_employee = await repo.update_employee(employee_id, update_data)
         
         if updated_employee:
+            publish_changes([employee_event("update", employee_id, updated_employee.to_dict())])
             return EmployeeResponse(**updated_employee.to_dict())
         else:
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to update employee"
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Employee with ID {employee_id} not found"
             )
-    except HTTPException:
+    except (HTTPException, PoolTimeoutError):
         raise
     except Exception as e:
         # Check for duplicate email error
-        if "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
+        if isinstance(e, DuplicateEmailError) or "Duplicate entry" in str(e) or "UNIQUE constraint" in str(e):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already exists"
@@ -149,32 +661,29 @@ async def update_employee(employee_id: int, employee: EmployeeUpdate):
 
 
 @router.delete("/{employee_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_employee(employee_id: int):
+async def delete_employee(
+    employee_id: int,
+    repo: AsyncEmployeeRepository = Depends(get_employee_repository),
+):
     """
     Delete an employee.
     
     Args:
         employee_id: Unique employee identifier
+        repo: Employee repository for the configured backend
         
     Raises:
         HTTPException: If employee not found or deletion fails
     """
     try:
-        # Check if employee exists
-        existing_employee = operations.get_employee(employee_id)
-        if not existing_employee:
+        deleted = await repo.delete_employee(employee_id)
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Employee with ID {employee_id} not found"
             )
-        
-        success = operations.delete_employee(employee_id)
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to delete employee"
-            )
-    except HTTPException:
+        publish_changes([employee_event("delete", employee_id)])
+    except (HTTPException, PoolTimeoutError):
         raise
     except Exception as e:
         raise HTTPException(
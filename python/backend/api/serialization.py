@@ -0,0 +1,81 @@
+"""
+Fast JSON encoding for employee list responses.
+
+Rows from operations.get_employee_rows_page are already trusted and
+JSON-ready, so they are mapped straight to response objects through a
+precomputed column layout and encoded in a single pass, skipping the
+Employee model and Pydantic re-validation. The output is byte-identical
+to serializing EmployeePage through FastAPI's JSONResponse.
+"""
+
+import json
+from operator import itemgetter
+from typing import Any, List, Optional, Sequence
+
+from fastapi.responses import JSONResponse
+
+from backend.database.queries import EMPLOYEE_COLUMNS
+from backend.models.schemas import EmployeeResponse
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content as compact UTF-8 JSON.
+
+    Uses orjson when installed; otherwise the standard library with the
+    same settings as FastAPI's JSONResponse.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that passes pre-encoded bytes through untouched."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+class RowLayout:
+    """Precomputed mapping from SELECT column order to response field order."""
+
+    def __init__(self, columns: Sequence[str], fields: Sequence[str]):
+        self.fields = tuple(fields)
+        self._getter = itemgetter(*(columns.index(field) for field in self.fields))
+
+    def to_objects(self, rows: Sequence[Sequence[Any]]) -> List[dict]:
+        """Map rows to dictionaries keyed in response field order."""
+        fields, getter = self.fields, self._getter
+        return [dict(zip(fields, getter(row))) for row in rows]
+
+    def encode_items(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Encode rows as a body with a single items list."""
+        return dumps({"items": self.to_objects(rows)})
+
+    def encode_page(self, rows: Sequence[Sequence[Any]], next_cursor: Optional[str]) -> bytes:
+        """Encode rows and the next cursor as an EmployeePage body."""
+        return dumps({"items": self.to_objects(rows), "next_cursor": next_cursor})
+
+    def encode_changes(
+        self, rows: Sequence[Sequence[Any]], deleted: List[int], next_token: str, has_more: bool
+    ) -> bytes:
+        """Encode changed rows, deleted ids and the next token as an EmployeeChanges body."""
+        return dumps({
+            "items": self.to_objects(rows),
+            "deleted": deleted,
+            "next_token": next_token,
+            "has_more": has_more,
+        })
+
+
+EMPLOYEE_ROWS = RowLayout(EMPLOYEE_COLUMNS, list(EmployeeResponse.model_fields))
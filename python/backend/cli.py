@@ -0,0 +1,152 @@
+"""
+Maintenance commands.
+
+    python -m backend.cli migrate
+    python -m backend.cli rebuild-summary
+    python -m backend.cli purge-tombstones [--older-than SECONDS]
+    python -m backend.cli import FILE [--report PATH] [--batch-size N]
+    python -m backend.cli run-jobs [--mode thread|process] [--workers N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from backend.config import AppConfig, DatabaseConfig, JobsConfig, SyncConfig
+from backend.database.repository import get_repository
+
+
+def migrate(args: argparse.Namespace) -> None:
+    """Apply the schema even if the recorded schema version is current."""
+    if DatabaseConfig.BACKEND != "mysql":
+        print(f"DB_BACKEND={DatabaseConfig.BACKEND} has no recorded schema version; nothing to do")
+        return
+    from backend.database.connection import DatabaseConnection
+
+    DatabaseConnection.create_tables()
+
+
+def rebuild_summary(args: argparse.Namespace) -> None:
+    """Recompute the employee summary table from the employees table."""
+    groups = get_repository().rebuild_employee_summary()
+    print(f"Employee summary rebuilt: {json.dumps(groups)}")
+
+
+def purge_tombstones(args: argparse.Namespace) -> None:
+    """Delete change feed tombstones older than the retention window."""
+    purged = get_repository().purge_tombstones(args.older_than)
+    print(f"Purged {purged} employee tombstones")
+
+
+def import_file(args: argparse.Namespace) -> None:
+    """Import employees from a CSV file, writing rejected rows to an error report."""
+    from backend.utils.importer import ImportFormatError, import_employees
+
+    report_path = args.report or (
+        "import-errors.csv" if args.file == "-" else f"{os.path.splitext(args.file)[0]}.errors.csv"
+    )
+    repository = get_repository()
+    repository.initialize()
+    started = time.perf_counter()
+
+    def on_batch(counts, line):
+        print(f"{counts['rows']} rows: {counts['created']} created, {counts['failed']} rejected", end="\r")
+
+    source = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8-sig", newline="")
+    try:
+        with open(report_path, "w", encoding="utf-8", newline="") as report:
+            counts = import_employees(
+                repository, source, report, batch_size=args.batch_size, chunk_size=AppConfig.BULK_CHUNK_SIZE,
+                on_batch=on_batch,
+            )
+    except ImportFormatError as e:
+        os.remove(report_path)
+        sys.exit(f"Cannot import {args.file}: {e}")
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        repository.close()
+
+    elapsed = time.perf_counter() - started
+    # Ends the progress line
+    print()
+    print(f"Imported {counts['created']} of {counts['rows']} rows in {elapsed:.1f}s"
+          f" ({counts['rows'] / elapsed if elapsed else 0:.0f} rows/s)")
+    if counts["failed"]:
+        print(f"{counts['failed']} rows rejected; see {report_path}")
+    else:
+        os.remove(report_path)
+
+
+def run_jobs(args: argparse.Namespace) -> None:
+    """Run queued jobs without serving the API, until interrupted."""
+    from backend.jobs.runner import JobRunner
+    from backend.jobs.store import get_job_store
+
+    repository = get_repository()
+    repository.initialize()
+
+    async def serve() -> None:
+        runner = JobRunner(
+            get_job_store(), args.mode, args.workers, JobsConfig.POLL_SECONDS, JobsConfig.STALE_SECONDS,
+            JobsConfig.RETENTION_SECONDS,
+        )
+        runner.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        repository.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Employee service maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser(
+        "migrate", help="Recreate missing tables and indexes, e.g. after changing the schema by hand"
+    ).set_defaults(handler=migrate)
+    commands.add_parser(
+        "rebuild-summary", help="Recompute employee_summary, e.g. after loading data outside the API"
+    ).set_defaults(handler=rebuild_summary)
+    purge = commands.add_parser(
+        "purge-tombstones", help="Delete change feed tombstones, e.g. from cron with SYNC_PURGE_INTERVAL_SECONDS=0"
+    )
+    purge.add_argument(
+        "--older-than", type=float, default=SyncConfig.TOMBSTONE_RETENTION_SECONDS,
+        help="Age in seconds beyond which tombstones are deleted (default: SYNC_TOMBSTONE_RETENTION_SECONDS)",
+    )
+    purge.set_defaults(handler=purge_tombstones)
+    importer = commands.add_parser(
+        "import", help="Import employees from a CSV file with a header row, e.g. an HR export"
+    )
+    importer.add_argument("file", help='CSV file, or "-" for standard input')
+    importer.add_argument(
+        "--report", help="Where to write rejected rows (default: FILE with .errors.csv, if any row fails)"
+    )
+    importer.add_argument(
+        "--batch-size", type=int, default=AppConfig.IMPORT_BATCH_SIZE,
+        help="Rows validated and inserted at a time (default: IMPORT_BATCH_SIZE)",
+    )
+    importer.set_defaults(handler=import_file)
+    jobs = commands.add_parser(
+        "run-jobs", help="Run queued jobs, e.g. on a host of its own with JOBS_ENABLED=false on the API servers"
+    )
+    jobs.add_argument("--mode", choices=("thread", "process"), default=JobsConfig.MODE, help="default: JOBS_MODE")
+    jobs.add_argument("--workers", type=int, default=JobsConfig.WORKERS, help="Jobs run at once (default: JOBS_WORKERS)")
+    jobs.set_defaults(handler=run_jobs)
+
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
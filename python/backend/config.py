@@ -3,6 +3,7 @@ Configuration settings for the application.
 """
 
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -12,11 +13,69 @@ load_dotenv()
 class DatabaseConfig:
     """Database configuration settings."""
     
+    # Storage backend: "mysql", "sqlite" (file at SQLITE_PATH) or "memory"
+    BACKEND = os.getenv("DB_BACKEND", "mysql").lower()
+    SQLITE_PATH = os.getenv("DB_SQLITE_PATH", "employees.sqlite3")
+    # SQLite files standing in for read replicas when testing routing locally;
+    # nothing copies writes to them
+    SQLITE_REPLICA_PATHS = [path.strip() for path in os.getenv("DB_SQLITE_REPLICA_PATHS", "").split(",") if path.strip()]
     HOST = os.getenv("DB_HOST", "localhost")
     PORT = int(os.getenv("DB_PORT", 3306))
     USER = os.getenv("DB_USER", "root")
     PASSWORD = os.getenv("DB_PASSWORD", "")
     DATABASE = os.getenv("DB_NAME", "employee_db")
+    # Connection pool sizing and health checks
+    POOL_MIN_SIZE = int(os.getenv("DB_POOL_MIN_SIZE", 1))
+    POOL_MAX_SIZE = int(os.getenv("DB_POOL_MAX_SIZE", os.getenv("DB_POOL_SIZE", 5)))
+    # Connections allowed across all server workers; each worker's pool gets an
+    # equal share instead of DB_POOL_MAX_SIZE. 0 keeps DB_POOL_MAX_SIZE per worker
+    POOL_TOTAL_SIZE = int(os.getenv("DB_POOL_TOTAL_SIZE", 0))
+    POOL_ACQUIRE_TIMEOUT = float(os.getenv("DB_POOL_ACQUIRE_TIMEOUT", 10))
+    POOL_MAX_LIFETIME = float(os.getenv("DB_POOL_MAX_LIFETIME", 1800))
+    POOL_PING_IDLE_SECONDS = float(os.getenv("DB_POOL_PING_IDLE_SECONDS", 30))
+    POOL_RESET_SESSION = os.getenv("DB_POOL_RESET_SESSION", "False").lower() == "true"
+    # Driver mode: pure-Python protocol, or the C extension when false
+    USE_PURE = os.getenv("DB_USE_PURE", "True").lower() == "true"
+    # Run fixed queries through cached server-side prepared statements
+    PREPARED_STATEMENTS = os.getenv("DB_PREPARED_STATEMENTS", "False").lower() == "true"
+    # Run blocking queries on worker threads instead of the event loop
+    ASYNC = os.getenv("DB_ASYNC", "True").lower() == "true"
+    # Seconds a worker waits for another worker to finish the startup DDL
+    SCHEMA_LOCK_TIMEOUT = int(os.getenv("DB_SCHEMA_LOCK_TIMEOUT", 60))
+    # Read replicas as "host[:port],..." (same user, password and database);
+    # reads go to them and writes to DB_HOST
+    REPLICA_HOSTS = [host.strip() for host in os.getenv("DB_REPLICA_HOSTS", "").split(",") if host.strip()]
+    # Connections per replica; defaults to the primary pool's size
+    REPLICA_POOL_MAX_SIZE = int(os.getenv("DB_REPLICA_POOL_MAX_SIZE", 0))
+    # Replicas further behind than this serve no reads until they catch up
+    REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", 5))
+    # How often replica lag is sampled; 0 trusts replicas without checking lag
+    REPLICA_CHECK_SECONDS = float(os.getenv("DB_REPLICA_CHECK_SECONDS", 2))
+    # After a client's write its reads go to the primary this long; 0 disables it
+    READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", 5))
+    
+    @classmethod
+    def pool_max_size(cls) -> int:
+        """Get the pool size of this worker, its share of DB_POOL_TOTAL_SIZE if set."""
+        if cls.POOL_TOTAL_SIZE > 0:
+            return max(1, cls.POOL_TOTAL_SIZE // ServerConfig.WORKERS)
+        return cls.POOL_MAX_SIZE
+    
+    @classmethod
+    def replica_addresses(cls) -> list:
+        """Get (host, port) of every configured replica."""
+        addresses = []
+        for entry in cls.REPLICA_HOSTS:
+            host, _, port = entry.partition(":")
+            addresses.append((host, int(port) if port else cls.PORT))
+        return addresses
+    
+    @classmethod
+    def has_replicas(cls) -> bool:
+        """Check whether reads of the configured backend are routed to replicas."""
+        if cls.BACKEND == "mysql":
+            return bool(cls.REPLICA_HOSTS)
+        return cls.BACKEND == "sqlite" and bool(cls.SQLITE_REPLICA_PATHS)
     
     @classmethod
     def get_connection_string(cls) -> dict:
@@ -30,9 +89,123 @@ class DatabaseConfig:
         }
 
 
+class CacheConfig:
+    """Employee cache configuration settings."""
+    
+    # "memory" (in-process LRU), "shared" (Redis-compatible store) or "none"
+    BACKEND = os.getenv("CACHE_BACKEND", "memory").lower()
+    MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", 10000))
+    TTL_SECONDS = float(os.getenv("CACHE_TTL_SECONDS", 60))
+    # Shared store URL; without it the shared backend uses an in-process stand-in
+    SHARED_URL = os.getenv("CACHE_SHARED_URL", "")
+
+
+class ProfilerConfig:
+    """Query profiler configuration settings."""
+    
+    # Time the statements run by the operations module
+    ENABLED = os.getenv("QUERY_PROFILER_ENABLED", "True").lower() == "true"
+    # Statements taking longer than this are logged
+    SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", 100))
+    # Capture EXPLAIN FORMAT=JSON the first time each normalized statement runs
+    EXPLAIN = os.getenv("QUERY_PROFILER_EXPLAIN", "True").lower() == "true"
+    # Distinct normalized statements tracked; further ones are not profiled
+    MAX_STATEMENTS = int(os.getenv("QUERY_PROFILER_MAX_STATEMENTS", 500))
+    # Slow executions kept for GET /debug/queries
+    RECENT_SLOW = int(os.getenv("QUERY_PROFILER_RECENT_SLOW", 50))
+
+
+class SyncConfig:
+    """Change feed (GET /employees/changes) configuration settings."""
+    
+    # Rows stamped within this many seconds of now are left for the next read,
+    # so a write whose transaction commits late is not skipped
+    LAG_SECONDS = int(os.getenv("SYNC_LAG_SECONDS", 2))
+    # Deletes stay visible this long; older tokens get 410 Gone and must resync
+    TOMBSTONE_RETENTION_SECONDS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_SECONDS", 7 * 24 * 3600))
+    # How often expired tombstones are purged in the background; 0 disables it
+    PURGE_INTERVAL_SECONDS = float(os.getenv("SYNC_PURGE_INTERVAL_SECONDS", 3600))
+    PURGE_BATCH_SIZE = int(os.getenv("SYNC_PURGE_BATCH_SIZE", 1000))
+    LIMIT_DEFAULT = int(os.getenv("SYNC_LIMIT_DEFAULT", 500))
+    LIMIT_MAX = int(os.getenv("SYNC_LIMIT_MAX", 5000))
+
+
+class EventsConfig:
+    """Change stream (GET /employees/stream) configuration settings."""
+    
+    # Publish employee changes and serve the Server-Sent Events stream
+    ENABLED = os.getenv("EVENTS_ENABLED", "True").lower() == "true"
+    # "local" (this process only) or "shared" (Redis pub/sub, for several workers)
+    FANOUT = os.getenv("EVENTS_FANOUT", "local").lower()
+    # Redis URL for the shared fan-out; defaults to the shared cache's store
+    SHARED_URL = os.getenv("EVENTS_SHARED_URL", os.getenv("CACHE_SHARED_URL", ""))
+    CHANNEL = os.getenv("EVENTS_CHANNEL", "employee-events")
+    # Events arriving within this window after the first go out as one message
+    BATCH_MS = float(os.getenv("EVENTS_BATCH_MS", 100))
+    # Distinct pending changes per connection before it is told to resync
+    QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", 1000))
+    # Idle streams get a comment line this often so proxies keep them open
+    HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", 15))
+
+
+class JobsConfig:
+    """Background job (POST /api/jobs) configuration settings."""
+    
+    # Run queued jobs in this process; with false it only queues them, for
+    # another server worker or python -m backend.cli run-jobs to pick up
+    ENABLED = os.getenv("JOBS_ENABLED", "True").lower() == "true"
+    # "thread" or "process" (a process per worker slot, so CPU-bound work such
+    # as import validation does not compete with requests for the GIL)
+    MODE = os.getenv("JOBS_MODE", "thread").lower()
+    # Jobs this process runs at the same time
+    WORKERS = int(os.getenv("JOBS_WORKERS", 2))
+    # Seconds between looks at the queue, heartbeats and stale-job checks
+    POLL_SECONDS = float(os.getenv("JOBS_POLL_SECONDS", 1))
+    # Attempts of a job that keeps failing; retries wait RETRY_BACKOFF_SECONDS,
+    # doubling per attempt up to RETRY_BACKOFF_MAX_SECONDS
+    MAX_ATTEMPTS = int(os.getenv("JOBS_MAX_ATTEMPTS", 3))
+    RETRY_BACKOFF_SECONDS = float(os.getenv("JOBS_RETRY_BACKOFF_SECONDS", 5))
+    RETRY_BACKOFF_MAX_SECONDS = float(os.getenv("JOBS_RETRY_BACKOFF_MAX_SECONDS", 300))
+    # A running job without a heartbeat for this long lost its process and is requeued
+    STALE_SECONDS = float(os.getenv("JOBS_STALE_SECONDS", 60))
+    # Where uploads, error reports and exports are kept, and for how long after
+    # their job finished; shared storage if several hosts run jobs
+    DIR = os.getenv("JOBS_DIR", os.path.join(tempfile.gettempdir(), "employee-jobs"))
+    RETENTION_SECONDS = float(os.getenv("JOBS_RETENTION_SECONDS", 86400))
+
+
+class ServerConfig:
+    """Settings of the server launcher (python -m backend.server)."""
+    
+    HOST = os.getenv("SERVER_HOST", "0.0.0.0")
+    PORT = int(os.getenv("SERVER_PORT", 8000))
+    # Worker processes; the launcher exports it so every worker knows its pool share.
+    # WEB_CONCURRENCY is also what uvicorn --workers defaults to
+    WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", 1)))
+    # Seconds a shutdown waits for open requests, streams and pooled connections
+    GRACEFUL_SHUTDOWN_SECONDS = int(os.getenv("SERVER_GRACEFUL_SHUTDOWN_SECONDS", 10))
+
+
 class AppConfig:
     """Application configuration settings."""
     
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
     API_PREFIX = "/api"
     CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    PAGE_SIZE_DEFAULT = int(os.getenv("PAGE_SIZE_DEFAULT", 100))
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", 1000))
+    EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+    SEARCH_LIMIT_DEFAULT = int(os.getenv("SEARCH_LIMIT_DEFAULT", 10))
+    SEARCH_LIMIT_MAX = int(os.getenv("SEARCH_LIMIT_MAX", 50))
+    BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 20000))
+    BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", 500))
+    # CSV imports: rows validated and inserted per batch, and the upload size limit
+    IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))
+    IMPORT_MAX_BYTES = int(os.getenv("IMPORT_MAX_BYTES", 200 * 1024 * 1024))
+    # Record request, query and pool metrics and serve them on /metrics
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "True").lower() == "true"
+    # Compress JSON, NDJSON and CSV responses of at least this many bytes with br or gzip
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "True").lower() == "true"
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+    # Seconds between the database checks behind /readyz and /health
+    HEALTH_CHECK_INTERVAL_SECONDS = float(os.getenv("HEALTH_CHECK_INTERVAL_SECONDS", 5))
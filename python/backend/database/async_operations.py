@@ -0,0 +1,127 @@
+"""
+Async access to the employee repository.
+
+The storage backends are blocking, so each call runs on a worker thread while
+the event loop keeps serving other requests. Admission is gated by a capacity
+limiter sized to the connection pool: excess callers wait asynchronously for a
+free slot instead of tying up threads or exhausting the pool.
+"""
+
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import anyio
+import anyio.to_thread
+
+from backend.config import DatabaseConfig
+from backend.database.queries import DEFAULT_LIST_SORT
+from backend.database.repository import EmployeeRepository, get_repository
+from backend.models.employee import Employee
+
+T = TypeVar("T")
+
+_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_limiter() -> anyio.CapacityLimiter:
+    """Create the limiter lazily so it binds to the running event loop."""
+    global _limiter
+    if _limiter is None:
+        _limiter = anyio.CapacityLimiter(DatabaseConfig.pool_max_size())
+    return _limiter
+
+
+async def run_db(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking database function without blocking the event loop.
+
+    When DB_ASYNC is disabled the function is called inline, which restores
+    the previous synchronous behaviour.
+
+    Args:
+        func: Blocking function, usually a repository method
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    if not DatabaseConfig.ASYNC:
+        return func(*args, **kwargs)
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=_get_limiter()
+    )
+
+
+class AsyncEmployeeRepository:
+    """Awaitable front of an EmployeeRepository; each call goes through run_db."""
+
+    def __init__(self, repository: EmployeeRepository):
+        self.sync = repository
+
+    async def create_employee(self, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        return await run_db(self.sync.create_employee, employee_data)
+
+    async def bulk_create_employees(self, employees_data: List[Dict[str, Any]], **options: Any) -> Dict[str, Any]:
+        return await run_db(self.sync.bulk_create_employees, employees_data, **options)
+
+    async def bulk_update_employees(self, employee_data: Dict[str, Any], **selection: Any) -> Dict[str, Any]:
+        return await run_db(self.sync.bulk_update_employees, employee_data, **selection)
+
+    async def bulk_delete_employees(self, **selection: Any) -> Dict[str, Any]:
+        return await run_db(self.sync.bulk_delete_employees, **selection)
+
+    async def get_employee(self, employee_id: int) -> Optional[Employee]:
+        return await run_db(self.sync.get_employee, employee_id)
+
+    async def get_all_employees(self) -> List[Employee]:
+        return await run_db(self.sync.get_all_employees)
+
+    async def get_employee_rows_page(
+        self,
+        limit: int,
+        after: Optional[Dict[str, Any]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_LIST_SORT,
+    ) -> Tuple[List[List[Any]], Optional[Dict[str, Any]]]:
+        return await run_db(self.sync.get_employee_rows_page, limit, after, filters, sort)
+
+    async def get_employees_page(
+        self, limit: int, after_id: Optional[int] = None, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Employee], Optional[int]]:
+        return await run_db(self.sync.get_employees_page, limit, after_id, filters)
+
+    async def get_collection_version(self) -> Dict[str, Any]:
+        return await run_db(self.sync.get_collection_version)
+
+    async def get_changes(self, since: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        return await run_db(self.sync.get_changes, since, limit)
+
+    async def purge_tombstones(self, older_than_seconds: float) -> int:
+        return await run_db(self.sync.purge_tombstones, older_than_seconds)
+
+    async def search_employee_rows(self, query: str, limit: int = 10) -> List[List[Any]]:
+        return await run_db(self.sync.search_employee_rows, query, limit)
+
+    async def get_employee_stats(self, dimension: str) -> List[Dict[str, Any]]:
+        return await run_db(self.sync.get_employee_stats, dimension)
+
+    async def update_employee(self, employee_id: int, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        return await run_db(self.sync.update_employee, employee_id, employee_data)
+
+    async def delete_employee(self, employee_id: int) -> bool:
+        return await run_db(self.sync.delete_employee, employee_id)
+
+    async def test_connection(self) -> bool:
+        return await run_db(self.sync.test_connection)
+
+
+_async_repository: Optional[AsyncEmployeeRepository] = None
+
+
+def get_async_repository() -> AsyncEmployeeRepository:
+    """Return the async front of the process-wide repository."""
+    global _async_repository
+    if _async_repository is None or _async_repository.sync is not get_repository():
+        _async_repository = AsyncEmployeeRepository(get_repository())
+    return _async_repository
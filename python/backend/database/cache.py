@@ -0,0 +1,276 @@
+"""
+Read-through cache for employee lookups.
+
+Single employees are cached by id and list results by their query
+parameters. Every write bumps a shared write version that is part of each
+list key, so list entries are invalidated wholesale while single employees
+are invalidated precisely by id.
+"""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from backend.config import CacheConfig
+
+
+class CacheBackend(ABC):
+    """Storage interface for cache entries and version counters."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-compatible value for ttl seconds."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+
+    @abstractmethod
+    def get_version(self, name: str) -> int:
+        """Return the current value of a version counter."""
+
+    @abstractmethod
+    def bump_version(self, name: str) -> int:
+        """Increment a version counter and return the new value."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters."""
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process LRU cache with a per-entry TTL."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Versions live outside the LRU so they can never be evicted
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def get_version(self, name: str) -> int:
+        return self._versions.get(name, 0)
+
+    def bump_version(self, name: str) -> int:
+        with self._lock:
+            self._versions[name] = self._versions.get(name, 0) + 1
+            return self._versions[name]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                **self._counters,
+            }
+
+
+class LocalStore:
+    """
+    Thread-safe in-process stand-in for a shared key-value store.
+
+    Implements the small subset of the Redis client API used by
+    SharedStoreBackend, so the shared code path can run without a server.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(name)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[name]
+                return None
+            return value
+
+    def set(self, name: str, value: bytes, ex: Optional[float] = None) -> bool:
+        with self._lock:
+            self._data[name] = (time.monotonic() + ex if ex else None, value)
+            return True
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            return sum(1 for name in names if self._data.pop(name, None) is not None)
+
+    def incr(self, name: str) -> int:
+        with self._lock:
+            _, value = self._data.get(name, (None, b"0"))
+            new_value = int(value) + 1
+            self._data[name] = (None, str(new_value).encode())
+            return new_value
+
+
+class SharedStoreBackend(CacheBackend):
+    """
+    Cache backend on a shared key-value store with a Redis-compatible client.
+
+    Values are stored as JSON. Eviction is left to the store, so only hits
+    and misses are counted here.
+    """
+
+    def __init__(self, client: Any, prefix: str = "employee-cache:"):
+        self.client = client
+        self.prefix = prefix
+        self._counters = {"hits": 0, "misses": 0}
+        self._lock = threading.Lock()
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            self._count("misses")
+            return None
+        self._count("hits")
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self.client.set(self.prefix + key, json.dumps(value).encode("utf-8"), ex=max(1, int(ttl)))
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def get_version(self, name: str) -> int:
+        raw = self.client.get(self.prefix + "version:" + name)
+        return int(raw) if raw is not None else 0
+
+    def bump_version(self, name: str) -> int:
+        return int(self.client.incr(self.prefix + "version:" + name))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"backend": "shared", **self._counters}
+
+
+class EmployeeCache:
+    """Employee-specific cache keys and invalidation on top of a backend."""
+
+    WRITE_VERSION = "writes"
+    ITEM_VERSION = "items"
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    def write_version(self) -> int:
+        """Version counter bumped by every write; part of every list key."""
+        return self.backend.get_version(self.WRITE_VERSION)
+
+    def _employee_key(self, employee_id: int) -> str:
+        return f"employee:{self.backend.get_version(self.ITEM_VERSION)}:{employee_id}"
+
+    def _list_key(self, version: int, name: str, params: Iterable[Any]) -> str:
+        return f"list:{version}:{name}:" + ":".join(str(param) for param in params)
+
+    def get_employee(self, employee_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached employee dictionary, or None on a miss."""
+        return self.backend.get(self._employee_key(employee_id))
+
+    def set_employee(self, employee_id: int, data: Dict[str, Any], version: int) -> None:
+        """
+        Cache an employee read at the given write version.
+
+        The entry is dropped if a write happened since the read started, so a
+        slow reader cannot put back a row that was just invalidated.
+        """
+        if version == self.write_version():
+            self.backend.set(self._employee_key(employee_id), data, self.ttl)
+
+    def get_list(self, name: str, params: Iterable[Any], version: int) -> Optional[Any]:
+        """Return a cached list result for the given query parameters."""
+        return self.backend.get(self._list_key(version, name, params))
+
+    def set_list(self, name: str, params: Iterable[Any], version: int, value: Any) -> None:
+        """Cache a list result read at the given write version."""
+        self.backend.set(self._list_key(version, name, params), value, self.ttl)
+
+    def invalidate_employees(self, employee_ids: Iterable[int] = ()) -> None:
+        """Drop the given employees and every cached list."""
+        self.backend.bump_version(self.WRITE_VERSION)
+        for employee_id in employee_ids:
+            self.backend.delete(self._employee_key(employee_id))
+
+    def invalidate_all(self) -> None:
+        """Drop every cached employee and list."""
+        self.backend.bump_version(self.ITEM_VERSION)
+        self.backend.bump_version(self.WRITE_VERSION)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return backend counters plus the current write version."""
+        return {**self.backend.stats(), "ttl_seconds": self.ttl, "write_version": self.write_version()}
+
+
+_cache: Optional[EmployeeCache] = None
+
+
+def _create_shared_client() -> Any:
+    """Connect to the configured shared store, or fall back to the local stand-in."""
+    if CacheConfig.SHARED_URL:
+        try:
+            import redis  # type: ignore
+        except ImportError:
+            print("CACHE_SHARED_URL is set but the redis package is not installed; using a local store")
+        else:
+            return redis.Redis.from_url(CacheConfig.SHARED_URL)
+    return LocalStore()
+
+
+def get_cache() -> Optional[EmployeeCache]:
+    """
+    Return the process-wide employee cache, creating it on first use.
+
+    Returns:
+        EmployeeCache, or None when caching is disabled
+    """
+    global _cache
+    if _cache is None and CacheConfig.BACKEND != "none":
+        if CacheConfig.BACKEND == "shared":
+            backend: CacheBackend = SharedStoreBackend(_create_shared_client())
+        else:
+            backend = LRUCacheBackend(CacheConfig.MAX_ENTRIES)
+        _cache = EmployeeCache(backend, CacheConfig.TTL_SECONDS)
+    return _cache
@@ -2,76 +2,302 @@
 MySQL database connection management.
 """
 
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from contextlib import contextmanager
-from mysql.connector import pooling, Error  # type: ignore
+from mysql.connector import Error, InterfaceError, OperationalError, errorcode  # type: ignore
+from mysql.connector.constants import ClientFlag  # type: ignore
 import mysql.connector  # type: ignore
 
+from backend import metrics
 from backend.config import DatabaseConfig
+from backend.database.pool import ConnectionPool, PoolTimeoutError
+from backend.database.replicas import ReplicaRouter
+from backend.database.schema import (
+    CREATE_EMPLOYEE_SUMMARY_TABLE,
+    CREATE_EMPLOYEE_TOMBSTONES_TABLE,
+    CREATE_EMPLOYEE_WRITE_VERSION_TABLE,
+    CREATE_EMPLOYEES_TABLE,
+    CREATE_JOBS_TABLE,
+    CREATE_SCHEMA_VERSION_TABLE,
+    SCHEMA_COMPONENT,
+    SCHEMA_VERSION,
+    SELECT_EMPLOYEE_INDEXES,
+    SELECT_SCHEMA_VERSION,
+    UPSERT_SCHEMA_VERSION,
+    index_changes,
+)
+from backend.database.statements import clear_statement_cache
+from backend.database.summary import rebuild_summary
 
 
 class DatabaseConnection:
-    """Manages MySQL database connections using connection pooling."""
+    """
+    Manages MySQL database connections using connection pooling.
 
-    _pool: Optional[pooling.MySQLConnectionPool] = None
+    With DB_REPLICA_HOSTS set, each replica gets its own pool and
+    get_connection(read_only=True) is routed by a ReplicaRouter to a replica
+    within DB_REPLICA_MAX_LAG_SECONDS, or to the primary when none is, after
+    a replica fails to connect, and for requests that must read their writes.
+    """
+
+    _pool: Optional[ConnectionPool] = None
+    _replicas: Optional[ReplicaRouter[ConnectionPool]] = None
+    _pool_lock = threading.Lock()
+
+    @classmethod
+    def _connection_kwargs(cls, host: Optional[str] = None, port: Optional[int] = None) -> Dict[str, Any]:
+        """Build the keyword arguments for mysql.connector.connect, for the primary by default."""
+        # Expected dict: {"host": "...", "user": "...", "password": "...", "database": "...", "port": 3306}
+        config = DatabaseConfig.get_connection_string()
+        if host is not None:
+            config.update(host=host, port=port)
+        return {
+            **config,
+            "autocommit": True,        # keep transactions clean
+            "charset": "utf8mb4",
+            # The C extension is used when available and DB_USE_PURE=false
+            "use_pure": DatabaseConfig.USE_PURE,
+            "raise_on_warnings": True,
+            # rowcount reports matched rows, so an UPDATE that changes
+            # nothing is not mistaken for a missing row
+            "client_flags": [ClientFlag.FOUND_ROWS],
+        }
+
+    @classmethod
+    def _create_pool(cls, conn_kwargs: Dict[str, Any], min_size: int, max_size: int) -> ConnectionPool:
+        return ConnectionPool(
+            connect=lambda: mysql.connector.connect(**conn_kwargs),
+            min_size=min_size,
+            max_size=max_size,
+            acquire_timeout=DatabaseConfig.POOL_ACQUIRE_TIMEOUT,
+            max_lifetime=DatabaseConfig.POOL_MAX_LIFETIME,
+            ping_idle_after=DatabaseConfig.POOL_PING_IDLE_SECONDS,
+            reset_session=DatabaseConfig.POOL_RESET_SESSION,
+            on_reset=clear_statement_cache,
+        )
 
     @classmethod
-    def initialize_pool(cls, pool_size: int = 5):
+    def initialize_pool(cls, pool_size: Optional[int] = None, warm: bool = True):
         """
-        Initialize the connection pool.
+        Initialize the connection pool and open its minimum connections.
+
+        Replica pools, if any, open their connections on demand and start
+        the lag checks.
 
         Args:
-            pool_size: Number of connections in the pool
+            pool_size: Maximum number of connections (defaults to this worker's
+                share of DB_POOL_TOTAL_SIZE, or DB_POOL_MAX_SIZE)
+            warm: Open DB_POOL_MIN_SIZE connections now; otherwise they are
+                opened on demand or by warm_pool()
         """
-        try:
-            # Expected dict: {"host": "...", "user": "...", "password": "...", "database": "...", "port": 3306}
-            config = DatabaseConfig.get_connection_string()
-
-            base_conn_kwargs = {
-                **config,
-                "autocommit": True,        # keep transactions clean
-                "charset": "utf8mb4",
-                "use_pure": True,
-                "raise_on_warnings": True,
-            }
-
-            cls._pool = pooling.MySQLConnectionPool(
-                pool_name="employee_pool",
-                pool_size=pool_size,
-                pool_reset_session=True,   # reset state when returning to pool
-                **base_conn_kwargs,
+        max_size = pool_size or DatabaseConfig.pool_max_size()
+        pool = cls._create_pool(cls._connection_kwargs(), DatabaseConfig.POOL_MIN_SIZE, max_size)
+        if warm:
+            try:
+                pool.warm()
+            except Error as e:
+                print(f"Error creating connection pool: {e}")
+                raise
+        cls._pool = pool
+        print(f"Database connection pool initialized ({pool.min_size}-{max_size} connections)")
+
+        if DatabaseConfig.REPLICA_HOSTS and cls._replicas is None:
+            replica_size = DatabaseConfig.REPLICA_POOL_MAX_SIZE or max_size
+            cls._replicas = ReplicaRouter(
+                {
+                    f"{host}:{port}": cls._create_pool(cls._connection_kwargs(host, port), 0, replica_size)
+                    for host, port in DatabaseConfig.replica_addresses()
+                },
+                cls._replica_lag,
+                DatabaseConfig.REPLICA_MAX_LAG_SECONDS,
+                DatabaseConfig.REPLICA_CHECK_SECONDS,
             )
-            print(f"Database connection pool initialized with {pool_size} connections")
-        except Error as e:
-            print(f"Error creating connection pool: {e}")
+            cls._replicas.start()
+            print(f"Routing reads to {len(cls._replicas.replicas)} replicas (0-{replica_size} connections each)")
+
+    @staticmethod
+    def _replica_lag(pool: ConnectionPool) -> Optional[float]:
+        """
+        Read a replica's lag from SHOW REPLICA STATUS.
+
+        Returns:
+            Seconds_Behind_Source, or None if the host is not replicating
+        """
+        connection = pool.acquire(timeout=DatabaseConfig.REPLICA_CHECK_SECONDS or None)
+        discard = False
+        try:
+            cursor = connection.cursor(dictionary=True)
+            try:
+                try:
+                    cursor.execute("SHOW REPLICA STATUS")
+                except Error as e:
+                    if e.errno != errorcode.ER_PARSE_ERROR:
+                        raise
+                    # Before MySQL 8.0.22
+                    cursor.execute("SHOW SLAVE STATUS")
+                row = cursor.fetchone()
+                cursor.fetchall()
+            finally:
+                cursor.close()
+        except (InterfaceError, OperationalError):
+            discard = True
             raise
+        finally:
+            pool.release(connection, discard=discard)
+        if row is None:
+            return None
+        lag = row.get("Seconds_Behind_Source", row.get("Seconds_Behind_Master"))
+        return float(lag) if lag is not None else None
+
+    @classmethod
+    def warm_pool(cls) -> None:
+        """Open connections until DB_POOL_MIN_SIZE are available."""
+        cls._get_pool().warm()
+
+    @classmethod
+    def close(cls, timeout: float = 0.0) -> None:
+        """
+        Close the connection pool, e.g. at shutdown.
+
+        Idle connections are closed at once; connections still held by
+        requests are closed as they come back, waiting up to timeout seconds.
+        The next get_connection opens a new pool.
+
+        Args:
+            timeout: Seconds to wait for connections in use
+        """
+        with cls._pool_lock:
+            pool, cls._pool = cls._pool, None
+            replicas, cls._replicas = cls._replicas, None
+        if replicas is not None:
+            replicas.close()
+            for replica in replicas.replicas:
+                replica.target.close()
+        if pool is None:
+            return
+        in_use = pool.close(timeout)
+        if in_use:
+            print(f"Database connection pool closed with {in_use} connections still in use")
+        else:
+            print("Database connection pool closed")
+
+    @classmethod
+    def _get_pool(cls) -> ConnectionPool:
+        """Return the pool, initializing it on first use."""
+        if cls._pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    cls.initialize_pool()
+        return cls._pool
 
     @classmethod
     @contextmanager
-    def get_connection(cls):
+    def get_connection(cls, read_only: bool = False):
         """
         Get a database connection from the pool.
 
+        Blocks for up to DB_POOL_ACQUIRE_TIMEOUT seconds when every connection
+        is in use. A connection that failed at the protocol level is closed
+        instead of being returned to the pool. Checkout wait and hold times
+        are recorded in the metrics registry.
+
+        Args:
+            read_only: The caller only reads, so a replica may serve it
+
         Yields:
             MySQL connection object
         """
-        if cls._pool is None:
-            cls.initialize_pool()
+        pool = cls._get_pool()
+        replicas = cls._replicas
+        replica = replicas.route() if read_only and replicas is not None else None
+        started = time.perf_counter()
+        try:
+            connection = None
+            if replica is not None:
+                try:
+                    connection = replica.target.acquire()
+                    pool = replica.target
+                except PoolTimeoutError:
+                    raise
+                except Error as e:
+                    replicas.mark_failed(replica, e)
+                    replica = None
+            if connection is None:
+                connection = pool.acquire()
+        except PoolTimeoutError:
+            metrics.DB_POOL_TIMEOUTS.inc()
+            raise
+        acquired = time.perf_counter()
+        metrics.DB_POOL_WAIT_SECONDS.observe(acquired - started)
+        discard = False
+        try:
+            yield connection
+        except (InterfaceError, OperationalError) as e:
+            discard = True
+            if replica is not None:
+                replicas.mark_failed(replica, e)
+            raise
+        finally:
+            pool.release(connection, discard=discard)
+            metrics.DB_CONNECTION_HOLD_SECONDS.observe(time.perf_counter() - acquired)
+
+    @classmethod
+    @contextmanager
+    def spare_connection(cls):
+        """
+        Get a primary connection only if the pool has one free right away.
 
-        connection = cls._pool.get_connection()
+        For side work such as capturing a query plan, which must neither wait
+        for a connection nor run inside the caller's transaction.
+
+        Yields:
+            MySQL connection object, or None when every connection is in use
+        """
+        pool = cls._get_pool()
+        connection = pool.try_acquire()
+        if connection is None:
+            yield None
+            return
+        discard = False
         try:
-            # Ensure the connection is alive; reconnect if needed
-            try:
-                connection.ping(reconnect=True, attempts=1, delay=0)
-            except Exception:
-                pass
             yield connection
+        except (InterfaceError, OperationalError):
+            discard = True
+            raise
         finally:
-            try:
-                if connection and connection.is_connected():
-                    connection.close()
-            except Exception:
-                pass
+            pool.release(connection, discard=discard)
+
+    @classmethod
+    def from_replica(cls, connection) -> bool:
+        """
+        Return True if connection was checked out of a replica pool.
+
+        Rows read from a replica may predate a write that was just made, so
+        callers do not put them into the cache.
+        """
+        replicas = cls._replicas
+        return replicas is not None and any(replica.target.owns(connection) for replica in replicas.replicas)
+
+    @classmethod
+    def pool_stats(cls) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+
+        Returns:
+            Occupancy (in use, idle, waiters) and lifetime counters, plus
+            routing status and pool statistics per replica
+        """
+        if cls._pool is None:
+            return {"initialized": False}
+        stats = {"initialized": True, **cls._pool.stats()}
+        if cls._replicas is not None:
+            stats["replicas"] = [
+                {**status, "pool": replica.target.stats()}
+                for replica, status in zip(cls._replicas.replicas, cls._replicas.stats())
+            ]
+        return stats
 
     @classmethod
     def test_connection(cls) -> bool:
@@ -96,30 +322,201 @@ class DatabaseConnection:
             return False
 
     @classmethod
-    def create_tables(cls):
+    def create_tables(cls, skip_if_current: bool = False) -> bool:
         """
-        Create database tables if they don't exist.
+        Create database tables if they don't exist and reconcile their indexes.
+
+        Runs under the schema lock, so server workers starting together do
+        not race each other's DDL, and records SCHEMA_VERSION once done.
+
+        Args:
+            skip_if_current: Do nothing if the recorded schema version is
+                SCHEMA_VERSION, as on every start after the first
+
+        Returns:
+            True if the DDL ran, False if it was skipped
         """
-        create_table_query = """
-        CREATE TABLE IF NOT EXISTS employees (
-            id INT AUTO_INCREMENT PRIMARY KEY,
-            name VARCHAR(100) NOT NULL,
-            email VARCHAR(100) UNIQUE NOT NULL,
-            phone VARCHAR(20),
-            department VARCHAR(50),
-            position VARCHAR(50),
-            salary DECIMAL(10, 2),
-            hire_date DATE,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        with cls.get_connection() as conn:
+            if skip_if_current and cls._applied_schema_version(conn) == SCHEMA_VERSION:
+                print(f"Database schema is current (version {SCHEMA_VERSION})")
+                return False
+            with cls._schema_lock(conn):
+                # Another worker may have applied it while this one waited
+                if skip_if_current and cls._applied_schema_version(conn) == SCHEMA_VERSION:
+                    return False
+                cursor = conn.cursor()
+                try:
+                    cls._create_table(cursor, CREATE_EMPLOYEES_TABLE)
+                    summary_created = cls._create_table(cursor, CREATE_EMPLOYEE_SUMMARY_TABLE)
+                    cls._create_table(cursor, CREATE_EMPLOYEE_TOMBSTONES_TABLE)
+                    cls._create_table(cursor, CREATE_EMPLOYEE_WRITE_VERSION_TABLE)
+                    cls._create_table(cursor, CREATE_JOBS_TABLE)
+                    cls._create_table(cursor, CREATE_SCHEMA_VERSION_TABLE)
+                    conn.commit()
+                    print("Employee tables created or already exist")
+                finally:
+                    cursor.close()
+                if summary_created:
+                    # Existing employees predate the summary table
+                    rebuild_summary(conn)
+                cls._reconcile_indexes(conn)
+
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(UPSERT_SCHEMA_VERSION, (SCHEMA_COMPONENT, SCHEMA_VERSION, SCHEMA_VERSION))
+                    conn.commit()
+                finally:
+                    cursor.close()
+                print(f"Database schema version {SCHEMA_VERSION} applied")
+                return True
+
+    @staticmethod
+    def _applied_schema_version(conn) -> Optional[str]:
+        """Return the recorded schema version, or None before the first create_tables."""
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SELECT_SCHEMA_VERSION, (SCHEMA_COMPONENT,))
+            row = cursor.fetchone()
+            cursor.fetchall()
+            return row[0] if row else None
+        except Error as e:
+            if e.errno == errorcode.ER_NO_SUCH_TABLE:
+                return None
+            raise
+        finally:
+            cursor.close()
+
+    @classmethod
+    @contextmanager
+    def _schema_lock(cls, conn):
         """
+        Hold the MySQL advisory lock guarding schema changes.
 
-        with cls.get_connection() as conn:
-            cursor = conn.cursor()
+        GET_LOCK names are server-wide, so the name includes the database.
+        The lock belongs to the session and is also released if the
+        connection is lost.
+
+        Raises:
+            TimeoutError: If another session holds it for longer than
+                DB_SCHEMA_LOCK_TIMEOUT seconds
+        """
+        name = f"{DatabaseConfig.DATABASE}.employee_schema"
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (name, DatabaseConfig.SCHEMA_LOCK_TIMEOUT))
+            (acquired,) = cursor.fetchone()
+        finally:
+            cursor.close()
+        if acquired != 1:
+            raise TimeoutError(f"Schema lock {name!r} not acquired within {DatabaseConfig.SCHEMA_LOCK_TIMEOUT}s")
+        try:
+            yield
+        finally:
             try:
-                cursor.execute(create_table_query)
-                conn.commit()
-                print("Employee table created or already exists")
-            finally:
-                cursor.close()
+                cursor = conn.cursor()
+                try:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (name,))
+                    cursor.fetchall()
+                finally:
+                    cursor.close()
+            except Error as e:
+                # A lost connection has released the lock with its session
+                print(f"Error releasing schema lock: {e}")
+
+    @staticmethod
+    def _create_table(cursor, statement: str) -> bool:
+        """
+        Run a CREATE TABLE IF NOT EXISTS statement.
+
+        Returns:
+            True if the table was created, False if it already existed
+        """
+        try:
+            cursor.execute(statement)
+            return True
+        except Error as e:
+            # raise_on_warnings turns the "already exists" note into an error
+            if e.errno == errorcode.ER_TABLE_EXISTS_ERROR:
+                return False
+            raise
+
+    @staticmethod
+    @contextmanager
+    def warnings_ignored(conn):
+        """
+        Run statements on conn without fetching or raising their warnings.
+
+        Connections raise on warnings so that truncated or coerced values fail
+        loudly, but some statements warn as a matter of course: EXPLAIN
+        attaches Note 1003 (the rewritten query), and the first FULLTEXT index
+        on a table warns that InnoDB rebuilds it to add FTS_DOC_ID.
+
+        Args:
+            conn: Connection checked out of the pool
+
+        Yields:
+            conn, with warnings off until the block ends
+        """
+        raise_on_warnings, get_warnings = conn.raise_on_warnings, conn.get_warnings
+        conn.raise_on_warnings = False
+        conn.get_warnings = False
+        try:
+            yield conn
+        finally:
+            conn.get_warnings = get_warnings
+            conn.raise_on_warnings = raise_on_warnings
+
+    @classmethod
+    def reconcile_indexes(cls) -> List[str]:
+        """
+        Bring the employees table indexes in line with the schema module.
+
+        Tables created from database_schema.sql, by an older release, or by hand
+        are compared against information_schema; missing or differently defined
+        indexes are (re)built and obsolete ones dropped in one online ALTER TABLE,
+        followed by one ALTER TABLE per missing FULLTEXT index.
+
+        Returns:
+            ALTER TABLE clauses that were applied
+        """
+        with cls.get_connection() as conn:
+            with cls._schema_lock(conn):
+                return cls._reconcile_indexes(conn)
+
+    @staticmethod
+    def _existing_indexes(cursor) -> Dict[str, Tuple[str, ...]]:
+        """Read the employees table indexes from information_schema: name -> columns in order."""
+        cursor.execute(SELECT_EMPLOYEE_INDEXES)
+        existing: Dict[str, Tuple[str, ...]] = {}
+        for index_name, column_name in cursor.fetchall():
+            existing[index_name] = existing.get(index_name, ()) + (column_name,)
+        return existing
+
+    @classmethod
+    def _reconcile_indexes(cls, conn) -> List[str]:
+        """Apply the index changes on conn; the caller holds the schema lock."""
+        cursor = conn.cursor()
+        try:
+            clauses = index_changes(cls._existing_indexes(cursor))
+            online = [clause for clause in clauses if not clause.startswith("ADD FULLTEXT")]
+            if online:
+                cursor.execute(
+                    f"ALTER TABLE employees {', '.join(online)}, ALGORITHM=INPLACE, LOCK=NONE"
+                )
+            # Adding a FULLTEXT index blocks writes and only one can be
+            # built per statement, so each gets its own ALTER TABLE. The
+            # first one on a table without FTS_DOC_ID rebuilds it and warns
+            # (InnoDB warning 124), so the result is checked below instead
+            fulltext = [clause for clause in clauses if clause not in online]
+            if fulltext:
+                with cls.warnings_ignored(conn):
+                    for clause in fulltext:
+                        cursor.execute(f"ALTER TABLE employees {clause}")
+            if clauses:
+                remaining = index_changes(cls._existing_indexes(cursor))
+                if remaining:
+                    raise RuntimeError(f"Employee indexes still differ from the schema: {'; '.join(remaining)}")
+                print(f"Reconciled employee indexes: {'; '.join(clauses)}")
+            return clauses
+        finally:
+            cursor.close()
@@ -0,0 +1,493 @@
+"""
+In-process employee storage (DB_BACKEND=memory).
+
+Employees live in a dict keyed by id, with secondary indexes on email (for
+the uniqueness check) and department (for the most common filter). The
+summary behind get_employee_stats is maintained incrementally, as the MySQL
+backend does. Nothing is persisted; intended for development, demos and
+tests that should not need a database server.
+"""
+
+import bisect
+import heapq
+import itertools
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from backend.database import summary
+from backend.database.queries import DEFAULT_LIST_SORT, EMPLOYEE_COLUMNS, LIST_SORTS, UPDATABLE_FIELDS
+from backend.database.repository import (
+    DuplicateEmailError,
+    EmployeeRepository,
+    changes_result,
+    split_request_duplicates,
+    sync_positions,
+)
+from backend.models.employee import Employee
+
+SALARY = EMPLOYEE_COLUMNS.index("salary")
+
+# Row positions of name, email, department and position, the columns search looks at
+SEARCH_COLUMNS = (1, 2, 4, 5)
+
+
+def _fold(value: Any) -> Any:
+    """Comparison key for text, matching MySQL's case-insensitive collation."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _stored_row(employee_id: int, employee_data: Dict[str, Any]) -> List[Any]:
+    """Build a JSON-ready row in EMPLOYEE_COLUMNS order from an employee dictionary."""
+    salary = employee_data.get("salary")
+    hire_date = employee_data.get("hire_date")
+    return [
+        employee_id,
+        employee_data["name"],
+        employee_data["email"],
+        employee_data.get("phone"),
+        employee_data.get("department"),
+        employee_data.get("position"),
+        # Mirror the DECIMAL(10, 2) column
+        float(summary.as_stored(salary)) if salary is not None else None,
+        hire_date.isoformat() if isinstance(hire_date, date) else hire_date,
+    ]
+
+
+def _as_dict(row: List[Any]) -> Dict[str, Any]:
+    return dict(zip(EMPLOYEE_COLUMNS, row))
+
+
+def _sort_key(value: Any, employee_id: int) -> Tuple[Any, ...]:
+    """Order (value, id) like MySQL: NULLs before any value in ascending order."""
+    return (value is not None, _fold(value), employee_id)
+
+
+def _filter_predicate(filters: Dict[str, Any]) -> Callable[[List[Any]], bool]:
+    """Build a test for the non-None attribute filters of the list endpoint."""
+    department = _fold(filters.get("department"))
+    position = _fold(filters.get("position"))
+    salary_min, salary_max = filters.get("salary_min"), filters.get("salary_max")
+    hired_after = str(filters["hired_after"]) if "hired_after" in filters else None
+    hired_before = str(filters["hired_before"]) if "hired_before" in filters else None
+
+    def accepts(row: List[Any]) -> bool:
+        if department is not None and _fold(row[4]) != department:
+            return False
+        if position is not None and _fold(row[5]) != position:
+            return False
+        if salary_min is not None and (row[6] is None or row[6] < salary_min):
+            return False
+        if salary_max is not None and (row[6] is None or row[6] > salary_max):
+            return False
+        if hired_after is not None and (row[7] is None or row[7] < hired_after):
+            return False
+        if hired_before is not None and (row[7] is None or row[7] > hired_before):
+            return False
+        return True
+
+    return accepts
+
+
+class MemoryEmployeeRepository(EmployeeRepository):
+    """Employees kept in process memory, guarded by one lock."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._rows: Dict[int, List[Any]] = {}
+        self._by_email: Dict[str, int] = {}
+        self._by_department: Dict[Any, Set[int]] = {}
+        # Sorted ids, for pages in id order without a scan
+        self._ids: List[int] = []
+        # Case-folded name, email, department and position per id
+        self._search_text: Dict[int, str] = {}
+        self._summary: summary.Deltas = {}
+        # Summary groups are keyed case-insensitively, like the MySQL primary
+        # key, and reported with the spelling seen first
+        self._labels: Dict[Tuple[str, str], str] = {}
+        self._next_id = 1
+        # Last modification per id (Unix seconds), kept in modification
+        # order so the change feed walks only the recent end; timestamps
+        # strictly increase. A counter bumped by every change serves the
+        # collection validator
+        self._updated_at: Dict[int, float] = {}
+        self._last_modified: Optional[float] = None
+        self._version = 0
+        # Deletion time per deleted id, in deletion order
+        self._tombstones: Dict[int, float] = {}
+
+    def test_connection(self) -> bool:
+        return True
+
+    # Index maintenance; callers hold the lock
+
+    def _summarize(self, rows: Iterable[List[Any]], sign: int = 1) -> None:
+        employees = []
+        for row in rows:
+            data = _as_dict(row)
+            for dimension in ("department", "position"):
+                if data[dimension] is not None:
+                    key = data[dimension].casefold()
+                    self._labels.setdefault((dimension, key), data[dimension])
+                    data[dimension] = key
+            employees.append(data)
+        summary.add_employees(self._summary, employees, sign)
+
+    def _index(self, row: List[Any]) -> None:
+        self._by_email[_fold(row[2])] = row[0]
+        self._by_department.setdefault(_fold(row[4]), set()).add(row[0])
+        self._search_text[row[0]] = "\n".join(_fold(row[column]) or "" for column in SEARCH_COLUMNS)
+        self._summarize([row])
+
+    def _unindex(self, row: List[Any]) -> None:
+        del self._by_email[_fold(row[2])]
+        department_ids = self._by_department[_fold(row[4])]
+        department_ids.discard(row[0])
+        if not department_ids:
+            del self._by_department[_fold(row[4])]
+        del self._search_text[row[0]]
+        self._summarize([row], sign=-1)
+
+    def _clock(self) -> float:
+        """Current time, nudged past the last modification so stamps never repeat."""
+        now = time.time()
+        if self._last_modified is not None and now <= self._last_modified:
+            now = self._last_modified + 1e-6
+        return now
+
+    def _touch(self, employee_id: Optional[int] = None, deleted: bool = False) -> None:
+        now = self._clock()
+        if employee_id is not None:
+            # Re-inserted to move it to the recent end
+            log = self._tombstones if deleted else self._updated_at
+            log.pop(employee_id, None)
+            log[employee_id] = now
+        self._last_modified = now
+        self._version += 1
+
+    def _insert(self, employee_data: Dict[str, Any]) -> List[Any]:
+        employee_id = self._next_id
+        self._next_id += 1
+        row = _stored_row(employee_id, employee_data)
+        self._rows[employee_id] = row
+        # Ids only grow, so appending keeps the list sorted
+        self._ids.append(employee_id)
+        self._index(row)
+        self._touch(employee_id)
+        return row
+
+    def _remove(self, employee_id: int) -> List[Any]:
+        row = self._rows.pop(employee_id)
+        del self._ids[bisect.bisect_left(self._ids, employee_id)]
+        self._unindex(row)
+        del self._updated_at[employee_id]
+        self._touch(employee_id, deleted=True)
+        return row
+
+    def _replace(self, row: List[Any], changes: Dict[str, Any]) -> List[Any]:
+        """Apply changes to a stored row and return the new row; unchanged rows are kept."""
+        employee_id = row[0]
+        new_row = _stored_row(employee_id, {**_as_dict(row), **changes})
+        if new_row == row:
+            return row
+        email_owner = self._by_email.get(_fold(new_row[2]))
+        if email_owner is not None and email_owner != employee_id:
+            raise DuplicateEmailError(f"Email already exists: {new_row[2]}")
+        self._unindex(row)
+        self._rows[employee_id] = new_row
+        self._index(new_row)
+        self._touch(employee_id)
+        return new_row
+
+    def _candidates(self, ids: Optional[List[int]], filters: Dict[str, Any]) -> Iterable[List[Any]]:
+        """Narrow the rows to scan with the id list or the department index."""
+        if ids:
+            return (self._rows[employee_id] for employee_id in set(ids) if employee_id in self._rows)
+        if "department" in filters:
+            department_ids = self._by_department.get(_fold(filters["department"]), ())
+            return (self._rows[employee_id] for employee_id in department_ids)
+        return self._rows.values()
+
+    def _matching(self, ids: Optional[List[int]], filters: Optional[Dict[str, Any]]) -> Iterable[List[Any]]:
+        """Rows selected by an id list and/or the attribute filters of the list endpoint."""
+        filters = {key: value for key, value in (filters or {}).items() if value is not None}
+        accepts = _filter_predicate(filters)
+        return (row for row in self._candidates(ids, filters) if accepts(row))
+
+    # Reads
+
+    def get_employee(self, employee_id: int) -> Optional[Employee]:
+        with self._lock:
+            row = self._rows.get(employee_id)
+            if row is None:
+                return None
+            updated_at = self._updated_at[employee_id]
+        return Employee.from_dict({**_as_dict(row), "updated_at": updated_at})
+
+    def get_collection_version(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"last_modified": self._last_modified, "count": len(self._rows), "write_version": self._version}
+
+    def get_changes(self, since: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """Walks each modification log back from its recent end, so the cost follows the churn."""
+
+        def after(log: Dict[int, float], position: Optional[List[float]]) -> List[Tuple[float, int]]:
+            entries = []
+            for employee_id, stamp in reversed(log.items()):
+                if position is not None and [stamp, employee_id] <= position:
+                    break
+                entries.append((stamp, employee_id))
+            entries.reverse()
+            return entries[:limit + 1]
+
+        with self._lock:
+            # Every change is applied under the lock, so nothing below the
+            # bound can still be in flight
+            bound = self._clock()
+            updated_after, deleted_after = sync_positions(since, time.time(), bound)
+            updated = [
+                (stamp, list(self._rows[employee_id])) for stamp, employee_id in after(self._updated_at, updated_after)
+            ]
+            deleted = after(self._tombstones, deleted_after)
+        return changes_result(since, bound, limit, updated, deleted)
+
+    def purge_tombstones(self, older_than_seconds: float) -> int:
+        cutoff = time.time() - older_than_seconds
+        with self._lock:
+            # Oldest first; stop at the first one still within retention
+            expired = [
+                employee_id
+                for employee_id, _ in itertools.takewhile(lambda item: item[1] < cutoff, self._tombstones.items())
+            ]
+            for employee_id in expired:
+                del self._tombstones[employee_id]
+        return len(expired)
+
+    def get_all_employees(self) -> List[Employee]:
+        with self._lock:
+            rows = [self._rows[employee_id] for employee_id in reversed(self._ids)]
+        return [Employee.from_dict(_as_dict(row)) for row in rows]
+
+    def get_employee_rows_page(
+        self,
+        limit: int,
+        after: Optional[Dict[str, Any]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_LIST_SORT,
+    ) -> Tuple[List[List[Any]], Optional[Dict[str, Any]]]:
+        """
+        Id order without a department filter walks the sorted id list from the
+        keyset position; everything else picks the page with a bounded heap
+        over the matching rows instead of sorting them.
+        """
+        if sort not in LIST_SORTS:
+            raise ValueError(f"Unsupported sort: {sort}")
+        filters = {key: value for key, value in (filters or {}).items() if value is not None}
+        descending = sort.startswith("-")
+        column = sort.lstrip("-")
+        sort_index = EMPLOYEE_COLUMNS.index(column)
+
+        def key(row: List[Any]) -> Tuple[Any, ...]:
+            return _sort_key(row[sort_index], row[0])
+
+        # One extra row tells whether another page exists
+        with self._lock:
+            if column == "id" and "department" not in filters:
+                accepts = _filter_predicate(filters)
+                if descending:
+                    end = bisect.bisect_left(self._ids, after["id"]) if after is not None else len(self._ids)
+                    ids: Iterable[int] = (self._ids[i] for i in range(end - 1, -1, -1))
+                else:
+                    start = bisect.bisect_right(self._ids, after["id"]) if after is not None else 0
+                    ids = itertools.islice(self._ids, start, None)
+                rows: Iterable[List[Any]] = (row for row in map(self._rows.__getitem__, ids) if accepts(row))
+                page = [list(row) for row in itertools.islice(rows, limit + 1)]
+            else:
+                rows = self._matching(None, filters)
+                if after is not None:
+                    bound = _sort_key(after["id"] if column == "id" else after.get("v"), after["id"])
+                    if descending:
+                        rows = (row for row in rows if key(row) < bound)
+                    else:
+                        rows = (row for row in rows if key(row) > bound)
+                select = heapq.nlargest if descending else heapq.nsmallest
+                page = [list(row) for row in select(limit + 1, rows, key=key)]
+
+        next_position = None
+        if len(page) > limit:
+            page = page[:limit]
+            next_position = {"id": page[-1][0]}
+            if column != "id":
+                next_position["v"] = page[-1][sort_index]
+        return page, next_position
+
+    def iter_employee_batches(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        with self._lock:
+            ids = list(self._ids)
+        for offset in range(0, len(ids), batch_size):
+            with self._lock:
+                rows = [self._rows[employee_id] for employee_id in ids[offset:offset + batch_size]
+                        if employee_id in self._rows]
+            yield [_as_dict(row) for row in rows]
+
+    def search_employee_rows(self, query: str, limit: int = 10) -> List[List[Any]]:
+        """
+        Substring search over name, email, department and position.
+
+        Every term of at least two characters must occur in one of the
+        columns. Employees whose name starts with the query rank first, then
+        the newest.
+        """
+        text = " ".join(query.split()).casefold()
+        terms = [term.replace('"', "") for term in text.split()]
+        terms = [term for term in terms if len(term) >= 2]
+        if not terms:
+            return []
+
+        with self._lock:
+            hits = [
+                self._rows[employee_id] for employee_id, haystack in self._search_text.items()
+                if all(term in haystack for term in terms)
+            ]
+        best = heapq.nsmallest(limit, hits, key=lambda row: (not row[1].casefold().startswith(text), -row[0]))
+        return [list(row) for row in best]
+
+    def get_employee_stats(self, dimension: str) -> List[Dict[str, Any]]:
+        if dimension not in summary.SUMMARY_DIMENSIONS:
+            raise ValueError(f"Unsupported dimension: {dimension}")
+        with self._lock:
+            groups = sorted(
+                (key, self._labels.get((dimension, key), key), list(entry))
+                for (group_dimension, key), entry in self._summary.items()
+                if group_dimension == dimension and entry[0] > 0
+            )
+        return [
+            {
+                "key": label if key != summary.NO_GROUP else None,
+                "headcount": headcount,
+                "total_salary": float(salary_total),
+                "average_salary": round(float(salary_total) / salary_count, 2) if salary_count else None,
+            }
+            for key, label, (headcount, salary_count, salary_total) in groups
+        ]
+
+    def rebuild_employee_summary(self) -> Dict[str, int]:
+        with self._lock:
+            self._summary = {}
+            self._summarize(self._rows.values())
+            return {
+                dimension: sum(1 for group_dimension, _ in self._summary if group_dimension == dimension)
+                for dimension in summary.SUMMARY_DIMENSIONS
+            }
+
+    # Writes
+
+    def create_employee(self, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        with self._lock:
+            if _fold(employee_data["email"]) in self._by_email:
+                raise DuplicateEmailError(f"Email already exists: {employee_data['email']}")
+            row = self._insert(employee_data)
+        return Employee.from_dict(_as_dict(row))
+
+    def bulk_create_employees(
+        self,
+        employees_data: List[Dict[str, Any]],
+        chunk_size: int = 500,
+        single_transaction: bool = False,
+        abort_on_error: bool = False,
+    ) -> Dict[str, Any]:
+        """Same chunk and abort semantics as operations.bulk_create_employees."""
+        ids: List[Optional[int]] = [None] * len(employees_data)
+        pending, errors = split_request_duplicates(employees_data)
+        if errors and abort_on_error:
+            return {"ids": ids, "errors": errors, "aborted": True}
+
+        aborted = False
+        with self._lock:
+            staged: List[Tuple[int, Dict[str, Any]]] = []
+            for offset in range(0, len(pending), chunk_size):
+                chunk = pending[offset:offset + chunk_size]
+                accepted = []
+                for index, data in chunk:
+                    if _fold(data["email"]) in self._by_email:
+                        errors.append({"index": index, "error": "Email already exists"})
+                    else:
+                        accepted.append((index, data))
+                if abort_on_error and len(accepted) < len(chunk):
+                    # The failed chunk is rolled back, and with it the whole batch
+                    # when it runs as one transaction
+                    aborted = True
+                    staged = []
+                    break
+                staged.extend(accepted)
+                if not single_transaction:
+                    for index, data in staged:
+                        ids[index] = self._insert(data)[0]
+                    staged = []
+            for index, data in staged:
+                ids[index] = self._insert(data)[0]
+
+        errors.sort(key=lambda error: error["index"])
+        return {"ids": ids, "errors": errors, "aborted": aborted}
+
+    def update_employee(self, employee_id: int, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        changes = {field: value for field, value in employee_data.items() if value is not None}
+        with self._lock:
+            row = self._rows.get(employee_id)
+            if row is None:
+                return None
+            row = self._replace(row, changes)
+        return Employee.from_dict(_as_dict(row))
+
+    def delete_employee(self, employee_id: int) -> bool:
+        with self._lock:
+            if employee_id not in self._rows:
+                return False
+            self._remove(employee_id)
+            return True
+
+    def bulk_update_employees(
+        self,
+        employee_data: Dict[str, Any],
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        salary_factor: Optional[float] = None,
+        return_ids: bool = False,
+    ) -> Dict[str, Any]:
+        """Like MySQL, "affected" counts only rows whose values actually changed."""
+        changes = {
+            field: employee_data[field] for field in UPDATABLE_FIELDS if employee_data.get(field) is not None
+        }
+        if not ids and not any(value is not None for value in (filters or {}).values()):
+            raise ValueError("A bulk update needs ids or at least one filter")
+        if not changes and salary_factor is None:
+            raise ValueError("A bulk update needs at least one change")
+
+        with self._lock:
+            matched = sorted(self._matching(ids, filters), key=lambda row: row[0])
+            affected = 0
+            for row in matched:
+                row_changes = dict(changes)
+                if salary_factor is not None:
+                    salary = row_changes.get("salary", row[SALARY])
+                    if salary is not None:
+                        row_changes["salary"] = salary * salary_factor
+                if self._replace(row, row_changes) is not row:
+                    affected += 1
+        return {"affected": affected, "ids": [row[0] for row in matched] if return_ids else None}
+
+    def bulk_delete_employees(
+        self,
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_ids: bool = False,
+    ) -> Dict[str, Any]:
+        if not ids and not any(value is not None for value in (filters or {}).values()):
+            raise ValueError("A bulk delete needs ids or at least one filter")
+
+        with self._lock:
+            deleted_ids = sorted(row[0] for row in self._matching(ids, filters))
+            for employee_id in deleted_ids:
+                self._remove(employee_id)
+        return {"affected": len(deleted_ids), "ids": deleted_ids if return_ids else None}
@@ -2,93 +2,515 @@
 CRUD operations for employee records.
 """
 
-from typing import Optional, List, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import date
-from mysql.connector import Error  # type: ignore
+from mysql.connector import Error, IntegrityError, errorcode  # type: ignore
+from backend import metrics
+from backend.config import DatabaseConfig, SyncConfig
+from backend.database.cache import get_cache
 from backend.database.connection import DatabaseConnection
+from backend.database.profiler import ProfiledCursor, profile_cursor
+from backend.database.statements import prepared_cursor
+from backend.database import summary
+from backend.database.queries import (
+    DEFAULT_LIST_SORT,
+    EMPLOYEE_COLUMNS,
+    LIST_SORTS,
+    build_filter_clause,
+    build_page_query,
+    build_set_clause,
+)
+from backend.database.repository import changes_result, split_request_duplicates, sync_positions
 from backend.models.employee import Employee
 
 
+# Fixed statements; these module-level strings double as prepared statement cache keys
+INSERT_EMPLOYEE = """
+    INSERT INTO employees (name, email, phone, department, position, salary, hire_date)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """
+
+# updated_at as Unix seconds feeds the HTTP validators; readers that zip
+# rows with EMPLOYEE_COLUMNS ignore the extra column
+SELECT_EMPLOYEE_BY_ID = """
+    SELECT id, name, email, phone, department, position, salary, hire_date,
+        UNIX_TIMESTAMP(updated_at) AS updated_at
+    FROM employees
+    WHERE id = %s
+    """
+
+SELECT_EMPLOYEES_FIRST_PAGE = """
+    SELECT id, name, email, phone, department, position, salary, hire_date
+    FROM employees
+    ORDER BY id DESC
+    LIMIT %s
+    """
+
+SELECT_EMPLOYEES_NEXT_PAGE = """
+    SELECT id, name, email, phone, department, position, salary, hire_date
+    FROM employees
+    WHERE id < %s
+    ORDER BY id DESC
+    LIMIT %s
+    """
+
+# Employees whose name starts with the query rank first, then by FULLTEXT relevance
+SEARCH_EMPLOYEES = """
+    SELECT id, name, email, phone, department, position, salary, hire_date
+    FROM employees
+    WHERE MATCH(name, email, department, position) AGAINST (%s IN BOOLEAN MODE)
+    ORDER BY name LIKE %s DESC,
+        MATCH(name, email, department, position) AGAINST (%s IN BOOLEAN MODE) DESC,
+        id DESC
+    LIMIT %s
+    """
+
+SELECT_EMPLOYEE_FOR_UPDATE = SELECT_EMPLOYEE_BY_ID + "FOR UPDATE\n"
+
+SELECT_EMPLOYEE_SUMMARY = """
+    SELECT group_key, headcount, salary_count, salary_total
+    FROM employee_summary
+    WHERE dimension = %s AND headcount > 0
+    ORDER BY group_key
+    """
+
+# Reads one entry of idx_updated_at, the department groups of the summary
+# (whose headcounts add up to COUNT(*)) and the write counter rather than
+# any employee row
+SELECT_COLLECTION_VERSION = """
+    SELECT
+        (SELECT UNIX_TIMESTAMP(MAX(updated_at)) FROM employees),
+        (SELECT COALESCE(SUM(headcount), 0) FROM employee_summary WHERE dimension = 'department'),
+        (SELECT COALESCE(MAX(version), 0) FROM employee_write_version)
+    """
+
+# Creates the counter's only row on the first write
+BUMP_WRITE_VERSION = """
+    INSERT INTO employee_write_version (id, version)
+    VALUES (1, 1)
+    ON DUPLICATE KEY UPDATE version = version + 1
+    """
+
+DELETE_EMPLOYEE = """
+    DELETE FROM employees
+    WHERE id = %s
+    """
+
+INSERT_TOMBSTONE = """
+    INSERT INTO employee_tombstones (id)
+    VALUES (%s)
+    ON DUPLICATE KEY UPDATE deleted_at = CURRENT_TIMESTAMP
+    """
+
+# Change feed reads. The oldest transaction that has written rows bounds
+# them from above: its rows carry timestamps from before its commit and
+# would otherwise appear behind a position clients have already passed
+SELECT_SYNC_CLOCK = "SELECT UNIX_TIMESTAMP()"
+
+SELECT_OLDEST_WRITE_TRANSACTION = """
+    SELECT UNIX_TIMESTAMP(MIN(trx_started))
+    FROM information_schema.INNODB_TRX
+    WHERE trx_rows_modified > 0
+    """
+
+# Range scans of idx_updated_at / idx_deleted_at, which end in id
+SELECT_CHANGED_EMPLOYEES = """
+    SELECT id, name, email, phone, department, position, salary, hire_date,
+        UNIX_TIMESTAMP(updated_at)
+    FROM employees
+    WHERE updated_at >= FROM_UNIXTIME(%s)
+        AND (updated_at > FROM_UNIXTIME(%s) OR id > %s)
+        AND updated_at < FROM_UNIXTIME(%s)
+    ORDER BY updated_at, id
+    LIMIT %s
+    """
+
+SELECT_ALL_CHANGED_EMPLOYEES = """
+    SELECT id, name, email, phone, department, position, salary, hire_date,
+        UNIX_TIMESTAMP(updated_at)
+    FROM employees
+    WHERE updated_at < FROM_UNIXTIME(%s)
+    ORDER BY updated_at, id
+    LIMIT %s
+    """
+
+SELECT_TOMBSTONES = """
+    SELECT UNIX_TIMESTAMP(deleted_at), id
+    FROM employee_tombstones
+    WHERE deleted_at >= FROM_UNIXTIME(%s)
+        AND (deleted_at > FROM_UNIXTIME(%s) OR id > %s)
+        AND deleted_at < FROM_UNIXTIME(%s)
+    ORDER BY deleted_at, id
+    LIMIT %s
+    """
+
+PURGE_TOMBSTONES = """
+    DELETE FROM employee_tombstones
+    WHERE deleted_at < NOW() - INTERVAL %s SECOND
+    ORDER BY deleted_at
+    LIMIT %s
+    """
+
+
+@contextmanager
+def _fixed_statement(conn, query: str):
+    """
+    Get a cursor for one of the fixed statements above.
+
+    With DB_PREPARED_STATEMENTS enabled this is the connection's cached
+    server-side prepared statement; otherwise a plain text-protocol cursor
+    that is closed afterwards. Either way rows come back as tuples and must
+    be fetched completely.
+
+    Args:
+        conn: Checked-out connection
+        query: One of the module-level statement constants
+
+    Yields:
+        Cursor to execute the query on
+    """
+    if DatabaseConfig.PREPARED_STATEMENTS:
+        cursor = profile_cursor(prepared_cursor(conn, query))
+        try:
+            yield cursor
+        finally:
+            # The prepared cursor stays open in the cache; only end its profile
+            if isinstance(cursor, ProfiledCursor):
+                cursor.finish()
+        return
+    cursor = _cursor(conn)
+    try:
+        yield cursor
+    finally:
+        cursor.close()
+
+
+def _cursor(conn, **kwargs):
+    """Open a cursor on the connection, profiled when QUERY_PROFILER_ENABLED."""
+    return profile_cursor(conn.cursor(**kwargs))
+
+
+def _invalidate_cache(employee_ids: Optional[List[int]] = None) -> None:
+    """
+    Invalidate cached reads after a committed write.
+
+    Args:
+        employee_ids: Ids of changed employees; None means the changed rows
+            are unknown and every cached employee is dropped
+    """
+    cache = get_cache()
+    if cache is None:
+        return
+    if employee_ids is None:
+        cache.invalidate_all()
+    else:
+        cache.invalidate_employees(employee_ids)
+
+
+def _apply_summary(conn, deltas: summary.Deltas) -> None:
+    """Apply employee summary deltas on the connection's open transaction."""
+    cursor = _cursor(conn)
+    try:
+        summary.apply_deltas(cursor, deltas)
+    finally:
+        cursor.close()
+
+
+def _bump_write_version(conn) -> None:
+    """
+    Count a write to employees on the connection's open transaction.
+
+    Every writer locks the counter's single row, so this runs last in the
+    transaction and the lock is held only until the commit.
+    """
+    with _fixed_statement(conn, BUMP_WRITE_VERSION) as cursor:
+        cursor.execute(BUMP_WRITE_VERSION)
+
+
+@metrics.instrument("create_employee", rows=lambda employee: 1 if employee else 0)
 def create_employee(employee_data: Dict[str, Any]) -> Optional[Employee]:
     """
     Create a new employee record in the database.
 
+    The employee summary is updated in the same transaction. The response is
+    built from the inserted values and the generated id, so no read-back
+    query is needed.
+
     Args:
         employee_data: Dictionary containing employee information
 
     Returns:
         Employee object if successful, None otherwise
     """
-    insert_query = """
-    INSERT INTO employees (name, email, phone, department, position, salary, hire_date)
-    VALUES (%s, %s, %s, %s, %s, %s, %s)
-    """
-
     try:
         with DatabaseConnection.get_connection() as conn:
-            cursor = conn.cursor()
+            conn.start_transaction()
             try:
-                cursor.execute(
-                    insert_query,
-                    (
-                        employee_data["name"],
-                        employee_data["email"],
-                        employee_data.get("phone"),
-                        employee_data.get("department"),
-                        employee_data.get("position"),
-                        employee_data.get("salary"),
-                        employee_data.get("hire_date"),
-                    ),
-                )
+                with _fixed_statement(conn, INSERT_EMPLOYEE) as cursor:
+                    cursor.execute(
+                        INSERT_EMPLOYEE,
+                        (
+                            employee_data["name"],
+                            employee_data["email"],
+                            employee_data.get("phone"),
+                            employee_data.get("department"),
+                            employee_data.get("position"),
+                            employee_data.get("salary"),
+                            employee_data.get("hire_date"),
+                        ),
+                    )
+                    employee_id = cursor.lastrowid
+                _apply_summary(conn, summary.add_employees({}, [employee_data]))
+                _bump_write_version(conn)
                 conn.commit()
-                employee_id = cursor.lastrowid
-            finally:
-                cursor.close()
+            except Exception:
+                conn.rollback()
+                raise
 
-            # Fetch the created employee
-            return get_employee(employee_id)
+            _invalidate_cache([])
+
+            salary = employee_data.get("salary")
+            return Employee.from_dict({
+                **employee_data,
+                "id": employee_id,
+                # Mirror the DECIMAL(10, 2) column
+                "salary": round(salary, 2) if salary is not None else None,
+            })
     except Error as e:
         print(f"Error creating employee: {e}")
         raise
 
 
-def get_employee(employee_id: int) -> Optional[Employee]:
+EMPLOYEE_INSERT_COLUMNS = ["name", "email", "phone", "department", "position", "salary", "hire_date"]
+
+
+def _insert_values(employee_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Order an employee dictionary into INSERT parameter order."""
+    return tuple(employee_data.get(column) for column in EMPLOYEE_INSERT_COLUMNS)
+
+
+def _email_key(email: str) -> str:
+    """Comparison key for emails, matching the table's case-insensitive collation."""
+    return email.casefold()
+
+
+def _existing_emails(cursor, emails: List[str]) -> set:
+    """Return the comparison keys of the given emails that already exist."""
+    if not emails:
+        return set()
+    placeholders = ", ".join(["%s"] * len(emails))
+    cursor.execute(f"SELECT email FROM employees WHERE email IN ({placeholders})", tuple(emails))
+    return {_email_key(row[0]) for row in cursor.fetchall()}
+
+
+def _insert_chunk(cursor, chunk: List[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, str]]:
     """
-    Retrieve a single employee by ID.
+    Insert a chunk of employees, falling back to row-by-row on a conflict.
+
+    The multi-row INSERT is tried first. If it hits a unique key violation
+    (a concurrent insert of the same email), the chunk is replayed one row at
+    a time under savepoints so only the conflicting rows fail.
 
     Args:
-        employee_id: Unique employee identifier
+        cursor: Cursor on a connection with an open transaction
+        chunk: (request index, employee dictionary) pairs
 
     Returns:
-        Employee object if found, None otherwise
+        (request index, error message) pairs for rows that failed
     """
-    select_query = """
-    SELECT id, name, email, phone, department, position, salary, hire_date
-    FROM employees
-    WHERE id = %s
+    row_placeholder = "(" + ", ".join(["%s"] * len(EMPLOYEE_INSERT_COLUMNS)) + ")"
+    insert_query = (
+        f"INSERT INTO employees ({', '.join(EMPLOYEE_INSERT_COLUMNS)}) VALUES "
+        + ", ".join([row_placeholder] * len(chunk))
+    )
+    params = [value for _, data in chunk for value in _insert_values(data)]
+
+    cursor.execute("SAVEPOINT bulk_chunk")
+    try:
+        cursor.execute(insert_query, tuple(params))
+        return []
+    except IntegrityError as e:
+        if e.errno != errorcode.ER_DUP_ENTRY:
+            raise
+        cursor.execute("ROLLBACK TO SAVEPOINT bulk_chunk")
+
+    failures: List[Tuple[int, str]] = []
+    single_query = f"INSERT INTO employees ({', '.join(EMPLOYEE_INSERT_COLUMNS)}) VALUES {row_placeholder}"
+    for index, data in chunk:
+        cursor.execute("SAVEPOINT bulk_row")
+        try:
+            cursor.execute(single_query, _insert_values(data))
+        except IntegrityError as e:
+            if e.errno != errorcode.ER_DUP_ENTRY:
+                raise
+            cursor.execute("ROLLBACK TO SAVEPOINT bulk_row")
+            failures.append((index, "Email already exists"))
+    return failures
+
+
+def _ids_by_email(cursor, emails: List[str], chunk_size: int) -> Dict[str, int]:
+    """Look up the ids assigned to freshly inserted emails, chunk by chunk."""
+    ids: Dict[str, int] = {}
+    for offset in range(0, len(emails), chunk_size):
+        chunk = emails[offset:offset + chunk_size]
+        placeholders = ", ".join(["%s"] * len(chunk))
+        cursor.execute(
+            f"SELECT id, email FROM employees WHERE email IN ({placeholders})", tuple(chunk)
+        )
+        ids.update((_email_key(email), employee_id) for employee_id, email in cursor.fetchall())
+    return ids
+
+
+@metrics.instrument(
+    "bulk_create_employees",
+    rows=lambda result: sum(1 for employee_id in result["ids"] if employee_id is not None),
+)
+def bulk_create_employees(
+    employees_data: List[Dict[str, Any]],
+    chunk_size: int = 500,
+    single_transaction: bool = False,
+    abort_on_error: bool = False,
+) -> Dict[str, Any]:
+    """
+    Create many employees with chunked multi-row INSERT statements.
+
+    Emails that repeat within the request or already exist in the table are
+    reported per item and skipped. By default every chunk commits on its own;
+    with single_transaction the whole batch commits once at the end.
+
+    Args:
+        employees_data: Employee dictionaries, in request order
+        chunk_size: Number of rows per INSERT statement
+        single_transaction: Commit the whole batch in one transaction
+        abort_on_error: Roll back and stop at the first failed item
+
+    Returns:
+        Dictionary with "ids" (assigned id or None per item), "errors"
+        (list of {"index", "error"}) and "aborted"; items after the point
+        of an abort are neither created nor listed in "errors"
     """
+    ids: List[Optional[int]] = [None] * len(employees_data)
+
+    # Only the first occurrence of an email within the request is inserted
+    pending, errors = split_request_duplicates(employees_data)
+
+    if errors and abort_on_error:
+        return {"ids": ids, "errors": errors, "aborted": True}
 
+    aborted = False
     try:
         with DatabaseConnection.get_connection() as conn:
-            # Use buffered=True to ensure the result set is fully read
-            cursor = conn.cursor(dictionary=True, buffered=True)
+            cursor = _cursor(conn)
+            # (request index, email) of rows inserted but not yet committed / committed
+            uncommitted: List[Tuple[int, str]] = []
+            committed: List[Tuple[int, str]] = []
             try:
-                cursor.execute(select_query, (employee_id,))
-                row = cursor.fetchone()  # fetch to consume
+                if single_transaction:
+                    conn.start_transaction()
+                for offset in range(0, len(pending), chunk_size):
+                    chunk = pending[offset:offset + chunk_size]
+                    if not single_transaction:
+                        conn.start_transaction()
+
+                    existing = _existing_emails(cursor, [data["email"] for _, data in chunk])
+                    to_insert = []
+                    chunk_errors = []
+                    for index, data in chunk:
+                        if _email_key(data["email"]) in existing:
+                            chunk_errors.append((index, "Email already exists"))
+                        else:
+                            to_insert.append((index, data))
+                    if to_insert:
+                        chunk_errors.extend(_insert_chunk(cursor, to_insert))
+
+                    errors.extend({"index": index, "error": error} for index, error in chunk_errors)
+                    if chunk_errors and abort_on_error:
+                        conn.rollback()
+                        aborted = True
+                        break
+
+                    failed = {index for index, _ in chunk_errors}
+                    inserted = [(index, data) for index, data in to_insert if index not in failed]
+                    summary.apply_deltas(cursor, summary.add_employees({}, (data for _, data in inserted)))
+                    uncommitted.extend((index, data["email"]) for index, data in inserted)
+                    if not single_transaction:
+                        if uncommitted:
+                            _bump_write_version(conn)
+                        conn.commit()
+                        committed.extend(uncommitted)
+                        uncommitted = []
+
+                if single_transaction and not aborted:
+                    if uncommitted:
+                        _bump_write_version(conn)
+                    conn.commit()
+                    committed.extend(uncommitted)
+
+                if committed:
+                    _invalidate_cache([])
+                ids_by_email = _ids_by_email(cursor, [email for _, email in committed], chunk_size)
+                for index, email in committed:
+                    ids[index] = ids_by_email.get(_email_key(email))
+            except Exception:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
             finally:
                 cursor.close()
 
-            if row:
-                # Convert hire_date string to date object if present
-                if row.get("hire_date") and isinstance(row["hire_date"], str):
-                    row["hire_date"] = date.fromisoformat(row["hire_date"])
-                return Employee.from_dict(row)
-            return None
+        errors.sort(key=lambda error: error["index"])
+        return {"ids": ids, "errors": errors, "aborted": aborted}
+    except Error as e:
+        print(f"Error bulk creating employees: {e}")
+        raise
+
+
+def _fetch_employee(conn, employee_id: int) -> Optional[Employee]:
+    """Read one employee on an already checked-out connection."""
+    with _fixed_statement(conn, SELECT_EMPLOYEE_BY_ID) as cursor:
+        cursor.execute(SELECT_EMPLOYEE_BY_ID, (employee_id,))
+        rows = cursor.fetchall()  # fetch to consume
+        row = dict(zip(cursor.column_names, rows[0])) if rows else None
+
+    if row:
+        # Convert hire_date string to date object if present
+        if row.get("hire_date") and isinstance(row["hire_date"], str):
+            row["hire_date"] = date.fromisoformat(row["hire_date"])
+        return Employee.from_dict(row)
+    return None
+
+
+@metrics.instrument("get_employee", rows=lambda employee: 1 if employee else 0)
+def get_employee(employee_id: int) -> Optional[Employee]:
+    """
+    Retrieve a single employee by ID.
+
+    Args:
+        employee_id: Unique employee identifier
+
+    Returns:
+        Employee object if found, None otherwise
+    """
+    cache = get_cache()
+    if cache is not None:
+        cached = cache.get_employee(employee_id)
+        if cached is not None:
+            return Employee.from_dict(cached)
+        version = cache.write_version()
+
+    try:
+        with DatabaseConnection.get_connection(read_only=True) as conn:
+            employee = _fetch_employee(conn, employee_id)
+            if employee is not None and cache is not None and not DatabaseConnection.from_replica(conn):
+                cache.set_employee(employee_id, {**employee.to_dict(), "updated_at": employee.updated_at}, version)
+            return employee
     except Error as e:
         print(f"Error retrieving employee: {e}")
         raise
 
 
+@metrics.instrument("get_all_employees", rows=len)
 def get_all_employees() -> List[Employee]:
     """
     Retrieve all employees from the database.
@@ -96,6 +518,13 @@ def get_all_employees() -> List[Employee]:
     Returns:
         List of Employee objects
     """
+    cache = get_cache()
+    if cache is not None:
+        version = cache.write_version()
+        cached = cache.get_list("all", (), version)
+        if cached is not None:
+            return [Employee.from_dict(data) for data in cached]
+
     select_query = """
     SELECT id, name, email, phone, department, position, salary, hire_date
     FROM employees
@@ -103,8 +532,8 @@ def get_all_employees() -> List[Employee]:
     """
 
     try:
-        with DatabaseConnection.get_connection() as conn:
-            cursor = conn.cursor(dictionary=True, buffered=True)
+        with DatabaseConnection.get_connection(read_only=True) as conn:
+            cursor = _cursor(conn, dictionary=True, buffered=True)
             try:
                 cursor.execute(select_query)
                 rows = cursor.fetchall()  # fetch all to consume
@@ -118,32 +547,453 @@ def get_all_employees() -> List[Employee]:
                     row["hire_date"] = date.fromisoformat(row["hire_date"])
                 employees.append(Employee.from_dict(row))
 
+            if cache is not None and not DatabaseConnection.from_replica(conn):
+                cache.set_list("all", (), version, [emp.to_dict() for emp in employees])
             return employees
     except Error as e:
         print(f"Error retrieving employees: {e}")
         raise
 
 
+@metrics.instrument("get_collection_version")
+def get_collection_version() -> Dict[str, Any]:
+    """
+    Return a validator for the employee collection without reading rows.
+
+    Derived from database state only, so every process and every replica
+    computes the same version: MAX(updated_at) is an index lookup, the
+    headcount comes from the summary, and the persisted write version is
+    bumped by every write transaction, which covers writes made within the
+    same second that one-second timestamps cannot tell apart.
+
+    Returns:
+        Dictionary with last_modified (Unix seconds, None when empty), count
+        and write_version
+    """
+    try:
+        with DatabaseConnection.get_connection(read_only=True) as conn:
+            with _fixed_statement(conn, SELECT_COLLECTION_VERSION) as cursor:
+                cursor.execute(SELECT_COLLECTION_VERSION)
+                last_modified, count, write_version = cursor.fetchall()[0]
+        return {
+            "last_modified": float(last_modified) if last_modified is not None else None,
+            "count": int(count),
+            "write_version": int(write_version),
+        }
+    except Error as e:
+        print(f"Error reading employee collection version: {e}")
+        raise
+
+
+def _sync_bound(cursor) -> Tuple[int, int]:
+    """
+    Read the server clock and the upper bound for a change read.
+
+    Returns:
+        Tuple of (now, bound) in Unix seconds
+    """
+    cursor.execute(SELECT_SYNC_CLOCK)
+    now = int(cursor.fetchall()[0][0])
+    bound = now - SyncConfig.LAG_SECONDS
+    try:
+        cursor.execute(SELECT_OLDEST_WRITE_TRANSACTION)
+        oldest = cursor.fetchall()[0][0]
+    except Error as e:
+        # Needs the PROCESS privilege; without it SYNC_LAG_SECONDS alone
+        # has to cover the longest write transaction
+        if e.errno != errorcode.ER_SPECIFIC_ACCESS_DENIED_ERROR:
+            raise
+        oldest = None
+    if oldest is not None:
+        bound = min(bound, int(oldest))
+    return now, bound
+
+
+@metrics.instrument("get_changes", rows=lambda changes: len(changes["rows"]) + len(changes["deleted"]))
+def get_changes(since: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+    """
+    Retrieve employees changed and ids deleted after a change feed position.
+
+    Rows are read in (updated_at, id) order and tombstones in (deleted_at,
+    id) order, each as a range scan of its timestamp index, so the cost
+    follows the number of changes rather than the table size. Both stop
+    below a bound of SYNC_LAG_SECONDS before now, or the start of the
+    oldest running write transaction if that is earlier.
+
+    Args:
+        since: Position returned by the previous call, None for a full sync
+        limit: Maximum number of rows, and of deleted ids, to return
+
+    Returns:
+        Dictionary with rows, deleted, next and has_more
+
+    Raises:
+        SyncTokenExpiredError: If tombstones after the position may have been purged
+    """
+    try:
+        with DatabaseConnection.get_connection() as conn:
+            cursor = _cursor(conn)
+            try:
+                now, bound = _sync_bound(cursor)
+                updated_after, deleted_after = sync_positions(since, now, bound)
+                # Fetch one extra entry to find out whether more remain
+                if updated_after is None:
+                    cursor.execute(SELECT_ALL_CHANGED_EMPLOYEES, (bound, limit + 1))
+                else:
+                    stamp, employee_id = updated_after
+                    cursor.execute(SELECT_CHANGED_EMPLOYEES, (stamp, stamp, employee_id, bound, limit + 1))
+                updated = [(int(row[-1]), _json_row(row[:-1])) for row in cursor.fetchall()]
+                stamp, employee_id = deleted_after
+                cursor.execute(SELECT_TOMBSTONES, (stamp, stamp, employee_id, bound, limit + 1))
+                deleted = [(int(stamp), employee_id) for stamp, employee_id in cursor.fetchall()]
+            finally:
+                cursor.close()
+        return changes_result(since, bound, limit, updated, deleted)
+    except Error as e:
+        print(f"Error retrieving employee changes: {e}")
+        raise
+
+
+@metrics.instrument("purge_tombstones", rows=int)
+def purge_tombstones(older_than_seconds: float) -> int:
+    """
+    Delete tombstones older than the given age.
+
+    Deletes in batches of SYNC_PURGE_BATCH_SIZE, each its own transaction,
+    so purging a large backlog never holds many row locks at once.
+
+    Args:
+        older_than_seconds: Age beyond which tombstones are deleted
+
+    Returns:
+        Number of tombstones deleted
+    """
+    purged = 0
+    try:
+        with DatabaseConnection.get_connection() as conn:
+            cursor = _cursor(conn)
+            try:
+                while True:
+                    cursor.execute(PURGE_TOMBSTONES, (int(older_than_seconds), SyncConfig.PURGE_BATCH_SIZE))
+                    purged += cursor.rowcount
+                    if cursor.rowcount < SyncConfig.PURGE_BATCH_SIZE:
+                        return purged
+            finally:
+                cursor.close()
+    except Error as e:
+        print(f"Error purging employee tombstones: {e}")
+        raise
+
+
+def _json_row(row: Tuple[Any, ...]) -> List[Any]:
+    """Convert a raw row in EMPLOYEE_COLUMNS order to JSON-ready values."""
+    employee_id, name, email, phone, department, position, salary, hire_date = row
+    return [
+        employee_id,
+        name,
+        email,
+        phone,
+        department,
+        position,
+        float(salary) if salary is not None else None,
+        str(hire_date) if hire_date is not None else None,
+    ]
+
+
+@metrics.instrument("get_employee_stats", rows=len)
+def get_employee_stats(dimension: str) -> List[Dict[str, Any]]:
+    """
+    Retrieve headcount and salary aggregates from the employee summary.
+
+    Args:
+        dimension: "department", "position" or "hire_month"
+
+    Returns:
+        One dictionary per group with key (None for employees without a
+        value), headcount, total_salary and average_salary (None when no
+        employee in the group has a salary), ordered by key
+    """
+    if dimension not in summary.SUMMARY_DIMENSIONS:
+        raise ValueError(f"Unsupported dimension: {dimension}")
+
+    cache = get_cache()
+    if cache is not None:
+        version = cache.write_version()
+        cached = cache.get_list("stats", (dimension,), version)
+        if cached is not None:
+            return cached
+
+    try:
+        with DatabaseConnection.get_connection(read_only=True) as conn:
+            with _fixed_statement(conn, SELECT_EMPLOYEE_SUMMARY) as cursor:
+                cursor.execute(SELECT_EMPLOYEE_SUMMARY, (dimension,))
+                rows = cursor.fetchall()
+
+            groups = [
+                {
+                    "key": group_key if group_key != summary.NO_GROUP else None,
+                    "headcount": headcount,
+                    "total_salary": float(salary_total),
+                    "average_salary": round(float(salary_total) / salary_count, 2) if salary_count else None,
+                }
+                for group_key, headcount, salary_count, salary_total in rows
+            ]
+            if cache is not None and not DatabaseConnection.from_replica(conn):
+                cache.set_list("stats", (dimension,), version, groups)
+            return groups
+    except Error as e:
+        print(f"Error retrieving employee stats: {e}")
+        raise
+
+
+@metrics.instrument("rebuild_employee_summary", rows=lambda counts: sum(counts.values()))
+def rebuild_employee_summary() -> Dict[str, int]:
+    """
+    Recompute the employee summary from scratch.
+
+    Needed after employees were loaded or changed outside this module.
+
+    Returns:
+        Number of groups written per dimension
+    """
+    try:
+        with DatabaseConnection.get_connection() as conn:
+            groups = summary.rebuild_summary(conn)
+        _invalidate_cache([])
+        return groups
+    except Error as e:
+        print(f"Error rebuilding employee summary: {e}")
+        raise
+
+
+@metrics.instrument("get_employee_rows_page", rows=lambda page: len(page[0]))
+def get_employee_rows_page(
+    limit: int,
+    after: Optional[Dict[str, Any]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    sort: str = DEFAULT_LIST_SORT,
+) -> Tuple[List[List[Any]], Optional[Dict[str, Any]]]:
+    """
+    Retrieve one filtered and sorted page of employees as JSON-ready rows.
+
+    This is the fast path behind the list endpoint: rows skip the Employee
+    and Pydantic models and keep the EMPLOYEE_COLUMNS order, with salary as
+    float and hire_date as an ISO string.
+
+    Pages use keyset pagination on (sort column, id), so the cost of a page
+    does not depend on its depth. The default newest-first order without
+    filters runs as a fixed (preparable) statement.
+
+    Args:
+        limit: Maximum number of employees to return
+        after: Keyset position returned for the previous page
+        filters: Optional department, position, salary_min, salary_max,
+            hired_after and hired_before
+        sort: One of LIST_SORTS; a leading "-" means descending
+
+    Returns:
+        Tuple of (rows, next_position); next_position is None on the last page
+    """
+    if sort not in LIST_SORTS:
+        raise ValueError(f"Unsupported sort: {sort}")
+    filters = {key: value for key, value in (filters or {}).items() if value is not None}
+    column = sort.lstrip("-")
+    after_value = after.get("v") if after is not None and column != "id" else None
+
+    cache = get_cache()
+    if cache is not None:
+        version = cache.write_version()
+        cache_params = (
+            limit,
+            sort,
+            after["id"] if after is not None else None,
+            after_value,
+            *(f"{key}={value}" for key, value in sorted(filters.items())),
+        )
+        cached = cache.get_list("page", cache_params, version)
+        if cached is not None:
+            return cached["rows"], cached["next"]
+
+    # Fetch one extra row to find out whether another page exists
+    fixed = not filters and sort == DEFAULT_LIST_SORT
+    if not fixed:
+        select_query, params = build_page_query(limit + 1, after, filters, sort)
+    elif after is None:
+        select_query, params = SELECT_EMPLOYEES_FIRST_PAGE, [limit + 1]
+    else:
+        select_query, params = SELECT_EMPLOYEES_NEXT_PAGE, [after["id"], limit + 1]
+
+    try:
+        with DatabaseConnection.get_connection(read_only=True) as conn:
+            if fixed:
+                with _fixed_statement(conn, select_query) as cursor:
+                    cursor.execute(select_query, params)
+                    raw_rows = cursor.fetchall()
+            else:
+                # Built per filter/sort combination, so not worth preparing
+                cursor = _cursor(conn)
+                try:
+                    cursor.execute(select_query, params)
+                    raw_rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+
+            rows = [_json_row(row) for row in raw_rows[:limit]]
+            next_position = None
+            if len(raw_rows) > limit:
+                next_position = {"id": rows[-1][0]}
+                if column != "id":
+                    next_position["v"] = rows[-1][EMPLOYEE_COLUMNS.index(column)]
+            if cache is not None and not DatabaseConnection.from_replica(conn):
+                cache.set_list("page", cache_params, version, {"rows": rows, "next": next_position})
+            return rows, next_position
+    except Error as e:
+        print(f"Error retrieving employee page: {e}")
+        raise
+
+
+def get_employees_page(
+    limit: int,
+    after_id: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Tuple[List[Employee], Optional[int]]:
+    """
+    Retrieve one page of employees, newest first, using keyset pagination on the primary key.
+
+    Args:
+        limit: Maximum number of employees to return
+        after_id: Return only employees with an id lower than this value
+        filters: Optional attribute filters, see get_employee_rows_page
+
+    Returns:
+        Tuple of (employees, next_after_id); next_after_id is None on the last page
+    """
+    after = {"id": after_id} if after_id is not None else None
+    rows, next_position = get_employee_rows_page(limit, after, filters)
+    employees = [Employee.from_dict(dict(zip(EMPLOYEE_COLUMNS, row))) for row in rows]
+    return employees, next_position["id"] if next_position is not None else None
+
+
+def _search_expression(query: str) -> str:
+    """
+    Turn free text into a boolean-mode FULLTEXT expression requiring every term.
+
+    Each term is quoted, so characters such as "@", "." or "-" in email
+    addresses are matched literally instead of being read as operators.
+    Terms shorter than the ngram token size cannot match and are dropped.
+
+    Args:
+        query: Search text as typed by the user
+
+    Returns:
+        Boolean-mode expression, or an empty string if no usable term remains
+    """
+    terms = [term.replace('"', "") for term in query.split()]
+    return " ".join(f'+"{term}"' for term in terms if len(term) >= 2)
+
+
+@metrics.instrument("search_employee_rows", rows=len)
+def search_employee_rows(query: str, limit: int = 10) -> List[List[Any]]:
+    """
+    Search employees by name, email, department and position.
+
+    Served by the ngram FULLTEXT index, so substrings of any of the four
+    columns match. Employees whose name starts with the query come first,
+    then the rest by relevance.
+
+    Args:
+        query: Search text; every whitespace-separated term must match
+        limit: Maximum number of employees to return
+
+    Returns:
+        JSON-ready rows in EMPLOYEE_COLUMNS order, best match first
+    """
+    text = " ".join(query.split())
+    expression = _search_expression(text)
+    if not expression:
+        return []
+
+    cache = get_cache()
+    if cache is not None:
+        version = cache.write_version()
+        cached = cache.get_list("search", (limit, text), version)
+        if cached is not None:
+            return cached
+
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    params = (expression, escaped + "%", expression, limit)
+    try:
+        with DatabaseConnection.get_connection(read_only=True) as conn:
+            with _fixed_statement(conn, SEARCH_EMPLOYEES) as cursor:
+                cursor.execute(SEARCH_EMPLOYEES, params)
+                rows = [_json_row(row) for row in cursor.fetchall()]
+            if cache is not None and not DatabaseConnection.from_replica(conn):
+                cache.set_list("search", (limit, text), version, rows)
+            return rows
+    except Error as e:
+        print(f"Error searching employees: {e}")
+        raise
+
+
+@metrics.instrument("iter_employee_batches")
+def iter_employee_batches(batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream all employees in id order from an unbuffered server-side cursor.
+
+    A single pooled connection is held until the generator is exhausted or
+    closed, and at most one batch of rows is held in memory at a time.
+
+    Args:
+        batch_size: Number of rows fetched from the server per batch
+
+    Yields:
+        Lists of employee dictionaries (as produced by Employee.to_dict)
+    """
+    select_query = """
+    SELECT id, name, email, phone, department, position, salary, hire_date
+    FROM employees
+    ORDER BY id
+    """
+
+    try:
+        with DatabaseConnection.get_connection(read_only=True) as conn:
+            cursor = _cursor(conn)
+            try:
+                cursor.execute(select_query)
+                columns = cursor.column_names
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield [Employee.from_dict(dict(zip(columns, row))).to_dict() for row in rows]
+            finally:
+                # An abandoned stream leaves rows on the wire; drain them so the
+                # connection can go back to the pool in a clean state
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
+    except Error as e:
+        print(f"Error streaming employees: {e}")
+        raise
+
+
+@metrics.instrument("update_employee", rows=lambda employee: 1 if employee else 0)
 def update_employee(employee_id: int, employee_data: Dict[str, Any]) -> Optional[Employee]:
     """
     Update an existing employee record.
 
+    The row is locked and read, updated, and the employee summary adjusted in
+    one transaction on one pooled connection. The response is the locked row
+    merged with the changes, so no read-back query is needed.
+
     Args:
         employee_id: Unique employee identifier
         employee_data: Dictionary containing fields to update
 
     Returns:
-        Updated Employee object if successful, None otherwise
+        Updated Employee object if successful, None if not found
     """
-    # Build dynamic update query based on provided fields
-    update_fields = []
-    values: List[Any] = []
-
-    allowed_fields = ["name", "email", "phone", "department", "position", "salary", "hire_date"]
-    for field in allowed_fields:
-        if field in employee_data and employee_data[field] is not None:
-            update_fields.append(f"{field} = %s")
-            values.append(employee_data[field])
+    update_fields, values = build_set_clause(employee_data)
 
     if not update_fields:
         # No fields to update
@@ -155,51 +1005,224 @@ def update_employee(employee_id: int, employee_data: Dict[str, Any]) -> Optional
     SET {', '.join(update_fields)}
     WHERE id = %s
     """
+    changes = {field: value for field, value in employee_data.items() if value is not None}
 
     try:
         with DatabaseConnection.get_connection() as conn:
-            cursor = conn.cursor()
+            conn.start_transaction()
+            cursor = _cursor(conn)
             try:
+                cursor.execute(SELECT_EMPLOYEE_FOR_UPDATE, (employee_id,))
+                rows = cursor.fetchall()
+                if not rows:
+                    conn.rollback()
+                    return None
+                before = dict(zip(EMPLOYEE_COLUMNS, rows[0]))
+                after = {**before, **changes}
+
                 cursor.execute(update_query, tuple(values))
+                if any(field in changes for field in summary.SUMMARY_SOURCE_COLUMNS):
+                    deltas = summary.add_employees({}, [before], sign=-1)
+                    summary.apply_deltas(cursor, summary.add_employees(deltas, [after]))
+                _bump_write_version(conn)
                 conn.commit()
-                affected_rows = cursor.rowcount
+            except Exception:
+                conn.rollback()
+                raise
             finally:
                 cursor.close()
 
-            if affected_rows > 0:
-                return get_employee(employee_id)
-            return None
+            _invalidate_cache([employee_id])
+            salary = after.get("salary")
+            return Employee.from_dict({
+                **after,
+                # Mirror the DECIMAL(10, 2) column
+                "salary": round(salary, 2) if salary is not None else None,
+            })
     except Error as e:
         print(f"Error updating employee: {e}")
         raise
 
 
+@metrics.instrument("delete_employee", rows=int)
 def delete_employee(employee_id: int) -> bool:
     """
     Delete an employee record from the database.
 
+    The row is locked and read first so its contribution can be removed
+    from the employee summary in the same transaction, which also records
+    a tombstone for the change feed.
+
     Args:
         employee_id: Unique employee identifier
 
     Returns:
         True if deletion was successful, False otherwise
     """
-    delete_query = """
-    DELETE FROM employees
-    WHERE id = %s
+    try:
+        with DatabaseConnection.get_connection() as conn:
+            conn.start_transaction()
+            cursor = _cursor(conn)
+            try:
+                cursor.execute(SELECT_EMPLOYEE_FOR_UPDATE, (employee_id,))
+                rows = cursor.fetchall()
+                if not rows:
+                    conn.rollback()
+                    return False
+                cursor.execute(DELETE_EMPLOYEE, (employee_id,))
+                cursor.execute(INSERT_TOMBSTONE, (employee_id,))
+                summary.apply_deltas(cursor, summary.add_employees({}, [dict(zip(EMPLOYEE_COLUMNS, rows[0]))], sign=-1))
+                _bump_write_version(conn)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+            _invalidate_cache([employee_id])
+            return True
+    except Error as e:
+        print(f"Error deleting employee: {e}")
+        raise
+
+
+def _select_ids_for_update(cursor, where_clause: str, values: List[Any]) -> List[int]:
+    """Lock the matching rows and return their ids."""
+    cursor.execute(f"SELECT id FROM employees WHERE {where_clause} ORDER BY id FOR UPDATE", tuple(values))
+    return [row[0] for row in cursor.fetchall()]
+
+
+@metrics.instrument("bulk_update_employees", rows=lambda result: result["affected"])
+def bulk_update_employees(
+    employee_data: Dict[str, Any],
+    ids: Optional[List[int]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    salary_factor: Optional[float] = None,
+    return_ids: bool = False,
+) -> Dict[str, Any]:
+    """
+    Apply the same change to every matching employee in one UPDATE statement.
+
+    When the change affects summarized columns, the matching rows are locked
+    and the employee summary is adjusted in the same transaction.
+
+    Args:
+        employee_data: Dictionary containing fields to set
+        ids: Explicit employee ids to update
+        filters: Attribute filters, see build_filter_clause
+        salary_factor: Multiply salaries by this factor
+        return_ids: Also return the ids of the matched employees
+
+    Returns:
+        Dictionary with "affected" and, if requested, "ids"
+
+    Raises:
+        ValueError: If no selector or no change is given
     """
+    update_fields, set_values = build_set_clause(employee_data, salary_factor)
+    conditions, where_values = build_filter_clause(ids, filters)
+    if not conditions:
+        raise ValueError("A bulk update needs ids or at least one filter")
+    if not update_fields:
+        raise ValueError("A bulk update needs at least one change")
+
+    where_clause = " AND ".join(conditions)
+    update_query = f"UPDATE employees SET {', '.join(update_fields)} WHERE {where_clause}"
+    touches_summary = salary_factor is not None or any(
+        employee_data.get(field) is not None for field in summary.SUMMARY_SOURCE_COLUMNS
+    )
 
     try:
         with DatabaseConnection.get_connection() as conn:
-            cursor = conn.cursor()
+            cursor = _cursor(conn)
             try:
-                cursor.execute(delete_query, (employee_id,))
+                conn.start_transaction()
+                matched_ids = None
+                if return_ids or touches_summary:
+                    matched_ids = _select_ids_for_update(cursor, where_clause, where_values)
+                if touches_summary:
+                    # The update may move rows out of the filter, so the
+                    # summary is adjusted by id before and after it
+                    deltas = summary.add_ids({}, cursor, matched_ids, sign=-1)
+                cursor.execute(update_query, tuple(set_values + where_values))
+                affected_rows = cursor.rowcount
+                if touches_summary:
+                    summary.apply_deltas(cursor, summary.add_ids(deltas, cursor, matched_ids))
+                if affected_rows > 0:
+                    _bump_write_version(conn)
                 conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+            if affected_rows > 0:
+                _invalidate_cache(ids or matched_ids)
+            return {"affected": affected_rows, "ids": matched_ids if return_ids else None}
+    except Error as e:
+        print(f"Error bulk updating employees: {e}")
+        raise
+
+
+@metrics.instrument("bulk_delete_employees", rows=lambda result: result["affected"])
+def bulk_delete_employees(
+    ids: Optional[List[int]] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    return_ids: bool = False,
+) -> Dict[str, Any]:
+    """
+    Delete every matching employee in one DELETE statement.
+
+    The rows are locked and aggregated first so the employee summary can be
+    adjusted in the same transaction; their ids are copied into the
+    tombstones before the delete.
+
+    Args:
+        ids: Explicit employee ids to delete
+        filters: Attribute filters, see build_filter_clause
+        return_ids: Also return the ids of the deleted employees
+
+    Returns:
+        Dictionary with "affected" and, if requested, "ids"
+
+    Raises:
+        ValueError: If no selector is given
+    """
+    conditions, where_values = build_filter_clause(ids, filters)
+    if not conditions:
+        raise ValueError("A bulk delete needs ids or at least one filter")
+
+    where_clause = " AND ".join(conditions)
+
+    try:
+        with DatabaseConnection.get_connection() as conn:
+            cursor = _cursor(conn)
+            try:
+                conn.start_transaction()
+                deleted_ids = _select_ids_for_update(cursor, where_clause, where_values) if return_ids else None
+                deltas = summary.add_matching({}, cursor, where_clause, where_values, sign=-1, lock=True)
+                cursor.execute(
+                    f"INSERT INTO employee_tombstones (id) SELECT id FROM employees WHERE {where_clause} "
+                    "ON DUPLICATE KEY UPDATE deleted_at = CURRENT_TIMESTAMP",
+                    tuple(where_values),
+                )
+                cursor.execute(f"DELETE FROM employees WHERE {where_clause}", tuple(where_values))
                 affected_rows = cursor.rowcount
+                summary.apply_deltas(cursor, deltas)
+                if affected_rows > 0:
+                    _bump_write_version(conn)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
             finally:
                 cursor.close()
 
-            return affected_rows > 0
+            if affected_rows > 0:
+                _invalidate_cache(ids or deleted_ids)
+            return {"affected": affected_rows, "ids": deleted_ids}
     except Error as e:
-        print(f"Error deleting employee: {e}")
+        print(f"Error bulk deleting employees: {e}")
         raise
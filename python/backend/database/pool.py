@@ -0,0 +1,309 @@
+"""
+Bounded MySQL connection pool with blocking acquire and idle health checks.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+from mysql.connector.errors import PoolError  # type: ignore
+
+
+class PoolTimeoutError(PoolError):
+    """Raised when no connection becomes available within the acquire timeout."""
+
+
+class _PooledConnection:
+    """Bookkeeping for one physical connection."""
+
+    __slots__ = ("connection", "created_at", "last_used_at")
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+
+class ConnectionPool:
+    """
+    Thread-safe connection pool.
+
+    Callers beyond max_size wait in a queue for up to acquire_timeout seconds
+    instead of failing immediately. Idle connections are reused LIFO, pinged
+    only after sitting idle for longer than ping_idle_after, and replaced once
+    they are older than max_lifetime.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 5,
+        acquire_timeout: float = 10.0,
+        max_lifetime: float = 1800.0,
+        ping_idle_after: float = 30.0,
+        reset_session: bool = False,
+        on_reset: Optional[Callable[[Any], None]] = None,
+    ):
+        """
+        Initialize the pool without opening any connections.
+
+        Args:
+            connect: Factory returning a new open connection
+            min_size: Connections opened by warm()
+            max_size: Upper bound on open connections
+            acquire_timeout: Seconds to wait for a free connection
+            max_lifetime: Seconds after which a connection is replaced
+            ping_idle_after: Idle seconds after which a connection is pinged before reuse
+            reset_session: Reset session state whenever a connection is returned
+            on_reset: Called with a connection whose session state was lost
+                through a reset or a reconnect
+        """
+        self._connect = connect
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.max_lifetime = max_lifetime
+        self.ping_idle_after = ping_idle_after
+        self.reset_session = reset_session
+        self._on_reset = on_reset
+
+        self._cond = threading.Condition()
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._waiters = 0
+        self._closed = False
+        self._counters = {
+            "acquired": 0,
+            "created": 0,
+            "closed": 0,
+            "timeouts": 0,
+            "pings": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+
+    def warm(self) -> None:
+        """Open connections until min_size are available."""
+        while True:
+            with self._cond:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                entry = self._open()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._idle.append(entry)
+                self._cond.notify()
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """
+        Check out a connection, waiting if the pool is at capacity.
+
+        Args:
+            timeout: Seconds to wait; defaults to acquire_timeout
+
+        Returns:
+            Open connection
+
+        Raises:
+            PoolTimeoutError: If no connection is available in time
+        """
+        timeout = self.acquire_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        entry: Optional[_PooledConnection] = None
+
+        with self._cond:
+            if self._closed:
+                raise PoolError("Connection pool is closed")
+            self._waiters += 1
+            try:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if self._closed:
+                        raise PoolError("Connection pool is closed")
+                    if remaining <= 0:
+                        self._counters["timeouts"] += 1
+                        raise PoolTimeoutError(
+                            f"No connection available within {timeout:g}s "
+                            f"(pool size {self.max_size})"
+                        )
+                    self._cond.wait(remaining)
+                if self._idle:
+                    entry = self._idle.pop()
+                else:
+                    self._size += 1
+            finally:
+                self._waiters -= 1
+            waited = time.monotonic() - started
+            self._counters["acquired"] += 1
+            self._counters["wait_time_total"] += waited
+            self._counters["wait_time_max"] = max(self._counters["wait_time_max"], waited)
+
+        return self._check_out(entry)
+
+    def try_acquire(self) -> Optional[Any]:
+        """
+        Check out a connection only if one is free right away.
+
+        Unlike acquire(timeout=0), finding the pool at capacity is not counted
+        as a timeout, so side work can use spare connections without showing
+        up as pool pressure.
+
+        Returns:
+            Open connection, or None if the pool is at capacity or closed
+        """
+        with self._cond:
+            if self._closed or (not self._idle and self._size >= self.max_size):
+                return None
+            entry: Optional[_PooledConnection] = None
+            if self._idle:
+                entry = self._idle.pop()
+            else:
+                self._size += 1
+            self._counters["acquired"] += 1
+
+        return self._check_out(entry)
+
+    def _check_out(self, entry: Optional[_PooledConnection]) -> Any:
+        """Prepare an idle entry, or open a new one for a reserved slot, and mark it in use."""
+        try:
+            entry = self._prepare(entry) if entry is not None else self._open()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+
+        with self._cond:
+            self._in_use[id(entry.connection)] = entry
+        return entry.connection
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Return a connection to the pool.
+
+        Args:
+            connection: Connection obtained from acquire()
+            discard: Close the connection instead of reusing it
+        """
+        with self._cond:
+            entry = self._in_use.pop(id(connection), None)
+        if entry is None:
+            return
+
+        if not discard:
+            try:
+                if connection.unread_result:
+                    connection.consume_results()
+                if connection.in_transaction:
+                    connection.rollback()
+                if self.reset_session:
+                    connection.reset_session()
+                    if self._on_reset is not None:
+                        self._on_reset(connection)
+            except Exception:
+                discard = True
+        if self._closed or time.monotonic() - entry.created_at > self.max_lifetime:
+            discard = True
+
+        if discard:
+            self._close(entry)
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            return
+
+        entry.last_used_at = time.monotonic()
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    def close(self, timeout: float = 0.0) -> int:
+        """
+        Close the pool: idle connections now, in-use ones as they are released.
+
+        Args:
+            timeout: Seconds to wait for in-use connections to be released
+
+        Returns:
+            Number of connections still in use when the wait ended
+        """
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._closed = True
+            self._cond.notify_all()
+        for entry in idle:
+            self._close(entry)
+
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._size > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            return self._size
+
+    def owns(self, connection: Any) -> bool:
+        """Return True if connection is checked out of this pool."""
+        with self._cond:
+            return id(connection) in self._in_use
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of pool occupancy and counters."""
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "min_size": self.min_size,
+                "size": self._size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "waiters": self._waiters,
+                **self._counters,
+            }
+
+    def _open(self) -> _PooledConnection:
+        """Open a new physical connection."""
+        entry = _PooledConnection(self._connect())
+        with self._cond:
+            self._counters["created"] += 1
+        return entry
+
+    def _close(self, entry: _PooledConnection) -> None:
+        """Close a physical connection, ignoring errors."""
+        try:
+            entry.connection.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._counters["closed"] += 1
+
+    def _prepare(self, entry: _PooledConnection) -> _PooledConnection:
+        """Replace or health-check an idle connection before handing it out."""
+        now = time.monotonic()
+        if now - entry.created_at > self.max_lifetime:
+            self._close(entry)
+            return self._open()
+        if now - entry.last_used_at > self.ping_idle_after:
+            with self._cond:
+                self._counters["pings"] += 1
+            session = getattr(entry.connection, "connection_id", None)
+            try:
+                entry.connection.ping(reconnect=True, attempts=1, delay=0)
+            except Exception:
+                self._close(entry)
+                return self._open()
+            if self._on_reset is not None and entry.connection.connection_id != session:
+                self._on_reset(entry.connection)
+        return entry
@@ -0,0 +1,362 @@
+"""
+Per-statement query profiler.
+
+Cursors handed out by the operations module are wrapped in ProfiledCursor,
+which times execute and fetch calls and reports each statement to the
+process-wide QueryProfiler once its results are consumed. The profiler
+aggregates by normalized SQL (literals and placeholders replaced, value
+lists collapsed), logs executions slower than SLOW_QUERY_MS with redacted
+parameters, and captures EXPLAIN FORMAT=JSON the first time each normalized
+statement runs. GET /debug/queries reports the top statements by total time.
+"""
+
+import functools
+import json
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set
+
+from backend.config import ProfilerConfig
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_VALUE_ROWS = re.compile(r"(\(\.\.\.\))(?:\s*,\s*\(\.\.\.\))+")
+
+# Statements EXPLAIN accepts and whose plan is worth reading
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE")
+
+# Parameters shown per slow query log line
+_MAX_LOGGED_PARAMS = 20
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """
+    Reduce a statement to its shape so executions can be grouped.
+
+    Literals and placeholders become ?, IN lists and multi-row VALUES
+    collapse to (...), and whitespace is squeezed, so a bulk insert of 500
+    rows and one of 3 rows count as the same statement.
+
+    Args:
+        sql: Statement as sent to the driver
+
+    Returns:
+        Normalized statement
+    """
+    normalized = _STRING_LITERAL.sub("?", sql)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    return _VALUE_ROWS.sub(r"\1, ...", normalized)
+
+
+def redact_params(params: Optional[Sequence[Any]]) -> List[str]:
+    """
+    Describe statement parameters without exposing employee data.
+
+    Integers (ids, limits) and NULLs are kept; every other value is replaced
+    by its type, and strings also by their length.
+
+    Args:
+        params: Parameters passed with the statement
+
+    Returns:
+        One description per parameter, truncated after a fixed count
+    """
+    values = list(params or ())
+    redacted = []
+    for value in values[:_MAX_LOGGED_PARAMS]:
+        if value is None or (isinstance(value, int) and not isinstance(value, bool)):
+            redacted.append(repr(value))
+        elif isinstance(value, str):
+            redacted.append(f"<str:{len(value)}>")
+        else:
+            redacted.append(f"<{type(value).__name__}>")
+    if len(values) > _MAX_LOGGED_PARAMS:
+        redacted.append(f"... {len(values) - _MAX_LOGGED_PARAMS} more")
+    return redacted
+
+
+class _StatementStats:
+    """Aggregates for one normalized statement."""
+
+    __slots__ = ("statement", "calls", "total", "max", "rows", "slow_calls", "plan")
+
+    def __init__(self, statement: str):
+        self.statement = statement
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.slow_calls = 0
+        self.plan: Optional[Dict[str, Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "statement": self.statement,
+            "calls": self.calls,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max * 1000, 3),
+            "rows": self.rows,
+            "slow_calls": self.slow_calls,
+            "plan": self.plan,
+        }
+
+
+class QueryProfiler:
+    """Thread-safe per-statement timing, slow query log and plan capture."""
+
+    def __init__(
+        self,
+        slow_query_ms: float = 100.0,
+        explain: bool = True,
+        max_statements: int = 500,
+        recent_slow: int = 50,
+    ):
+        """
+        Args:
+            slow_query_ms: Executions slower than this are logged
+            explain: Capture EXPLAIN FORMAT=JSON on first occurrence, or on
+                the next one if no connection was free for it
+            max_statements: Distinct normalized statements aggregated; slow
+                executions of further statements are still logged
+            recent_slow: Slow executions kept for reporting
+        """
+        self.slow_query_seconds = slow_query_ms / 1000
+        self.explain = explain
+        self.max_statements = max_statements
+        self._statements: Dict[str, _StatementStats] = {}
+        self._recent_slow: Deque[Dict[str, Any]] = deque(maxlen=recent_slow)
+        self._explaining: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, params: Optional[Sequence[Any]], duration: float, rows: int) -> None:
+        """
+        Account one execution of a statement.
+
+        Args:
+            sql: Statement as sent to the driver
+            params: Parameters passed with it
+            duration: Seconds spent executing and fetching
+            rows: Rows fetched, or affected for writes
+        """
+        statement = normalize_sql(sql)
+        slow = duration >= self.slow_query_seconds
+        explain = False
+        with self._lock:
+            stats = self._statements.get(statement)
+            if stats is None and len(self._statements) < self.max_statements:
+                stats = self._statements[statement] = _StatementStats(statement)
+            if stats is not None:
+                stats.calls += 1
+                stats.total += duration
+                stats.rows += rows
+                if duration > stats.max:
+                    stats.max = duration
+                if slow:
+                    stats.slow_calls += 1
+                explain = (
+                    self.explain
+                    and stats.plan is None
+                    and statement not in self._explaining
+                    and statement.upper().startswith(_EXPLAINABLE)
+                )
+                if explain:
+                    self._explaining.add(statement)
+
+        if slow:
+            redacted = redact_params(params)
+            self._recent_slow.append({
+                "statement": statement,
+                "params": redacted,
+                "duration_ms": round(duration * 1000, 3),
+                "rows": rows,
+                "at": time.time(),
+            })
+            print(f"Slow query ({duration * 1000:.1f} ms, {rows} rows): {statement} params={redacted}")
+        if explain:
+            plan = self._explain(sql, params)
+            with self._lock:
+                self._explaining.discard(statement)
+                if plan is not None:
+                    stats.plan = plan
+
+    @staticmethod
+    def _explain(sql: str, params: Optional[Sequence[Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Run EXPLAIN FORMAT=JSON for a statement on a spare pool connection.
+
+        The statement's own connection may be inside a write transaction, and
+        EXPLAIN always attaches Note 1003, which connections raising on
+        warnings would turn into an error, so the plan is captured on a
+        connection of its own with warnings off.
+
+        Args:
+            sql: Statement as sent to the driver
+            params: Parameters passed with it
+
+        Returns:
+            The plan, {"error": ...} if EXPLAIN failed, or None when no
+            connection was free and a later execution should try again
+        """
+        from backend.database.connection import DatabaseConnection
+
+        try:
+            with DatabaseConnection.spare_connection() as conn:
+                if conn is None:
+                    return None
+                with DatabaseConnection.warnings_ignored(conn):
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute("EXPLAIN FORMAT=JSON " + sql, tuple(params or ()))
+                        row = cursor.fetchone()
+                        cursor.fetchall()
+                    finally:
+                        cursor.close()
+            return json.loads(row[0])
+        except Exception as e:
+            return {"error": str(e)}
+
+    def report(self, limit: int = 20) -> Dict[str, Any]:
+        """
+        Summarize the profiled statements.
+
+        Args:
+            limit: Number of statements to return
+
+        Returns:
+            Dictionary with the slow query threshold, the top statements by
+            total time and the most recent slow executions, newest first
+        """
+        with self._lock:
+            ranked = sorted(self._statements.values(), key=lambda stats: stats.total, reverse=True)
+            statements = [stats.to_dict() for stats in ranked[:limit]]
+            tracked = len(self._statements)
+        return {
+            "slow_query_ms": self.slow_query_seconds * 1000,
+            "tracked_statements": tracked,
+            "statements": statements,
+            "recent_slow": list(reversed(self._recent_slow)),
+        }
+
+    def reset(self) -> None:
+        """Forget every statement, plan and slow execution."""
+        with self._lock:
+            self._statements.clear()
+            self._recent_slow.clear()
+
+
+class ProfiledCursor:
+    """
+    Cursor wrapper reporting each statement to a QueryProfiler.
+
+    Only time spent inside execute and fetch calls is counted, so a streamed
+    result consumed slowly by the caller is not reported as a slow query. A
+    statement is reported when its results were fetched completely, when
+    the next statement runs, or when the cursor is closed or finished.
+    """
+
+    def __init__(self, cursor: Any, profiler: QueryProfiler):
+        self._cursor = cursor
+        self._profiler = profiler
+        self._sql: Optional[str] = None
+        self._params: Optional[Sequence[Any]] = None
+        self._elapsed = 0.0
+        self._fetched: Optional[int] = None
+
+    def execute(self, operation: str, params: Optional[Sequence[Any]] = None, *args: Any, **kwargs: Any) -> Any:
+        self.finish()
+        started = time.perf_counter()
+        try:
+            if params is None:
+                return self._cursor.execute(operation, *args, **kwargs)
+            return self._cursor.execute(operation, params, *args, **kwargs)
+        finally:
+            self._elapsed = time.perf_counter() - started
+            self._sql = operation
+            self._params = params
+            self._fetched = None
+
+    def fetchone(self) -> Any:
+        started = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._elapsed += time.perf_counter() - started
+        if row is not None:
+            self._fetched = (self._fetched or 0) + 1
+        return row
+
+    def fetchmany(self, *args: Any, **kwargs: Any) -> List[Any]:
+        started = time.perf_counter()
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._elapsed += time.perf_counter() - started
+        self._fetched = (self._fetched or 0) + len(rows)
+        return rows
+
+    def fetchall(self) -> List[Any]:
+        started = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._elapsed += time.perf_counter() - started
+        self._fetched = (self._fetched or 0) + len(rows)
+        self.finish()
+        return rows
+
+    def finish(self) -> None:
+        """Report the current statement, if any, without closing the cursor."""
+        if self._sql is None:
+            return
+        sql, params = self._sql, self._params
+        self._sql = self._params = None
+        rows = self._fetched if self._fetched is not None else max(self._cursor.rowcount or 0, 0)
+        self._profiler.record(sql, params, self._elapsed, rows)
+
+    def close(self) -> Any:
+        self.finish()
+        return self._cursor.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+_profiler: Optional[QueryProfiler] = None
+
+
+def get_profiler() -> Optional[QueryProfiler]:
+    """
+    Return the process-wide query profiler, creating it on first use.
+
+    Returns:
+        QueryProfiler, or None when profiling is disabled
+    """
+    global _profiler
+    if _profiler is None and ProfilerConfig.ENABLED:
+        _profiler = QueryProfiler(
+            ProfilerConfig.SLOW_QUERY_MS,
+            ProfilerConfig.EXPLAIN,
+            ProfilerConfig.MAX_STATEMENTS,
+            ProfilerConfig.RECENT_SLOW,
+        )
+    return _profiler
+
+
+def profile_cursor(cursor: Any) -> Any:
+    """
+    Wrap a cursor for profiling when the profiler is enabled.
+
+    Args:
+        cursor: Cursor from conn.cursor() or the prepared statement cache
+
+    Returns:
+        ProfiledCursor, or the cursor itself when profiling is disabled
+    """
+    profiler = get_profiler()
+    if profiler is None:
+        return cursor
+    return ProfiledCursor(cursor, profiler)
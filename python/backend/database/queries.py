@@ -0,0 +1,170 @@
+"""
+SQL fragments shared by the SQL storage backends.
+
+The builders return conditions and parameter values with %s placeholders, the
+paramstyle of the MySQL driver; the SQLite backend rewrites them to "?".
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+# Column order of every employee SELECT and of JSON-ready rows
+EMPLOYEE_COLUMNS = ("id", "name", "email", "phone", "department", "position", "salary", "hire_date")
+
+# Sort keys accepted by the list endpoint; a leading "-" means descending
+LIST_SORTS = ("id", "-id", "name", "-name", "salary", "-salary", "hire_date", "-hire_date")
+DEFAULT_LIST_SORT = "-id"
+
+
+UPDATABLE_FIELDS = ["name", "email", "phone", "department", "position", "salary", "hire_date"]
+
+
+def build_set_clause(
+    employee_data: Dict[str, Any], salary_factor: Optional[float] = None
+) -> Tuple[List[str], List[Any]]:
+    """
+    Build the SET assignments for an UPDATE from the provided fields.
+
+    Fields that are missing or None are left untouched.
+
+    Args:
+        employee_data: Dictionary containing fields to update
+        salary_factor: Multiply the current salary by this factor instead of
+            assigning a value
+
+    Returns:
+        Tuple of (assignment strings, parameter values)
+    """
+    update_fields: List[str] = []
+    values: List[Any] = []
+
+    for field in UPDATABLE_FIELDS:
+        if field in employee_data and employee_data[field] is not None:
+            update_fields.append(f"{field} = %s")
+            values.append(employee_data[field])
+
+    if salary_factor is not None:
+        update_fields.append("salary = ROUND(salary * %s, 2)")
+        values.append(salary_factor)
+
+    return update_fields, values
+
+
+def build_filter_clause(
+    ids: Optional[List[int]] = None, filters: Optional[Dict[str, Any]] = None
+) -> Tuple[List[str], List[Any]]:
+    """
+    Build WHERE conditions selecting employees by id list and/or attributes.
+
+    Args:
+        ids: Explicit employee ids
+        filters: Optional department, position, salary_min, salary_max,
+            hired_after and hired_before (range bounds are inclusive)
+
+    Returns:
+        Tuple of (condition strings, parameter values)
+    """
+    conditions: List[str] = []
+    values: List[Any] = []
+    filters = filters or {}
+
+    if ids:
+        conditions.append(f"id IN ({', '.join(['%s'] * len(ids))})")
+        values.extend(ids)
+    if filters.get("department") is not None:
+        conditions.append("department = %s")
+        values.append(filters["department"])
+    if filters.get("position") is not None:
+        conditions.append("position = %s")
+        values.append(filters["position"])
+    if filters.get("salary_min") is not None:
+        conditions.append("salary >= %s")
+        values.append(filters["salary_min"])
+    if filters.get("salary_max") is not None:
+        conditions.append("salary <= %s")
+        values.append(filters["salary_max"])
+    if filters.get("hired_after") is not None:
+        conditions.append("hire_date >= %s")
+        values.append(filters["hired_after"])
+    if filters.get("hired_before") is not None:
+        conditions.append("hire_date <= %s")
+        values.append(filters["hired_before"])
+
+    return conditions, values
+
+
+def keyset_condition(column: str, descending: bool, after: Dict[str, Any]) -> Tuple[str, List[Any]]:
+    """
+    Build the condition selecting rows strictly after a keyset position.
+
+    Rows are ordered by (column, id), both in the same direction. MySQL and
+    SQLite sort NULLs first in ascending and last in descending order, which
+    the conditions below follow so nullable sort columns page without gaps.
+
+    Args:
+        column: Sort column
+        descending: Whether the sort is descending
+        after: Keyset position {"id": ..., "v": ...}; "v" is the sort column
+            value of the last row returned and is unused when sorting by id
+
+    Returns:
+        Tuple of (condition string, parameter values)
+    """
+    op = "<" if descending else ">"
+    after_id = after["id"]
+    if column == "id":
+        return f"id {op} %s", [after_id]
+
+    value = after.get("v")
+    if value is None:
+        if descending:
+            return f"({column} IS NULL AND id < %s)", [after_id]
+        return f"(({column} IS NULL AND id > %s) OR {column} IS NOT NULL)", [after_id]
+
+    if column == "salary":
+        # Compare against DECIMAL exactly rather than as a float
+        value = Decimal(str(value))
+    condition = f"{column} {op} %s OR ({column} = %s AND id {op} %s)"
+    if descending:
+        condition += f" OR {column} IS NULL"
+    return f"({condition})", [value, value, after_id]
+
+
+def build_page_query(
+    limit: int, after: Optional[Dict[str, Any]], filters: Dict[str, Any], sort: str
+) -> Tuple[str, List[Any]]:
+    """
+    Build the SELECT for one filtered and sorted list page.
+
+    Every filter/sort combination offered by the list endpoint is backed by
+    an index in schema.EMPLOYEE_INDEXES, so the query reads an index range in
+    order instead of scanning and sorting the table.
+
+    Args:
+        limit: Number of rows to fetch
+        after: Keyset position of the last row of the previous page
+        filters: Attribute filters accepted by build_filter_clause
+        sort: Sort key from LIST_SORTS
+
+    Returns:
+        Tuple of (query string, parameter values)
+    """
+    descending = sort.startswith("-")
+    column = sort.lstrip("-")
+    conditions, values = build_filter_clause(filters=filters)
+    if after is not None:
+        condition, condition_values = keyset_condition(column, descending, after)
+        conditions.append(condition)
+        values.extend(condition_values)
+
+    direction = "DESC" if descending else "ASC"
+    order_by = f"id {direction}" if column == "id" else f"{column} {direction}, id {direction}"
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT {', '.join(EMPLOYEE_COLUMNS)}
+        FROM employees
+        {where}
+        ORDER BY {order_by}
+        LIMIT %s
+        """
+    return query, values + [limit]
@@ -0,0 +1,280 @@
+"""
+Read replica routing.
+
+ReplicaRouter picks the replica that serves a read: round robin over the
+replicas whose last lag sample is within DB_REPLICA_MAX_LAG_SECONDS and
+that have not failed recently; when none qualifies the read goes to the
+primary. A background thread samples every replica's lag each
+DB_REPLICA_CHECK_SECONDS. The router does not depend on MySQL:
+DatabaseConnection routes between connection pools with it, and
+ReplicatedEmployeeRepository between storage backends, so routing can be
+exercised locally with two SQLite files standing in for primary and replica.
+
+Reads of a client that has just written go to the primary, so it sees its
+own writes: ReadYourWritesMiddleware runs such requests inside
+primary_reads(), which the worker threads doing their database work inherit.
+"""
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, TypeVar
+
+from backend import metrics
+from backend.database.repository import EmployeeRepository
+from backend.database.queries import DEFAULT_LIST_SORT
+
+T = TypeVar("T")
+
+_PRIMARY_READS: ContextVar[bool] = ContextVar("primary_reads", default=False)
+
+
+def reads_from_primary() -> bool:
+    """Return True if reads of the current request must go to the primary."""
+    return _PRIMARY_READS.get()
+
+
+@contextmanager
+def primary_reads() -> Iterator[None]:
+    """Send every read made in this context to the primary."""
+    token = _PRIMARY_READS.set(True)
+    try:
+        yield
+    finally:
+        _PRIMARY_READS.reset(token)
+
+
+class Replica(Generic[T]):
+    """One replica and what the router last learned about it."""
+
+    __slots__ = ("name", "target", "lag", "checked_at", "failed_until", "error")
+
+    def __init__(self, name: str, target: T):
+        self.name = name
+        self.target = target
+        self.lag: Optional[float] = None
+        self.checked_at: Optional[float] = None
+        self.failed_until = 0.0
+        self.error: Optional[str] = None
+
+
+class ReplicaRouter(Generic[T]):
+    """Chooses a sufficiently fresh replica for each read."""
+
+    def __init__(
+        self,
+        replicas: Dict[str, T],
+        measure_lag: Callable[[T], Optional[float]],
+        max_lag: float = 5.0,
+        check_interval: float = 2.0,
+    ):
+        """
+        Args:
+            replicas: Replica name (e.g. host:port) to routing target
+            measure_lag: Returns a target's replication lag in seconds, or
+                None if it is not replicating; may raise when unreachable
+            max_lag: Replicas further behind serve no reads
+            check_interval: Seconds between lag samples; 0 disables the
+                checks and trusts every replica that has not failed
+        """
+        self.replicas = [Replica(name, target) for name, target in replicas.items()]
+        self.measure_lag = measure_lag
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        # A failed replica sits out this long, or until a lag check succeeds
+        self.failure_backoff = check_interval or 5.0
+        self._turn = itertools.count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Sample lag now and then every check_interval seconds in a background thread."""
+        if self.check_interval <= 0 or self._thread is not None:
+            return
+        self.check()
+        self._thread = threading.Thread(target=self._check_periodically, name="replica-lag", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the lag checks."""
+        self._stop.set()
+
+    def _check_periodically(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            self.check()
+
+    def check(self) -> None:
+        """Sample the lag of every replica."""
+        for replica in self.replicas:
+            try:
+                lag = self.measure_lag(replica.target)
+                error = None if lag is not None else "not replicating"
+            except Exception as e:
+                lag, error = None, str(e)
+            if error is not None and error != replica.error:
+                print(f"Replica {replica.name} serves no reads: {error}")
+            elif error is None and replica.error is not None:
+                print(f"Replica {replica.name} serves reads again")
+            replica.lag, replica.error, replica.checked_at = lag, error, time.monotonic()
+            if error is None:
+                replica.failed_until = 0.0
+
+    def _eligible(self, replica: Replica[T], now: float) -> bool:
+        if now < replica.failed_until:
+            return False
+        if self.check_interval <= 0:
+            return True
+        # A sample older than a few intervals means the checks are stuck
+        fresh = replica.checked_at is not None and now - replica.checked_at <= 3 * self.check_interval
+        return fresh and replica.lag is not None and replica.lag <= self.max_lag
+
+    def route(self) -> Optional[Replica[T]]:
+        """
+        Choose the replica for a read.
+
+        Returns:
+            Replica, or None if the read must go to the primary
+        """
+        if reads_from_primary():
+            metrics.DB_READS.inc(("primary", "read_your_writes"))
+            return None
+        now = time.monotonic()
+        eligible = [replica for replica in self.replicas if self._eligible(replica, now)]
+        if not eligible:
+            metrics.DB_READS.inc(("primary", "no_replica"))
+            return None
+        metrics.DB_READS.inc(("replica", "replica"))
+        return eligible[next(self._turn) % len(eligible)]
+
+    def mark_failed(self, replica: Replica[T], error: Exception) -> None:
+        """Take a replica out of rotation after a connection failure."""
+        replica.failed_until = time.monotonic() + self.failure_backoff
+        replica.error = str(error)
+        print(f"Replica {replica.name} failed, reading from the primary: {error}")
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Describe every replica: lag, last check age, whether it serves reads, last error."""
+        now = time.monotonic()
+        return [
+            {
+                "name": replica.name,
+                "lag_seconds": replica.lag,
+                "checked_seconds_ago": round(now - replica.checked_at, 3) if replica.checked_at else None,
+                "serving": self._eligible(replica, now),
+                "error": replica.error,
+            }
+            for replica in self.replicas
+        ]
+
+
+class ReplicatedEmployeeRepository(EmployeeRepository):
+    """
+    Storage backend routing reads to replica backends and writes to a primary.
+
+    The storage-level counterpart of DatabaseConnection's replica routing,
+    for backends that are not MySQL. The change feed and everything that
+    writes use the primary. A read that fails on a replica, other than with
+    a ValueError (bad input), is retried on the primary.
+    """
+
+    def __init__(
+        self,
+        primary: EmployeeRepository,
+        replicas: List[EmployeeRepository],
+        measure_lag: Callable[[EmployeeRepository], Optional[float]] = lambda repository: 0.0,
+        max_lag: float = 5.0,
+        check_interval: float = 2.0,
+    ):
+        """
+        Args:
+            primary: Backend taking writes
+            replicas: Backends serving reads
+            measure_lag: Replication lag of a replica backend; stand-ins
+                that do not replicate count as caught up by default
+            max_lag: Replicas further behind serve no reads
+            check_interval: Seconds between lag samples
+        """
+        self.primary = primary
+        self.router: ReplicaRouter[EmployeeRepository] = ReplicaRouter(
+            {f"replica-{index}": replica for index, replica in enumerate(replicas)},
+            measure_lag, max_lag, check_interval,
+        )
+
+    def initialize(self) -> None:
+        self.primary.initialize()
+        for replica in self.router.replicas:
+            replica.target.initialize()
+        self.router.start()
+
+    def close(self) -> None:
+        self.router.close()
+        for replica in self.router.replicas:
+            replica.target.close()
+        self.primary.close()
+
+    def _read(self, method: str, *args: Any) -> Any:
+        replica = self.router.route()
+        if replica is not None:
+            try:
+                return getattr(replica.target, method)(*args)
+            except ValueError:
+                raise
+            except Exception as e:
+                self.router.mark_failed(replica, e)
+        return getattr(self.primary, method)(*args)
+
+    def test_connection(self):
+        return self.primary.test_connection()
+
+    def create_employee(self, employee_data):
+        return self.primary.create_employee(employee_data)
+
+    def bulk_create_employees(self, employees_data, chunk_size=500, single_transaction=False, abort_on_error=False):
+        return self.primary.bulk_create_employees(employees_data, chunk_size, single_transaction, abort_on_error)
+
+    def get_employee(self, employee_id):
+        return self._read("get_employee", employee_id)
+
+    def get_all_employees(self):
+        return self._read("get_all_employees")
+
+    def get_employee_rows_page(self, limit, after=None, filters=None, sort=DEFAULT_LIST_SORT):
+        return self._read("get_employee_rows_page", limit, after, filters, sort)
+
+    def get_collection_version(self):
+        return self._read("get_collection_version")
+
+    def get_changes(self, since, limit):
+        # Positions are only meaningful against the primary's clock and rows
+        return self.primary.get_changes(since, limit)
+
+    def purge_tombstones(self, older_than_seconds):
+        return self.primary.purge_tombstones(older_than_seconds)
+
+    def iter_employee_batches(self, batch_size=1000):
+        # A stream cannot move hosts halfway, so it is not retried
+        replica = self.router.route()
+        return (replica.target if replica is not None else self.primary).iter_employee_batches(batch_size)
+
+    def search_employee_rows(self, query, limit=10):
+        return self._read("search_employee_rows", query, limit)
+
+    def get_employee_stats(self, dimension):
+        return self._read("get_employee_stats", dimension)
+
+    def update_employee(self, employee_id, employee_data):
+        return self.primary.update_employee(employee_id, employee_data)
+
+    def delete_employee(self, employee_id):
+        return self.primary.delete_employee(employee_id)
+
+    def bulk_update_employees(self, employee_data, ids=None, filters=None, salary_factor=None, return_ids=False):
+        return self.primary.bulk_update_employees(employee_data, ids, filters, salary_factor, return_ids)
+
+    def bulk_delete_employees(self, ids=None, filters=None, return_ids=False):
+        return self.primary.bulk_delete_employees(ids, filters, return_ids)
+
+    def rebuild_employee_summary(self):
+        return self.primary.rebuild_employee_summary()
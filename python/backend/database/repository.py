@@ -0,0 +1,392 @@
+"""
+Storage backend interface for employees.
+
+EmployeeRepository is what the API depends on. MySQLEmployeeRepository wraps
+the operations module; the in-memory and SQLite implementations live in
+backend.database.memory and backend.database.sqlite. DB_BACKEND selects one.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from backend.config import DatabaseConfig, ServerConfig, SyncConfig
+from backend.database.queries import DEFAULT_LIST_SORT, EMPLOYEE_COLUMNS
+from backend.models.employee import Employee
+
+
+class DuplicateEmailError(ValueError):
+    """Raised by the non-MySQL backends when an email is already taken."""
+
+
+class SyncTokenExpiredError(ValueError):
+    """Raised when a change feed position is older than the tombstone retention."""
+
+
+class EmployeeRepository(ABC):
+    """
+    Employee storage.
+
+    Methods mirror the operations module and keep its contracts: rows are
+    lists in EMPLOYEE_COLUMNS order with salary as float and hire_date as an
+    ISO string, list pages use keyset positions {"id": ..., "v": ...}, and
+    bulk results have the same keys.
+    """
+
+    def initialize(self) -> None:
+        """Prepare the backend (connections, schema) at application startup."""
+
+    def close(self) -> None:
+        """Release backend resources at application shutdown."""
+
+    @abstractmethod
+    def test_connection(self) -> bool:
+        """Return True if the backend is reachable."""
+
+    @abstractmethod
+    def create_employee(self, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        """Create one employee and return it with its id."""
+
+    @abstractmethod
+    def bulk_create_employees(
+        self,
+        employees_data: List[Dict[str, Any]],
+        chunk_size: int = 500,
+        single_transaction: bool = False,
+        abort_on_error: bool = False,
+    ) -> Dict[str, Any]:
+        """Create many employees; returns {"ids", "errors", "aborted"}."""
+
+    @abstractmethod
+    def get_employee(self, employee_id: int) -> Optional[Employee]:
+        """Return one employee, or None if not found."""
+
+    @abstractmethod
+    def get_all_employees(self) -> List[Employee]:
+        """Return every employee, newest first."""
+
+    @abstractmethod
+    def get_employee_rows_page(
+        self,
+        limit: int,
+        after: Optional[Dict[str, Any]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_LIST_SORT,
+    ) -> Tuple[List[List[Any]], Optional[Dict[str, Any]]]:
+        """Return one filtered, sorted page of rows and the next keyset position."""
+
+    def get_employees_page(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Employee], Optional[int]]:
+        """Return one page of employees, newest first, and the next after_id."""
+        after = {"id": after_id} if after_id is not None else None
+        rows, next_position = self.get_employee_rows_page(limit, after, filters)
+        employees = [Employee.from_dict(dict(zip(EMPLOYEE_COLUMNS, row))) for row in rows]
+        return employees, next_position["id"] if next_position is not None else None
+
+    @abstractmethod
+    def get_collection_version(self) -> Dict[str, Any]:
+        """
+        Return a validator for the whole employee collection without reading rows.
+
+        Returns:
+            Dictionary with last_modified (Unix seconds of the latest change,
+            None when unknown), count and write_version (a counter stored
+            with the employees and bumped by every write), all read from the
+            stored data; any change to an employee changes write_version
+        """
+
+    @abstractmethod
+    def get_changes(self, since: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """
+        Return employees changed and ids deleted after a change feed position.
+
+        Args:
+            since: Position returned by the previous call, None for a full sync
+            limit: Maximum number of rows, and of deleted ids, to return
+
+        Returns:
+            Dictionary with rows (in EMPLOYEE_COLUMNS order), deleted (ids),
+            next (the position to pass next) and has_more
+
+        Raises:
+            SyncTokenExpiredError: If tombstones after the position may have
+                been purged
+        """
+
+    @abstractmethod
+    def purge_tombstones(self, older_than_seconds: float) -> int:
+        """Delete tombstones recorded more than older_than_seconds ago; returns the count."""
+
+    @abstractmethod
+    def iter_employee_batches(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """Yield every employee in id order as batches of Employee.to_dict dictionaries."""
+
+    @abstractmethod
+    def search_employee_rows(self, query: str, limit: int = 10) -> List[List[Any]]:
+        """Return rows matching every search term, best match first."""
+
+    @abstractmethod
+    def get_employee_stats(self, dimension: str) -> List[Dict[str, Any]]:
+        """Return headcount and salary aggregates per group of a dimension."""
+
+    @abstractmethod
+    def update_employee(self, employee_id: int, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        """Apply the non-None fields and return the employee, or None if not found."""
+
+    @abstractmethod
+    def delete_employee(self, employee_id: int) -> bool:
+        """Delete one employee; False if not found."""
+
+    @abstractmethod
+    def bulk_update_employees(
+        self,
+        employee_data: Dict[str, Any],
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        salary_factor: Optional[float] = None,
+        return_ids: bool = False,
+    ) -> Dict[str, Any]:
+        """Apply one change to every selected employee; returns {"affected", "ids"}."""
+
+    @abstractmethod
+    def bulk_delete_employees(
+        self,
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_ids: bool = False,
+    ) -> Dict[str, Any]:
+        """Delete every selected employee; returns {"affected", "ids"}."""
+
+    @abstractmethod
+    def rebuild_employee_summary(self) -> Dict[str, int]:
+        """Recompute the aggregates behind get_employee_stats."""
+
+
+def split_request_duplicates(
+    employees_data: List[Dict[str, Any]]
+) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Keep the first occurrence of each email in a bulk request.
+
+    Returns:
+        Tuple of ((index, data) pairs to insert, per-item errors for repeats)
+    """
+    seen: set = set()
+    pending: List[Tuple[int, Dict[str, Any]]] = []
+    errors: List[Dict[str, Any]] = []
+    for index, data in enumerate(employees_data):
+        key = data["email"].casefold()
+        if key in seen:
+            errors.append({"index": index, "error": "Duplicate email in request"})
+        else:
+            seen.add(key)
+            pending.append((index, data))
+    return pending, errors
+
+
+def sync_positions(
+    since: Optional[Dict[str, Any]], now: float, bound: float
+) -> Tuple[Optional[List[float]], List[float]]:
+    """
+    Resolve where a change read starts.
+
+    Positions are [timestamp, id] pairs, one for employee rows ("u", ordered
+    by updated_at) and one for tombstones ("d", ordered by deleted_at). A
+    full sync reads every row but no tombstones, as the client has nothing
+    to delete yet.
+
+    Args:
+        since: Position from the previous read, None for a full sync
+        now: Current time of the backend's clock, in Unix seconds
+        bound: Upper limit of the read, in Unix seconds
+
+    Returns:
+        Tuple of (row position or None to read from the start, tombstone position)
+
+    Raises:
+        SyncTokenExpiredError: If the tombstone position is older than the
+            retention window, so deletes may have been purged unseen
+    """
+    if since is None:
+        return None, [bound, 0]
+    if since["d"][0] < now - SyncConfig.TOMBSTONE_RETENTION_SECONDS:
+        raise SyncTokenExpiredError("Sync token expired")
+    return since.get("u"), since["d"]
+
+
+def changes_result(
+    since: Optional[Dict[str, Any]],
+    bound: float,
+    limit: int,
+    updated: List[Tuple[float, List[Any]]],
+    deleted: List[Tuple[float, int]],
+) -> Dict[str, Any]:
+    """
+    Assemble a get_changes result from the entries read after a position.
+
+    A keyset that returned fewer than limit + 1 entries is caught up, and
+    its position moves to the bound: everything stamped before the bound
+    has been read, and nothing stamped at or after it has.
+
+    Args:
+        since: Position the entries were read after, None for a full sync
+        bound: Exclusive upper limit the entries were read below
+        limit: Page size; updated and deleted hold up to limit + 1 entries
+        updated: (updated_at, row) pairs in (updated_at, id) order
+        deleted: (deleted_at, id) pairs in (deleted_at, id) order
+
+    Returns:
+        Dictionary with rows, deleted, next and has_more
+    """
+    def advance(position: Optional[List[float]], entries: List[Tuple[float, Any]], key) -> List[float]:
+        if len(entries) > limit:
+            stamp, entry = entries[limit - 1]
+            return [stamp, key(entry)]
+        # A bound that moved back (e.g. behind a long transaction) never rewinds the position
+        return max(position, [bound, 0]) if position is not None else [bound, 0]
+
+    since = since or {}
+    return {
+        "rows": [row for _, row in updated[:limit]],
+        "deleted": [employee_id for _, employee_id in deleted[:limit]],
+        "next": {
+            "u": advance(since.get("u"), updated, lambda row: row[0]),
+            "d": advance(since.get("d"), deleted, lambda employee_id: employee_id),
+        },
+        "has_more": len(updated) > limit or len(deleted) > limit,
+    }
+
+
+class MySQLEmployeeRepository(EmployeeRepository):
+    """MySQL storage through the pooled connection and the operations module."""
+
+    def initialize(self) -> None:
+        from backend.database.connection import DatabaseConnection
+
+        # The schema check needs one connection; the rest of DB_POOL_MIN_SIZE
+        # opens after it
+        if DatabaseConnection._pool is None:
+            DatabaseConnection.initialize_pool(warm=False)
+        DatabaseConnection.create_tables(skip_if_current=True)
+        DatabaseConnection.warm_pool()
+
+    def close(self) -> None:
+        from backend.database.connection import DatabaseConnection
+
+        # Requests still running on worker threads get to finish their queries
+        DatabaseConnection.close(ServerConfig.GRACEFUL_SHUTDOWN_SECONDS)
+
+    def test_connection(self) -> bool:
+        from backend.database.connection import DatabaseConnection
+
+        return DatabaseConnection.test_connection()
+
+    def create_employee(self, employee_data):
+        return _operations().create_employee(employee_data)
+
+    def bulk_create_employees(self, employees_data, chunk_size=500, single_transaction=False, abort_on_error=False):
+        return _operations().bulk_create_employees(employees_data, chunk_size, single_transaction, abort_on_error)
+
+    def get_employee(self, employee_id):
+        return _operations().get_employee(employee_id)
+
+    def get_all_employees(self):
+        return _operations().get_all_employees()
+
+    def get_employee_rows_page(self, limit, after=None, filters=None, sort=DEFAULT_LIST_SORT):
+        return _operations().get_employee_rows_page(limit, after, filters, sort)
+
+    def get_collection_version(self):
+        return _operations().get_collection_version()
+
+    def get_changes(self, since, limit):
+        return _operations().get_changes(since, limit)
+
+    def purge_tombstones(self, older_than_seconds):
+        return _operations().purge_tombstones(older_than_seconds)
+
+    def iter_employee_batches(self, batch_size=1000):
+        return _operations().iter_employee_batches(batch_size)
+
+    def search_employee_rows(self, query, limit=10):
+        return _operations().search_employee_rows(query, limit)
+
+    def get_employee_stats(self, dimension):
+        return _operations().get_employee_stats(dimension)
+
+    def update_employee(self, employee_id, employee_data):
+        return _operations().update_employee(employee_id, employee_data)
+
+    def delete_employee(self, employee_id):
+        return _operations().delete_employee(employee_id)
+
+    def bulk_update_employees(self, employee_data, ids=None, filters=None, salary_factor=None, return_ids=False):
+        return _operations().bulk_update_employees(employee_data, ids, filters, salary_factor, return_ids)
+
+    def bulk_delete_employees(self, ids=None, filters=None, return_ids=False):
+        return _operations().bulk_delete_employees(ids, filters, return_ids)
+
+    def rebuild_employee_summary(self):
+        return _operations().rebuild_employee_summary()
+
+
+def _operations():
+    """Import the operations module on first use; it imports this module itself."""
+    from backend.database import operations as module
+
+    return module
+
+
+_repository: Optional[EmployeeRepository] = None
+
+
+def create_repository(backend: Optional[str] = None) -> EmployeeRepository:
+    """
+    Build a repository for the given backend name.
+
+    Args:
+        backend: "mysql", "sqlite" or "memory"; defaults to DB_BACKEND
+
+    Returns:
+        New, uninitialized repository
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = backend or DatabaseConfig.BACKEND
+    if backend == "mysql":
+        return MySQLEmployeeRepository()
+    if backend == "sqlite":
+        from backend.database.sqlite import SQLiteEmployeeRepository
+
+        if DatabaseConfig.SQLITE_REPLICA_PATHS:
+            from backend.database.replicas import ReplicatedEmployeeRepository
+
+            return ReplicatedEmployeeRepository(
+                SQLiteEmployeeRepository(DatabaseConfig.SQLITE_PATH),
+                [SQLiteEmployeeRepository(path) for path in DatabaseConfig.SQLITE_REPLICA_PATHS],
+                max_lag=DatabaseConfig.REPLICA_MAX_LAG_SECONDS,
+                check_interval=DatabaseConfig.REPLICA_CHECK_SECONDS,
+            )
+        return SQLiteEmployeeRepository(DatabaseConfig.SQLITE_PATH)
+    if backend == "memory":
+        from backend.database.memory import MemoryEmployeeRepository
+
+        return MemoryEmployeeRepository()
+    raise ValueError(f"Unknown DB_BACKEND: {backend}")
+
+
+def get_repository() -> EmployeeRepository:
+    """
+    Return the process-wide repository, creating it on first use.
+
+    Returns:
+        Repository for the configured DB_BACKEND
+    """
+    global _repository
+    if _repository is None:
+        _repository = create_repository()
+    return _repository
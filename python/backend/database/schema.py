@@ -0,0 +1,190 @@
+"""
+Canonical table definitions.
+
+database_schema.sql mirrors these definitions; DatabaseConnection.create_tables
+and DatabaseConnection.reconcile_indexes bring an existing database in line
+with them, so both bootstrap paths end up with the same table.
+"""
+
+import hashlib
+from typing import Dict, List, Tuple
+
+# Secondary indexes, each matching a filter/sort combination of the list endpoint.
+# InnoDB appends the primary key to every secondary index, so each one also
+# serves the "id" tie-breaker of keyset pagination.
+EMPLOYEE_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "idx_department": ("department",),  # department filter, sorted by id
+    "idx_department_hire_date": ("department", "hire_date"),  # department filter, sorted by hire date
+    "idx_department_salary": ("department", "salary"),  # department filter, sorted or ranged by salary
+    "idx_position": ("position",),
+    "idx_name": ("name",),
+    "idx_salary": ("salary",),
+    "idx_hire_date": ("hire_date",),
+    "idx_updated_at": ("updated_at",),  # MAX(updated_at) for the collection ETag, change feed ranges
+}
+
+# FULLTEXT indexes; the ngram parser indexes every 2-character sequence
+# (ngram_token_size), so search matches inside words and email addresses
+EMPLOYEE_FULLTEXT_INDEXES: Dict[str, Tuple[str, ...]] = {
+    "ftx_employee_search": ("name", "email", "department", "position"),
+}
+
+# Indexes from earlier schema versions that are dropped on reconcile.
+# idx_email duplicated the index behind the UNIQUE constraint on email.
+OBSOLETE_INDEXES = ("idx_email",)
+
+CREATE_EMPLOYEES_TABLE = """
+    CREATE TABLE IF NOT EXISTS employees (
+        id INT AUTO_INCREMENT PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        email VARCHAR(100) UNIQUE NOT NULL,
+        phone VARCHAR(20),
+        department VARCHAR(50),
+        position VARCHAR(50),
+        salary DECIMAL(10, 2),
+        hire_date DATE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+        {indexes}
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """.format(
+    indexes=",\n        ".join(
+        [f"INDEX {name} ({', '.join(columns)})" for name, columns in EMPLOYEE_INDEXES.items()]
+        + [
+            f"FULLTEXT INDEX {name} ({', '.join(columns)}) WITH PARSER ngram"
+            for name, columns in EMPLOYEE_FULLTEXT_INDEXES.items()
+        ]
+    )
+)
+
+# Aggregates per department, position and hire month (YYYY-MM), maintained
+# by every write; see backend/database/summary.py
+CREATE_EMPLOYEE_SUMMARY_TABLE = """
+    CREATE TABLE IF NOT EXISTS employee_summary (
+        dimension VARCHAR(20) NOT NULL,
+        group_key VARCHAR(50) NOT NULL,
+        headcount INT NOT NULL DEFAULT 0,
+        salary_count INT NOT NULL DEFAULT 0,
+        salary_total DECIMAL(18, 2) NOT NULL DEFAULT 0,
+        PRIMARY KEY (dimension, group_key)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """
+
+# One row per deleted employee id, so GET /employees/changes can report
+# deletes; rows older than the retention window are purged in the background
+CREATE_EMPLOYEE_TOMBSTONES_TABLE = """
+    CREATE TABLE IF NOT EXISTS employee_tombstones (
+        id INT PRIMARY KEY,
+        deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        INDEX idx_deleted_at (deleted_at)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """
+
+# Persisted write counter: one row, bumped by every transaction that creates,
+# updates or deletes employees. updated_at and deleted_at have one-second
+# resolution, so the collection ETag needs it to tell apart two writes made
+# within the same second
+CREATE_EMPLOYEE_WRITE_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS employee_write_version (
+        id TINYINT PRIMARY KEY,
+        version BIGINT NOT NULL DEFAULT 0
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """
+
+# Background jobs (backend/jobs): one row per job with its parameters, state,
+# progress and result. Times are Unix seconds, the same clock the runners
+# use for backoff and stale-job checks; result holds a running job's
+# checkpoint until it finishes
+CREATE_JOBS_TABLE = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id BIGINT AUTO_INCREMENT PRIMARY KEY,
+        kind VARCHAR(50) NOT NULL,
+        params TEXT NOT NULL,
+        status VARCHAR(20) NOT NULL DEFAULT 'queued',
+        attempts INT NOT NULL DEFAULT 0,
+        max_attempts INT NOT NULL DEFAULT 1,
+        run_after DOUBLE NOT NULL,
+        progress_done BIGINT NOT NULL DEFAULT 0,
+        progress_total BIGINT,
+        result MEDIUMTEXT,
+        error TEXT,
+        cancel_requested TINYINT NOT NULL DEFAULT 0,
+        worker VARCHAR(100),
+        created_at DOUBLE NOT NULL,
+        started_at DOUBLE,
+        finished_at DOUBLE,
+        heartbeat_at DOUBLE,
+        INDEX idx_status_run_after (status, run_after),
+        INDEX idx_finished_at (finished_at)
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """
+
+# Schema version last applied by DatabaseConnection.create_tables; startup skips
+# the DDL while it matches SCHEMA_VERSION
+CREATE_SCHEMA_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_version (
+        component VARCHAR(50) PRIMARY KEY,
+        version VARCHAR(64) NOT NULL,
+        applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+    """
+
+SCHEMA_COMPONENT = "employees"
+
+SELECT_SCHEMA_VERSION = "SELECT version FROM schema_version WHERE component = %s"
+
+UPSERT_SCHEMA_VERSION = """
+    INSERT INTO schema_version (component, version) VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE version = %s
+    """
+
+SELECT_EMPLOYEE_INDEXES = """
+    SELECT INDEX_NAME, COLUMN_NAME
+    FROM information_schema.STATISTICS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'employees'
+    ORDER BY INDEX_NAME, SEQ_IN_INDEX
+    """
+
+
+def index_changes(existing: Dict[str, Tuple[str, ...]]) -> List[str]:
+    """
+    Compute the ALTER TABLE clauses that turn existing indexes into the canonical set.
+
+    Args:
+        existing: Index name to ordered column names, as found in the database
+
+    Returns:
+        ALTER TABLE clauses; empty when the indexes already match
+    """
+    clauses = [f"DROP INDEX {name}" for name in OBSOLETE_INDEXES if name in existing]
+    for kind, indexes in (("INDEX", EMPLOYEE_INDEXES), ("FULLTEXT INDEX", EMPLOYEE_FULLTEXT_INDEXES)):
+        for name, columns in indexes.items():
+            current = existing.get(name)
+            if current == columns:
+                continue
+            if current is not None:
+                clauses.append(f"DROP INDEX {name}")
+            clause = f"ADD {kind} {name} ({', '.join(columns)})"
+            clauses.append(clause + " WITH PARSER ngram" if kind == "FULLTEXT INDEX" else clause)
+    return clauses
+
+
+def _schema_version() -> str:
+    """Digest of every definition above, so any schema change bumps the version."""
+    digest = hashlib.sha256()
+    for part in (
+        CREATE_EMPLOYEES_TABLE,
+        CREATE_EMPLOYEE_SUMMARY_TABLE,
+        CREATE_EMPLOYEE_TOMBSTONES_TABLE,
+        CREATE_EMPLOYEE_WRITE_VERSION_TABLE,
+        CREATE_JOBS_TABLE,
+        repr(sorted(EMPLOYEE_INDEXES.items())),
+        repr(sorted(EMPLOYEE_FULLTEXT_INDEXES.items())),
+        repr(OBSOLETE_INDEXES),
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+SCHEMA_VERSION = _schema_version()
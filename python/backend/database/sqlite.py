@@ -0,0 +1,506 @@
+"""
+SQLite employee storage (DB_BACKEND=sqlite, file at DB_SQLITE_PATH).
+
+Uses the same query builders as the MySQL backend, rewritten to SQLite's
+"?" placeholders. Text columns use NOCASE collation to match MySQL's
+case-insensitive comparisons, and SQLite orders NULLs like MySQL, so keyset
+cursors behave the same on both. A single connection is shared behind a
+lock; aggregates are computed on read rather than kept in a summary table.
+"""
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from backend.config import SyncConfig
+from backend.database import summary
+from backend.database.queries import (
+    DEFAULT_LIST_SORT,
+    EMPLOYEE_COLUMNS,
+    LIST_SORTS,
+    build_filter_clause,
+    build_page_query,
+    build_set_clause,
+)
+from backend.database.repository import (
+    DuplicateEmailError,
+    EmployeeRepository,
+    changes_result,
+    split_request_duplicates,
+    sync_positions,
+)
+from backend.database.schema import EMPLOYEE_INDEXES
+from backend.models.employee import Employee
+
+CREATE_EMPLOYEES_TABLE = """
+    CREATE TABLE IF NOT EXISTS employees (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL COLLATE NOCASE,
+        email TEXT NOT NULL UNIQUE COLLATE NOCASE,
+        phone TEXT,
+        department TEXT COLLATE NOCASE,
+        position TEXT COLLATE NOCASE,
+        salary REAL,
+        hire_date TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+    """
+
+CREATE_EMPLOYEE_TOMBSTONES_TABLE = """
+    CREATE TABLE IF NOT EXISTS employee_tombstones (
+        id INTEGER PRIMARY KEY,
+        deleted_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """
+
+# Bumped by every transaction that writes employees; see schema.py
+CREATE_EMPLOYEE_WRITE_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS employee_write_version (
+        id INTEGER PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0
+    )
+    """
+
+BUMP_WRITE_VERSION = """
+    INSERT INTO employee_write_version (id, version) VALUES (1, 1)
+    ON CONFLICT (id) DO UPDATE SET version = version + 1
+    """
+
+# REPLACE resets deleted_at to its default
+INSERT_TOMBSTONES = "INSERT OR REPLACE INTO employee_tombstones (id) "
+
+INSERT_EMPLOYEE = f"""
+    INSERT INTO employees ({', '.join(EMPLOYEE_COLUMNS[1:])})
+    VALUES ({', '.join(['?'] * (len(EMPLOYEE_COLUMNS) - 1))})
+    """
+
+SELECT_EMPLOYEES = f"SELECT {', '.join(EMPLOYEE_COLUMNS)} FROM employees"
+
+
+def _unix_seconds(column: str) -> str:
+    """
+    SQLite expression converting a CURRENT_TIMESTAMP (UTC text) column to Unix seconds.
+
+    Avoids strftime('%s', ...), whose %s _sql would rewrite to a placeholder.
+    """
+    return f"CAST(round((julianday({column}) - 2440587.5) * 86400) AS INTEGER)"
+
+
+# As Unix seconds for HTTP validators
+UPDATED_AT_SECONDS = _unix_seconds("updated_at")
+
+SELECT_COLLECTION_VERSION = f"""
+    SELECT
+        (SELECT MAX({UPDATED_AT_SECONDS}) FROM employees),
+        (SELECT COUNT(*) FROM employees),
+        (SELECT COALESCE(MAX(version), 0) FROM employee_write_version)
+    """
+
+# Change feed reads, in (timestamp, id) order from a keyset position
+SELECT_CHANGED_EMPLOYEES = f"""
+    SELECT {', '.join(EMPLOYEE_COLUMNS)}, {UPDATED_AT_SECONDS}
+    FROM employees
+    WHERE updated_at >= datetime(?, 'unixepoch')
+        AND (updated_at > datetime(?, 'unixepoch') OR id > ?)
+        AND updated_at < datetime(?, 'unixepoch')
+    ORDER BY updated_at, id
+    LIMIT ?
+    """
+
+SELECT_TOMBSTONES = f"""
+    SELECT {_unix_seconds("deleted_at")}, id
+    FROM employee_tombstones
+    WHERE deleted_at >= datetime(?, 'unixepoch')
+        AND (deleted_at > datetime(?, 'unixepoch') OR id > ?)
+        AND deleted_at < datetime(?, 'unixepoch')
+    ORDER BY deleted_at, id
+    LIMIT ?
+    """
+
+# Summary dimension -> SQLite expression grouping employees along it
+STATS_EXPRESSIONS = {
+    "department": "department",
+    "position": "position",
+    "hire_month": "substr(hire_date, 1, 7)",
+}
+
+
+class _Abort(Exception):
+    """Rolls back a bulk insert transaction that hit a failure under abort_on_error."""
+
+
+def _sql(query: str) -> str:
+    """Rewrite the MySQL driver's %s placeholders to SQLite's."""
+    return query.replace("%s", "?")
+
+
+def _param(value: Any) -> Any:
+    """Convert a query parameter to a type SQLite stores natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _params(values: Sequence[Any]) -> Tuple[Any, ...]:
+    return tuple(_param(value) for value in values)
+
+
+def _insert_values(employee_data: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Order an employee dictionary into INSERT parameter order, salary rounded like DECIMAL(10, 2)."""
+    salary = employee_data.get("salary")
+    return _params([
+        employee_data["name"],
+        employee_data["email"],
+        employee_data.get("phone"),
+        employee_data.get("department"),
+        employee_data.get("position"),
+        summary.as_stored(salary) if salary is not None else None,
+        employee_data.get("hire_date"),
+    ])
+
+
+def _employee(row: Sequence[Any]) -> Employee:
+    # Rows may carry UPDATED_AT_SECONDS after the employee columns
+    return Employee.from_dict(dict(zip(EMPLOYEE_COLUMNS + ("updated_at",), row)))
+
+
+class SQLiteEmployeeRepository(EmployeeRepository):
+    """Employees in a SQLite database file."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open the database.
+
+        Args:
+            path: Database file, or ":memory:" for a private in-memory database
+        """
+        self._path = path
+        self._lock = threading.RLock()
+        # Autocommit mode; writes open their own transactions
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self.initialize()
+
+    def initialize(self) -> None:
+        with self._lock:
+            self._conn.execute(CREATE_EMPLOYEES_TABLE)
+            for name, columns in EMPLOYEE_INDEXES.items():
+                self._conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON employees ({', '.join(columns)})")
+            self._conn.execute(CREATE_EMPLOYEE_TOMBSTONES_TABLE)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_deleted_at ON employee_tombstones (deleted_at)")
+            self._conn.execute(CREATE_EMPLOYEE_WRITE_VERSION_TABLE)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def test_connection(self) -> bool:
+        try:
+            with self._lock:
+                self._conn.execute("SELECT 1").fetchall()
+            return True
+        except sqlite3.Error as e:
+            print(f"Database connection test failed: {e}")
+            return False
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Hold the connection for one write transaction, committed on success."""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except sqlite3.IntegrityError as e:
+                cursor.execute("ROLLBACK")
+                if "UNIQUE constraint failed: employees.email" in str(e):
+                    raise DuplicateEmailError("Email already exists") from e
+                raise
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            finally:
+                cursor.close()
+
+    def _query(self, query: str, values: Sequence[Any] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._conn.execute(_sql(query), _params(values)).fetchall()
+
+    # Reads
+
+    def get_employee(self, employee_id: int) -> Optional[Employee]:
+        rows = self._query(
+            f"SELECT {', '.join(EMPLOYEE_COLUMNS)}, {UPDATED_AT_SECONDS} FROM employees WHERE id = ?", (employee_id,)
+        )
+        return _employee(rows[0]) if rows else None
+
+    def get_collection_version(self) -> Dict[str, Any]:
+        with self._lock:
+            last_modified, count, write_version = self._conn.execute(SELECT_COLLECTION_VERSION).fetchone()
+        return {"last_modified": last_modified, "count": count, "write_version": write_version}
+
+    def get_changes(self, since: Optional[Dict[str, Any]], limit: int) -> Dict[str, Any]:
+        """
+        Timestamps have one-second resolution; the bound stays SYNC_LAG_SECONDS
+        behind now for transactions of other processes sharing the file.
+        """
+        now = int(time.time())
+        bound = now - SyncConfig.LAG_SECONDS
+        updated_after, deleted_after = sync_positions(since, now, bound)
+        # Fetch one extra entry to find out whether more remain
+        updated_stamp, updated_id = updated_after or (0, 0)
+        deleted_stamp, deleted_id = deleted_after
+        with self._lock:
+            rows = self._query(
+                SELECT_CHANGED_EMPLOYEES, (updated_stamp, updated_stamp, updated_id, bound, limit + 1)
+            )
+            tombstones = self._query(SELECT_TOMBSTONES, (deleted_stamp, deleted_stamp, deleted_id, bound, limit + 1))
+        updated = [(row[-1], list(row[:-1])) for row in rows]
+        return changes_result(since, bound, limit, updated, [tuple(row) for row in tombstones])
+
+    def purge_tombstones(self, older_than_seconds: float) -> int:
+        with self._transaction() as cursor:
+            cursor.execute(
+                "DELETE FROM employee_tombstones WHERE deleted_at < datetime(?, 'unixepoch')",
+                (int(time.time() - older_than_seconds),),
+            )
+            return cursor.rowcount
+
+    def get_all_employees(self) -> List[Employee]:
+        return [_employee(row) for row in self._query(f"{SELECT_EMPLOYEES} ORDER BY id DESC")]
+
+    def get_employee_rows_page(
+        self,
+        limit: int,
+        after: Optional[Dict[str, Any]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = DEFAULT_LIST_SORT,
+    ) -> Tuple[List[List[Any]], Optional[Dict[str, Any]]]:
+        if sort not in LIST_SORTS:
+            raise ValueError(f"Unsupported sort: {sort}")
+        filters = {key: value for key, value in (filters or {}).items() if value is not None}
+        column = sort.lstrip("-")
+
+        # Fetch one extra row to find out whether another page exists
+        query, values = build_page_query(limit + 1, after, filters, sort)
+        rows = [list(row) for row in self._query(query, values)]
+        next_position = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_position = {"id": rows[-1][0]}
+            if column != "id":
+                next_position["v"] = rows[-1][EMPLOYEE_COLUMNS.index(column)]
+        return rows, next_position
+
+    def iter_employee_batches(self, batch_size: int = 1000) -> Iterator[List[Dict[str, Any]]]:
+        """Read batch by batch on the primary key so the connection is not held between batches."""
+        after_id = 0
+        while True:
+            rows = self._query(f"{SELECT_EMPLOYEES} WHERE id > ? ORDER BY id LIMIT ?", (after_id, batch_size))
+            if not rows:
+                return
+            after_id = rows[-1][0]
+            yield [dict(zip(EMPLOYEE_COLUMNS, row)) for row in rows]
+
+    def search_employee_rows(self, query: str, limit: int = 10) -> List[List[Any]]:
+        """
+        LIKE search over name, email, department and position.
+
+        Every term of at least two characters must occur in one of the
+        columns. Employees whose name starts with the query rank first, then
+        the newest. Scans the table; fine for the sizes this backend targets.
+        """
+        text = " ".join(query.split())
+        terms = [term.replace('"', "") for term in text.split()]
+        terms = [term for term in terms if len(term) >= 2]
+        if not terms:
+            return []
+
+        def pattern(term: str) -> str:
+            return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+        match = " OR ".join(f"{column} LIKE ? ESCAPE '\\'" for column in ("name", "email", "department", "position"))
+        conditions = " AND ".join([f"({match})"] * len(terms))
+        values = [f"%{pattern(term)}%" for term in terms for _ in range(4)]
+        rows = self._query(
+            f"{SELECT_EMPLOYEES} WHERE {conditions} ORDER BY name LIKE ? ESCAPE '\\' DESC, id DESC LIMIT ?",
+            values + [pattern(text) + "%", limit],
+        )
+        return [list(row) for row in rows]
+
+    def get_employee_stats(self, dimension: str) -> List[Dict[str, Any]]:
+        if dimension not in STATS_EXPRESSIONS:
+            raise ValueError(f"Unsupported dimension: {dimension}")
+        rows = self._query(
+            f"""
+            SELECT {STATS_EXPRESSIONS[dimension]} AS group_key, COUNT(*), COUNT(salary), COALESCE(SUM(salary), 0)
+            FROM employees
+            GROUP BY group_key
+            ORDER BY group_key
+            """
+        )
+        return [
+            {
+                "key": group_key if group_key != summary.NO_GROUP else None,
+                "headcount": headcount,
+                "total_salary": round(salary_total, 2),
+                "average_salary": round(salary_total / salary_count, 2) if salary_count else None,
+            }
+            for group_key, headcount, salary_count, salary_total in rows
+        ]
+
+    def rebuild_employee_summary(self) -> Dict[str, int]:
+        """Nothing to rebuild; reports the number of groups per dimension."""
+        return {
+            dimension: self._query(f"SELECT COUNT(*) FROM (SELECT 1 FROM employees GROUP BY {expression})")[0][0]
+            for dimension, expression in STATS_EXPRESSIONS.items()
+        }
+
+    # Writes
+
+    def create_employee(self, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        values = _insert_values(employee_data)
+        with self._transaction() as cursor:
+            cursor.execute(INSERT_EMPLOYEE, values)
+            employee_id = cursor.lastrowid
+            cursor.execute(BUMP_WRITE_VERSION)
+        return _employee((employee_id, *values))
+
+    def bulk_create_employees(
+        self,
+        employees_data: List[Dict[str, Any]],
+        chunk_size: int = 500,
+        single_transaction: bool = False,
+        abort_on_error: bool = False,
+    ) -> Dict[str, Any]:
+        """Same chunk and abort semantics as operations.bulk_create_employees."""
+        ids: List[Optional[int]] = [None] * len(employees_data)
+        pending, errors = split_request_duplicates(employees_data)
+        if errors and abort_on_error:
+            return {"ids": ids, "errors": errors, "aborted": True}
+
+        # The transaction scope is the whole batch or one chunk
+        scope = max(len(pending), 1) if single_transaction else chunk_size
+        aborted = False
+        for start in range(0, len(pending), scope):
+            assigned: List[Tuple[int, int]] = []
+            try:
+                with self._transaction() as cursor:
+                    for offset in range(start, min(start + scope, len(pending)), chunk_size):
+                        chunk = pending[offset:offset + chunk_size]
+                        emails = [data["email"] for _, data in chunk]
+                        cursor.execute(
+                            f"SELECT email FROM employees WHERE email IN ({', '.join(['?'] * len(emails))})", emails
+                        )
+                        existing = {row[0].casefold() for row in cursor.fetchall()}
+                        failed = [index for index, data in chunk if data["email"].casefold() in existing]
+                        errors.extend({"index": index, "error": "Email already exists"} for index in failed)
+                        if failed and abort_on_error:
+                            raise _Abort()
+                        for index, data in chunk:
+                            if data["email"].casefold() not in existing:
+                                cursor.execute(INSERT_EMPLOYEE, _insert_values(data))
+                                assigned.append((index, cursor.lastrowid))
+                    if assigned:
+                        cursor.execute(BUMP_WRITE_VERSION)
+            except _Abort:
+                aborted = True
+                break
+            for index, employee_id in assigned:
+                ids[index] = employee_id
+
+        errors.sort(key=lambda error: error["index"])
+        return {"ids": ids, "errors": errors, "aborted": aborted}
+
+    def update_employee(self, employee_id: int, employee_data: Dict[str, Any]) -> Optional[Employee]:
+        update_fields, values = build_set_clause(employee_data)
+        if not update_fields:
+            return self.get_employee(employee_id)
+        if employee_data.get("salary") is not None:
+            values[update_fields.index("salary = %s")] = summary.as_stored(employee_data["salary"])
+
+        with self._transaction() as cursor:
+            cursor.execute(
+                _sql(f"UPDATE employees SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP WHERE id = ?"),
+                _params(values + [employee_id]),
+            )
+            if cursor.rowcount == 0:
+                return None
+            cursor.execute(BUMP_WRITE_VERSION)
+            cursor.execute(f"{SELECT_EMPLOYEES} WHERE id = ?", (employee_id,))
+            row = cursor.fetchone()
+        return _employee(row)
+
+    def delete_employee(self, employee_id: int) -> bool:
+        with self._transaction() as cursor:
+            cursor.execute("DELETE FROM employees WHERE id = ?", (employee_id,))
+            if cursor.rowcount == 0:
+                return False
+            cursor.execute(INSERT_TOMBSTONES + "VALUES (?)", (employee_id,))
+            cursor.execute(BUMP_WRITE_VERSION)
+            return True
+
+    def bulk_update_employees(
+        self,
+        employee_data: Dict[str, Any],
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        salary_factor: Optional[float] = None,
+        return_ids: bool = False,
+    ) -> Dict[str, Any]:
+        update_fields, set_values = build_set_clause(employee_data, salary_factor)
+        conditions, where_values = build_filter_clause(ids, filters)
+        if not conditions:
+            raise ValueError("A bulk update needs ids or at least one filter")
+        if not update_fields:
+            raise ValueError("A bulk update needs at least one change")
+
+        where_clause = _sql(" AND ".join(conditions))
+        with self._transaction() as cursor:
+            matched_ids = None
+            if return_ids:
+                cursor.execute(f"SELECT id FROM employees WHERE {where_clause} ORDER BY id", _params(where_values))
+                matched_ids = [row[0] for row in cursor.fetchall()]
+            cursor.execute(
+                _sql(f"UPDATE employees SET {', '.join(update_fields)}, updated_at = CURRENT_TIMESTAMP WHERE ")
+                + where_clause,
+                _params(set_values + where_values),
+            )
+            affected = cursor.rowcount
+            if affected:
+                cursor.execute(BUMP_WRITE_VERSION)
+        return {"affected": affected, "ids": matched_ids}
+
+    def bulk_delete_employees(
+        self,
+        ids: Optional[List[int]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_ids: bool = False,
+    ) -> Dict[str, Any]:
+        conditions, where_values = build_filter_clause(ids, filters)
+        if not conditions:
+            raise ValueError("A bulk delete needs ids or at least one filter")
+
+        where_clause = _sql(" AND ".join(conditions))
+        with self._transaction() as cursor:
+            deleted_ids = None
+            if return_ids:
+                cursor.execute(f"SELECT id FROM employees WHERE {where_clause} ORDER BY id", _params(where_values))
+                deleted_ids = [row[0] for row in cursor.fetchall()]
+            cursor.execute(
+                f"{INSERT_TOMBSTONES} SELECT id FROM employees WHERE {where_clause}", _params(where_values)
+            )
+            cursor.execute(f"DELETE FROM employees WHERE {where_clause}", _params(where_values))
+            affected = cursor.rowcount
+            if affected:
+                cursor.execute(BUMP_WRITE_VERSION)
+        return {"affected": affected, "ids": deleted_ids}
@@ -0,0 +1,58 @@
+"""
+Per-connection cache of server-side prepared statements.
+
+mysql.connector re-prepares a statement whenever a prepared cursor executes
+a different SQL string object, so each fixed query keeps its own cursor on
+each connection. The server then parses each query once per connection
+instead of once per execution.
+"""
+
+from typing import Any, Dict
+
+_CACHE_ATTRIBUTE = "_employee_prepared_statements"
+
+
+def prepared_cursor(conn: Any, query: str) -> Any:
+    """
+    Return the cached prepared cursor for a query on this connection.
+
+    The cursor belongs to the cache and must not be closed by the caller.
+    The query must be passed as the same string object on every call.
+
+    Args:
+        conn: Open MySQL connection
+        query: Fixed SQL statement
+
+    Returns:
+        Prepared cursor for the query
+    """
+    cache: Dict[str, Any] = getattr(conn, _CACHE_ATTRIBUTE, None)
+    if cache is None:
+        cache = {}
+        setattr(conn, _CACHE_ATTRIBUTE, cache)
+    cursor = cache.get(query)
+    if cursor is None:
+        cursor = conn.cursor(prepared=True)
+        cache[query] = cursor
+    return cursor
+
+
+def clear_statement_cache(conn: Any) -> None:
+    """
+    Forget the prepared statements of a connection.
+
+    Called after a reconnect or session reset, which deallocate every
+    prepared statement on the server.
+
+    Args:
+        conn: MySQL connection
+    """
+    cache: Dict[str, Any] = getattr(conn, _CACHE_ATTRIBUTE, None) or {}
+    setattr(conn, _CACHE_ATTRIBUTE, {})
+    for cursor in cache.values():
+        # Drop the handles without sending COM_STMT_CLOSE for dead statements
+        cursor._prepared = None
+        try:
+            cursor.close()
+        except Exception:
+            pass
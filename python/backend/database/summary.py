@@ -0,0 +1,184 @@
+"""
+Incrementally maintained employee aggregates.
+
+employee_summary holds headcount and salary totals per department, position
+and hire month. Every write in operations turns the rows it changes into
+deltas and applies them in the same transaction, so dashboard reads cost
+O(groups) instead of O(employees). rebuild_summary recomputes the table
+from scratch (python -m backend.cli rebuild-summary).
+"""
+
+from datetime import date
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Summary dimension -> SQL expression grouping employees along it
+SUMMARY_DIMENSIONS = {
+    "department": "department",
+    "position": "position",
+    "hire_month": "DATE_FORMAT(hire_date, '%Y-%m')",
+}
+
+# Employee columns that feed the summary; writes touching none of them leave it alone
+SUMMARY_SOURCE_COLUMNS = ("department", "position", "salary", "hire_date")
+
+# Employees without a value are summarized under an empty group key
+NO_GROUP = ""
+
+# Rows per id list when aggregating explicit ids
+ID_CHUNK_SIZE = 1000
+
+# (dimension, group key) -> [headcount, salary count, salary total]
+Deltas = Dict[Tuple[str, str], List[Any]]
+
+
+def _add(deltas: Deltas, dimension: str, key: Optional[str], headcount: int,
+         salary_count: int, salary_total: Decimal) -> None:
+    """Accumulate one group's change."""
+    entry = deltas.setdefault((dimension, key if key is not None else NO_GROUP), [0, 0, Decimal("0")])
+    entry[0] += headcount
+    entry[1] += salary_count
+    entry[2] += salary_total
+
+
+def _hire_month(hire_date: Any) -> Optional[str]:
+    """Format a hire date (date or ISO string) as YYYY-MM."""
+    if hire_date is None:
+        return None
+    if isinstance(hire_date, date):
+        return hire_date.strftime("%Y-%m")
+    return str(hire_date)[:7]
+
+
+def as_stored(salary: Any) -> Decimal:
+    """Round a salary the way the DECIMAL(10, 2) column stores it."""
+    # The driver sends floats as repr(), which MySQL rounds half away from zero
+    return Decimal(repr(salary) if isinstance(salary, float) else str(salary)).quantize(
+        Decimal("0.01"), rounding=ROUND_HALF_UP
+    )
+
+
+def add_employees(deltas: Deltas, employees: Iterable[Dict[str, Any]], sign: int = 1) -> Deltas:
+    """
+    Add (sign=1) or remove (sign=-1) employees given as dictionaries.
+
+    Args:
+        deltas: Accumulator to update
+        employees: Dictionaries with department, position, salary and hire_date
+        sign: 1 for inserted rows, -1 for removed rows
+
+    Returns:
+        The updated accumulator
+    """
+    for employee in employees:
+        salary = employee.get("salary")
+        salary_count = sign if salary is not None else 0
+        salary_total = sign * as_stored(salary) if salary is not None else Decimal("0")
+        _add(deltas, "department", employee.get("department"), sign, salary_count, salary_total)
+        _add(deltas, "position", employee.get("position"), sign, salary_count, salary_total)
+        _add(deltas, "hire_month", _hire_month(employee.get("hire_date")), sign, salary_count, salary_total)
+    return deltas
+
+
+def add_matching(deltas: Deltas, cursor, where_clause: str, values: Sequence[Any],
+                 sign: int = 1, lock: bool = False) -> Deltas:
+    """
+    Add or remove the employees matching a WHERE clause, aggregated in SQL.
+
+    Args:
+        deltas: Accumulator to update
+        cursor: Cursor on a connection with an open transaction
+        where_clause: Condition selecting employees
+        values: Parameters of the condition
+        sign: 1 for rows that now exist, -1 for rows about to go away
+        lock: Lock the matching rows (FOR UPDATE)
+
+    Returns:
+        The updated accumulator
+    """
+    cursor.execute(
+        f"""
+        SELECT department, position, {SUMMARY_DIMENSIONS['hire_month']},
+            COUNT(*), COUNT(salary), COALESCE(SUM(salary), 0)
+        FROM employees
+        WHERE {where_clause}
+        GROUP BY 1, 2, 3
+        {'FOR UPDATE' if lock else ''}
+        """,
+        tuple(values),
+    )
+    for department, position, hire_month, headcount, salary_count, salary_total in cursor.fetchall():
+        headcount, salary_count, salary_total = sign * headcount, sign * salary_count, sign * Decimal(salary_total)
+        _add(deltas, "department", department, headcount, salary_count, salary_total)
+        _add(deltas, "position", position, headcount, salary_count, salary_total)
+        _add(deltas, "hire_month", hire_month, headcount, salary_count, salary_total)
+    return deltas
+
+
+def add_ids(deltas: Deltas, cursor, ids: Sequence[int], sign: int = 1) -> Deltas:
+    """Add or remove the employees with the given ids, ID_CHUNK_SIZE ids per query."""
+    for offset in range(0, len(ids), ID_CHUNK_SIZE):
+        chunk = ids[offset:offset + ID_CHUNK_SIZE]
+        add_matching(deltas, cursor, f"id IN ({', '.join(['%s'] * len(chunk))})", chunk, sign)
+    return deltas
+
+
+def apply_deltas(cursor, deltas: Deltas) -> None:
+    """
+    Apply accumulated deltas with one upsert on the caller's transaction.
+
+    Groups are written in key order so concurrent writers lock summary rows
+    in the same order and cannot deadlock on each other.
+    """
+    changed = sorted(
+        (key, entry) for key, entry in deltas.items()
+        if entry[0] or entry[1] or entry[2]
+    )
+    if not changed:
+        return
+    cursor.execute(
+        "INSERT INTO employee_summary (dimension, group_key, headcount, salary_count, salary_total) VALUES "
+        + ", ".join(["(%s, %s, %s, %s, %s)"] * len(changed))
+        + """ AS delta
+        ON DUPLICATE KEY UPDATE
+            headcount = headcount + delta.headcount,
+            salary_count = salary_count + delta.salary_count,
+            salary_total = salary_total + delta.salary_total
+        """,
+        tuple(value for (dimension, key), entry in changed for value in (dimension, key, *entry)),
+    )
+
+
+def rebuild_summary(conn) -> Dict[str, int]:
+    """
+    Recompute employee_summary from the employees table in one transaction.
+
+    Args:
+        conn: Connection without an open transaction
+
+    Returns:
+        Number of groups written per dimension
+    """
+    cursor = conn.cursor()
+    try:
+        conn.start_transaction()
+        cursor.execute("DELETE FROM employee_summary")
+        groups = {}
+        for dimension, expression in SUMMARY_DIMENSIONS.items():
+            cursor.execute(
+                f"""
+                INSERT INTO employee_summary (dimension, group_key, headcount, salary_count, salary_total)
+                SELECT %s, COALESCE({expression}, %s), COUNT(*), COUNT(salary), COALESCE(SUM(salary), 0)
+                FROM employees
+                GROUP BY 2
+                """,
+                (dimension, NO_GROUP),
+            )
+            groups[dimension] = cursor.rowcount
+        conn.commit()
+        return groups
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
@@ -0,0 +1,91 @@
+"""
+What a job handler sees of its job.
+
+Handlers report progress through JobContext.progress, which is also where
+they are stopped: it raises JobCancelled once cancellation was requested and
+JobInterrupted once the runner no longer owns the job (shutdown, or another
+runner took over a job whose heartbeat went stale). The checkpoint passed
+along is stored with the job, so a retried run can continue from it.
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from backend.api.events import RESYNC, publish_changes
+from backend.config import JobsConfig
+from backend.jobs.store import JobStore
+
+
+class JobCancelled(Exception):
+    """Raised at a progress report after cancellation of the job was requested."""
+
+
+class JobInterrupted(Exception):
+    """Raised at a progress report when the runner no longer owns the job."""
+
+
+class JobContext:
+    """A running job, its store and its runner's claim on it."""
+
+    def __init__(self, store: JobStore, job: Dict[str, Any], worker: str):
+        """
+        Args:
+            store: Job store the job is in
+            job: The claimed job
+            worker: Token of the runner that claimed it
+        """
+        self.store = store
+        self.job = job
+        self.worker = worker
+        self.changed = False
+
+    @property
+    def id(self) -> int:
+        """The job's id."""
+        return self.job["id"]
+
+    @property
+    def checkpoint(self) -> Dict[str, Any]:
+        """The last state saved, by this run or an earlier, unsuccessful one; empty at first."""
+        return self.job["result"] or {}
+
+    def path(self, suffix: str) -> str:
+        """
+        Return the path of a file under JOBS_DIR belonging to this job.
+
+        Files named this way, such as an export or an error report, are
+        removed with the job.
+
+        Args:
+            suffix: Appended to the job's file name, e.g. ".csv"
+
+        Returns:
+            Path of the file; JOBS_DIR is created if needed
+        """
+        os.makedirs(JobsConfig.DIR, exist_ok=True)
+        return os.path.join(JobsConfig.DIR, f"job-{self.id}{suffix}")
+
+    def progress(self, done: int, total: Optional[int] = None, checkpoint: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record progress and check whether the job should go on.
+
+        Args:
+            done: Units of work done, e.g. rows or bytes
+            total: Units of work in all, if known
+            checkpoint: JSON-serializable state a retry would resume from
+
+        Raises:
+            JobCancelled: If cancellation was requested
+            JobInterrupted: If the runner lost the job
+        """
+        cancel_requested = self.store.progress(self.id, self.worker, done, total, checkpoint)
+        self.job.update(progress_done=done, progress_total=total, result=checkpoint)
+        if cancel_requested is None:
+            raise JobInterrupted(f"Job {self.id} was taken back from {self.worker}")
+        if cancel_requested:
+            raise JobCancelled(f"Job {self.id} cancelled after {done} of {total or '?'}")
+
+    def publish_changes(self) -> None:
+        """Tell change stream clients that employees changed, without saying which."""
+        self.changed = True
+        publish_changes([RESYNC])
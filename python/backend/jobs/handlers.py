@@ -0,0 +1,218 @@
+"""
+Job handlers, one per job kind.
+
+Each takes the JobContext and the job's parameters and returns the job's
+result. They work through get_repository(), the same storage layer the
+routes use (the operations module on MySQL), so caching, metrics and
+change bookkeeping behave as for the equivalent request. A file a job
+produces, such as an export or an import's error report, is named in the
+result's "file" entry and downloadable from GET /api/jobs/{id}/result.
+
+A handler raises ValueError for a job that cannot succeed, which is not
+retried; any other exception is retried with backoff while attempts remain.
+"""
+
+import glob
+import io
+import os
+from contextlib import closing
+from typing import Any, Callable, Dict, Iterator, List
+
+from backend.config import AppConfig, DatabaseConfig, JobsConfig
+from backend.database.repository import get_repository
+from backend.jobs.context import JobContext
+from backend.models.schemas import ExportJobParams, SalaryAdjustmentParams
+from backend.utils.export import EXPORT_MEDIA_TYPES, csv_chunks, ndjson_chunks
+from backend.utils.importer import import_employees
+
+Handler = Callable[[JobContext, Dict[str, Any]], Dict[str, Any]]
+
+# Kinds that must not run twice: a run failing after its write committed
+# would repeat the write
+SINGLE_ATTEMPT_KINDS = {"salary_adjustment"}
+
+
+def run_import(ctx: JobContext, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Import the uploaded CSV file at params["upload"] (POST /api/employees/import).
+
+    Progress is in bytes of the upload. Every batch checkpoints the counts and
+    the last line it covered, so a retry continues after it and appends to
+    the same error report.
+
+    Args:
+        ctx: The running job
+        params: Job parameters, with the upload's path
+
+    Returns:
+        Rows read, created and failed, and the error report when rows failed
+    """
+    checkpoint = ctx.checkpoint
+    after_line = checkpoint.get("line", 0)
+    before = {key: checkpoint.get(key, 0) for key in ("rows", "created", "failed")}
+    upload = params["upload"]
+    total = os.path.getsize(upload)
+    report_path = ctx.path("-errors.csv")
+    created = 0
+
+    with open(upload, "rb") as raw, \
+            open(report_path, "a" if after_line else "w", newline="", encoding="utf-8") as report:
+        stream = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
+        def on_batch(counts: Dict[str, int], line: int) -> None:
+            nonlocal created
+            if counts["created"] > created:
+                created = counts["created"]
+                ctx.publish_changes()
+            # The checkpoint must not get ahead of the report
+            report.flush()
+            # Ahead of the parser by at most one read buffer
+            ctx.progress(
+                raw.tell(), total, {**{key: before[key] + counts[key] for key in before}, "line": line}
+            )
+
+        counts = import_employees(
+            get_repository(),
+            stream,
+            report,
+            batch_size=AppConfig.IMPORT_BATCH_SIZE,
+            chunk_size=AppConfig.BULK_CHUNK_SIZE,
+            on_batch=on_batch,
+            after_line=after_line,
+        )
+
+    result: Dict[str, Any] = {key: before[key] + counts[key] for key in before}
+    if result["failed"]:
+        result.update(file=report_path, media_type="text/csv", filename=f"import-{ctx.id}-errors.csv")
+    else:
+        os.remove(report_path)
+    print(f"Import job {ctx.id}: {result['created']} of {result['rows']} rows created")
+    return result
+
+
+def run_export(ctx: JobContext, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Write every employee to a CSV or NDJSON file.
+
+    Progress is in rows, against the headcount when the export started.
+
+    Args:
+        ctx: The running job
+        params: Job parameters, as ExportJobParams
+
+    Returns:
+        Rows written and the file to download
+    """
+    export = ExportJobParams.model_validate(params)
+    repository = get_repository()
+    total = repository.get_collection_version()["count"]
+    path = ctx.path(f".{export.format}")
+    rows = 0
+
+    with closing(repository.iter_employee_batches(AppConfig.EXPORT_BATCH_SIZE)) as batches:
+        def counted() -> Iterator[List[Dict[str, Any]]]:
+            nonlocal rows
+            for batch in batches:
+                yield batch
+                rows += len(batch)
+                ctx.progress(rows, max(total, rows))
+
+        encoder = csv_chunks if export.format == "csv" else ndjson_chunks
+        with open(path, "wb") as output:
+            for chunk in encoder(counted()):
+                output.write(chunk)
+
+    return {
+        "rows": rows,
+        "file": path,
+        "media_type": EXPORT_MEDIA_TYPES[export.format],
+        "filename": f"employees-{ctx.id}.{export.format}",
+    }
+
+
+def run_salary_adjustment(ctx: JobContext, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Multiply the salaries of the selected employees in one statement, like PATCH /employees/bulk.
+
+    Args:
+        ctx: The running job
+        params: Job parameters, as SalaryAdjustmentParams
+
+    Returns:
+        Dictionary with "affected" and, if requested, "ids"
+    """
+    adjustment = SalaryAdjustmentParams.model_validate(params)
+    result = get_repository().bulk_update_employees(
+        {},
+        ids=adjustment.ids,
+        filters=adjustment.filter.model_dump(exclude_none=True) if adjustment.filter else None,
+        salary_factor=adjustment.salary_factor,
+        return_ids=adjustment.return_ids,
+    )
+    if result["affected"]:
+        ctx.publish_changes()
+    return result
+
+
+def run_rebuild_summary(ctx: JobContext, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recompute the employee summary, like python -m backend.cli rebuild-summary.
+
+    Args:
+        ctx: The running job
+        params: Unused
+
+    Returns:
+        Number of summary groups written per dimension
+    """
+    return {"groups": get_repository().rebuild_employee_summary()}
+
+
+def run_reconcile_indexes(ctx: JobContext, params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuild missing or outdated employee indexes and drop obsolete ones (MySQL only).
+
+    Args:
+        ctx: The running job
+        params: Unused
+
+    Returns:
+        The ALTER TABLE clauses applied
+
+    Raises:
+        ValueError: If DB_BACKEND is not mysql
+    """
+    if DatabaseConfig.BACKEND != "mysql":
+        raise ValueError(f"DB_BACKEND={DatabaseConfig.BACKEND} creates its indexes at startup; nothing to reconcile")
+    from backend.database.connection import DatabaseConnection
+
+    return {"changes": DatabaseConnection.reconcile_indexes()}
+
+
+HANDLERS: Dict[str, Handler] = {
+    "import": run_import,
+    "export": run_export,
+    "salary_adjustment": run_salary_adjustment,
+    "rebuild_summary": run_rebuild_summary,
+    "reconcile_indexes": run_reconcile_indexes,
+}
+
+
+def remove_files(job: Dict[str, Any], keep_result: bool = False) -> None:
+    """
+    Delete a job's upload and the files it wrote under JOBS_DIR.
+
+    Args:
+        job: The job
+        keep_result: Keep the file named by the job's result, for a job that
+            succeeded and is not purged yet
+    """
+    keep = job["result"].get("file") if keep_result and job["result"] else None
+    paths = glob.glob(os.path.join(JobsConfig.DIR, f"job-{job['id']}[.-]*"))
+    paths.append(job["params"].get("upload"))
+    for path in paths:
+        if path and path != keep:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
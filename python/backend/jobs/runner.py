@@ -0,0 +1,329 @@
+"""
+Background job runner.
+
+Every server worker with JOBS_ENABLED runs a JobRunner, started and stopped
+with the application. Its dispatch loop, on the event loop, claims due jobs
+from the job store while it has free slots, hands each to a bounded pool of
+JOBS_WORKERS threads or processes (JOBS_MODE), and every JOBS_POLL_SECONDS
+sends heartbeats for its running jobs, takes back jobs whose runner stopped
+sending them, and refreshes the queue counts behind the metrics.
+
+A run that raises is retried after an exponential backoff with jitter while
+attempts remain; a ValueError (the job cannot succeed) fails it at once. On
+shutdown running jobs are given back to the queue and stop at their next
+progress report; a retry resumes from their checkpoint.
+
+Process mode keeps CPU-bound handlers, such as import validation, from
+competing with requests for the GIL. Job processes have their own
+connection pool and employee cache, so with CACHE_BACKEND=memory this
+worker's cache may serve employees a job changed for up to
+CACHE_TTL_SECONDS. DB_BACKEND=memory always runs jobs on threads.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import random
+import socket
+import time
+import uuid
+from concurrent.futures import BrokenExecutor, Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from backend import metrics
+from backend.api.events import RESYNC, publish_changes
+from backend.config import DatabaseConfig, JobsConfig, ServerConfig
+from backend.database.repository import get_repository
+from backend.jobs.context import JobCancelled, JobContext, JobInterrupted
+from backend.jobs.handlers import HANDLERS, SINGLE_ATTEMPT_KINDS, remove_files
+from backend.jobs.store import FINISHED_STATUSES, JobStore, get_job_store
+
+# Connections of a job process's own pool
+PROCESS_POOL_SIZE = 2
+
+
+def retry_delay(attempt: int) -> float:
+    """
+    Compute the delay before retrying a failed run.
+
+    The delay doubles per attempt up to RETRY_BACKOFF_MAX_SECONDS, with jitter.
+
+    Args:
+        attempt: Number of the attempt that failed, starting at 1
+
+    Returns:
+        Seconds to wait
+    """
+    delay = min(JobsConfig.RETRY_BACKOFF_MAX_SECONDS, JobsConfig.RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    # Spread retries of jobs that failed together, e.g. during a database outage
+    return delay * random.uniform(0.5, 1.0)
+
+
+def run_job(job_id: int, worker: str) -> Dict[str, Any]:
+    """
+    Run a claimed job and record how the run ended.
+
+    Runs on a pool thread or in a job process.
+
+    Args:
+        job_id: Id of a job claimed by worker
+        worker: Token of the claiming runner
+
+    Returns:
+        Outcome: kind, status ("succeeded", "failed", "cancelled",
+        "retried" or "interrupted"), run seconds and whether employees changed
+    """
+    store = get_job_store()
+    job = store.get(job_id)
+    ctx = JobContext(store, job, worker)
+    started = time.perf_counter()
+    result: Optional[Dict[str, Any]] = None
+    try:
+        handler = HANDLERS.get(job["kind"])
+        if handler is None:
+            raise ValueError(f"Unknown job kind: {job['kind']}")
+        result = handler(ctx, job["params"])
+        status = "succeeded" if store.finish(job_id, worker, "succeeded", result) else "interrupted"
+    except JobCancelled as e:
+        print(e)
+        status = "cancelled" if store.finish(job_id, worker, "cancelled", ctx.job["result"]) else "interrupted"
+    except JobInterrupted:
+        status = "interrupted"
+    except ValueError as e:
+        print(f"Job {job_id} ({job['kind']}) failed: {e}")
+        status = "failed" if store.finish(job_id, worker, "failed", ctx.job["result"], str(e)) else "interrupted"
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        if job["attempts"] < job["max_attempts"]:
+            delay = retry_delay(job["attempts"])
+            print(f"Job {job_id} ({job['kind']}) attempt {job['attempts']} failed, retrying in {delay:.1f}s: {error}")
+            status = "retried" if store.retry(job_id, worker, time.time() + delay, error) else "interrupted"
+        else:
+            print(f"Job {job_id} ({job['kind']}) failed after {job['attempts']} attempts: {error}")
+            status = "failed" if store.finish(job_id, worker, "failed", ctx.job["result"], error) else "interrupted"
+    if status in FINISHED_STATUSES:
+        remove_files({**job, "result": result}, keep_result=status == "succeeded")
+    return {
+        "kind": job["kind"],
+        "status": status,
+        "seconds": time.perf_counter() - started,
+        "changed": ctx.changed,
+    }
+
+
+def _initialize_process() -> None:
+    """Prepare a job process: a small connection pool and the storage backend."""
+    if DatabaseConfig.BACKEND == "mysql":
+        from backend.database.connection import DatabaseConnection
+
+        DatabaseConnection.initialize_pool(pool_size=PROCESS_POOL_SIZE, warm=False)
+    get_repository().initialize()
+
+
+class JobRunner:
+    """Claims jobs from the store and runs them on a bounded pool."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        mode: str = "thread",
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        stale_after: float = 60.0,
+        retention: float = 86400.0,
+    ):
+        """
+        Initialize the runner without starting it.
+
+        Args:
+            store: Job store to claim from
+            mode: "thread" or "process"
+            workers: Jobs run at the same time
+            poll_interval: Seconds between looks at the queue and heartbeats
+            stale_after: Seconds without heartbeat after which another
+                runner's job is taken back
+            retention: Seconds finished jobs and their files are kept
+        """
+        if mode not in ("thread", "process"):
+            print(f"Unknown JOBS_MODE={mode}; running jobs on threads")
+            mode = "thread"
+        if mode == "process" and DatabaseConfig.BACKEND == "memory":
+            print("DB_BACKEND=memory is private to this process; running jobs on threads")
+            mode = "thread"
+        self.store = store
+        self.mode = mode
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.retention = retention
+        # Identifies this runner's claims in the store
+        self.worker = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        # Job id -> (kind, run future)
+        self.running: Dict[int, Any] = {}
+        self.counts: Dict[str, int] = {}
+        self.outcomes: Dict[str, int] = {}
+        self.stopping = False
+        self._executor: Optional[Executor] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._purged_at = 0.0
+        self._error: Optional[str] = None
+
+    def _create_executor(self) -> Executor:
+        """Create the pool of job threads or processes."""
+        if self.mode == "process":
+            # Forking a process with threads and open connections is unsafe
+            return ProcessPoolExecutor(
+                self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=_initialize_process
+            )
+        return ThreadPoolExecutor(self.workers, thread_name_prefix="job")
+
+    def start(self) -> None:
+        """Start the dispatch loop; call on startup."""
+        self._executor = self._create_executor()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        print(f"Job runner {self.worker} started ({self.workers} {self.mode} workers)")
+
+    def wake(self) -> None:
+        """Look at the queue now rather than at the next poll, e.g. after queueing a job."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self) -> None:
+        """Poll until cancelled, early when woken."""
+        while True:
+            try:
+                await self.poll()
+                self._error = None
+            except Exception as e:
+                # Also while the database is unreachable or its schema not applied yet
+                if str(e) != self._error:
+                    print(f"Job runner error: {e}")
+                self._error = str(e)
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def poll(self) -> None:
+        """Claim due jobs for the free slots and do the periodic store upkeep."""
+        free = 0 if self.stopping else self.workers - len(self.running)
+        claimed = await asyncio.to_thread(self._poll, list(self.running), free)
+        loop = asyncio.get_running_loop()
+        for job in claimed:
+            metrics.JOB_QUEUE_SECONDS.observe(max(0.0, job["started_at"] - job["run_after"]), (job["kind"],))
+            try:
+                future = loop.run_in_executor(self._executor, run_job, job["id"], self.worker)
+            except RuntimeError as e:
+                # The pool broke or shut down; the job goes stale and is taken back
+                print(f"Cannot run job {job['id']}: {e}")
+                continue
+            self.running[job["id"]] = (job["kind"], future)
+            future.add_done_callback(lambda future, job=job: self._finished(job, future))
+
+    def _poll(self, running: List[int], free: int) -> List[Dict[str, Any]]:
+        """Store upkeep and claims for poll(), on a thread."""
+        self.store.heartbeat(running, self.worker)
+        for job in self.store.requeue_stale(self.stale_after):
+            print(f"Job {job['id']} ({job['kind']}) lost its runner; now {job['status']}")
+        if time.monotonic() - self._purged_at > 60:
+            self._purged_at = time.monotonic()
+            for job in self.store.purge(self.retention):
+                remove_files(job)
+        claimed = self.store.claim(self.worker, free) if free > 0 else []
+        self.counts = self.store.counts()
+        return claimed
+
+    def _finished(self, job: Dict[str, Any], future: "asyncio.Future[Dict[str, Any]]") -> None:
+        """Account a run that ended and look at the queue for the freed slot."""
+        self.running.pop(job["id"], None)
+        if future.cancelled():
+            return
+        try:
+            outcome = future.result()
+        except Exception as e:
+            # The outcome could not be recorded; the job goes stale and is taken back
+            print(f"Job {job['id']} ({job['kind']}) crashed its worker: {type(e).__name__}: {e}")
+            outcome = {"kind": job["kind"], "status": "crashed", "seconds": None, "changed": False}
+            if isinstance(e, BrokenExecutor) and not self.stopping:
+                self._executor = self._create_executor()
+        metrics.JOBS_COMPLETED.inc((outcome["kind"], outcome["status"]))
+        if outcome["seconds"] is not None:
+            metrics.JOB_SECONDS.observe(outcome["seconds"], (outcome["kind"],))
+        self.outcomes[outcome["status"]] = self.outcomes.get(outcome["status"], 0) + 1
+        # A job process published to its own, unsubscribed broadcaster
+        if outcome["changed"] and self.mode == "process":
+            publish_changes([RESYNC])
+        self.wake()
+
+    async def stop(self) -> None:
+        """
+        Stop claiming and give running jobs back to the queue; call on shutdown.
+
+        Single-attempt jobs are not given back, since their handler may be
+        past its write; unless they end within SERVER_GRACEFUL_SHUTDOWN_SECONDS
+        they go stale and fail. Other runners wait as long before taking the
+        given-back jobs, by which time their handlers here have stopped.
+        """
+        self.stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        running = dict(self.running)
+        released = [job_id for job_id, (kind, _) in running.items() if kind not in SINGLE_ATTEMPT_KINDS]
+        if released:
+            try:
+                count = await asyncio.to_thread(
+                    self.store.release, released, self.worker, time.time() + ServerConfig.GRACEFUL_SHUTDOWN_SECONDS
+                )
+                print(f"Returned {count} running jobs to the queue")
+            except Exception as e:
+                print(f"Error returning running jobs to the queue: {e}")
+        if running:
+            await asyncio.wait([future for _, future in running.values()], timeout=ServerConfig.GRACEFUL_SHUTDOWN_SECONDS)
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Describe the runner.
+
+        Returns:
+            Dictionary with the worker token, mode, slots, running jobs,
+            outcomes since start, queue counts and the last poll error
+        """
+        return {
+            "worker": self.worker,
+            "mode": self.mode,
+            "workers": self.workers,
+            "running": [{"id": job_id, "kind": kind} for job_id, (kind, _) in self.running.items()],
+            "outcomes": dict(self.outcomes),
+            "counts": dict(self.counts),
+            "error": self._error,
+        }
+
+
+_runner: Optional[JobRunner] = None
+
+
+def get_job_runner() -> Optional[JobRunner]:
+    """
+    Return the process-wide job runner, creating it on first use.
+
+    Returns:
+        JobRunner, or None when this process does not run jobs
+    """
+    global _runner
+    if _runner is None and JobsConfig.ENABLED:
+        _runner = JobRunner(
+            get_job_store(),
+            JobsConfig.MODE,
+            JobsConfig.WORKERS,
+            JobsConfig.POLL_SECONDS,
+            JobsConfig.STALE_SECONDS,
+            JobsConfig.RETENTION_SECONDS,
+        )
+    return _runner
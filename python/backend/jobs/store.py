@@ -0,0 +1,469 @@
+"""
+Persistent job queue.
+
+Jobs are rows of the jobs table (backend/database/schema.py for MySQL, the
+SQLite definition below otherwise). A runner claims a queued job by moving
+it to "running" under its worker token with a conditional UPDATE, so server
+workers and hosts sharing the database never run the same job twice; every
+later write of the job checks the token, so a runner that lost a job (its
+heartbeat went stale and another runner took over) finds out at its next
+progress report. DB_BACKEND=memory keeps jobs in a private in-memory SQLite
+database, which only threads of this process can reach.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from backend.config import DatabaseConfig
+
+STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+JOB_COLUMNS = (
+    "id", "kind", "params", "status", "attempts", "max_attempts", "run_after", "progress_done",
+    "progress_total", "result", "error", "cancel_requested", "worker", "created_at", "started_at",
+    "finished_at", "heartbeat_at",
+)
+
+SELECT_JOBS = f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs"
+
+CREATE_SQLITE_JOBS_TABLE = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        kind TEXT NOT NULL,
+        params TEXT NOT NULL,
+        status TEXT NOT NULL DEFAULT 'queued',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        max_attempts INTEGER NOT NULL DEFAULT 1,
+        run_after REAL NOT NULL,
+        progress_done INTEGER NOT NULL DEFAULT 0,
+        progress_total INTEGER,
+        result TEXT,
+        error TEXT,
+        cancel_requested INTEGER NOT NULL DEFAULT 0,
+        worker TEXT,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL,
+        heartbeat_at REAL
+    )
+    """
+
+
+def _job(row: Sequence[Any]) -> Dict[str, Any]:
+    """Turn a jobs row into a dictionary with params and result decoded."""
+    job = dict(zip(JOB_COLUMNS, row))
+    job["params"] = json.loads(job["params"])
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    job["cancel_requested"] = bool(job["cancel_requested"])
+    return job
+
+
+def _encode(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Encode params, a result or a checkpoint for its TEXT column."""
+    return json.dumps(value, separators=(",", ":")) if value is not None else None
+
+
+class JobStore(ABC):
+    """
+    The jobs table, behind whichever database DB_BACKEND uses.
+
+    Statements use the MySQL driver's %s placeholders; subclasses only
+    provide execution.
+    """
+
+    def initialize(self) -> None:
+        """Create the table if the backend does not get it from the schema."""
+
+    def close(self) -> None:
+        """Release the store's connection."""
+
+    @abstractmethod
+    def _execute(self, query: str, values: Sequence[Any] = ()) -> Tuple[List[Tuple[Any, ...]], int, Optional[int]]:
+        """
+        Run one statement.
+
+        Args:
+            query: Statement with %s placeholders
+            values: Parameters for the placeholders
+
+        Returns:
+            (fetched rows, affected row count, last inserted id)
+        """
+
+    def create(self, kind: str, params: Dict[str, Any], max_attempts: int = 1) -> Dict[str, Any]:
+        """
+        Queue a job.
+
+        Args:
+            kind: Handler name
+            params: JSON-serializable handler parameters
+            max_attempts: Runs before a failing job is given up
+
+        Returns:
+            The new job
+        """
+        now = time.time()
+        _, _, job_id = self._execute(
+            "INSERT INTO jobs (kind, params, status, max_attempts, run_after, created_at)"
+            " VALUES (%s, %s, 'queued', %s, %s, %s)",
+            (kind, _encode(params), max_attempts, now, now),
+        )
+        return self.get(job_id)
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a single job by ID.
+
+        Args:
+            job_id: Id returned when the job was queued
+
+        Returns:
+            The job, or None if not found
+        """
+        rows, _, _ = self._execute(f"{SELECT_JOBS} WHERE id = %s", (job_id,))
+        return _job(rows[0]) if rows else None
+
+    def list(self, status: Optional[str] = None, kind: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Retrieve the newest jobs.
+
+        Args:
+            status: Only jobs in this status
+            kind: Only jobs of this kind
+            limit: Number of jobs to return
+
+        Returns:
+            Jobs, newest first
+        """
+        clauses, values = [], []
+        if status is not None:
+            clauses.append("status = %s")
+            values.append(status)
+        if kind is not None:
+            clauses.append("kind = %s")
+            values.append(kind)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows, _, _ = self._execute(f"{SELECT_JOBS}{where} ORDER BY id DESC LIMIT %s", (*values, limit))
+        return [_job(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count jobs per status.
+
+        Returns:
+            Dictionary mapping every status to its number of jobs
+        """
+        rows, _, _ = self._execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def claim(self, worker: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Move up to limit due jobs, oldest first, from queued to running under worker.
+
+        Candidates another runner claims first are skipped.
+
+        Args:
+            worker: Token of the claiming runner
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            The claimed jobs, attempts already counting this run
+        """
+        now = time.time()
+        rows, _, _ = self._execute(
+            "SELECT id FROM jobs WHERE status = 'queued' AND run_after <= %s ORDER BY run_after, id LIMIT %s",
+            (now, limit),
+        )
+        claimed = []
+        for (job_id,) in rows:
+            _, affected, _ = self._execute(
+                "UPDATE jobs SET status = 'running', worker = %s, attempts = attempts + 1,"
+                " started_at = %s, heartbeat_at = %s, error = NULL"
+                " WHERE id = %s AND status = 'queued'",
+                (worker, now, now, job_id),
+            )
+            if affected:
+                claimed.append(self.get(job_id))
+        return claimed
+
+    def heartbeat(self, job_ids: Sequence[int], worker: str) -> None:
+        """
+        Mark running jobs as alive, so other runners do not take them over.
+
+        Args:
+            job_ids: Ids of jobs the runner is running
+            worker: Token of the runner
+        """
+        if not job_ids:
+            return
+        self._execute(
+            f"UPDATE jobs SET heartbeat_at = %s WHERE worker = %s AND status = 'running'"
+            f" AND id IN ({', '.join(['%s'] * len(job_ids))})",
+            (time.time(), worker, *job_ids),
+        )
+
+    def progress(
+        self, job_id: int, worker: str, done: int, total: Optional[int], checkpoint: Optional[Dict[str, Any]]
+    ) -> Optional[bool]:
+        """
+        Record a running job's progress and the state it would resume from.
+
+        Args:
+            job_id: Id of the running job
+            worker: Token of the runner running it
+            done: Units of work done
+            total: Units of work in all, if known
+            checkpoint: JSON-serializable state a retry would resume from
+
+        Returns:
+            Whether cancellation was requested, or None if worker no longer
+            owns the job
+        """
+        _, affected, _ = self._execute(
+            "UPDATE jobs SET progress_done = %s, progress_total = %s, result = %s, heartbeat_at = %s"
+            " WHERE id = %s AND worker = %s AND status = 'running'",
+            (done, total, _encode(checkpoint), time.time(), job_id, worker),
+        )
+        if not affected:
+            return None
+        rows, _, _ = self._execute("SELECT cancel_requested FROM jobs WHERE id = %s", (job_id,))
+        return bool(rows and rows[0][0])
+
+    def finish(
+        self, job_id: int, worker: str, status: str, result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """
+        End a running job as succeeded, failed or cancelled.
+
+        Args:
+            job_id: Id of the running job
+            worker: Token of the runner running it
+            status: "succeeded", "failed" or "cancelled"
+            result: Handler result, or the last checkpoint
+            error: Reason the job failed
+
+        Returns:
+            False if worker no longer owned the job
+        """
+        _, affected, _ = self._execute(
+            "UPDATE jobs SET status = %s, result = %s, error = %s, finished_at = %s, worker = NULL,"
+            " progress_done = CASE WHEN %s = 'succeeded' THEN COALESCE(progress_total, progress_done)"
+            " ELSE progress_done END"
+            " WHERE id = %s AND worker = %s AND status = 'running'",
+            (status, _encode(result), error, time.time(), status, job_id, worker),
+        )
+        return bool(affected)
+
+    def retry(self, job_id: int, worker: str, run_after: float, error: str) -> bool:
+        """
+        Queue a failed run again; its checkpoint is kept.
+
+        Args:
+            job_id: Id of the running job
+            worker: Token of the runner running it
+            run_after: Unix time before which the job is not claimed again
+            error: Reason the run failed
+
+        Returns:
+            False if worker no longer owned the job
+        """
+        _, affected, _ = self._execute(
+            "UPDATE jobs SET status = 'queued', run_after = %s, error = %s, worker = NULL"
+            " WHERE id = %s AND worker = %s AND status = 'running'",
+            (run_after, error, job_id, worker),
+        )
+        return bool(affected)
+
+    def release(self, job_ids: Sequence[int], worker: str, run_after: float) -> int:
+        """
+        Give running jobs back to the queue, e.g. on shutdown, without counting the run.
+
+        Their handlers stop at their next progress report.
+
+        Args:
+            job_ids: Ids of jobs the runner is running
+            worker: Token of the runner
+            run_after: Unix time before which the jobs are not claimed again
+
+        Returns:
+            Number of jobs given back
+        """
+        if not job_ids:
+            return 0
+        _, affected, _ = self._execute(
+            f"UPDATE jobs SET status = 'queued', run_after = %s, attempts = attempts - 1, worker = NULL"
+            f" WHERE worker = %s AND status = 'running' AND id IN ({', '.join(['%s'] * len(job_ids))})",
+            (run_after, worker, *job_ids),
+        )
+        return affected
+
+    def cancel(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a job: a queued one at once, a running one at its next progress report.
+
+        Args:
+            job_id: Id returned when the job was queued
+
+        Returns:
+            The job afterwards, or None if not found
+        """
+        self._execute(
+            "UPDATE jobs SET status = 'cancelled', finished_at = %s WHERE id = %s AND status = 'queued'",
+            (time.time(), job_id),
+        )
+        self._execute("UPDATE jobs SET cancel_requested = 1 WHERE id = %s AND status = 'running'", (job_id,))
+        return self.get(job_id)
+
+    def requeue_stale(self, stale_after: float) -> List[Dict[str, Any]]:
+        """
+        Take back running jobs whose runner stopped sending heartbeats.
+
+        They are queued again, or end as failed once out of attempts, or as
+        cancelled if that was requested.
+
+        Args:
+            stale_after: Seconds without heartbeat after which a job is taken back
+
+        Returns:
+            The jobs taken back, as they are now
+        """
+        rows, _, _ = self._execute(
+            "SELECT id, worker FROM jobs WHERE status = 'running' AND heartbeat_at < %s",
+            (time.time() - stale_after,),
+        )
+        taken = []
+        for job_id, worker in rows:
+            now = time.time()
+            _, affected, _ = self._execute(
+                "UPDATE jobs SET worker = NULL,"
+                " status = CASE WHEN cancel_requested = 1 THEN 'cancelled'"
+                " WHEN attempts >= max_attempts THEN 'failed' ELSE 'queued' END,"
+                " finished_at = CASE WHEN cancel_requested = 1 OR attempts >= max_attempts THEN %s END,"
+                " error = CASE WHEN cancel_requested = 1 THEN NULL ELSE %s END,"
+                " run_after = %s"
+                " WHERE id = %s AND worker = %s AND status = 'running' AND heartbeat_at < %s",
+                (now, f"Runner {worker} stopped responding", now, job_id, worker, now - stale_after),
+            )
+            if affected:
+                taken.append(self.get(job_id))
+        return taken
+
+    def purge(self, older_than_seconds: float) -> List[Dict[str, Any]]:
+        """
+        Delete jobs that finished more than older_than_seconds ago.
+
+        Args:
+            older_than_seconds: Age of the jobs to delete
+
+        Returns:
+            The deleted jobs, so their files can be removed
+        """
+        rows, _, _ = self._execute(
+            f"{SELECT_JOBS} WHERE finished_at < %s", (time.time() - older_than_seconds,)
+        )
+        purged = [_job(row) for row in rows]
+        for offset in range(0, len(purged), 500):
+            ids = [job["id"] for job in purged[offset:offset + 500]]
+            self._execute(f"DELETE FROM jobs WHERE id IN ({', '.join(['%s'] * len(ids))})", ids)
+        return purged
+
+
+class MySQLJobStore(JobStore):
+    """Jobs in the MySQL database, through the shared connection pool."""
+
+    def _execute(self, query, values=()):
+        from backend.database.connection import DatabaseConnection
+
+        with DatabaseConnection.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, tuple(values))
+                rows = cursor.fetchall() if cursor.with_rows else []
+                return rows, cursor.rowcount, cursor.lastrowid
+            finally:
+                cursor.close()
+
+
+class SQLiteJobStore(JobStore):
+    """Jobs in a SQLite database, on a connection of their own."""
+
+    def __init__(self, path: str) -> None:
+        """
+        Open the database and create the jobs table if needed.
+
+        Args:
+            path: Database file, or ":memory:" for jobs of this process only
+        """
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self.initialize()
+
+    def initialize(self) -> None:
+        with self._lock:
+            self._conn.execute(CREATE_SQLITE_JOBS_TABLE)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_status_run_after ON jobs (status, run_after)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_finished_at ON jobs (finished_at)")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _execute(self, query, values=()):
+        with self._lock:
+            cursor = self._conn.execute(query.replace("%s", "?"), tuple(values))
+            try:
+                return cursor.fetchall(), cursor.rowcount, cursor.lastrowid
+            finally:
+                cursor.close()
+
+
+_store: Optional[JobStore] = None
+_store_lock = threading.Lock()
+
+
+def create_job_store(backend: Optional[str] = None) -> JobStore:
+    """
+    Build the job store for a backend name.
+
+    Args:
+        backend: "mysql", "sqlite" or "memory"; defaults to DB_BACKEND
+
+    Returns:
+        JobStore for the backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    backend = backend or DatabaseConfig.BACKEND
+    if backend == "mysql":
+        return MySQLJobStore()
+    if backend == "sqlite":
+        return SQLiteJobStore(DatabaseConfig.SQLITE_PATH)
+    if backend == "memory":
+        return SQLiteJobStore(":memory:")
+    raise ValueError(f"Unknown DB_BACKEND: {backend}")
+
+
+def get_job_store() -> JobStore:
+    """
+    Return the process-wide job store, creating it on first use.
+
+    Returns:
+        JobStore for DB_BACKEND
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = create_job_store()
+    return _store
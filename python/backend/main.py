@@ -2,13 +2,24 @@
 FastAPI application entry point.
 """
 
-from fastapi import FastAPI, Request
+import asyncio
+from typing import Optional
+
+from fastapi import FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from mysql.connector import Error, errorcode  # <-- added for precise error handling
-from backend.config import AppConfig, DatabaseConfig
-from backend.database.connection import DatabaseConnection
-from backend.api import routes
+from fastapi.responses import JSONResponse, PlainTextResponse
+from backend import metrics
+from backend.database.pool import PoolTimeoutError
+from backend.config import AppConfig, DatabaseConfig, SyncConfig
+from backend.database.cache import get_cache
+from backend.database.profiler import get_profiler
+from backend.database.repository import get_repository
+from backend.api import jobs, routes
+from backend.api.dependencies import get_employee_repository
+from backend.api.events import get_broadcaster
+from backend.api.health import get_health_monitor
+from backend.api.middleware import CompressionMiddleware, MetricsMiddleware, ReadYourWritesMiddleware
+from backend.jobs.runner import get_job_runner
 
 # Create FastAPI application
 app = FastAPI(
@@ -26,32 +37,78 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Read from the primary during and shortly after a client's writes
+if DatabaseConfig.has_replicas() and DatabaseConfig.READ_YOUR_WRITES_SECONDS > 0:
+    app.add_middleware(ReadYourWritesMiddleware, window=DatabaseConfig.READ_YOUR_WRITES_SECONDS)
+
+# Compress large responses; inside the metrics middleware, so timings include it
+if AppConfig.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=AppConfig.COMPRESSION_MIN_SIZE)
+
+# Record request metrics; added last so it also times CORS handling
+if AppConfig.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # Include API routes
 app.include_router(routes.router, prefix=AppConfig.API_PREFIX)
+app.include_router(jobs.router, prefix=AppConfig.API_PREFIX)
+
+_purge_task: Optional[asyncio.Task] = None
+
+
+async def _purge_tombstones_periodically() -> None:
+    """Delete change feed tombstones past their retention every SYNC_PURGE_INTERVAL_SECONDS."""
+    repo = get_employee_repository()
+    while True:
+        await asyncio.sleep(SyncConfig.PURGE_INTERVAL_SECONDS)
+        try:
+            purged = await repo.purge_tombstones(SyncConfig.TOMBSTONE_RETENTION_SECONDS)
+            if purged:
+                print(f"Purged {purged} employee tombstones")
+        except Exception as e:
+            # Retried at the next interval
+            print(f"Error purging employee tombstones: {e}")
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize database connection and create tables on startup."""
-    try:
-        # Initialize the pool once
-        DatabaseConnection.initialize_pool()
+    """Start background work; the storage backend initializes without delaying startup."""
+    # Opens the pool and checks the schema in the background; /readyz reports
+    # ready once that succeeded
+    get_health_monitor().start()
 
-        # Create tables; safe even if they exist (IF NOT EXISTS is used in the implementation)
-        try:
-            DatabaseConnection.create_tables()
-            print("Application started successfully")
-        except Error as e:
-            # Defensive guard: ignore 'table exists' even if IF NOT EXISTS is changed accidentally
-            if getattr(e, "errno", None) == errorcode.ER_TABLE_EXISTS_ERROR:
-                print("Table 'employees' already exists (ignored).")
-            else:
-                # Log but don't crash the app
-                print(f"Error creating tables during startup: {e}")
+    global _purge_task
+    if SyncConfig.PURGE_INTERVAL_SECONDS > 0:
+        _purge_task = asyncio.create_task(_purge_tombstones_periodically())
+
+    broadcaster = get_broadcaster()
+    if broadcaster is not None:
+        broadcaster.start()
+
+    # Claims jobs once the database is reachable; until then it retries quietly
+    runner = get_job_runner()
+    if runner is not None:
+        runner.start()
 
-    except Exception as e:
-        # Do not raise; allow app to start and /health to report actual status
-        print(f"Error during startup: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background work and release the storage backend's connections."""
+    get_health_monitor().stop()
+    global _purge_task
+    if _purge_task is not None:
+        _purge_task.cancel()
+        _purge_task = None
+    # Ends open change streams, which would otherwise hold up the shutdown
+    broadcaster = get_broadcaster()
+    if broadcaster is not None:
+        broadcaster.close()
+    # Running jobs go back to the queue and stop at their next progress report
+    runner = get_job_runner()
+    if runner is not None:
+        await runner.stop()
+    # Waits for connections still held by requests, so keep it off the event loop
+    await asyncio.to_thread(get_repository().close)
 
 
 @app.get("/")
@@ -66,14 +123,133 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint."""
-    db_status = DatabaseConnection.test_connection()
+    """Health check endpoint; reports the database status cached by the health monitor."""
+    status = get_health_monitor().status()
     return {
-        "status": "healthy" if db_status else "unhealthy",
-        "database": "connected" if db_status else "disconnected"
+        "status": "healthy" if status["database"] == "connected" else "unhealthy",
+        "database": status["database"]
     }
 
 
+@app.get("/livez")
+async def liveness():
+    """Liveness probe: the process serves requests. Never touches the database."""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readiness():
+    """Readiness probe: 200 once the backend is initialized and its last check passed, else 503."""
+    status = get_health_monitor().status()
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+
+@app.get("/debug/pool")
+async def pool_stats():
+    """Connection pool occupancy and wait statistics."""
+    from backend.database.connection import DatabaseConnection
+
+    return DatabaseConnection.pool_stats()
+
+
+@app.get("/debug/cache")
+async def cache_stats():
+    """Employee cache counters for sizing the cache."""
+    cache = get_cache()
+    return cache.stats() if cache is not None else {"backend": "none"}
+
+
+@app.get("/debug/queries")
+async def query_stats(limit: int = Query(20, ge=1, le=500, description="Number of statements to return")):
+    """Top statements by total time, with captured plans and recent slow queries."""
+    profiler = get_profiler()
+    return profiler.report(limit) if profiler is not None else {"enabled": False}
+
+
+def _pool_gauges():
+    """Current pool occupancy, read from the pool at scrape time."""
+    if DatabaseConfig.BACKEND != "mysql":
+        return []
+    from backend.database.connection import DatabaseConnection
+
+    stats = DatabaseConnection.pool_stats()
+    if not stats["initialized"]:
+        return []
+    lines = []
+    for key in ("size", "in_use", "idle", "waiters", "max_size"):
+        name = f"db_pool_{key}"
+        lines.extend(metrics.gauge_lines(name, f"Connection pool {key.replace('_', ' ')}.", [({}, stats[key])]))
+    replicas = stats.get("replicas", [])
+    if replicas:
+        lines.extend(metrics.gauge_lines(
+            "db_replica_lag_seconds", "Last sampled replication lag per replica.",
+            [({"replica": replica["name"]}, replica["lag_seconds"]) for replica in replicas
+             if replica["lag_seconds"] is not None],
+        ))
+        lines.extend(metrics.gauge_lines(
+            "db_replica_serving", "1 if the replica currently serves reads.",
+            [({"replica": replica["name"]}, int(replica["serving"])) for replica in replicas],
+        ))
+    return lines
+
+
+@app.get("/debug/jobs")
+async def job_stats():
+    """This worker's job runner: mode, running jobs and outcomes since start, with queue counts."""
+    runner = get_job_runner()
+    return runner.stats() if runner is not None else {"enabled": False}
+
+
+def _event_stream_gauges():
+    """Open change stream connections of this worker."""
+    broadcaster = get_broadcaster()
+    if broadcaster is None:
+        return []
+    return metrics.gauge_lines(
+        "employee_event_streams", "Open change stream connections.", [({}, broadcaster.subscriber_count)]
+    )
+
+
+def _job_gauges():
+    """Queue depth by status, as of the job runner's last poll, and this worker's busy job slots."""
+    runner = get_job_runner()
+    if runner is None or not runner.counts:
+        return []
+    lines = metrics.gauge_lines(
+        "jobs", "Jobs in the job store by status.",
+        [({"status": status}, count) for status, count in runner.counts.items()],
+    )
+    lines.extend(metrics.gauge_lines(
+        "job_runner_busy", "Jobs running in this worker's job pool.", [({}, len(runner.running))]
+    ))
+    lines.extend(metrics.gauge_lines(
+        "job_runner_slots", "Size of this worker's job pool.", [({}, runner.workers)]
+    ))
+    return lines
+
+
+metrics.REGISTRY.add_collector(_pool_gauges)
+metrics.REGISTRY.add_collector(_event_stream_gauges)
+metrics.REGISTRY.add_collector(_job_gauges)
+
+
+if AppConfig.METRICS_ENABLED:
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics_endpoint():
+        """Request, query and pool metrics in the Prometheus text format."""
+        return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    """Report pool exhaustion as a retryable 503 instead of a 500."""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Database busy, please retry"},
+        headers={"Retry-After": "1"}
+    )
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for debugging."""
@@ -93,5 +269,6 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 if __name__ == "__main__":
+    # Development server; production runs several workers with python -m backend.server
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=AppConfig.DEBUG)
@@ -0,0 +1,274 @@
+"""
+In-process metrics with Prometheus text exposition.
+
+Counters and histograms write to a per-thread shard, so recording a value
+takes no lock: the event loop thread and every database worker thread
+update their own cells, and GET /metrics merges the shards when scraped.
+Each uvicorn worker process keeps its own registry; scrape every worker
+(or run one) to see the whole service.
+"""
+
+import bisect
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond cache hits to stalled requests
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Seconds, for background jobs and their time in the queue
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 3600.0)
+
+# Content type of the text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render {name="value",...}; extra is an already formatted pair such as le="0.1"."""
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Registry:
+    """Metric definitions plus the per-thread shards holding their values."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: List[Dict[Tuple["_Metric", Labels], List[float]]] = []
+        self._metrics: List["_Metric"] = []
+        self._collectors: List[Callable[[], Iterable[str]]] = []
+
+    def shard(self) -> Dict[Tuple["_Metric", Labels], List[float]]:
+        """Return the calling thread's shard, creating it on the thread's first write."""
+        try:
+            return self._local.values
+        except AttributeError:
+            values: Dict[Tuple["_Metric", Labels], List[float]] = {}
+            with self._lock:
+                self._shards.append(values)
+            self._local.values = values
+            return values
+
+    def register(self, metric: "_Metric") -> None:
+        with self._lock:
+            self._metrics.append(metric)
+
+    def add_collector(self, collector: Callable[[], Iterable[str]]) -> None:
+        """Add a callable producing exposition lines at scrape time, e.g. for gauges."""
+        with self._lock:
+            self._collectors.append(collector)
+
+    def merged(self) -> Dict[Tuple["_Metric", Labels], List[float]]:
+        """Sum the cells of every shard."""
+        with self._lock:
+            shards = list(self._shards)
+        totals: Dict[Tuple["_Metric", Labels], List[float]] = {}
+        for shard in shards:
+            # Copied in one step; the owning thread may add keys meanwhile
+            for key, cell in list(shard.items()):
+                total = totals.get(key)
+                if total is None:
+                    totals[key] = list(cell)
+                else:
+                    for index, value in enumerate(cell):
+                        total[index] += value
+        return totals
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        totals = self.merged()
+        by_metric: Dict["_Metric", List[Tuple[Labels, List[float]]]] = {}
+        for (metric, labels), cell in totals.items():
+            by_metric.setdefault(metric, []).append((labels, cell))
+
+        lines: List[str] = []
+        with self._lock:
+            metrics = list(self._metrics)
+            collectors = list(self._collectors)
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for labels, cell in sorted(by_metric.get(metric, []), key=lambda item: item[0]):
+                lines.extend(metric.samples(labels, cell))
+        for collector in collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+class _Metric:
+    """Base of the metric types; values live in the registry's shards."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 registry: Optional[Registry] = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._registry = registry or REGISTRY
+        self._registry.register(self)
+
+    def _cell(self, labels: Labels, size: int) -> List[float]:
+        shard = self._registry.shard()
+        cell = shard.get((self, labels))
+        if cell is None:
+            cell = shard[(self, labels)] = [0] * size
+        return cell
+
+    def samples(self, labels: Labels, cell: List[float]) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self._cell(labels, 1)[0] += amount
+
+    def samples(self, labels: Labels, cell: List[float]) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_number(cell[0])}"]
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS, registry: Optional[Registry] = None):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+        # One cell per bucket, one for +Inf, then the sum
+        self._size = len(self.buckets) + 2
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        cell = self._cell(labels, self._size)
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def samples(self, labels: Labels, cell: List[float]) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), cell):
+            cumulative += count
+            le = f'le="{_format_number(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+        label_text = _format_labels(self.labelnames, labels)
+        lines.append(f"{self.name}_sum{label_text} {_format_number(cell[-1])}")
+        lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+def gauge_lines(name: str, documentation: str, samples: Iterable[Tuple[Dict[str, str], float]]) -> List[str]:
+    """Render a gauge for a collector from (labels, value) pairs."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        lines.append(f"{name}{_format_labels(list(labels), list(labels.values()))} {_format_number(value)}")
+    return lines
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_SECONDS = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template.", ("method", "route")
+)
+HTTP_RESPONSES = Counter(
+    "http_responses_total", "HTTP responses by route template and status code.", ("method", "route", "status")
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "db_pool_wait_seconds", "Time to check a connection out of the pool, including opening one."
+)
+DB_POOL_TIMEOUTS = Counter("db_pool_timeouts_total", "Checkouts that gave up waiting for a free connection.")
+DB_CONNECTION_HOLD_SECONDS = Histogram(
+    "db_connection_hold_seconds", "Time a checked-out connection was held before release."
+)
+DB_OPERATION_SECONDS = Histogram(
+    "db_operation_duration_seconds", "Duration of each database operation, cache hits included.", ("operation",)
+)
+DB_OPERATION_ERRORS = Counter("db_operation_errors_total", "Database operations that raised.", ("operation",))
+DB_ROWS = Counter("db_rows_total", "Rows returned or affected by database operations.", ("operation",))
+DB_READS = Counter(
+    "db_reads_total", "Read checkouts by the host serving them and why.", ("target", "reason")
+)
+EVENTS_PUBLISHED = Counter("employee_events_published_total", "Change events published by this worker.", ("type",))
+EVENT_STREAM_OVERFLOWS = Counter(
+    "employee_event_stream_overflows_total", "Stream connections told to resync after their pending events overflowed."
+)
+JOBS_COMPLETED = Counter(
+    "jobs_completed_total", "Job runs ended by this worker, by kind and outcome.", ("kind", "outcome")
+)
+JOB_SECONDS = Histogram("job_duration_seconds", "Run time of each job run.", ("kind",), buckets=JOB_BUCKETS)
+JOB_QUEUE_SECONDS = Histogram(
+    "job_queue_wait_seconds", "Time a job was due before a runner claimed it.", ("kind",), buckets=JOB_BUCKETS
+)
+
+
+def instrument(operation: str, rows: Optional[Callable[[Any], int]] = None) -> Callable:
+    """
+    Record duration, errors and rows of a database operation.
+
+    Generator functions are timed until exhausted or closed, and count the
+    items of every yielded batch as rows.
+
+    Args:
+        operation: Value of the "operation" label
+        rows: Callable deriving the row count from the return value
+
+    Returns:
+        Decorator
+    """
+    labels = (operation,)
+
+    def decorate(func: Callable) -> Callable:
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def generator(*args: Any, **kwargs: Any):
+                started = time.perf_counter()
+                count = 0
+                try:
+                    for batch in func(*args, **kwargs):
+                        count += len(batch)
+                        yield batch
+                except Exception:
+                    DB_OPERATION_ERRORS.inc(labels)
+                    raise
+                finally:
+                    DB_OPERATION_SECONDS.observe(time.perf_counter() - started, labels)
+                    DB_ROWS.inc(labels, count)
+            return generator
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                DB_OPERATION_ERRORS.inc(labels)
+                raise
+            finally:
+                DB_OPERATION_SECONDS.observe(time.perf_counter() - started, labels)
+            if rows is not None:
+                DB_ROWS.inc(labels, rows(result))
+            return result
+        return wrapper
+
+    return decorate
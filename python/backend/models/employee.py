@@ -11,6 +11,8 @@ class Employee:
     Employee class representing an employee with various attributes.
     """
     
+    __slots__ = ("id", "name", "email", "phone", "department", "position", "salary", "hire_date", "updated_at")
+    
     def __init__(
         self,
         name: str,
@@ -20,7 +22,8 @@ class Employee:
         position: Optional[str] = None,
         salary: Optional[float] = None,
         hire_date: Optional[date] = None,
-        employee_id: Optional[int] = None
+        employee_id: Optional[int] = None,
+        updated_at: Optional[float] = None
     ):
         """
         Initialize an Employee instance.
@@ -34,6 +37,7 @@ class Employee:
             salary: Employee's salary
             hire_date: Date of hire
             employee_id: Unique employee ID (for existing employees)
+            updated_at: Last modification as Unix seconds, when read from storage
         """
         self.id = employee_id
         self.name = name
@@ -43,6 +47,7 @@ class Employee:
         self.position = position
         self.salary = salary
         self.hire_date = hire_date
+        self.updated_at = updated_at
     
     def validate(self) -> Tuple[bool, Optional[str]]:
         """
@@ -69,6 +74,8 @@ class Employee:
         """
         Convert employee instance to dictionary.
         
+        updated_at is metadata for HTTP validators and is not included.
+        
         Returns:
             Dictionary representation of the employee
         """
@@ -109,7 +116,8 @@ class Employee:
             department=data.get('department'),
             position=data.get('position'),
             salary=data.get('salary'),
-            hire_date=hire_date
+            hire_date=hire_date,
+            updated_at=float(data['updated_at']) if data.get('updated_at') is not None else None
         )
     
     def __repr__(self) -> str:
@@ -3,8 +3,8 @@ Pydantic schemas for request/response validation.
 """
 
 from datetime import date
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from typing import Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 
 class EmployeeBase(BaseModel):
@@ -69,3 +69,185 @@ class EmployeeResponse(EmployeeBase):
                 "hire_date": "2023-01-15"
             }
         }
+
+
+class EmployeePage(BaseModel):
+    """Schema for one page of the employee list."""
+    items: List[EmployeeResponse] = Field(..., description="Employees on this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; null on the last page"
+    )
+
+
+class EmployeeChanges(BaseModel):
+    """Schema for one read of the employee change feed."""
+    items: List[EmployeeResponse] = Field(..., description="Employees created or updated since the token")
+    deleted: List[int] = Field(..., description="Ids of employees deleted since the token")
+    next_token: str = Field(..., description="Token for the next read")
+    has_more: bool = Field(..., description="More changes are available right away")
+
+
+class EmployeeSearchResults(BaseModel):
+    """Schema for employee search results, best match first."""
+    items: List[EmployeeResponse] = Field(..., description="Matching employees")
+
+
+class EmployeeStatsGroup(BaseModel):
+    """Schema for the aggregates of one group of employees."""
+    key: Optional[str] = Field(None, description="Group value; null for employees without one")
+    headcount: int
+    total_salary: float
+    average_salary: Optional[float] = Field(None, description="Null when no employee has a salary")
+
+
+class EmployeeStats(BaseModel):
+    """Schema for employee aggregates along one dimension."""
+    by: Literal["department", "position", "hire_month"]
+    groups: List[EmployeeStatsGroup]
+
+
+class BulkItemError(BaseModel):
+    """Schema for a failed item in a bulk request."""
+    index: int = Field(..., description="Position of the item in the request")
+    error: str = Field(..., description="Reason the item failed")
+
+
+class BulkCreateResponse(BaseModel):
+    """Schema for the result of a bulk create."""
+    created: int = Field(..., description="Number of employees created")
+    ids: List[Optional[int]] = Field(..., description="Assigned id per request item; null if not created")
+    errors: List[BulkItemError] = Field(default_factory=list)
+    aborted: bool = Field(False, description="True if the batch stopped at the first failure")
+
+
+# Sort keys of the employee list; a leading "-" means descending
+EmployeeSort = Literal["id", "-id", "name", "-name", "salary", "-salary", "hire_date", "-hire_date"]
+
+
+class EmployeeFilter(BaseModel):
+    """Schema for selecting employees by attribute."""
+    department: Optional[str] = Field(None, max_length=50)
+    position: Optional[str] = Field(None, max_length=50)
+    salary_min: Optional[float] = Field(None, ge=0, description="Salary of at least this amount")
+    salary_max: Optional[float] = Field(None, ge=0, description="Salary of at most this amount")
+    hired_after: Optional[date] = Field(None, description="Hired on or after this date")
+    hired_before: Optional[date] = Field(None, description="Hired on or before this date")
+
+
+class BulkSelection(BaseModel):
+    """Base schema for bulk requests that target ids or a filter."""
+    ids: Optional[List[int]] = Field(None, min_length=1, description="Explicit employee ids")
+    filter: Optional[EmployeeFilter] = Field(None, description="Attribute filter")
+    return_ids: bool = Field(False, description="Return the ids of affected employees")
+
+    @model_validator(mode="after")
+    def validate_selection(self):
+        """Require ids or a non-empty filter so a request cannot hit every row by accident."""
+        if not self.ids and not (self.filter and self.filter.model_dump(exclude_none=True)):
+            raise ValueError("Provide ids or at least one filter field")
+        return self
+
+
+class BulkUpdateRequest(BulkSelection):
+    """Schema for a bulk update."""
+    changes: EmployeeUpdate = Field(default_factory=EmployeeUpdate, description="Fields to set")
+    salary_factor: Optional[float] = Field(None, gt=0, description="Multiply salaries by this factor")
+
+    @model_validator(mode="after")
+    def validate_changes(self):
+        """Validate that the update changes something and keeps emails unique."""
+        changes = self.changes.model_dump(exclude_none=True)
+        if "email" in changes:
+            raise ValueError("Email cannot be set in a bulk update")
+        if "salary" in changes and self.salary_factor is not None:
+            raise ValueError("Use either changes.salary or salary_factor, not both")
+        if not changes and self.salary_factor is None:
+            raise ValueError("Provide at least one change")
+        return self
+
+
+class BulkDeleteRequest(BulkSelection):
+    """Schema for a bulk delete."""
+    pass
+
+
+class BulkMutationResponse(BaseModel):
+    """Schema for the result of a bulk update or delete."""
+    affected: int = Field(..., description="Number of employees affected")
+    ids: Optional[List[int]] = Field(None, description="Affected ids, if requested")
+
+
+class ExportJobParams(BaseModel):
+    """Parameters of an export job."""
+    format: Literal["csv", "ndjson"] = "csv"
+
+
+class SalaryAdjustmentParams(BulkSelection):
+    """Parameters of a salary adjustment job."""
+    salary_factor: float = Field(..., gt=0, description="Multiply salaries by this factor")
+
+
+class JobRequestBase(BaseModel):
+    """Base schema for queueing a job."""
+    max_attempts: Optional[int] = Field(None, ge=1, le=20, description="Runs before giving up; JOBS_MAX_ATTEMPTS by default")
+
+
+class ExportJobRequest(JobRequestBase):
+    """Schema for an export of every employee to a downloadable file."""
+    kind: Literal["export"]
+    params: ExportJobParams = Field(default_factory=ExportJobParams)
+
+
+class SalaryAdjustmentJobRequest(JobRequestBase):
+    """Schema for multiplying the salaries of the selected employees."""
+    kind: Literal["salary_adjustment"]
+    params: SalaryAdjustmentParams
+
+    @model_validator(mode="after")
+    def validate_attempts(self):
+        """Refuse retries: a run that failed after its update committed would apply the factor twice."""
+        if self.max_attempts not in (None, 1):
+            raise ValueError("Salary adjustments run once; max_attempts must be 1")
+        return self
+
+
+class MaintenanceJobParams(BaseModel):
+    """Parameters of a summary rebuild or index reconciliation; there are none."""
+    pass
+
+
+class MaintenanceJobRequest(JobRequestBase):
+    """Schema for rebuilding the employee summary or reconciling the employee indexes."""
+    kind: Literal["rebuild_summary", "reconcile_indexes"]
+    params: MaintenanceJobParams = Field(default_factory=MaintenanceJobParams)
+
+
+# Told apart by kind; routes declare it with Body(discriminator="kind")
+JobRequest = Union[ExportJobRequest, SalaryAdjustmentJobRequest, MaintenanceJobRequest]
+
+
+class JobResponse(BaseModel):
+    """Schema for the state of a background job."""
+    id: int
+    kind: str
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    params: Dict[str, Any]
+    attempts: int = Field(..., description="Runs started so far")
+    max_attempts: int
+    progress: Optional[float] = Field(None, description="Share of the work done, from 0 to 1, once the total is known")
+    progress_done: int
+    progress_total: Optional[int] = None
+    result: Optional[Dict[str, Any]] = Field(None, description="Outcome once succeeded; the checkpoint before")
+    result_url: Optional[str] = Field(None, description="Download of the file the job produced, if any")
+    error: Optional[str] = Field(None, description="Last failure; a queued job with an error is waiting to retry")
+    cancel_requested: bool
+    created_at: float = Field(..., description="Unix time the job was queued")
+    run_after: float = Field(..., description="Unix time before which the job is not started")
+    started_at: Optional[float] = Field(None, description="Unix time the latest run started")
+    finished_at: Optional[float] = None
+
+
+class JobList(BaseModel):
+    """Schema for a list of jobs."""
+    jobs: List[JobResponse]
+    counts: Dict[str, int] = Field(..., description="Jobs per status, across all kinds")
@@ -0,0 +1,125 @@
+"""
+Production server launcher.
+
+    python -m backend.server [--workers N|auto] [--host HOST] [--port PORT]
+
+Runs the API under uvicorn with N worker processes behind one listening
+socket. The worker count is exported as WEB_CONCURRENCY before the workers
+start, so each one sizes its connection pool to its share of
+DB_POOL_TOTAL_SIZE. On SIGTERM or SIGINT uvicorn stops accepting
+connections, gives open requests and change streams
+SERVER_GRACEFUL_SHUTDOWN_SECONDS to finish, and then runs each worker's
+shutdown, which drains its connection pool. Startup DDL is serialized
+across workers by the schema lock in DatabaseConnection.create_tables.
+"""
+
+import argparse
+import importlib.util
+import os
+from typing import Optional
+
+import uvicorn
+
+from backend.config import CacheConfig, DatabaseConfig, EventsConfig, ServerConfig
+
+APP = "backend.main:app"
+
+
+def parse_workers(value: str) -> int:
+    """Parse a worker count; "auto" means one worker per CPU."""
+    if value == "auto":
+        return os.cpu_count() or 1
+    workers = int(value)
+    if workers < 1:
+        raise argparse.ArgumentTypeError("workers must be at least 1")
+    return workers
+
+
+def _shared_store_problem(url_setting: str, url: str) -> Optional[str]:
+    """
+    Explain why a shared store setting falls back to a per-process one.
+
+    Args:
+        url_setting: Name of the environment variable holding the URL
+        url: Its value
+
+    Returns:
+        The reason, or None when the shared store can be used
+    """
+    if not url:
+        return f"without {url_setting}"
+    if importlib.util.find_spec("redis") is None:
+        return "without the redis package installed"
+    return None
+
+
+def check_worker_settings(workers: int) -> int:
+    """
+    Warn about settings that only work within one process.
+
+    Args:
+        workers: Requested worker count
+
+    Returns:
+        Worker count to run, 1 for the memory backend
+    """
+    if workers == 1:
+        return workers
+    if DatabaseConfig.BACKEND == "memory":
+        print("DB_BACKEND=memory keeps data per process; running a single worker")
+        return 1
+    if CacheConfig.BACKEND == "memory":
+        print("CACHE_BACKEND=memory is per worker: writes do not invalidate other workers' caches "
+              "until CACHE_TTL_SECONDS pass; use CACHE_BACKEND=shared or none")
+    elif CacheConfig.BACKEND == "shared":
+        problem = _shared_store_problem("CACHE_SHARED_URL", CacheConfig.SHARED_URL)
+        if problem is not None:
+            print(f"CACHE_BACKEND=shared {problem} falls back to a store per worker: writes do not invalidate "
+                  f"other workers' caches until CACHE_TTL_SECONDS pass")
+    if EventsConfig.ENABLED and EventsConfig.FANOUT != "shared":
+        print("EVENTS_FANOUT=local: change stream clients only see writes handled by their own worker; "
+              "use EVENTS_FANOUT=shared")
+    elif EventsConfig.ENABLED:
+        problem = _shared_store_problem("EVENTS_SHARED_URL", EventsConfig.SHARED_URL)
+        if problem is not None:
+            print(f"EVENTS_FANOUT=shared {problem} delivers events per worker: change stream clients only "
+                  f"see writes handled by their own worker")
+    if DatabaseConfig.POOL_TOTAL_SIZE > 0:
+        if DatabaseConfig.POOL_TOTAL_SIZE < workers:
+            print(f"DB_POOL_TOTAL_SIZE={DatabaseConfig.POOL_TOTAL_SIZE} is below the worker count; "
+                  f"each worker still opens 1 connection")
+        else:
+            print(f"Each worker gets {DatabaseConfig.POOL_TOTAL_SIZE // workers} of "
+                  f"DB_POOL_TOTAL_SIZE={DatabaseConfig.POOL_TOTAL_SIZE} connections")
+    else:
+        print(f"Up to {workers * DatabaseConfig.POOL_MAX_SIZE} database connections "
+              f"({workers} workers x DB_POOL_MAX_SIZE={DatabaseConfig.POOL_MAX_SIZE}); "
+              f"set DB_POOL_TOTAL_SIZE to cap the total")
+    return workers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the employee API")
+    parser.add_argument(
+        "--workers", type=parse_workers, default=ServerConfig.WORKERS,
+        help='Worker processes, or "auto" for one per CPU (default: WEB_CONCURRENCY or 1)',
+    )
+    parser.add_argument("--host", default=ServerConfig.HOST, help="Bind address (default: SERVER_HOST)")
+    parser.add_argument("--port", type=int, default=ServerConfig.PORT, help="Bind port (default: SERVER_PORT)")
+    args = parser.parse_args()
+
+    workers = check_worker_settings(args.workers)
+    # Inherited by the worker processes, which read it into ServerConfig.WORKERS
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+    uvicorn.run(
+        APP,
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        # Open change streams never finish on their own
+        timeout_graceful_shutdown=ServerConfig.GRACEFUL_SHUTDOWN_SECONDS,
+    )
+
+
+if __name__ == "__main__":
+    main()
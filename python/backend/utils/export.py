@@ -0,0 +1,52 @@
+"""
+Chunk encoders for streaming employee exports.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+EXPORT_FIELDS = ["id", "name", "email", "phone", "department", "position", "salary", "hire_date"]
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def ndjson_chunks(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """
+    Encode batches of employee dictionaries as newline-delimited JSON.
+
+    Args:
+        batches: Iterable of lists of employee dictionaries
+
+    Yields:
+        One UTF-8 encoded chunk per batch
+    """
+    for batch in batches:
+        lines = [json.dumps(row, ensure_ascii=False, separators=(",", ":")) for row in batch]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def csv_chunks(batches: Iterable[List[Dict[str, Any]]]) -> Iterator[bytes]:
+    """
+    Encode batches of employee dictionaries as CSV with a header row.
+
+    Args:
+        batches: Iterable of lists of employee dictionaries
+
+    Yields:
+        One UTF-8 encoded chunk per batch, preceded by the header
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue().encode("utf-8")
+
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
@@ -0,0 +1,283 @@
+"""
+Streaming CSV import of employees.
+
+Rows are parsed incrementally and validated a batch at a time: cheap checks
+from backend.utils.validators first, then one pydantic validation of
+EmployeeCreate for the whole batch. Email addresses get EmailStr's checks
+and normalization, but its costly domain part (IDNA) runs once per distinct
+domain rather than once per row. Valid rows go to the repository's
+bulk_create_employees, which checks emails against the table in bulk and
+inserts with chunked multi-row INSERTs. Rejected rows are written to an
+error report in the import format with "line" and "error" columns in front,
+so a corrected report can be imported again as it is.
+"""
+
+import csv
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic.networks import validate_email as validate_email_address
+from pydantic_core import PydanticCustomError
+
+from backend.database.repository import EmployeeRepository
+from backend.models.schemas import EmployeeCreate
+from backend.utils.export import EXPORT_FIELDS
+from backend.utils.validators import validate_email, validate_phone, validate_salary
+
+IMPORT_FIELDS = [field for field in EXPORT_FIELDS if field != "id"]
+REQUIRED_FIELDS = ("name", "email")
+REPORT_FIELDS = ["line", "error"] + IMPORT_FIELDS
+
+
+
+class _ImportedEmployee(EmployeeCreate):
+    """EmployeeCreate with the email already checked by _normalize_email."""
+    email: str
+
+
+_BATCH_ADAPTER = TypeAdapter(List[_ImportedEmployee])
+
+# (line number, raw field values)
+Record = Tuple[int, Dict[str, Optional[str]]]
+
+
+class ImportFormatError(ValueError):
+    """The file cannot be imported at all, e.g. because of a missing column."""
+
+
+def read_header(header: List[str]) -> List[str]:
+    """
+    Check the header row of an import file.
+
+    Column names are matched case-insensitively. Columns the import does not
+    know, such as the id of an export or the line and error columns of an
+    error report, are ignored.
+
+    Args:
+        header: Column names of the first row
+
+    Returns:
+        Normalized column names
+
+    Raises:
+        ImportFormatError: If a required column is missing
+    """
+    columns = [column.strip().lower() for column in header]
+    missing = [field for field in REQUIRED_FIELDS if field not in columns]
+    if missing:
+        raise ImportFormatError(f"Missing required columns: {', '.join(missing)}")
+    return columns
+
+
+def iter_records(stream: TextIO) -> Iterator[Record]:
+    """
+    Parse CSV rows one at a time.
+
+    Args:
+        stream: Text stream opened with newline=""
+
+    Yields:
+        (line number, {field: value or None}) per non-empty row
+
+    Raises:
+        ImportFormatError: If the file is empty or lacks a required column
+    """
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        raise ImportFormatError("The file is empty")
+    columns = read_header(header)
+    positions = [(field, columns.index(field)) for field in IMPORT_FIELDS if field in columns]
+    for row in reader:
+        if not any(value.strip() for value in row):
+            continue
+        yield reader.line_num, {
+            field: (row[position].strip() or None) if position < len(row) else None
+            for field, position in positions
+        }
+
+
+@lru_cache(maxsize=4096)
+def _normalize_domain(domain: str) -> str:
+    """EmailStr's verdict on a domain: its normalized form, or ValueError."""
+    try:
+        return validate_email_address(f"x@{domain}")[1].partition("@")[2]
+    except PydanticCustomError as e:
+        raise ValueError(e.message()) from None
+
+
+def _normalize_email(email: str) -> str:
+    """
+    Validate and normalize an email address as EmailStr does.
+
+    Only called for addresses matching validate_email, whose local part is
+    plain ASCII, so the remaining rules are those on dots and on the total
+    length; the domain is checked by EmailStr itself, once per domain.
+
+    Raises:
+        ValueError: If the address is not valid
+    """
+    local, _, domain = email.rpartition("@")
+    if len(email) > 254:
+        raise ValueError("value is not a valid email address: The email address is too long.")
+    if local.startswith(".") or local.endswith(".") or ".." in local:
+        raise ValueError("value is not a valid email address: Invalid use of periods in the local part.")
+    return f"{local}@{_normalize_domain(domain)}"
+
+
+def _precheck(data: Dict[str, Optional[str]]) -> Tuple[Optional[Dict[str, Optional[str]]], Optional[str]]:
+    """
+    Run the validators module's checks and the email checks of the schema.
+
+    Returns:
+        The record's values with the email normalized, or the error message
+        of the first failed check
+    """
+    email = data.get("email")
+    if not email or not validate_email(email):
+        return None, "email: Invalid email address"
+    try:
+        email = _normalize_email(email)
+    except ValueError as e:
+        return None, f"email: {e}"
+    if data.get("phone") and not validate_phone(data["phone"]):
+        return None, "phone: Invalid phone number"
+    return {**data, "email": email}, None
+
+
+def _error_message(error: Dict[str, Any]) -> str:
+    field = error["loc"][1] if len(error["loc"]) > 1 else "row"
+    return f"{field}: {error['msg']}"
+
+
+def validate_batch(records: List[Record]) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Tuple[Record, str]]]:
+    """
+    Validate a batch of records against the import rules and EmployeeCreate.
+
+    The batch is validated with a single pydantic call; only a batch with
+    failures is validated a second time, without the failing rows.
+
+    Args:
+        records: Parsed records
+
+    Returns:
+        (line number, employee dictionary) per valid record, and
+        (record, error message) per invalid one
+    """
+    errors: List[Tuple[Record, str]] = []
+    # (record, values to validate)
+    candidates: List[Tuple[Record, Dict[str, Optional[str]]]] = []
+    for record in records:
+        prepared, error = _precheck(record[1])
+        if error is None:
+            candidates.append((record, prepared))
+        else:
+            errors.append((record, error))
+
+    try:
+        employees = _BATCH_ADAPTER.validate_python([prepared for _, prepared in candidates])
+    except ValidationError as e:
+        failures: Dict[int, str] = {}
+        for error in e.errors():
+            failures.setdefault(error["loc"][0], _error_message(error))
+        errors.extend((candidates[index][0], message) for index, message in failures.items())
+        candidates = [candidate for index, candidate in enumerate(candidates) if index not in failures]
+        employees = _BATCH_ADAPTER.validate_python([prepared for _, prepared in candidates])
+
+    valid: List[Tuple[int, Dict[str, Any]]] = []
+    for (record, _), employee in zip(candidates, employees):
+        ok, message = validate_salary(employee.salary)
+        if ok:
+            valid.append((record[0], employee.model_dump()))
+        else:
+            errors.append((record, f"salary: {message}"))
+    errors.sort(key=lambda failure: failure[0][0])
+    return valid, errors
+
+
+def _batches(records: Iterable[Record], size: int) -> Iterator[List[Record]]:
+    batch: List[Record] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_employees(
+    repository: EmployeeRepository,
+    stream: TextIO,
+    report: TextIO,
+    batch_size: int = 1000,
+    chunk_size: int = 500,
+    on_batch: Optional[Callable[[Dict[str, int], int], None]] = None,
+    after_line: int = 0,
+) -> Dict[str, int]:
+    """
+    Import employees from a CSV stream.
+
+    Every batch commits on its own, so a failure part way leaves the rows of
+    earlier batches imported; the counts tell how far the import got.
+
+    Args:
+        repository: Storage backend to create the employees in
+        stream: CSV text stream with a header row, opened with newline=""
+        report: Text stream receiving the error report
+        batch_size: Rows validated and handed to the repository at a time
+        chunk_size: Rows per INSERT statement
+        on_batch: Called with the running counts and the line of the batch's
+            last record after every batch
+        after_line: Skip the records up to this line, e.g. those a previous,
+            interrupted import of the file got through; the report then
+            continues that import's report, so no header is written
+
+    Returns:
+        Dictionary with rows, created and failed counts, not counting
+        skipped records
+
+    Raises:
+        ImportFormatError: If the file is empty or lacks a required column
+    """
+    writer = csv.writer(report)
+    if not after_line:
+        writer.writerow(REPORT_FIELDS)
+    counts = {"rows": 0, "created": 0, "failed": 0}
+    # Line of the first occurrence of every email in the file, by comparison key
+    seen: Dict[str, int] = {}
+
+    records = iter_records(stream)
+    if after_line:
+        records = (record for record in records if record[0] > after_line)
+    for batch in _batches(records, batch_size):
+        valid, errors = validate_batch(batch)
+        data_by_line = dict(batch)
+
+        unique: List[Tuple[int, Dict[str, Any]]] = []
+        for line, employee in valid:
+            key = employee["email"].casefold()
+            if key in seen:
+                errors.append(((line, data_by_line[line]), f"email: Duplicate of line {seen[key]}"))
+            else:
+                seen[key] = line
+                unique.append((line, employee))
+
+        if unique:
+            result = repository.bulk_create_employees(
+                [employee for _, employee in unique], chunk_size=chunk_size
+            )
+            for error in result["errors"]:
+                line = unique[error["index"]][0]
+                errors.append(((line, data_by_line[line]), f"email: {error['error']}"))
+            counts["created"] += sum(1 for employee_id in result["ids"] if employee_id is not None)
+
+        errors.sort(key=lambda failure: failure[0][0])
+        for (line, data), message in errors:
+            writer.writerow([line, message] + [data.get(field) or "" for field in IMPORT_FIELDS])
+        counts["rows"] += len(batch)
+        counts["failed"] += len(errors)
+        if on_batch is not None:
+            on_batch(counts, batch[-1][0])
+    return counts
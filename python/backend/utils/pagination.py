@@ -0,0 +1,87 @@
+"""
+Opaque cursor tokens for keyset pagination and the change feed.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """
+    Encode a keyset position as an opaque, URL-safe cursor token.
+
+    Args:
+        position: Keyset position, e.g. {"id": 42}
+
+    Returns:
+        URL-safe cursor string
+    """
+    raw = json.dumps(position, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode(token: str) -> Any:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, ValueError, UnicodeError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor token produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Keyset position dictionary
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    position = _decode(cursor)
+    if not isinstance(position, dict) or not isinstance(position.get("id"), int):
+        raise InvalidCursorError("Invalid cursor")
+    return position
+
+
+def _is_sync_position(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and len(value) == 2
+        and isinstance(value[0], (int, float))
+        and not isinstance(value[0], bool)
+        and isinstance(value[1], int)
+        and not isinstance(value[1], bool)
+    )
+
+
+def decode_sync_token(token: str) -> Dict[str, Any]:
+    """
+    Decode a change feed token; tokens are encoded with encode_cursor.
+
+    Args:
+        token: next_token from a previous change feed read
+
+    Returns:
+        Change feed position with "u" (rows, may be None) and "d" (tombstones)
+
+    Raises:
+        InvalidCursorError: If the token is malformed
+    """
+    position = _decode(token)
+    if (
+        not isinstance(position, dict)
+        or not (position.get("u") is None or _is_sync_position(position["u"]))
+        or not _is_sync_position(position.get("d"))
+    ):
+        raise InvalidCursorError("Invalid sync token")
+    return position
@@ -5,6 +5,13 @@ Input validation utilities.
 import re
 from typing import Optional, Tuple
 
+# Compiled once; the importer runs these on every row of large files
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_SEPARATORS = re.compile(r'[\s\-\(\)]')
+_PHONE_PATTERN = re.compile(r'^\+?\d{7,15}$')
+
+MAX_SALARY = 10000000
+
 
 def validate_email(email: str) -> bool:
     """
@@ -16,8 +23,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(_EMAIL_PATTERN.match(email))
 
 
 def validate_phone(phone: str) -> bool:
@@ -31,9 +37,9 @@ def validate_phone(phone: str) -> bool:
         True if valid, False otherwise
     """
     # Remove common separators
-    cleaned = re.sub(r'[\s\-\(\)]', '', phone)
+    cleaned = _PHONE_SEPARATORS.sub('', phone)
     # Check if it contains only digits and optional + at start
-    return bool(re.match(r'^\+?\d{7,15}$', cleaned))
+    return bool(_PHONE_PATTERN.match(cleaned))
 
 
 def validate_salary(salary: Optional[float]) -> Tuple[bool, Optional[str]]:
@@ -52,7 +58,7 @@ def validate_salary(salary: Optional[float]) -> Tuple[bool, Optional[str]]:
     if salary < 0:
         return False, "Salary cannot be negative"
     
-    if salary > 10000000:  # Reasonable upper limit
+    if salary > MAX_SALARY:  # Reasonable upper limit
         return False, "Salary exceeds maximum allowed value"
     
     return True, None
@@ -0,0 +1,94 @@
+"""
+Compare two benchmark reports.
+
+    python -m benchmarks.compare before.json after.json --threshold 10
+
+Prints every numeric result side by side with its relative change. Metrics
+named *_ms, *_ns or ns_per_op are better when lower; *_rps, *per_sec, *qps
+and throughput metrics are better when higher. With --threshold, exits non-zero
+if any of those got worse by more than the given percentage.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+LOWER_IS_BETTER = ("_ms", "_ns", "ns_per_op")
+HIGHER_IS_BETTER = ("_rps", "per_sec", "qps", "throughput")
+
+
+def flatten(results: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Yield (dotted.path, value) for every number in a nested result."""
+    if isinstance(results, dict):
+        for key in sorted(results):
+            yield from flatten(results[key], f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(results, (int, float)) and not isinstance(results, bool):
+        yield prefix, float(results)
+
+
+def direction(metric: str) -> Optional[int]:
+    """Return -1 if lower is better, 1 if higher is better, None if neutral."""
+    name = metric.rsplit(".", 1)[-1]
+    if name.endswith(LOWER_IS_BETTER):
+        return -1
+    if name.endswith(HIGHER_IS_BETTER):
+        return 1
+    return None
+
+
+def compare(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Compare the results of two reports.
+
+    Returns:
+        Metric path -> before, after, change_pct and regression flag
+    """
+    old = dict(flatten(before.get("results", {})))
+    new = dict(flatten(after.get("results", {})))
+    rows = {}
+    for metric in sorted(old.keys() | new.keys()):
+        a, b = old.get(metric), new.get(metric)
+        change = None
+        if a is not None and b is not None and a != 0:
+            change = round((b - a) / abs(a) * 100, 1)
+        better = direction(metric)
+        rows[metric] = {
+            "before": a,
+            "after": b,
+            "change_pct": change,
+            # Positive when the metric got worse
+            "worse_pct": -change * better if change is not None and better is not None else None,
+        }
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, help="Fail on regressions larger than this percentage")
+    args = parser.parse_args()
+
+    with open(args.before, encoding="utf-8") as f:
+        before = json.load(f)
+    with open(args.after, encoding="utf-8") as f:
+        after = json.load(f)
+
+    print(f"{before.get('environment', {}).get('commit')} -> {after.get('environment', {}).get('commit')}")
+    rows = compare(before, after)
+    width = max((len(metric) for metric in rows), default=10)
+    regressions = []
+    for metric, row in rows.items():
+        change = f"{row['change_pct']:+.1f}%" if row["change_pct"] is not None else "n/a"
+        print(f"{metric:<{width}}  {row['before']!s:>12}  {row['after']!s:>12}  {change:>8}")
+        if args.threshold is not None and (row["worse_pct"] or 0) > args.threshold:
+            regressions.append(metric)
+
+    if regressions:
+        print(f"Regressed by more than {args.threshold:g}%: {', '.join(regressions)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Concurrency benchmark: latency under N parallel clients.
+
+Runs against a live server, so the same script measures the blocking and the
+threaded database paths. Start the API twice and compare the two reports:
+
+    DB_ASYNC=false python -m uvicorn backend.main:app --port 8000
+    python -m benchmarks.concurrency --clients 32 --output before.json
+
+    DB_ASYNC=true python -m uvicorn backend.main:app --port 8000
+    python -m benchmarks.concurrency --clients 32 --output after.json
+
+The mix interleaves database-bound routes with /, which never touches the
+database; with a blocking event loop its p99 tracks the slowest query.
+"""
+
+import argparse
+import http.client
+import threading
+import time
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+from benchmarks.report import write_report
+
+DEFAULT_PATHS = ["/api/employees?limit=100", "/api/employees/1", "/"]
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a list of samples.
+
+    Args:
+        samples: Latency samples
+        pct: Percentile between 0 and 100
+
+    Returns:
+        The percentile value, or 0.0 for an empty list
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(samples: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    """Build the latency summary for one route, in milliseconds."""
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 2),
+        "p95_ms": round(percentile(samples, 95) * 1000, 2),
+        "p99_ms": round(percentile(samples, 99) * 1000, 2),
+        "max_ms": round(max(samples) * 1000, 2) if samples else 0.0,
+    }
+
+
+def run(base_url: str, paths: List[str], clients: int, duration: float) -> Dict[str, dict]:
+    """
+    Hammer the given paths from parallel keep-alive clients.
+
+    Args:
+        base_url: Server base URL, e.g. http://127.0.0.1:8000
+        paths: Request paths, issued round-robin by every client
+        clients: Number of parallel clients
+        duration: Benchmark duration in seconds
+
+    Returns:
+        Per-path latency summaries
+    """
+    target = urlsplit(base_url)
+    samples: Dict[str, List[float]] = {path: [] for path in paths}
+    errors: Dict[str, int] = {path: 0 for path in paths}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client(offset: int) -> None:
+        conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+        local: Dict[str, List[float]] = {path: [] for path in paths}
+        local_errors: Dict[str, int] = {path: 0 for path in paths}
+        i = offset
+        while time.perf_counter() < deadline:
+            path = paths[i % len(paths)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                conn.request("GET", path)
+                response = conn.getresponse()
+                response.read()
+                if response.status >= 500:
+                    local_errors[path] += 1
+                    continue
+            except (OSError, http.client.HTTPException):
+                local_errors[path] += 1
+                conn.close()
+                conn = http.client.HTTPConnection(target.hostname, target.port or 80, timeout=30)
+                continue
+            local[path].append(time.perf_counter() - start)
+        conn.close()
+        with lock:
+            for path in paths:
+                samples[path].extend(local[path])
+                errors[path] += local_errors[path]
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {path: summarize(samples[path], errors[path], elapsed) for path in paths}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--path", action="append", dest="paths", help="Path to request (repeatable)")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    results = run(args.url, args.paths or DEFAULT_PATHS, args.clients, args.duration)
+    write_report(
+        "concurrency", {"routes": results}, args.output,
+        url=args.url, clients=args.clients, duration_s=args.duration,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Synthetic employee data for benchmarks.
+
+Generates deterministic, realistic-looking employees and loads them with
+multi-row INSERTs, topping the table up to a target size:
+
+    python -m benchmarks.datagen --rows 1000000
+
+Generated emails use the synthetic.example.com domain, so the rows can be
+told apart from real data and removed with --purge. Rows are written
+directly, so the employee summary is rebuilt afterwards.
+"""
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+
+from backend.database.connection import DatabaseConnection
+from backend.database.operations import EMPLOYEE_INSERT_COLUMNS, rebuild_employee_summary
+
+EMAIL_DOMAIN = "synthetic.example.com"
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "William",
+    "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah",
+    "Charles", "Karen", "Christopher", "Nancy", "Daniel", "Lisa", "Matthew", "Betty", "Anthony",
+    "Margaret", "Mark", "Sandra", "Donald", "Ashley", "Steven", "Kimberly", "Paul", "Emily",
+    "Andrew", "Donna", "Joshua", "Michelle", "Wei", "Yuki", "Priya", "Ahmed", "Olga", "Mateo",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
+    "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor",
+    "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez",
+    "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young", "Allen", "King", "Wright",
+    "Scott", "Torres", "Nguyen", "Hill", "Flores", "Chen", "Tanaka", "Patel", "Khan", "Ivanova",
+]
+DEPARTMENTS = {
+    "Engineering": ["Software Engineer", "Senior Engineer", "Staff Engineer", "Engineering Manager"],
+    "Marketing": ["Marketing Specialist", "Marketing Manager", "Content Writer"],
+    "Sales": ["Account Executive", "Sales Manager", "Sales Representative"],
+    "HR": ["HR Specialist", "Recruiter", "HR Manager"],
+    "Finance": ["Accountant", "Financial Analyst", "Controller"],
+    "Support": ["Support Engineer", "Support Lead", "Help Desk Technician"],
+    "Operations": ["Operations Analyst", "Operations Manager", "Office Manager"],
+}
+
+
+def generate_employees(count: int, start: int = 0, seed: int = 42) -> Iterator[Tuple[Any, ...]]:
+    """
+    Yield synthetic employees as tuples in EMPLOYEE_INSERT_COLUMNS order.
+
+    The same (start, seed) always produces the same rows, and every row has
+    a unique email derived from its sequence number.
+
+    Args:
+        count: Number of employees to generate
+        start: Sequence number of the first employee
+        seed: Random seed
+
+    Returns:
+        Iterator of row tuples
+    """
+    rng = random.Random(seed * 1_000_003 + start)
+    departments = list(DEPARTMENTS)
+    first_hire = date(2005, 1, 1)
+    for number in range(start, start + count):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        department = rng.choice(departments)
+        yield (
+            f"{first} {last}",
+            f"{first.lower()}.{last.lower()}.{number}@{EMAIL_DOMAIN}",
+            f"+1{rng.randint(2000000000, 9999999999)}",
+            department,
+            rng.choice(DEPARTMENTS[department]),
+            round(rng.uniform(35000, 250000), 2),
+            first_hire + timedelta(days=rng.randint(0, 7300)),
+        )
+
+
+def employee_dicts(count: int, start: int = 0, seed: int = 42) -> Iterator[Dict[str, Any]]:
+    """Yield the same employees as generate_employees, as dictionaries."""
+    for row in generate_employees(count, start, seed):
+        yield dict(zip(EMPLOYEE_INSERT_COLUMNS, row))
+
+
+def seed_repository(repository: Any, rows: int, batch_size: int = 5000, seed: int = 42) -> int:
+    """
+    Load synthetic employees through a repository's bulk insert.
+
+    Works with every DB_BACKEND. Employees that already exist are reported
+    by the bulk insert and skipped, so repeated runs top up to the same rows.
+
+    Args:
+        repository: EmployeeRepository to load into
+        rows: Number of synthetic employees wanted
+        batch_size: Employees per bulk insert
+        seed: Random seed passed to generate_employees
+
+    Returns:
+        Number of employees created
+    """
+    created = 0
+    for start in range(0, rows, batch_size):
+        batch = list(employee_dicts(min(batch_size, rows - start), start=start, seed=seed))
+        result = repository.bulk_create_employees(batch, chunk_size=1000)
+        created += sum(1 for employee_id in result["ids"] if employee_id is not None)
+    return created
+
+
+def count_synthetic() -> int:
+    """Return the number of synthetic employees in the table."""
+    with DatabaseConnection.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT COUNT(*) FROM employees WHERE email LIKE %s", (f"%@{EMAIL_DOMAIN}",))
+            return cursor.fetchone()[0]
+        finally:
+            cursor.close()
+
+
+def seed_employees(target_rows: int, batch_size: int = 1000, seed: int = 42) -> int:
+    """
+    Insert synthetic employees until target_rows of them exist.
+
+    Args:
+        target_rows: Desired number of synthetic employees
+        batch_size: Rows per multi-row INSERT
+        seed: Random seed passed to generate_employees
+
+    Returns:
+        Number of rows inserted
+    """
+    existing = count_synthetic()
+    missing = max(0, target_rows - existing)
+    placeholders = "(" + ", ".join(["%s"] * len(EMPLOYEE_INSERT_COLUMNS)) + ")"
+    inserted = 0
+    with DatabaseConnection.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            batch: List[Any] = []
+            rows_in_batch = 0
+            for row in generate_employees(missing, start=existing, seed=seed):
+                batch.extend(row)
+                rows_in_batch += 1
+                if rows_in_batch == batch_size:
+                    _insert_batch(cursor, placeholders, rows_in_batch, batch)
+                    inserted += rows_in_batch
+                    batch, rows_in_batch = [], 0
+            if rows_in_batch:
+                _insert_batch(cursor, placeholders, rows_in_batch, batch)
+                inserted += rows_in_batch
+        finally:
+            cursor.close()
+    return inserted
+
+
+def _insert_batch(cursor: Any, placeholders: str, rows: int, values: List[Any]) -> None:
+    """Insert one batch with a single multi-row INSERT."""
+    cursor.execute(
+        f"INSERT INTO employees ({', '.join(EMPLOYEE_INSERT_COLUMNS)}) VALUES "
+        + ", ".join([placeholders] * rows),
+        values,
+    )
+
+
+def purge_employees(batch_size: int = 10000) -> int:
+    """Delete every synthetic employee in batches and return the number removed."""
+    removed = 0
+    with DatabaseConnection.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            while True:
+                cursor.execute(
+                    "DELETE FROM employees WHERE email LIKE %s LIMIT %s", (f"%@{EMAIL_DOMAIN}", batch_size)
+                )
+                removed += cursor.rowcount
+                if cursor.rowcount < batch_size:
+                    return removed
+        finally:
+            cursor.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="Target number of synthetic employees")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--purge", action="store_true", help="Delete all synthetic employees instead")
+    args = parser.parse_args()
+
+    if args.purge:
+        print(f"Removed {purge_employees()} synthetic employees")
+    else:
+        started = time.perf_counter()
+        inserted = seed_employees(args.rows, args.batch_size, args.seed)
+        elapsed = time.perf_counter() - started
+        print(
+            f"Inserted {inserted} synthetic employees in {elapsed:.1f}s "
+            f"({inserted / elapsed if elapsed else 0:.0f} rows/s, {count_synthetic()} in total)"
+        )
+    rebuild_employee_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Driver mode benchmark: queries/sec for each protocol and statement mode.
+
+Runs the fixed employee queries against the configured MySQL database in
+four modes (pure-Python or C extension, text or prepared statements):
+
+    python -m benchmarks.driver_modes --iterations 5000 --output modes.json
+
+Each mode gets a fresh pool; the employee cache is disabled so every call
+reaches the server. Rows created by the insert/delete pair are removed again.
+"""
+
+import argparse
+import time
+import uuid
+from typing import Callable, Dict, List
+
+from backend.config import CacheConfig, DatabaseConfig
+
+CacheConfig.BACKEND = "none"
+
+from backend.database import operations  # noqa: E402
+from backend.database.connection import DatabaseConnection  # noqa: E402
+from benchmarks.report import write_report  # noqa: E402
+
+MODES = [
+    ("pure_text", True, False),
+    ("pure_prepared", True, True),
+    ("cext_text", False, False),
+    ("cext_prepared", False, True),
+]
+
+
+def _rate(func: Callable[[int], None], iterations: int) -> float:
+    """Call func(i) for i in range(iterations) and return calls per second."""
+    started = time.perf_counter()
+    for i in range(iterations):
+        func(i)
+    return round(iterations / (time.perf_counter() - started), 1)
+
+
+def _sample_ids() -> List[int]:
+    employees, _ = operations.get_employees_page(1000)
+    if not employees:
+        raise SystemExit("The employees table is empty; seed it before benchmarking")
+    return [employee.id for employee in employees]
+
+
+def run_mode(use_pure: bool, prepared: bool, iterations: int) -> Dict[str, float]:
+    """Benchmark one driver mode and return queries/sec per operation."""
+    DatabaseConfig.USE_PURE = use_pure
+    DatabaseConfig.PREPARED_STATEMENTS = prepared
+    DatabaseConnection._pool = None
+    DatabaseConnection.initialize_pool()
+    try:
+        ids = _sample_ids()
+        prefix = uuid.uuid4().hex[:8]
+
+        def insert_delete(i: int) -> None:
+            created = operations.create_employee(
+                {"name": "Bench", "email": f"bench-{prefix}-{i}@example.com"}
+            )
+            operations.delete_employee(created.id)
+
+        return {
+            "get_employee_qps": _rate(lambda i: operations.get_employee(ids[i % len(ids)]), iterations),
+            "get_employees_page_qps": _rate(
+                lambda i: operations.get_employees_page(50, ids[i % len(ids)]), iterations
+            ),
+            "insert_delete_pair_qps": _rate(insert_delete, max(1, iterations // 10)),
+        }
+    finally:
+        DatabaseConnection._pool.close()
+        DatabaseConnection._pool = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    results = {
+        name: run_mode(use_pure, prepared, args.iterations)
+        for name, use_pure, prepared in MODES
+    }
+    write_report("driver_modes", results, args.output, iterations=args.iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+CSV import throughput: parsing, batched validation and the full import.
+
+Writes synthetic employees as an import file, with a share of rows made
+invalid, and reports rows/sec for each stage of backend.utils.importer. The
+full import runs against the configured DB_BACKEND, or a MySQL container
+with --throwaway-db:
+
+    python -m benchmarks.imports --rows 100000 --output imports.json
+    DB_BACKEND=memory python -m benchmarks.imports --rows 100000
+    python -m benchmarks.imports --no-db
+
+Imported employees use the synthetic.example.com domain, numbered from
+--start so they do not collide with benchmarks.datagen rows; remove them
+with python -m benchmarks.datagen --purge.
+"""
+
+import argparse
+import csv
+import io
+import random
+import time
+from contextlib import ExitStack
+from typing import Any, Callable, Dict
+
+from backend.config import CacheConfig
+
+CacheConfig.BACKEND = "none"
+
+from backend.config import AppConfig, DatabaseConfig  # noqa: E402
+from backend.database.repository import get_repository  # noqa: E402
+from backend.utils.importer import IMPORT_FIELDS, import_employees, iter_records, validate_batch  # noqa: E402
+from benchmarks.datagen import generate_employees  # noqa: E402
+from benchmarks.report import write_report  # noqa: E402
+
+
+def import_file(rows: int, start: int, invalid_rate: float, seed: int = 42) -> str:
+    """
+    Build an import file of synthetic employees.
+
+    Args:
+        rows: Data rows
+        start: Sequence number of the first synthetic employee
+        invalid_rate: Share of rows given an invalid email, phone or salary
+
+    Returns:
+        CSV text with a header row
+    """
+    rng = random.Random(seed)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(IMPORT_FIELDS)
+    for row in generate_employees(rows, start=start, seed=seed):
+        row = list(row)
+        if rng.random() < invalid_rate:
+            column = rng.choice((1, 2, 5))
+            row[column] = {1: "not-an-email", 2: "12", 5: "-1"}[column]
+        writer.writerow(row)
+    return buffer.getvalue()
+
+
+def rate(rows: int, func: Callable[[], Any], repeats: int = 3) -> Dict[str, float]:
+    """Best rows/sec of func over repeats runs."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return {"seconds": round(best, 3), "rows_per_sec": round(rows / best, 1)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="Rows in the import file")
+    parser.add_argument("--invalid-rate", type=float, default=0.01, help="Share of invalid rows")
+    parser.add_argument("--start", type=int, default=50_000_000, help="First synthetic sequence number")
+    parser.add_argument("--batch-size", type=int, default=AppConfig.IMPORT_BATCH_SIZE)
+    parser.add_argument("--no-db", action="store_true", help="Only measure parsing and validation")
+    parser.add_argument("--throwaway-db", action="store_true", help="Import into a MySQL container")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    text = import_file(args.rows, args.start, args.invalid_rate)
+
+    def validate_all() -> None:
+        records = list(iter_records(io.StringIO(text, newline="")))
+        for offset in range(0, len(records), args.batch_size):
+            validate_batch(records[offset:offset + args.batch_size])
+
+    results: Dict[str, Any] = {
+        "file_bytes": len(text.encode("utf-8")),
+        "parse": rate(args.rows, lambda: sum(1 for _ in iter_records(io.StringIO(text, newline="")))),
+        "parse_and_validate": rate(args.rows, validate_all),
+    }
+
+    backend = None
+    if not args.no_db:
+        with ExitStack() as stack:
+            if args.throwaway_db:
+                from benchmarks.mysql_container import throwaway_mysql
+
+                stack.enter_context(throwaway_mysql())
+            repo = get_repository()
+            repo.initialize()
+            report = io.StringIO()
+            started = time.perf_counter()
+            counts = import_employees(
+                repo, io.StringIO(text, newline=""), report,
+                batch_size=args.batch_size, chunk_size=AppConfig.BULK_CHUNK_SIZE,
+            )
+            elapsed = time.perf_counter() - started
+            results["import"] = {
+                **counts,
+                "seconds": round(elapsed, 3),
+                "rows_per_sec": round(args.rows / elapsed, 1),
+            }
+            backend = DatabaseConfig.BACKEND
+
+    write_report(
+        "imports", results, args.output,
+        rows=args.rows, invalid_rate=args.invalid_rate, batch_size=args.batch_size, backend=backend,
+    )
+
+
+if __name__ == "__main__":
+    main()
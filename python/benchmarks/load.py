@@ -0,0 +1,168 @@
+"""
+HTTP load driver: runs the API under uvicorn and measures it per route.
+
+Starts `uvicorn backend.main:app` in a child process, waits for it to
+report a healthy database, optionally seeds synthetic employees, then
+drives a route mix from parallel keep-alive clients and reports throughput
+and p50/p95/p99 latency per route:
+
+    python -m benchmarks.load --rows 100000 --clients 32 --duration 15 --output load.json
+    python -m benchmarks.load --throwaway-db --rows 100000 --output load.json
+
+The server inherits the environment, so DB_* and CACHE_* settings apply to
+it, DB_BACKEND included. --throwaway-db runs against a disposable MySQL
+container (requires Docker). With DB_BACKEND=memory every uvicorn worker
+has its own data, so keep --workers 1. Compare two runs with
+benchmarks.compare.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Iterator, List
+
+from backend.config import DatabaseConfig
+from backend.database.operations import rebuild_employee_summary
+from benchmarks.concurrency import run
+from benchmarks.datagen import employee_dicts, seed_employees
+from benchmarks.mysql_container import free_port, throwaway_mysql
+from benchmarks.report import write_report
+
+
+@contextmanager
+def uvicorn_server(port: int, workers: int, timeout: float = 60.0) -> Iterator[str]:
+    """
+    Run the API in a uvicorn child process until the block exits.
+
+    Args:
+        port: Port to listen on
+        workers: Number of uvicorn worker processes
+        timeout: Seconds to wait for /health to report a connected database
+
+    Yields:
+        Base URL of the server
+    """
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning", "--no-access-log",
+        ],
+        env=os.environ.copy(),
+    )
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+            try:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+                conn.request("GET", "/health")
+                health = json.loads(conn.getresponse().read())
+                conn.close()
+                if health.get("database") == "connected":
+                    break
+            except (OSError, http.client.HTTPException, ValueError):
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Server did not become healthy within {timeout:g}s")
+            time.sleep(0.5)
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _request(base_url: str, method: str, path: str, body: Any = None) -> Any:
+    """Send one request to the server and return the decoded JSON response."""
+    host, port = base_url.rsplit("/", 1)[-1].split(":")
+    conn = http.client.HTTPConnection(host, int(port), timeout=300)
+    try:
+        payload = json.dumps(body, default=str) if body is not None else None
+        conn.request(method, path, payload, {"Content-Type": "application/json"})
+        response = conn.getresponse()
+        data = json.loads(response.read())
+        if response.status >= 400:
+            raise RuntimeError(f"{method} {path} failed with {response.status}: {data}")
+        return data
+    finally:
+        conn.close()
+
+
+def seed_over_http(base_url: str, rows: int, batch_size: int = 5000) -> int:
+    """
+    Load synthetic employees through the bulk endpoint.
+
+    Used for the non-MySQL backends, whose data lives in the server process
+    or behind its own connection. Existing employees are skipped.
+
+    Returns:
+        Number of employees created
+    """
+    created = 0
+    for start in range(0, rows, batch_size):
+        batch = list(employee_dicts(min(batch_size, rows - start), start=start))
+        created += _request(base_url, "POST", "/api/employees/bulk", batch)["created"]
+    return created
+
+
+def route_mix(base_url: str) -> List[str]:
+    """Build the request paths, using an existing employee and department."""
+    items = _request(base_url, "GET", "/api/employees?limit=1")["items"]
+    if not items:
+        raise SystemExit("There are no employees; seed some with --rows or benchmarks.datagen")
+    employee_id, department = items[0]["id"], items[0]["department"] or "Engineering"
+    return [
+        "/",
+        f"/api/employees/{employee_id}",
+        "/api/employees?limit=100",
+        f"/api/employees?limit=50&department={department}&sort=-hire_date",
+        "/api/employees/search?q=jo&limit=10",
+        "/api/employees/stats?by=department",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--port", type=int, help="Server port (a free one by default)")
+    parser.add_argument("--rows", type=int, default=0, help="Seed this many synthetic employees first")
+    parser.add_argument("--throwaway-db", action="store_true", help="Run against a MySQL container")
+    parser.add_argument("--path", action="append", dest="paths", help="Path to request instead of the mix")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        if args.throwaway_db:
+            stack.enter_context(throwaway_mysql())
+        base_url = stack.enter_context(uvicorn_server(args.port or free_port(), args.workers))
+        if args.rows:
+            if DatabaseConfig.BACKEND == "mysql":
+                if seed_employees(args.rows):
+                    rebuild_employee_summary()
+            else:
+                seed_over_http(base_url, args.rows)
+
+        paths = args.paths or route_mix(base_url)
+        backend = DatabaseConfig.BACKEND
+        results = run(base_url, paths, args.clients, args.duration)
+
+    write_report(
+        "load", {"routes": results}, args.output,
+        clients=args.clients, duration_s=args.duration, workers=args.workers, rows=args.rows,
+        backend=backend,
+    )
+
+
+if __name__ == "__main__":
+    main()
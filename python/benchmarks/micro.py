@@ -0,0 +1,186 @@
+"""
+Microbenchmarks for the model layer and the storage backends.
+
+Model and serialization benchmarks need no database. The repository
+benchmarks run against the configured DB_BACKEND (--db), or against a
+disposable MySQL container (--throwaway-db, requires Docker):
+
+    python -m benchmarks.micro --output micro.json
+    python -m benchmarks.micro --throwaway-db --rows 100000 --output micro.json
+    DB_BACKEND=memory python -m benchmarks.micro --db --rows 100000 --output memory.json
+
+Each benchmark reports the best mean time per call over several repeats.
+The employee cache is disabled unless --cache is given.
+"""
+
+import argparse
+import time
+from contextlib import ExitStack
+from datetime import date
+from typing import Any, Callable, Dict, List
+
+from backend.config import CacheConfig
+
+CacheConfig.BACKEND = "none"
+
+from backend import metrics  # noqa: E402
+from backend.api.serialization import EMPLOYEE_ROWS  # noqa: E402
+from backend.config import DatabaseConfig  # noqa: E402
+from backend.database.queries import EMPLOYEE_COLUMNS  # noqa: E402
+from backend.database.repository import EmployeeRepository, get_repository  # noqa: E402
+from backend.models.employee import Employee  # noqa: E402
+from backend.models.schemas import EmployeeCreate, EmployeeResponse  # noqa: E402
+from benchmarks.report import write_report  # noqa: E402
+
+SAMPLE_ROW = {
+    "id": 123456,
+    "name": "Jennifer Lopez",
+    "email": "jennifer.lopez.123456@synthetic.example.com",
+    "phone": "+15551234567",
+    "department": "Engineering",
+    "position": "Senior Engineer",
+    "salary": 123456.78,
+    "hire_date": date(2019, 4, 1),
+}
+
+
+def measure(func: Callable[[int], Any], iterations: int, repeats: int = 5) -> Dict[str, float]:
+    """
+    Time func(i) over iterations calls, repeats times, and keep the best run.
+
+    Args:
+        func: Callable receiving the iteration number
+        iterations: Calls per repeat
+        repeats: Number of timed repeats
+
+    Returns:
+        ns_per_op and ops_per_sec of the fastest repeat
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for i in range(iterations):
+            func(i)
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return {
+        "iterations": iterations,
+        "ns_per_op": round(best * 1e9, 1),
+        "ops_per_sec": round(1 / best, 1) if best else 0.0,
+    }
+
+
+def model_benchmarks(iterations: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark Employee, the Pydantic schemas, the list encoder and metric recording."""
+    employee = Employee.from_dict(SAMPLE_ROW)
+    employee_dict = employee.to_dict()
+    create_payload = {key: value for key, value in SAMPLE_ROW.items() if key != "id"}
+    json_row = [
+        SAMPLE_ROW["id"], SAMPLE_ROW["name"], SAMPLE_ROW["email"], SAMPLE_ROW["phone"],
+        SAMPLE_ROW["department"], SAMPLE_ROW["position"], SAMPLE_ROW["salary"], str(SAMPLE_ROW["hire_date"]),
+    ]
+    page = [json_row] * 100
+    assert len(json_row) == len(EMPLOYEE_COLUMNS)
+
+    # What MetricsMiddleware records per request, in a registry of its own
+    registry = metrics.Registry()
+    latency = metrics.Histogram("latency_seconds", "Latency.", ("method", "route"), registry=registry)
+    responses = metrics.Counter("responses_total", "Responses.", ("method", "route", "status"), registry=registry)
+
+    def record_request(i: int) -> None:
+        latency.observe(0.004, ("GET", "/api/employees/{employee_id}"))
+        responses.inc(("GET", "/api/employees/{employee_id}", "200"))
+
+    return {
+        "employee_from_dict": measure(lambda i: Employee.from_dict(SAMPLE_ROW), iterations),
+        "employee_to_dict": measure(lambda i: employee.to_dict(), iterations),
+        "employee_response_init": measure(lambda i: EmployeeResponse(**employee_dict), iterations),
+        "employee_response_validate": measure(lambda i: EmployeeResponse.model_validate(employee_dict), iterations),
+        "employee_create_validate": measure(lambda i: EmployeeCreate(**create_payload), iterations),
+        "encode_page_100": measure(lambda i: EMPLOYEE_ROWS.encode_page(page, "cursor"), max(1, iterations // 100)),
+        "metrics_record_request": measure(record_request, iterations),
+    }
+
+
+def _sample_ids(repo: EmployeeRepository, count: int = 1000) -> List[int]:
+    """Return ids of existing employees to spread reads across the table."""
+    rows, _ = repo.get_employee_rows_page(count)
+    if not rows:
+        raise SystemExit("The employees table is empty; seed it with --rows or benchmarks.datagen")
+    return [row[0] for row in rows]
+
+
+def operation_benchmarks(repo: EmployeeRepository, iterations: int) -> Dict[str, Dict[str, float]]:
+    """Benchmark the repository of the configured DB_BACKEND."""
+    ids = _sample_ids(repo)
+    departments = [group["key"] for group in repo.get_employee_stats("department") if group["key"]]
+    prefix = f"micro-{int(time.time())}"
+
+    def write_cycle(i: int) -> None:
+        created = repo.create_employee(
+            {"name": "Micro Bench", "email": f"{prefix}-{i}@example.com", "department": "Benchmark"}
+        )
+        repo.update_employee(created.id, {"position": "Benchmark"})
+        repo.delete_employee(created.id)
+
+    def keyset_page(i: int) -> None:
+        repo.get_employee_rows_page(50, {"id": ids[i % len(ids)]})
+
+    def filtered_page(i: int) -> None:
+        repo.get_employee_rows_page(
+            50, filters={"department": departments[i % len(departments)]} if departments else None,
+            sort="-hire_date",
+        )
+
+    reads = max(1, iterations // 10)
+    return {
+        "get_employee": measure(lambda i: repo.get_employee(ids[i % len(ids)]), reads),
+        "get_employee_rows_page_first": measure(lambda i: repo.get_employee_rows_page(50), reads),
+        "get_employee_rows_page_keyset": measure(keyset_page, reads),
+        "get_employee_rows_page_filtered": measure(filtered_page, reads),
+        "search_employee_rows": measure(lambda i: repo.search_employee_rows("jo", 10), reads),
+        "get_employee_stats": measure(lambda i: repo.get_employee_stats("department"), reads),
+        "create_update_delete": measure(write_cycle, max(1, iterations // 100), repeats=3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=10000, help="Calls per model benchmark")
+    parser.add_argument("--db", action="store_true", help="Also benchmark the configured DB_BACKEND")
+    parser.add_argument("--throwaway-db", action="store_true", help="Benchmark a MySQL container")
+    parser.add_argument("--rows", type=int, default=0, help="Seed this many synthetic employees first")
+    parser.add_argument("--cache", choices=["none", "memory", "shared"], default="none")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+    CacheConfig.BACKEND = args.cache
+
+    results: Dict[str, Any] = {"model": model_benchmarks(args.iterations)}
+    backend = None
+    if args.db or args.throwaway_db:
+        with ExitStack() as stack:
+            if args.throwaway_db:
+                from benchmarks.mysql_container import throwaway_mysql
+
+                stack.enter_context(throwaway_mysql())
+            repo = get_repository()
+            if args.rows:
+                from benchmarks.datagen import seed_employees, seed_repository
+
+                if DatabaseConfig.BACKEND == "mysql":
+                    seed_employees(args.rows)
+                    repo.rebuild_employee_summary()
+                else:
+                    seed_repository(repo, args.rows)
+            results["operations"] = operation_benchmarks(repo, args.iterations)
+
+            backend = DatabaseConfig.BACKEND
+
+    write_report(
+        "micro", results, args.output,
+        iterations=args.iterations, rows=args.rows, cache=args.cache,
+        backend=backend,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Throwaway MySQL server for benchmarks.
+
+Starts a disposable MySQL container with Docker, points DatabaseConfig (and
+the DB_* environment variables inherited by child processes) at it, with
+DB_BACKEND=mysql, and removes it afterwards:
+
+    with throwaway_mysql():
+        ...
+
+Nothing is persisted; the container is started with --rm and stopped on exit.
+"""
+
+import os
+import socket
+import subprocess
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import mysql.connector  # type: ignore
+
+from backend.config import DatabaseConfig
+from backend.database.connection import DatabaseConnection
+
+DEFAULT_IMAGE = "mysql:8.0"
+PASSWORD = "benchmark"
+DATABASE = "employee_benchmark"
+
+
+def free_port() -> int:
+    """Return a TCP port that is currently free on the loopback interface."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(settings: Dict[str, str], timeout: float) -> None:
+    """Poll the server until it accepts connections or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            mysql.connector.connect(
+                host=settings["DB_HOST"],
+                port=int(settings["DB_PORT"]),
+                user=settings["DB_USER"],
+                password=settings["DB_PASSWORD"],
+                database=settings["DB_NAME"],
+                connection_timeout=2,
+            ).close()
+            return
+        except mysql.connector.Error:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"MySQL container did not become ready within {timeout:g}s")
+            time.sleep(1)
+
+
+@contextmanager
+def throwaway_mysql(image: str = DEFAULT_IMAGE, port: Optional[int] = None,
+                    timeout: float = 180.0) -> Iterator[Dict[str, str]]:
+    """
+    Run a disposable MySQL server for the duration of the block.
+
+    Args:
+        image: Docker image to run
+        port: Host port to publish; a free one is picked by default
+        timeout: Seconds to wait for the server to accept connections
+
+    Yields:
+        The DB_* settings pointing at the container
+    """
+    port = port or free_port()
+    container = subprocess.run(
+        [
+            "docker", "run", "--detach", "--rm",
+            "--env", f"MYSQL_ROOT_PASSWORD={PASSWORD}",
+            "--env", f"MYSQL_DATABASE={DATABASE}",
+            "--publish", f"127.0.0.1:{port}:3306",
+            image,
+        ],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+    settings = {
+        "DB_BACKEND": "mysql",
+        "DB_HOST": "127.0.0.1",
+        "DB_PORT": str(port),
+        "DB_USER": "root",
+        "DB_PASSWORD": PASSWORD,
+        "DB_NAME": DATABASE,
+    }
+    saved_env = {key: os.environ.get(key) for key in settings}
+    saved_config = (DatabaseConfig.BACKEND, DatabaseConfig.HOST, DatabaseConfig.PORT,
+                    DatabaseConfig.USER, DatabaseConfig.PASSWORD, DatabaseConfig.DATABASE)
+    try:
+        _wait_until_ready(settings, timeout)
+        os.environ.update(settings)
+        DatabaseConfig.BACKEND = "mysql"
+        DatabaseConfig.HOST, DatabaseConfig.PORT = settings["DB_HOST"], port
+        DatabaseConfig.USER, DatabaseConfig.PASSWORD = settings["DB_USER"], PASSWORD
+        DatabaseConfig.DATABASE = DATABASE
+        DatabaseConnection.initialize_pool()
+        DatabaseConnection.create_tables()
+        yield settings
+    finally:
+        if DatabaseConnection._pool is not None:
+            DatabaseConnection._pool.close()
+            DatabaseConnection._pool = None
+        (DatabaseConfig.BACKEND, DatabaseConfig.HOST, DatabaseConfig.PORT,
+         DatabaseConfig.USER, DatabaseConfig.PASSWORD, DatabaseConfig.DATABASE) = saved_config
+        for key, value in saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        subprocess.run(["docker", "stop", container], capture_output=True, check=False)
@@ -0,0 +1,65 @@
+"""
+Shared JSON report format for benchmarks.
+
+Every benchmark writes the same envelope, so results from two commits can
+be compared with benchmarks.compare:
+
+    {"benchmark": ..., "environment": {...}, "settings": {...}, "results": {...}}
+
+Keys are sorted so that reports also diff cleanly as text.
+"""
+
+import json
+import platform
+import subprocess
+from typing import Any, Dict, Optional
+
+from backend.config import CacheConfig, DatabaseConfig
+
+
+def _git(*args: str) -> Optional[str]:
+    """Run a git command and return its output, or None outside a checkout."""
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the code and configuration a benchmark ran against."""
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "db_use_pure": DatabaseConfig.USE_PURE,
+        "db_prepared_statements": DatabaseConfig.PREPARED_STATEMENTS,
+        "db_async": DatabaseConfig.ASYNC,
+        "db_pool_max_size": DatabaseConfig.pool_max_size(),
+        "cache_backend": CacheConfig.BACKEND,
+    }
+
+
+def write_report(name: str, results: Dict[str, Any], output: Optional[str] = None, **settings: Any) -> str:
+    """
+    Print a benchmark report and optionally write it to a file.
+
+    Args:
+        name: Benchmark name
+        results: Measurements, nested dictionaries of numbers
+        output: File to write the report to
+        **settings: Parameters the benchmark ran with
+
+    Returns:
+        The report as JSON text
+    """
+    report = {"benchmark": name, "environment": environment(), "settings": settings, "results": results}
+    text = json.dumps(report, indent=2, sort_keys=True, default=str)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+    return text
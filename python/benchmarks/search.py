@@ -0,0 +1,96 @@
+"""
+Search benchmark: latency of employee search on a synthetic dataset.
+
+Tops the table up to --rows synthetic employees (see benchmarks.datagen),
+then runs a mix of type-ahead queries against the FULLTEXT index and
+reports latency percentiles per query. Exits non-zero if any query's p95
+exceeds --budget-ms:
+
+    python -m benchmarks.search --rows 1000000 --budget-ms 10
+
+The employee cache is disabled so every query reaches the server.
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+from backend.config import CacheConfig
+
+CacheConfig.BACKEND = "none"
+
+from backend.database import operations  # noqa: E402
+from backend.database.operations import rebuild_employee_summary  # noqa: E402
+from benchmarks.concurrency import summarize  # noqa: E402
+from benchmarks.datagen import seed_employees  # noqa: E402
+from benchmarks.report import write_report  # noqa: E402
+
+# Typed prefixes and fragments as a help-desk user would enter them
+QUERIES = [
+    "jo",
+    "mich",
+    "priya",
+    "tanaka",
+    "wei chen",
+    "jennifer.l",
+    "ahmed.khan.4",
+    "recruit",
+    "support lead",
+    "finance",
+]
+
+
+def run(queries: List[str], iterations: int, limit: int) -> Dict[str, Dict[str, float]]:
+    """
+    Time each query iterations times.
+
+    Args:
+        queries: Search texts
+        iterations: Timed runs per query, after one warm-up run
+        limit: Result limit passed to the search
+
+    Returns:
+        Latency summary per query, plus the number of results
+    """
+    results = {}
+    for query in queries:
+        hits = len(operations.search_employee_rows(query, limit))
+        samples = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            began = time.perf_counter()
+            operations.search_employee_rows(query, limit)
+            samples.append(time.perf_counter() - began)
+        results[query] = {**summarize(samples, 0, time.perf_counter() - started), "results": hits}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000000, help="Synthetic employees to load first")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="Maximum p95 latency per query")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    inserted = seed_employees(args.rows)
+    if inserted:
+        rebuild_employee_summary()
+        print(f"Inserted {inserted} synthetic employees", file=sys.stderr)
+
+    results = run(QUERIES, args.iterations, args.limit)
+    write_report(
+        "search", {"queries": results}, args.output,
+        rows=args.rows, iterations=args.iterations, limit=args.limit, budget_ms=args.budget_ms,
+    )
+
+    slow = [query for query, summary in results.items() if summary["p95_ms"] > args.budget_ms]
+    if slow:
+        print(f"Over {args.budget_ms:g} ms at p95: {', '.join(slow)}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Startup cost: import time of the backend and time until the API is live and ready.
+
+Imports backend.main in fresh interpreters with -X importtime and reports
+the median total plus the backend modules and third-party packages costing
+the most, then starts the API under uvicorn and times the first successful
+/livez and /readyz:
+
+    python -m benchmarks.startup --runs 7 --output startup.json
+    DB_BACKEND=memory python -m benchmarks.startup
+
+The server inherits the environment, so DB_BACKEND and DB_* apply to it.
+"""
+
+import argparse
+import http.client
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from backend.config import DatabaseConfig
+from benchmarks.mysql_container import free_port, throwaway_mysql
+from benchmarks.report import write_report
+
+
+def import_times(module: str = "backend.main") -> Dict[str, int]:
+    """
+    Import a module in a fresh interpreter and collect -X importtime output.
+
+    Returns:
+        Cumulative microseconds per imported module, "" for the total
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    times[""] = times[module]
+    return times
+
+
+def measure_imports(runs: int, top: int) -> Dict[str, object]:
+    """Median import cost over runs, per backend module and per top-level package."""
+    samples: Dict[str, List[int]] = defaultdict(list)
+    for _ in range(runs):
+        for name, micros in import_times().items():
+            samples[name].append(micros)
+    median = {name: statistics.median(values) / 1000 for name, values in samples.items()}
+    backend = {name: ms for name, ms in median.items() if name.startswith("backend.")}
+    # Top-level packages only, so nested imports are not counted twice
+    packages = {name: ms for name, ms in median.items() if name and "." not in name and name != "backend"}
+    return {
+        "total_ms": median[""],
+        "backend_modules_ms": dict(sorted(backend.items(), key=lambda item: -item[1])[:top]),
+        "packages_ms": dict(sorted(packages.items(), key=lambda item: -item[1])[:top]),
+    }
+
+
+def _status(port: int, path: str) -> Optional[int]:
+    """GET a path and return its status, or None if the server is not listening yet."""
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        conn.request("GET", path)
+        status = conn.getresponse().status
+        conn.close()
+        return status
+    except (OSError, http.client.HTTPException):
+        return None
+
+
+def measure_server(port: int, timeout: float = 60.0) -> Dict[str, float]:
+    """Start uvicorn and time the first 200 from /livez and from /readyz."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "backend.main:app",
+            "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--no-access-log",
+        ],
+        env=os.environ.copy(),
+    )
+    results: Dict[str, float] = {}
+    try:
+        deadline = time.monotonic() + timeout
+        while "readyz_ms" not in results:
+            if process.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with status {process.returncode}")
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Server did not become ready within {timeout:g}s")
+            for path in ("/livez", "/readyz"):
+                key = f"{path[1:]}_ms"
+                if key not in results and _status(port, path) == 200:
+                    results[key] = (time.perf_counter() - started) * 1000
+            time.sleep(0.01)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7, help="Interpreters to import backend.main in")
+    parser.add_argument("--top", type=int, default=15, help="Modules and packages to list")
+    parser.add_argument("--no-server", action="store_true", help="Only measure imports")
+    parser.add_argument("--throwaway-db", action="store_true", help="Run the server against a MySQL container")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    results: Dict[str, object] = {"imports": measure_imports(args.runs, args.top)}
+    if not args.no_server:
+        if args.throwaway_db:
+            with throwaway_mysql():
+                results["server"] = measure_server(free_port())
+        else:
+            results["server"] = measure_server(free_port())
+
+    write_report(
+        "startup", results, args.output, runs=args.runs, backend=DatabaseConfig.BACKEND, server=not args.no_server
+    )
+
+
+if __name__ == "__main__":
+    main()
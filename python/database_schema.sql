@@ -17,9 +17,75 @@ CREATE TABLE IF NOT EXISTS employees (
     hire_date DATE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    INDEX idx_email (email),
-    INDEX idx_department (department)
-);
+    -- Keep in sync with the index lists in backend/database/schema.py;
+    -- the application reconciles existing tables against that list on startup
+    INDEX idx_department (department),
+    INDEX idx_department_hire_date (department, hire_date),
+    INDEX idx_department_salary (department, salary),
+    INDEX idx_position (position),
+    INDEX idx_name (name),
+    INDEX idx_salary (salary),
+    INDEX idx_hire_date (hire_date),
+    INDEX idx_updated_at (updated_at),
+    FULLTEXT INDEX ftx_employee_search (name, email, department, position) WITH PARSER ngram
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Aggregates per department, position and hire month (YYYY-MM), maintained
+-- incrementally by the application; after loading employees outside the
+-- application, run: python -m backend.cli rebuild-summary
+CREATE TABLE IF NOT EXISTS employee_summary (
+    dimension VARCHAR(20) NOT NULL,
+    group_key VARCHAR(50) NOT NULL,
+    headcount INT NOT NULL DEFAULT 0,
+    salary_count INT NOT NULL DEFAULT 0,
+    salary_total DECIMAL(18, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimension, group_key)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Deleted employee ids for the change feed (GET /api/employees/changes);
+-- rows older than SYNC_TOMBSTONE_RETENTION_SECONDS are purged by the application
+CREATE TABLE IF NOT EXISTS employee_tombstones (
+    id INT PRIMARY KEY,
+    deleted_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_deleted_at (deleted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Write counter bumped by every employee write, for the collection ETag
+-- (updated_at and deleted_at have one-second resolution)
+CREATE TABLE IF NOT EXISTS employee_write_version (
+    id TINYINT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Background jobs (POST /api/jobs, CSV imports); times are Unix seconds
+CREATE TABLE IF NOT EXISTS jobs (
+    id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,
+    params TEXT NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    attempts INT NOT NULL DEFAULT 0,
+    max_attempts INT NOT NULL DEFAULT 1,
+    run_after DOUBLE NOT NULL,
+    progress_done BIGINT NOT NULL DEFAULT 0,
+    progress_total BIGINT,
+    result MEDIUMTEXT,
+    error TEXT,
+    cancel_requested TINYINT NOT NULL DEFAULT 0,
+    worker VARCHAR(100),
+    created_at DOUBLE NOT NULL,
+    started_at DOUBLE,
+    finished_at DOUBLE,
+    heartbeat_at DOUBLE,
+    INDEX idx_status_run_after (status, run_after),
+    INDEX idx_finished_at (finished_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Schema version last applied by the backend; startup skips its DDL while current
+CREATE TABLE IF NOT EXISTS schema_version (
+    component VARCHAR(50) PRIMARY KEY,
+    version VARCHAR(64) NOT NULL,
+    applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
 -- Sample data (optional)
 -- INSERT INTO employees (name, email, phone, department, position, salary, hire_date) VALUES
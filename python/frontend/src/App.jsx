@@ -1,7 +1,7 @@
-import React, { useState, useEffect } from 'react'
+import React, { useState, useEffect, useRef } from 'react'
 import EmployeeList from './components/EmployeeList'
 import EmployeeForm from './components/EmployeeForm'
-import { getEmployees } from './services/api'
+import { applyEmployeeChanges, getEmployees, subscribeToEmployeeChanges } from './services/api'
 import './App.css'
 
 function App() {
@@ -10,9 +10,24 @@ function App() {
   const [error, setError] = useState(null)
   const [showForm, setShowForm] = useState(false)
   const [editingEmployee, setEditingEmployee] = useState(null)
+  // True while the change stream is connected and keeps the list current
+  const liveRef = useRef(false)
 
   useEffect(() => {
     loadEmployees()
+    return subscribeToEmployeeChanges({
+      onChanges: (events) => setEmployees((current) => applyEmployeeChanges(current, events)),
+      onResync: loadEmployees,
+      onOpen: (reconnected) => {
+        liveRef.current = true
+        if (reconnected) {
+          loadEmployees()
+        }
+      },
+      onError: () => {
+        liveRef.current = false
+      },
+    })
   }, [])
 
   const loadEmployees = async () => {
@@ -29,6 +44,13 @@ function App() {
     }
   }
 
+  // Mutations reach the list through the change stream; reload only without it
+  const refreshIfNotLive = () => {
+    if (!liveRef.current) {
+      loadEmployees()
+    }
+  }
+
   const handleAddEmployee = () => {
     setEditingEmployee(null)
     setShowForm(true)
@@ -42,7 +64,6 @@ function App() {
   const handleFormClose = () => {
     setShowForm(false)
     setEditingEmployee(null)
-    loadEmployees()
   }
 
   return (
@@ -61,7 +82,7 @@ function App() {
           <EmployeeForm
             employee={editingEmployee}
             onClose={handleFormClose}
-            onSuccess={loadEmployees}
+            onSuccess={refreshIfNotLive}
           />
         )}
 
@@ -71,7 +92,7 @@ function App() {
           <EmployeeList
             employees={employees}
             onEdit={handleEditEmployee}
-            onDelete={loadEmployees}
+            onDelete={refreshIfNotLive}
           />
         )}
       </div>
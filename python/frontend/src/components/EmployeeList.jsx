@@ -1,8 +1,38 @@
-import React from 'react'
+import React, { useEffect, useState } from 'react'
 import EmployeeCard from './EmployeeCard'
+import { searchEmployees } from '../services/api'
 import './EmployeeList.css'
 
+// Wait for a pause in typing before asking the server
+const SEARCH_DEBOUNCE_MS = 200
+const SEARCH_MIN_LENGTH = 2
+
 const EmployeeList = ({ employees, onEdit, onDelete }) => {
+  const [query, setQuery] = useState('')
+  const [results, setResults] = useState(null)
+
+  useEffect(() => {
+    const text = query.trim()
+    if (text.length < SEARCH_MIN_LENGTH) {
+      setResults(null)
+      return undefined
+    }
+
+    let cancelled = false
+    const timer = setTimeout(async () => {
+      try {
+        const items = await searchEmployees(text, 50)
+        if (!cancelled) setResults(items)
+      } catch (error) {
+        if (!cancelled) setResults([])
+      }
+    }, SEARCH_DEBOUNCE_MS)
+    return () => {
+      cancelled = true
+      clearTimeout(timer)
+    }
+  }, [query, employees])
+
   if (employees.length === 0) {
     return (
       <div className="empty-state">
@@ -11,11 +41,20 @@ const EmployeeList = ({ employees, onEdit, onDelete }) => {
     )
   }
 
+  const shown = results ?? employees
+
   return (
     <div className="employee-list">
-      <h2>Employees ({employees.length})</h2>
+      <h2>Employees ({results ? `${shown.length} matching` : employees.length})</h2>
+      <input
+        type="search"
+        className="employee-search"
+        placeholder="Search by name, email, department or position"
+        value={query}
+        onChange={(e) => setQuery(e.target.value)}
+      />
       <div className="employee-grid">
-        {employees.map((employee) => (
+        {shown.map((employee) => (
           <EmployeeCard
             key={employee.id}
             employee={employee}
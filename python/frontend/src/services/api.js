@@ -12,6 +12,8 @@ const apiClient = axios.create({
   headers: {
     'Content-Type': 'application/json',
   },
+  // Sends the read-your-writes cookie back on cross-origin requests
+  withCredentials: true,
 })
 
 // Request interceptor for debugging
@@ -38,12 +40,43 @@ apiClient.interceptors.response.use(
 )
 
 /**
- * Get all employees.
+ * Get one page of employees.
+ * @param {Object} params - Query parameters (limit, cursor)
+ * @returns {Promise<Object>} Page with items and next_cursor
+ */
+export const getEmployeesPage = async (params = {}) => {
+  try {
+    return await apiClient.get('/employees', { params })
+  } catch (error) {
+    throw error
+  }
+}
+
+/**
+ * Get all employees by following the pagination cursor.
  * @returns {Promise<Array>} Array of employee objects
  */
 export const getEmployees = async () => {
+  const employees = []
+  let cursor = null
+  do {
+    const page = await getEmployeesPage(cursor ? { cursor } : {})
+    employees.push(...page.items)
+    cursor = page.next_cursor
+  } while (cursor)
+  return employees
+}
+
+/**
+ * Search employees by name, email, department or position.
+ * @param {string} q - Search text (at least 2 characters)
+ * @param {number} limit - Maximum number of results
+ * @returns {Promise<Array>} Matching employees, best match first
+ */
+export const searchEmployees = async (q, limit = 10) => {
   try {
-    return await apiClient.get('/employees')
+    const result = await apiClient.get('/employees/search', { params: { q, limit } })
+    return result.items
   } catch (error) {
     throw error
   }
@@ -101,3 +134,43 @@ export const deleteEmployee = async (id) => {
     throw error
   }
 }
+
+/**
+ * Subscribe to the live employee change stream (Server-Sent Events).
+ * The browser reconnects by itself after a dropped connection.
+ * @param {Object} handlers - onChanges(events), onResync(), onOpen(reconnected), onError()
+ * @returns {Function} Call to close the stream
+ */
+export const subscribeToEmployeeChanges = ({ onChanges, onResync, onOpen, onError }) => {
+  const source = new EventSource(`${API_BASE_URL}/employees/stream`)
+  let opened = false
+
+  source.onopen = () => {
+    // Changes made while disconnected were missed
+    onOpen?.(opened)
+    opened = true
+  }
+  source.onerror = () => onError?.()
+  source.addEventListener('changes', (message) => onChanges(JSON.parse(message.data)))
+  source.addEventListener('resync', () => onResync())
+
+  return () => source.close()
+}
+
+/**
+ * Apply change stream events to a newest-first employee list.
+ * @param {Array} employees - Current employees, sorted by id descending
+ * @param {Array} events - Events with type (create, update, delete), id and employee
+ * @returns {Array} New employee list
+ */
+export const applyEmployeeChanges = (employees, events) => {
+  const byId = new Map(employees.map((employee) => [employee.id, employee]))
+  for (const event of events) {
+    if (event.type === 'delete') {
+      byId.delete(event.id)
+    } else {
+      byId.set(event.id, event.employee)
+    }
+  }
+  return [...byId.values()].sort((a, b) => b.id - a.id)
+}
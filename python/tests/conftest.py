@@ -0,0 +1,51 @@
+"""
+Shared test fixtures.
+
+Most tests run against the in-memory and SQLite backends and need nothing
+else. Tests that need MySQL take the mysql fixture and are skipped unless
+MYSQL_TESTS is set:
+
+    MYSQL_TESTS=1 python -m pytest       # the database the DB_* settings point at
+    MYSQL_TESTS=docker python -m pytest  # a throwaway container (needs Docker)
+
+With MYSQL_TESTS=1 the tests write to that database's tables, so point the
+DB_* settings at a database of its own.
+"""
+
+import os
+from typing import Iterator
+
+import pytest
+
+from backend.config import DatabaseConfig
+from backend.database.connection import DatabaseConnection
+
+
+@pytest.fixture(scope="session")
+def mysql() -> Iterator[type]:
+    """
+    A MySQL database with the application's schema applied.
+
+    Yields:
+        DatabaseConnection, with its pool initialized
+    """
+    mode = os.getenv("MYSQL_TESTS", "").lower()
+    if mode in ("", "0", "false"):
+        pytest.skip("MySQL tests are disabled; set MYSQL_TESTS=1 or MYSQL_TESTS=docker")
+
+    if mode == "docker":
+        from benchmarks.mysql_container import throwaway_mysql
+
+        with throwaway_mysql():
+            yield DatabaseConnection
+        return
+
+    backend = DatabaseConfig.BACKEND
+    DatabaseConfig.BACKEND = "mysql"
+    try:
+        DatabaseConnection.initialize_pool()
+        DatabaseConnection.create_tables()
+        yield DatabaseConnection
+    finally:
+        DatabaseConnection.close()
+        DatabaseConfig.BACKEND = backend
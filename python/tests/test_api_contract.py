@@ -0,0 +1,426 @@
+"""
+API contract tests, run against every hermetic storage backend.
+
+The FastAPI app is served with get_employee_repository overridden to a
+fresh MemoryEmployeeRepository or SQLiteEmployeeRepository per test, so the
+same requests must give the same responses whichever backend stores the
+employees. Startup events are not run: no database, job runner or change
+stream is started.
+"""
+
+import csv
+import io
+import json
+import time
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.api.dependencies import get_employee_repository
+from backend.config import JobsConfig, SyncConfig
+from backend.database.async_operations import AsyncEmployeeRepository
+from backend.database.memory import MemoryEmployeeRepository
+from backend.database.sqlite import SQLiteEmployeeRepository
+from backend.jobs import store as job_store
+from backend.main import app
+
+EMPLOYEES = "/api/employees"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request) -> str:
+    return request.param
+
+
+@pytest.fixture
+def client(backend, tmp_path, monkeypatch) -> Iterator[TestClient]:
+    """A client of the app storing employees in a fresh repository of the backend."""
+    if backend == "memory":
+        repository = MemoryEmployeeRepository()
+    else:
+        repository = SQLiteEmployeeRepository(str(tmp_path / "employees.sqlite3"))
+    # The change feed holds rows back for in-flight transactions of other
+    # processes, which these tests do not have
+    monkeypatch.setattr(SyncConfig, "LAG_SECONDS", 0)
+    app.dependency_overrides[get_employee_repository] = lambda: AsyncEmployeeRepository(repository)
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_employee_repository, None)
+        repository.close()
+
+
+def _create(client: TestClient, **fields: Any) -> Dict[str, Any]:
+    response = client.post(EMPLOYEES, json=fields)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _seed(client: TestClient) -> List[Dict[str, Any]]:
+    """Seven employees across two departments, with distinct names, salaries and hire dates."""
+    return [
+        _create(
+            client,
+            name=name,
+            email=f"{name.lower()}@example.com",
+            department="Engineering" if index % 2 else "Sales",
+            position="Engineer" if index % 2 else "Account Manager",
+            salary=40000 + 5000 * index,
+            hire_date=f"2023-0{index + 1}-15",
+        )
+        for index, name in enumerate(["Grace", "Alan", "Ada", "Linus", "Barbara", "Edsger", "Donald"])
+    ]
+
+
+def _wait_for_next_second() -> None:
+    """Let the current second pass; SQLite timestamps have one-second resolution."""
+    second = int(time.time())
+    while int(time.time()) == second:
+        time.sleep(0.05)
+
+
+def _pages(client: TestClient, **params: Any) -> List[List[Dict[str, Any]]]:
+    """Follow next_cursor through every page of the list."""
+    pages, cursor = [], None
+    while True:
+        response = client.get(EMPLOYEES, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        body = response.json()
+        pages.append(body["items"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+# CRUD
+
+def test_create_get_update_delete(client):
+    created = _create(
+        client, name="Zoë Ångström", email="zoe@example.com", phone="+1234567890",
+        department="Engineering", position="Engineer", salary=75000.5, hire_date="2023-01-15",
+    )
+    assert created == {
+        "id": created["id"], "name": "Zoë Ångström", "email": "zoe@example.com", "phone": "+1234567890",
+        "department": "Engineering", "position": "Engineer", "salary": 75000.5, "hire_date": "2023-01-15",
+    }
+    url = f"{EMPLOYEES}/{created['id']}"
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.json() == created
+    assert client.get(url, headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+
+    response = client.put(url, json={"position": "Staff Engineer", "salary": 80000})
+    assert response.status_code == 200, response.text
+    assert response.json() == {**created, "position": "Staff Engineer", "salary": 80000}
+    assert client.get(url).json() == response.json()
+
+    assert client.delete(url).status_code == 204
+    assert client.get(url).status_code == 404
+
+
+def test_missing_employee_is_404(client):
+    assert client.get(f"{EMPLOYEES}/999").status_code == 404
+    assert client.put(f"{EMPLOYEES}/999", json={"position": "Engineer"}).status_code == 404
+    assert client.delete(f"{EMPLOYEES}/999").status_code == 404
+
+
+def test_duplicate_email_is_400(client):
+    first = _create(client, name="Ada", email="ada@example.com")
+    other = _create(client, name="Alan", email="alan@example.com")
+
+    for email in ("ada@example.com", "ADA@example.com"):
+        response = client.post(EMPLOYEES, json={"name": "Another Ada", "email": email})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already exists"
+
+    response = client.put(f"{EMPLOYEES}/{other['id']}", json={"email": "ada@example.com"})
+    assert response.status_code == 400
+    assert client.get(f"{EMPLOYEES}/{first['id']}").json()["name"] == "Ada"
+
+
+def test_invalid_employee_is_422(client):
+    assert client.post(EMPLOYEES, json={"name": "Ada", "email": "not-an-email"}).status_code == 422
+    assert client.post(EMPLOYEES, json={"name": "Ada", "email": "ada@example.com", "salary": -1}).status_code == 422
+
+
+# List: keyset pagination, sorting and filters
+
+def test_pages_cover_every_employee_newest_first(client):
+    employees = _seed(client)
+    pages = _pages(client, limit=3)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [e["id"] for page in pages for e in page] == sorted((e["id"] for e in employees), reverse=True)
+
+
+@pytest.mark.parametrize("sort, key", [
+    ("name", "name"), ("-name", "name"), ("salary", "salary"), ("-hire_date", "hire_date"), ("id", "id"),
+])
+def test_pages_follow_sort(client, sort, key):
+    employees = _seed(client)
+    listed = [e for page in _pages(client, limit=2, sort=sort) for e in page]
+
+    assert [e[key] for e in listed] == sorted((e[key] for e in employees), reverse=sort.startswith("-"))
+    assert sorted(e["id"] for e in listed) == sorted(e["id"] for e in employees)
+
+
+def test_after_id(client):
+    employees = _seed(client)
+    ids = sorted(e["id"] for e in employees)
+
+    response = client.get(EMPLOYEES, params={"after_id": ids[2], "sort": "id", "limit": 2})
+    assert [e["id"] for e in response.json()["items"]] == ids[3:5]
+
+
+def test_invalid_cursors_are_400(client):
+    _seed(client)
+    cursor = client.get(EMPLOYEES, params={"limit": 2, "sort": "name"}).json()["next_cursor"]
+
+    assert client.get(EMPLOYEES, params={"cursor": cursor, "sort": "salary"}).status_code == 400
+    assert client.get(EMPLOYEES, params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get(EMPLOYEES, params={"after_id": 1, "sort": "name"}).status_code == 400
+    assert client.get(EMPLOYEES, params={"after_id": 1, "cursor": cursor}).status_code == 400
+
+
+def test_filters(client):
+    employees = _seed(client)
+
+    def listed(**params: Any) -> List[int]:
+        return sorted(e["id"] for page in _pages(client, limit=2, **params) for e in page)
+
+    def expected(accepts) -> List[int]:
+        return sorted(e["id"] for e in employees if accepts(e))
+
+    assert listed(department="Engineering") == expected(lambda e: e["department"] == "Engineering")
+    assert listed(position="Engineer", sort="-salary") == expected(lambda e: e["position"] == "Engineer")
+    assert listed(salary_min=50000, salary_max=60000) == expected(lambda e: 50000 <= e["salary"] <= 60000)
+    assert listed(hired_after="2023-03-01", hired_before="2023-05-31", sort="hire_date") == expected(
+        lambda e: "2023-03-01" <= e["hire_date"] <= "2023-05-31"
+    )
+    assert listed(department="Engineering", salary_min=60000, sort="salary") == expected(
+        lambda e: e["department"] == "Engineering" and e["salary"] >= 60000
+    )
+
+
+def test_list_etag(client):
+    employee = _create(client, name="Ada", email="ada@example.com")
+    response = client.get(EMPLOYEES)
+    etag = response.headers["ETag"]
+
+    assert client.get(EMPLOYEES, headers={"If-None-Match": etag}).status_code == 304
+    # Another page, or the same page after a change, is not the same representation
+    assert client.get(EMPLOYEES, params={"limit": 5}, headers={"If-None-Match": etag}).status_code == 200
+    client.put(f"{EMPLOYEES}/{employee['id']}", json={"position": "Engineer"})
+    assert client.get(EMPLOYEES, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_etag_changes_on_update_within_one_second(client):
+    employee = _create(client, name="Ada", email="ada@example.com")
+    url = f"{EMPLOYEES}/{employee['id']}"
+    # Start at a second boundary, so both updates share their updated_at second
+    _wait_for_next_second()
+    client.put(url, json={"salary": 2})
+    etag = client.get(EMPLOYEES).headers["ETag"]
+    client.put(url, json={"salary": 3})
+
+    response = client.get(EMPLOYEES, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["items"][0]["salary"] == 3.0
+
+
+def test_list_etag_ignores_parameter_order(client):
+    _create(client, name="Ada", email="ada@example.com", department="Engineering")
+    etag = client.get(f"{EMPLOYEES}?limit=5&department=Engineering").headers["ETag"]
+
+    response = client.get(f"{EMPLOYEES}?department=Engineering&limit=5", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+def test_list_etag_changes_on_delete(client):
+    _seed(client)
+    etag = client.get(EMPLOYEES).headers["ETag"]
+    employee = _create(client, name="Temp", email="temp@example.com")
+    client.delete(f"{EMPLOYEES}/{employee['id']}")
+
+    # Same headcount and possibly the same second, but a new tombstone
+    assert client.get(EMPLOYEES, headers={"If-None-Match": etag}).status_code == 200
+
+
+# Bulk operations
+
+def test_bulk_create(client):
+    _create(client, name="Ada", email="ada@example.com")
+    response = client.post(f"{EMPLOYEES}/bulk", json=[
+        {"name": "Alan", "email": "alan@example.com"},
+        {"name": "Ada again", "email": "ada@example.com"},
+        {"name": "Grace", "email": "grace@example.com", "salary": 1234.567},
+    ])
+    assert response.status_code == 200, response.text
+    body = response.json()
+
+    assert body["created"] == 2
+    assert body["ids"][1] is None
+    assert [error["index"] for error in body["errors"]] == [1]
+    assert client.get(f"{EMPLOYEES}/{body['ids'][2]}").json()["salary"] == 1234.57
+
+
+def test_bulk_create_abort_on_error(client):
+    _create(client, name="Ada", email="ada@example.com")
+    response = client.post(
+        f"{EMPLOYEES}/bulk",
+        params={"abort_on_error": "true", "transaction": "batch"},
+        json=[{"name": "Alan", "email": "alan@example.com"}, {"name": "Ada again", "email": "ada@example.com"}],
+    )
+    body = response.json()
+
+    assert body["aborted"] is True
+    assert body["created"] == 0
+    assert len(_pages(client)[0]) == 1
+
+
+def test_bulk_update(client):
+    employees = _seed(client)
+    engineering = sorted(e["id"] for e in employees if e["department"] == "Engineering")
+
+    response = client.patch(f"{EMPLOYEES}/bulk", json={
+        "filter": {"department": "Engineering"}, "salary_factor": 1.1, "return_ids": True,
+    })
+    assert response.status_code == 200, response.text
+    assert response.json()["affected"] == len(engineering)
+    assert sorted(response.json()["ids"]) == engineering
+    for employee in employees:
+        salary = client.get(f"{EMPLOYEES}/{employee['id']}").json()["salary"]
+        factor = 1.1 if employee["id"] in engineering else 1
+        assert salary == round(employee["salary"] * factor, 2)
+
+    response = client.patch(f"{EMPLOYEES}/bulk", json={"ids": engineering[:2], "changes": {"position": "Lead"}})
+    assert response.json() == {"affected": 2, "ids": None}
+    assert client.get(f"{EMPLOYEES}/{engineering[0]}").json()["position"] == "Lead"
+
+    assert client.patch(f"{EMPLOYEES}/bulk", json={"changes": {"position": "Lead"}}).status_code == 422
+
+
+def test_bulk_delete(client):
+    employees = _seed(client)
+    sales = sorted(e["id"] for e in employees if e["department"] == "Sales")
+
+    response = client.request("DELETE", f"{EMPLOYEES}/bulk", json={"filter": {"department": "Sales"}, "return_ids": True})
+    assert response.status_code == 200, response.text
+    assert response.json()["affected"] == len(sales)
+    assert sorted(response.json()["ids"]) == sales
+    assert all(client.get(f"{EMPLOYEES}/{employee_id}").status_code == 404 for employee_id in sales)
+
+    response = client.request("DELETE", f"{EMPLOYEES}/bulk", json={"ids": [sales[0], 999]})
+    assert response.json() == {"affected": 0, "ids": None}
+
+
+# Change feed
+
+def test_change_feed_reports_updates_and_tombstones(client):
+    ada = _create(client, name="Ada", email="ada@example.com")
+    alan = _create(client, name="Alan", email="alan@example.com")
+    grace = _create(client, name="Grace", email="grace@example.com")
+    _wait_for_next_second()
+
+    full = client.get(f"{EMPLOYEES}/changes").json()
+    assert sorted(e["id"] for e in full["items"]) == sorted([ada["id"], alan["id"], grace["id"]])
+    assert full["deleted"] == []
+    assert full["has_more"] is False
+
+    client.delete(f"{EMPLOYEES}/{ada['id']}")
+    client.put(f"{EMPLOYEES}/{alan['id']}", json={"position": "Engineer"})
+    client.request("DELETE", f"{EMPLOYEES}/bulk", json={"ids": [grace["id"]]})
+    _wait_for_next_second()
+
+    changes = client.get(f"{EMPLOYEES}/changes", params={"since": full["next_token"]}).json()
+    assert [e["id"] for e in changes["items"]] == [alan["id"]]
+    assert changes["items"][0]["position"] == "Engineer"
+    assert sorted(changes["deleted"]) == sorted([ada["id"], grace["id"]])
+
+    unchanged = client.get(f"{EMPLOYEES}/changes", params={"since": changes["next_token"]}).json()
+    assert (unchanged["items"], unchanged["deleted"]) == ([], [])
+
+
+def test_change_feed_pages(client):
+    employees = _seed(client)
+    _wait_for_next_second()
+
+    seen, token = [], None
+    while True:
+        body = client.get(f"{EMPLOYEES}/changes", params={"limit": 3, **({"since": token} if token else {})}).json()
+        seen.extend(e["id"] for e in body["items"])
+        token = body["next_token"]
+        if not body["has_more"]:
+            break
+    assert sorted(seen) == sorted(e["id"] for e in employees)
+
+
+def test_change_feed_rejects_invalid_tokens(client):
+    assert client.get(f"{EMPLOYEES}/changes", params={"since": "not-a-token"}).status_code == 400
+
+
+# Search, stats and export
+
+def test_search(client):
+    _seed(client)
+    _create(client, name="Adam Smith", email="adam@example.com", department="Research")
+
+    names = [e["name"] for e in client.get(f"{EMPLOYEES}/search", params={"q": "ad"}).json()["items"]]
+    assert sorted(names) == ["Ada", "Adam Smith"]
+    assert [e["name"] for e in client.get(f"{EMPLOYEES}/search", params={"q": "adam research"}).json()["items"]] == [
+        "Adam Smith"
+    ]
+    assert client.get(f"{EMPLOYEES}/search", params={"q": "a"}).status_code == 422
+
+
+def test_stats(client):
+    employees = _seed(client)
+    _create(client, name="Nobody", email="nobody@example.com")
+
+    groups = {g["key"]: g for g in client.get(f"{EMPLOYEES}/stats", params={"by": "department"}).json()["groups"]}
+    engineering = [e["salary"] for e in employees if e["department"] == "Engineering"]
+    assert groups["Engineering"]["headcount"] == len(engineering)
+    assert groups["Engineering"]["total_salary"] == sum(engineering)
+    assert groups["Engineering"]["average_salary"] == pytest.approx(sum(engineering) / len(engineering))
+    assert groups[None] == {"key": None, "headcount": 1, "total_salary": 0, "average_salary": None}
+
+    client.request("DELETE", f"{EMPLOYEES}/bulk", json={"filter": {"department": "Engineering"}})
+    groups = client.get(f"{EMPLOYEES}/stats", params={"by": "department"}).json()["groups"]
+    assert "Engineering" not in {g["key"] for g in groups}
+
+
+@pytest.mark.parametrize("format", ["csv", "ndjson"])
+def test_export(client, format):
+    employees = _seed(client)
+    response = client.get(f"{EMPLOYEES}/export", params={"format": format})
+    assert response.status_code == 200
+
+    if format == "csv":
+        exported = list(csv.DictReader(io.StringIO(response.text)))
+    else:
+        exported = [json.loads(line) for line in response.text.splitlines()]
+    assert [int(e["id"]) for e in exported] == sorted(e["id"] for e in employees)
+
+
+# Import (queued as a background job)
+
+def test_import_is_queued(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(JobsConfig, "DIR", str(tmp_path / "jobs"))
+    monkeypatch.setattr(JobsConfig, "ENABLED", False)
+    monkeypatch.setattr(job_store, "_store", job_store.SQLiteJobStore(":memory:"))
+
+    response = client.post(
+        f"{EMPLOYEES}/import", content=b"name,email\nAda,ada@example.com\n", headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == 202, response.text
+    job = client.get(response.headers["Location"]).json()
+    assert (job["kind"], job["status"]) == ("import", "queued")
+
+    response = client.post(f"{EMPLOYEES}/import", content=b"name,phone\nAda,1\n", headers={"Content-Type": "text/csv"})
+    assert response.status_code == 400
+    response = client.post(f"{EMPLOYEES}/import", content=b"name,email\n\xff\n", headers={"Content-Type": "text/csv"})
+    assert response.status_code == 400
+    # Only the queued job's upload is kept
+    assert len(list((tmp_path / "jobs").iterdir())) == 1
@@ -0,0 +1,132 @@
+"""
+Index usage of the employee list queries.
+
+Runs EXPLAIN on the query built for every filter/sort combination the list
+endpoint offers, first and subsequent pages, and checks that each reads an
+index instead of scanning or filesorting the table, and that the database
+indexes match schema.EMPLOYEE_INDEXES.
+
+The optimizer picks plans from table statistics, so the table is topped up
+with synthetic employees (benchmarks/datagen.py) and analyzed first; they
+are removed again afterwards.
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from backend.database.operations import rebuild_employee_summary
+from backend.database.queries import build_page_query
+from backend.database.schema import SELECT_EMPLOYEE_INDEXES, index_changes
+from benchmarks.datagen import purge_employees, seed_employees
+
+SEED_ROWS = 5000
+
+# (name, filters, sort, keyset position of the previous page, acceptable indexes)
+CASES: List[Tuple[str, Dict[str, Any], str, Optional[Dict[str, Any]], Tuple[str, ...]]] = [
+    ("newest", {}, "-id", None, ("PRIMARY",)),
+    ("oldest_next", {}, "id", {"id": 1000}, ("PRIMARY",)),
+    ("name", {}, "name", None, ("idx_name",)),
+    ("name_next", {}, "name", {"id": 1000, "v": "M"}, ("idx_name",)),
+    ("salary_desc_next", {}, "-salary", {"id": 1000, "v": 50000}, ("idx_salary",)),
+    ("hire_date_next", {}, "hire_date", {"id": 1000, "v": "2023-01-01"}, ("idx_hire_date",)),
+    ("department", {"department": "Engineering"}, "-id", None, ("idx_department",)),
+    ("department_next", {"department": "Engineering"}, "-id", {"id": 1000}, ("idx_department",)),
+    (
+        "department_by_hire_date",
+        {"department": "Engineering"},
+        "-hire_date",
+        {"id": 1000, "v": "2023-01-01"},
+        ("idx_department_hire_date",),
+    ),
+    (
+        "department_by_salary",
+        {"department": "Engineering"},
+        "salary",
+        {"id": 1000, "v": 50000},
+        ("idx_department_salary",),
+    ),
+    (
+        "department_salary_range",
+        {"department": "Engineering", "salary_min": 40000, "salary_max": 60000},
+        "salary",
+        None,
+        ("idx_department_salary",),
+    ),
+    ("position", {"position": "Engineer"}, "-id", None, ("idx_position",)),
+    ("salary_range", {"salary_min": 40000, "salary_max": 60000}, "-salary", None, ("idx_salary",)),
+    (
+        "hired_range",
+        {"hired_after": "2023-01-01", "hired_before": "2023-06-30"},
+        "hire_date",
+        None,
+        ("idx_hire_date",),
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def seeded(mysql) -> Iterator[type]:
+    """The employees table with SEED_ROWS synthetic employees and fresh statistics."""
+    seed_employees(SEED_ROWS)
+    with mysql.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("ANALYZE TABLE employees")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+    yield mysql
+    purge_employees()
+    rebuild_employee_summary()
+
+
+def test_indexes_match_schema(mysql):
+    with mysql.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SELECT_EMPLOYEE_INDEXES)
+            existing: Dict[str, Tuple[str, ...]] = {}
+            for index_name, column_name in cursor.fetchall():
+                existing[index_name] = existing.get(index_name, ()) + (column_name,)
+        finally:
+            cursor.close()
+    assert index_changes(existing) == []
+
+
+@pytest.mark.parametrize(
+    "filters, sort, after, indexes",
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES],
+)
+def test_list_query_uses_index(seeded, filters, sort, after, indexes):
+    query, params = build_page_query(51, after, filters, sort)
+    with seeded.get_connection() as conn, seeded.warnings_ignored(conn):
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute("EXPLAIN " + query, params)
+            plan = cursor.fetchall()[0]
+        finally:
+            cursor.close()
+
+    assert plan["key"] is not None, plan
+    assert plan["type"] != "ALL", plan
+    assert plan["key"] in indexes, plan
+    assert "filesort" not in (plan.get("Extra") or ""), plan
+
+
+def test_reconcile_adds_fulltext_index_to_rebuilt_table(mysql):
+    # A copying rebuild drops InnoDB's hidden FTS_DOC_ID column, like a table
+    # from database_schema.sql or an older release, so adding the FULLTEXT
+    # index again rebuilds the table and warns
+    with mysql.get_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("ALTER TABLE employees DROP INDEX ftx_employee_search, ALGORITHM=COPY")
+        finally:
+            cursor.close()
+
+    clauses = mysql.reconcile_indexes()
+
+    assert [clause.split(" (")[0] for clause in clauses] == ["ADD FULLTEXT INDEX ftx_employee_search"]
+    assert mysql.reconcile_indexes() == []
@@ -0,0 +1,78 @@
+"""
+Slow query logging and plan capture of the query profiler.
+
+Statements run through the operations module with a profiler whose slow
+query threshold is zero, so every execution counts as slow. Plans must come
+back as real EXPLAIN FORMAT=JSON output, even though connections raise on
+warnings and EXPLAIN always attaches Note 1003, and even for statements
+running inside a write transaction.
+"""
+
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+import pytest
+
+from backend.config import CacheConfig
+from backend.database import cache, operations, profiler
+from backend.database.connection import DatabaseConnection
+from backend.database.profiler import QueryProfiler
+
+
+@pytest.fixture
+def query_profiler(monkeypatch) -> Iterator[QueryProfiler]:
+    """A profiler logging every statement as slow, with the employee cache off."""
+    monkeypatch.setattr(CacheConfig, "BACKEND", "none")
+    monkeypatch.setattr(cache, "_cache", None)
+    instance = QueryProfiler(slow_query_ms=0)
+    monkeypatch.setattr(profiler, "_profiler", instance)
+    yield instance
+
+
+def _statement(query_profiler: QueryProfiler, prefix: str):
+    """The reported statement starting with prefix."""
+    statements = query_profiler.report(limit=1000)["statements"]
+    matches = [stats for stats in statements if stats["statement"].startswith(prefix)]
+    assert matches, [stats["statement"] for stats in statements]
+    return matches[0]
+
+
+def test_slow_select_captures_plan(mysql, query_profiler):
+    operations.get_employees_page(limit=5)
+
+    stats = _statement(query_profiler, "SELECT")
+    assert stats["slow_calls"] == 1
+    assert "query_block" in stats["plan"], stats["plan"]
+    assert query_profiler.report()["recent_slow"]
+
+
+def test_write_in_transaction_captures_plan(mysql, query_profiler):
+    email = f"profiler-{uuid.uuid4().hex[:12]}@example.com"
+    employee = operations.create_employee({"name": "Profiled", "email": email})
+    try:
+        operations.update_employee(employee.id, {"position": "Profiled"})
+        stats = _statement(query_profiler, "UPDATE employees")
+        assert "query_block" in stats["plan"], stats["plan"]
+    finally:
+        operations.delete_employee(employee.id)
+
+
+def test_plan_is_retried_when_no_connection_is_free(monkeypatch):
+    attempts = []
+
+    @contextmanager
+    def exhausted():
+        attempts.append(1)
+        yield None
+
+    monkeypatch.setattr(DatabaseConnection, "spare_connection", exhausted)
+    query_profiler = QueryProfiler(slow_query_ms=1000)
+
+    query_profiler.record("SELECT id FROM employees WHERE id = %s", (1,), 0.001, 1)
+    query_profiler.record("SELECT id FROM employees WHERE id = %s", (2,), 0.001, 1)
+
+    stats = _statement(query_profiler, "SELECT")
+    assert stats["calls"] == 2
+    assert stats["plan"] is None
+    assert len(attempts) == 2
@@ -0,0 +1,138 @@
+"""
+Round trips per write request: pool checkouts and SQL statements.
+
+Each route handler is called once against MySQL while every connection
+checkout and executed statement is counted, so a change that adds a
+checkout or a query to a request fails here. The employee cache and the
+query profiler are turned off, so reads reach the database and EXPLAIN
+capture does not add statements.
+"""
+
+import asyncio
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+from fastapi import HTTPException, Request
+
+from backend.api import routes
+from backend.config import CacheConfig, ProfilerConfig
+from backend.database import cache, profiler
+from backend.database.async_operations import AsyncEmployeeRepository
+from backend.database.connection import DatabaseConnection
+from backend.database.repository import MySQLEmployeeRepository
+from backend.models.schemas import EmployeeCreate, EmployeeUpdate
+
+# (checkouts, statements) per handler. Writes maintain the employee summary
+# and bump the write version in the same transaction; deletes also record a
+# tombstone for the change feed
+EXPECTED = {
+    "create_employee": (1, 3),
+    "get_employee": (1, 1),
+    "update_employee": (1, 4),
+    "update_employee_missing": (1, 1),
+    "delete_employee": (1, 5),
+    "delete_employee_missing": (1, 1),
+}
+
+MISSING_ID = 2**31 - 1
+
+
+class _CountingCursor:
+    """Cursor proxy that counts executed statements."""
+
+    def __init__(self, cursor: Any, counters: Dict[str, int]):
+        self._cursor = cursor
+        self._counters = counters
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        self._counters["statements"] += 1
+        return self._cursor.execute(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class _CountingConnection:
+    """Connection proxy whose cursors count executed statements."""
+
+    def __init__(self, connection: Any, counters: Dict[str, int]):
+        self._connection = connection
+        self._counters = counters
+
+    def cursor(self, *args: Any, **kwargs: Any) -> _CountingCursor:
+        return _CountingCursor(self._connection.cursor(*args, **kwargs), self._counters)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._connection, name)
+
+
+@pytest.fixture
+def counters(mysql, monkeypatch) -> Iterator[Dict[str, int]]:
+    """Count checkouts and statements from here on, with cache and profiler off."""
+    monkeypatch.setattr(CacheConfig, "BACKEND", "none")
+    monkeypatch.setattr(cache, "_cache", None)
+    monkeypatch.setattr(ProfilerConfig, "ENABLED", False)
+    monkeypatch.setattr(profiler, "_profiler", None)
+
+    counts = {"checkouts": 0, "statements": 0}
+    original = DatabaseConnection.get_connection
+
+    @contextmanager
+    def counting_get_connection(*args: Any, **kwargs: Any):
+        counts["checkouts"] += 1
+        with original(*args, **kwargs) as conn:
+            yield _CountingConnection(conn, counts)
+
+    monkeypatch.setattr(DatabaseConnection, "get_connection", counting_get_connection)
+    yield counts
+
+
+# Handlers are called directly, so the repository dependency is passed explicitly
+_repository = AsyncEmployeeRepository(MySQLEmployeeRepository())
+
+
+async def _measure(counters: Dict[str, int], handler: Any, *args: Any) -> Tuple[Tuple[int, int], Any]:
+    """Call a handler and return its (checkouts, statements) and result (None on an HTTP error)."""
+    counters["checkouts"] = counters["statements"] = 0
+    try:
+        result = await handler(*args, repo=_repository)
+    except HTTPException:
+        result = None
+    return (counters["checkouts"], counters["statements"]), result
+
+
+def _get_request() -> Request:
+    """Bare GET request for handlers that read conditional request headers."""
+    return Request({"type": "http", "method": "GET", "headers": [], "query_string": b""})
+
+
+async def _run(counters: Dict[str, int]) -> Dict[str, Tuple[int, int]]:
+    email = f"roundtrip-{uuid.uuid4().hex[:12]}@example.com"
+    results = {}
+
+    results["create_employee"], created = await _measure(
+        counters, routes.create_employee, EmployeeCreate(name="Round Trip", email=email)
+    )
+    assert created is not None
+    employee_id = created.id
+
+    results["get_employee"], _ = await _measure(counters, routes.get_employee, employee_id, _get_request())
+    results["update_employee"], updated = await _measure(
+        counters, routes.update_employee, employee_id, EmployeeUpdate(position="Round Trip")
+    )
+    assert updated is not None and updated.position == "Round Trip"
+    results["update_employee_missing"], missing = await _measure(
+        counters, routes.update_employee, MISSING_ID, EmployeeUpdate(position="Round Trip")
+    )
+    assert missing is None
+    results["delete_employee"], _ = await _measure(counters, routes.delete_employee, employee_id)
+    results["delete_employee_missing"], missing = await _measure(counters, routes.delete_employee, employee_id)
+    assert missing is None
+
+    return results
+
+
+def test_write_round_trips(counters):
+    assert asyncio.run(_run(counters)) == EXPECTED
@@ -0,0 +1,115 @@
+"""
+Golden tests for the employee list fast path.
+
+FastJSONResponse bodies built from JSON-ready rows must be byte-identical
+to what FastAPI's JSONResponse produces for the equivalent EmployeePage,
+EmployeeChanges and EmployeeSearchResults models, with orjson and with the
+standard library fallback.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from backend.api import serialization
+from backend.api.serialization import EMPLOYEE_ROWS, FastJSONResponse
+from backend.models.schemas import EmployeeChanges, EmployeePage, EmployeeResponse, EmployeeSearchResults
+
+# Columns as the database returns them: DECIMAL salaries and DATE hire dates
+EMPLOYEES = [
+    {
+        "id": 1, "name": "John Doe", "email": "john.doe@example.com", "phone": "+1234567890",
+        "department": "Engineering", "position": "Software Engineer",
+        "salary": Decimal("75000.00"), "hire_date": date(2023, 1, 15),
+    },
+    {
+        "id": 2, "name": "Zoë Ångström-Müller", "email": "zoe@example.com", "phone": None,
+        "department": "Forschung & Entwicklung", "position": "Ingénieure",
+        "salary": Decimal("1234.56"), "hire_date": date(1999, 12, 31),
+    },
+    {
+        "id": 3, "name": "李小龍 \"Bruce\" \\ 🥋", "email": "bruce@example.com", "phone": None,
+        "department": None, "position": None, "salary": None, "hire_date": None,
+    },
+    {
+        "id": 4, "name": "Tab\tand\nnewline", "email": "control@example.com", "phone": "",
+        "department": "</script>", "position": "Intern",
+        "salary": Decimal("0.10"), "hire_date": date(2024, 2, 29),
+    },
+]
+
+# The fast path's page body for EMPLOYEES[:2], pinned byte for byte
+GOLDEN_PAGE = (
+    '{"items":['
+    '{"name":"John Doe","email":"john.doe@example.com","phone":"+1234567890",'
+    '"department":"Engineering","position":"Software Engineer","salary":75000.0,'
+    '"hire_date":"2023-01-15","id":1},'
+    '{"name":"Zoë Ångström-Müller","email":"zoe@example.com","phone":null,'
+    '"department":"Forschung & Entwicklung","position":"Ingénieure","salary":1234.56,'
+    '"hire_date":"1999-12-31","id":2}'
+    '],"next_cursor":"eyJpZCI6Mn0"}'
+).encode("utf-8")
+
+
+def _row(employee):
+    """A row as get_employee_rows_page returns it: float salary, ISO hire date, column order."""
+    values = {
+        **employee,
+        "salary": float(employee["salary"]) if employee["salary"] is not None else None,
+        "hire_date": employee["hire_date"].isoformat() if employee["hire_date"] is not None else None,
+    }
+    return tuple(values[column] for column in serialization.EMPLOYEE_COLUMNS)
+
+
+def _reference(model):
+    """The body FastAPI sends for a response model."""
+    return JSONResponse(content=jsonable_encoder(model)).body
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def encoder(request, monkeypatch):
+    """Run a test with orjson and again with the standard library fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_page_matches_golden_bytes(encoder):
+    body = FastJSONResponse(content=EMPLOYEE_ROWS.encode_page([_row(e) for e in EMPLOYEES[:2]], "eyJpZCI6Mn0")).body
+    assert body == GOLDEN_PAGE
+
+
+@pytest.mark.parametrize("next_cursor", [None, "eyJpZCI6NH0"])
+def test_page_matches_json_response(encoder, next_cursor):
+    rows = [_row(employee) for employee in EMPLOYEES]
+    expected = _reference(EmployeePage(
+        items=[EmployeeResponse(**employee) for employee in EMPLOYEES], next_cursor=next_cursor
+    ))
+    assert FastJSONResponse(content=EMPLOYEE_ROWS.encode_page(rows, next_cursor)).body == expected
+
+
+def test_empty_page_matches_json_response(encoder):
+    expected = _reference(EmployeePage(items=[], next_cursor=None))
+    assert FastJSONResponse(content=EMPLOYEE_ROWS.encode_page([], None)).body == expected
+
+
+def test_changes_match_json_response(encoder):
+    rows = [_row(employee) for employee in EMPLOYEES]
+    expected = _reference(EmployeeChanges(
+        items=[EmployeeResponse(**employee) for employee in EMPLOYEES],
+        deleted=[7, 9],
+        next_token="token",
+        has_more=True,
+    ))
+    assert FastJSONResponse(content=EMPLOYEE_ROWS.encode_changes(rows, [7, 9], "token", True)).body == expected
+
+
+def test_search_results_match_json_response(encoder):
+    rows = [_row(employee) for employee in EMPLOYEES]
+    expected = _reference(EmployeeSearchResults(items=[EmployeeResponse(**employee) for employee in EMPLOYEES]))
+    assert FastJSONResponse(content=EMPLOYEE_ROWS.encode_items(rows)).body == expected
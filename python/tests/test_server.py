@@ -0,0 +1,62 @@
+"""
+Multi-worker settings checks of the server launcher.
+
+Settings that keep state per process are reported before the workers start,
+including shared stores that silently fall back to a per-process one.
+"""
+
+import pytest
+
+from backend import server
+from backend.config import CacheConfig, DatabaseConfig, EventsConfig
+
+
+@pytest.fixture
+def settings(monkeypatch):
+    """Multi-worker friendly settings: MySQL, no cache, shared events with a URL."""
+    monkeypatch.setattr(DatabaseConfig, "BACKEND", "mysql")
+    monkeypatch.setattr(CacheConfig, "BACKEND", "none")
+    monkeypatch.setattr(EventsConfig, "ENABLED", True)
+    monkeypatch.setattr(EventsConfig, "FANOUT", "shared")
+    monkeypatch.setattr(EventsConfig, "SHARED_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(server.importlib.util, "find_spec", lambda name: object())
+    return monkeypatch
+
+
+def test_shared_settings_pass_quietly(settings, capsys):
+    assert server.check_worker_settings(4) == 4
+    assert "shared without" not in capsys.readouterr().out
+
+
+def test_memory_backend_runs_one_worker(settings):
+    settings.setattr(DatabaseConfig, "BACKEND", "memory")
+    assert server.check_worker_settings(4) == 1
+
+
+def test_shared_cache_without_url_warns(settings, capsys):
+    settings.setattr(CacheConfig, "BACKEND", "shared")
+    settings.setattr(CacheConfig, "SHARED_URL", "")
+
+    server.check_worker_settings(4)
+
+    assert "CACHE_BACKEND=shared without CACHE_SHARED_URL" in capsys.readouterr().out
+
+
+def test_shared_stores_without_redis_warn(settings, capsys):
+    settings.setattr(CacheConfig, "BACKEND", "shared")
+    settings.setattr(CacheConfig, "SHARED_URL", "redis://localhost:6379/0")
+    settings.setattr(server.importlib.util, "find_spec", lambda name: None)
+
+    server.check_worker_settings(4)
+
+    out = capsys.readouterr().out
+    assert "CACHE_BACKEND=shared without the redis package installed" in out
+    assert "EVENTS_FANOUT=shared without the redis package installed" in out
+
+
+def test_shared_events_without_url_warn(settings, capsys):
+    settings.setattr(EventsConfig, "SHARED_URL", "")
+
+    server.check_worker_settings(4)
+
+    assert "EVENTS_FANOUT=shared without EVENTS_SHARED_URL" in capsys.readouterr().out